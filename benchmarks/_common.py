@@ -0,0 +1,100 @@
+"""
+agt_sea — Benchmark Helpers
+
+Shared utilities for the scripts in this directory. Every benchmark runs
+the real graphs against the fake provider (``LLMProvider.FAKE``), so no
+API key is needed and the numbers measure agt_sea and LangGraph rather
+than a provider. The fake's latency, failure rate and score range come
+from the usual config (``FAKE_LLM_LATENCY_SECONDS`` etc.) — set them in
+the environment to model a slower or flakier provider.
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+import uuid
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from langgraph.types import Command
+
+from agt_sea.models.state import AgencyState, LLMProvider
+
+BRIEFS_DIR = Path(__file__).parent.parent / "briefs"
+
+
+def load_brief(filename: str = "sample_brief_001.txt") -> str:
+    """Load a client brief from the briefs directory."""
+    return (BRIEFS_DIR / filename).read_text().strip()
+
+
+def initial_state(brief: str, **overrides: Any) -> AgencyState:
+    """A fresh run on the fake provider."""
+    return AgencyState(client_brief=brief, llm_provider=LLMProvider.FAKE, **overrides)
+
+
+def thread_config() -> dict[str, Any]:
+    """A config with a fresh thread_id (required by the v2 graph)."""
+    return {"configurable": {"thread_id": f"bench-{uuid.uuid4()}"}}
+
+
+def run_st2(graph: Any, state: AgencyState, index: int = 0) -> dict[str, Any]:
+    """Run the v2 graph to the interrupt, select ``index``, run to the end."""
+    config = thread_config()
+    graph.invoke(state, config=config)
+    return graph.invoke(
+        Command(resume={"action": "select", "index": index}), config=config
+    )
+
+
+async def arun_st2(graph: Any, state: AgencyState, index: int = 0) -> dict[str, Any]:
+    """Async variant of ``run_st2`` for a graph built with ``asynchronous=True``."""
+    config = thread_config()
+    await graph.ainvoke(state, config=config)
+    return await graph.ainvoke(
+        Command(resume={"action": "select", "index": index}), config=config
+    )
+
+
+class Stopwatch:
+    """Context manager recording elapsed wall time in ``seconds``."""
+
+    def __enter__(self) -> Stopwatch:
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.seconds = time.perf_counter() - self._start
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of ``values`` (0 for an empty sequence)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def mean(values: Sequence[float]) -> float:
+    """Arithmetic mean (0 for an empty sequence)."""
+    return statistics.fmean(values) if values else 0.0
+
+
+def print_table(title: str, headers: Sequence[str], rows: Sequence[Sequence[Any]]) -> None:
+    """Print a fixed-width table; floats are shown to three decimals."""
+    cells = [
+        [f"{value:.3f}" if isinstance(value, float) else str(value) for value in row]
+        for row in rows
+    ]
+    widths = [
+        max(len(str(header)), *(len(row[i]) for row in cells))
+        for i, header in enumerate(headers)
+    ]
+    print(f"\n{title}")
+    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    print("  ".join("-" * w for w in widths))
+    for row in cells:
+        print("  ".join(cell.ljust(w) for cell, w in zip(row, widths)))
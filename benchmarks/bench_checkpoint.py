@@ -0,0 +1,105 @@
+"""
+agt_sea — Checkpoint Cost Benchmark
+
+Run with: uv run python benchmarks/bench_checkpoint.py [--runs 20]
+
+Runs complete Standard 2.0 runs on the fake provider against each
+checkpointer backend and times the saver calls LangGraph makes —
+``put`` (one per super-step), ``put_writes`` (one per task) and
+``get_tuple`` (on resume) — by wrapping them on the saver instance.
+Reports the calls per run, the mean cost of each, and the share of the
+run's wall time spent checkpointing. LangGraph issues some writes from a
+background thread, so that share can overstate what the saver adds to a
+run's latency.
+
+Backends: LangGraph's stock ``MemorySaver``, the default
+``BoundedMemorySaver`` and ``BatchedSqliteSaver`` on a temporary file.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import MemorySaver
+
+from agt_sea.graph.checkpointer import BatchedSqliteSaver, BoundedMemorySaver
+from agt_sea.graph.workflow_st2 import build_graph_st2
+
+from _common import Stopwatch, initial_state, load_brief, print_table, run_st2
+
+_TIMED_METHODS = ("put", "put_writes", "get_tuple")
+
+
+def _instrument(saver: BaseCheckpointSaver) -> dict[str, list[float]]:
+    """Wrap the saver's methods on the instance; returns the timing log."""
+    timings: dict[str, list[float]] = defaultdict(list)
+
+    def timed(name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                timings[name].append(time.perf_counter() - start)
+
+        return wrapper
+
+    for name in _TIMED_METHODS:
+        setattr(saver, name, timed(name, getattr(saver, name)))
+    return timings
+
+
+def bench_backend(
+    label: str, saver: BaseCheckpointSaver, runs: int, brief: str
+) -> list[Any]:
+    """Time ``runs`` v2 runs on ``saver``; returns one table row."""
+    timings = _instrument(saver)
+    graph = build_graph_st2(checkpointer=saver)
+    with Stopwatch() as wall:
+        for _ in range(runs):
+            run_st2(graph, initial_state(brief))
+
+    checkpoint_seconds = sum(sum(samples) for samples in timings.values())
+    row: list[Any] = [label]
+    for name in _TIMED_METHODS:
+        samples = timings[name]
+        row.append(len(samples) / runs)
+        row.append(sum(samples) / len(samples) * 1000 if samples else 0.0)
+    row.append(wall.seconds / runs * 1000)
+    row.append(checkpoint_seconds / wall.seconds * 100)
+    return row
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+    brief = load_brief()
+
+    rows = [
+        bench_backend("MemorySaver", MemorySaver(), args.runs, brief),
+        bench_backend("BoundedMemorySaver", BoundedMemorySaver(), args.runs, brief),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        saver = BatchedSqliteSaver.from_path(Path(tmp) / "bench.sqlite")
+        try:
+            rows.append(bench_backend("BatchedSqliteSaver", saver, args.runs, brief))
+        finally:
+            saver.close()
+
+    headers = ["backend"]
+    for name in _TIMED_METHODS:
+        headers += [f"{name}/run", f"{name} ms"]
+    headers += ["run ms", "checkpoint %"]
+    print_table("Standard 2.0 — checkpoint cost per backend", headers, rows)
+
+
+if __name__ == "__main__":
+    main()
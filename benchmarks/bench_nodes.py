@@ -0,0 +1,117 @@
+"""
+agt_sea — Per-Node Overhead Benchmark
+
+Run with: uv run python benchmarks/bench_nodes.py [--runs 20]
+
+Streams complete Standard 1.0 and Standard 2.0 runs on the fake provider
+(``stream_mode="updates"``) and times each node from the previous update
+to its own. For agent nodes the LLM time recorded on the node's history
+entry (``AgentOutput.latency_seconds``) is subtracted, leaving the
+per-node overhead: prompt assembly, schema binding and parsing, state
+copies, the checkpoint write and LangGraph's own step bookkeeping.
+
+With the default ``FAKE_LLM_LATENCY_SECONDS=0`` the LLM column is the
+fake's own (small) generation cost.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections import defaultdict
+from typing import Any
+
+from langgraph.types import Command
+
+from agt_sea.graph.checkpointer import BoundedMemorySaver
+from agt_sea.graph.workflow_st1 import build_graph_st1
+from agt_sea.graph.workflow_st2 import build_graph_st2
+from agt_sea.models.state import AgencyState
+
+from _common import initial_state, load_brief, mean, print_table, thread_config
+
+
+def _timed_updates(
+    graph: Any,
+    payload: Any,
+    config: dict[str, Any] | None,
+    walls: dict[str, list[float]],
+) -> dict[str, Any]:
+    """Stream one invocation, attributing elapsed time to each node.
+
+    Returns the last full state the stream emitted.
+    """
+    values: dict[str, Any] = {}
+    last = time.perf_counter()
+    for mode, chunk in graph.stream(
+        payload, config=config, stream_mode=["updates", "values"]
+    ):
+        if mode == "values":
+            values = chunk
+            continue
+        now = time.perf_counter()
+        for node in chunk:
+            if node != "__interrupt__":
+                walls[node].append(now - last)
+        last = now
+    return values
+
+
+def _llm_seconds(final: dict[str, Any], llm: dict[str, list[float]]) -> None:
+    """Collect per-agent LLM time from a finished run's history."""
+    for entry in AgencyState.model_validate(final).history:
+        if entry.latency_seconds is not None:
+            llm[entry.agent.value].append(entry.latency_seconds)
+
+
+def bench_st1(runs: int, brief: str) -> list[list[Any]]:
+    """Per-node timings for ``runs`` complete Standard 1.0 runs."""
+    graph = build_graph_st1()
+    walls: dict[str, list[float]] = defaultdict(list)
+    llm: dict[str, list[float]] = defaultdict(list)
+    for _ in range(runs):
+        final = _timed_updates(graph, initial_state(brief), None, walls)
+        _llm_seconds(final, llm)
+    return _rows(walls, llm)
+
+
+def bench_st2(runs: int, brief: str) -> list[list[Any]]:
+    """Per-node timings for ``runs`` Standard 2.0 runs (territory 0 selected)."""
+    graph = build_graph_st2(checkpointer=BoundedMemorySaver())
+    walls: dict[str, list[float]] = defaultdict(list)
+    llm: dict[str, list[float]] = defaultdict(list)
+    for _ in range(runs):
+        config = thread_config()
+        _timed_updates(graph, initial_state(brief), config, walls)
+        final = _timed_updates(
+            graph, Command(resume={"action": "select", "index": 0}), config, walls
+        )
+        _llm_seconds(final, llm)
+    return _rows(walls, llm)
+
+
+def _rows(
+    walls: dict[str, list[float]], llm: dict[str, list[float]]
+) -> list[list[Any]]:
+    """One table row per node: calls, mean wall / LLM / overhead ms."""
+    rows = []
+    for node, samples in walls.items():
+        wall_ms = mean(samples) * 1000
+        llm_ms = mean(llm.get(node, [])) * 1000
+        rows.append([node, len(samples), wall_ms, llm_ms, wall_ms - llm_ms])
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+    brief = load_brief()
+
+    headers = ["node", "calls", "wall ms", "llm ms", "overhead ms"]
+    print_table("Standard 1.0 — per-node mean", headers, bench_st1(args.runs, brief))
+    print_table("Standard 2.0 — per-node mean", headers, bench_st2(args.runs, brief))
+
+
+if __name__ == "__main__":
+    main()
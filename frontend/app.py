@@ -54,6 +54,18 @@ from agt_sea.models.state import (  # noqa: E402
     Taste,
 )
 from agt_sea.config import get_llm_provider, get_model_name  # noqa: E402
+from agt_sea.prompts.loader import (  # noqa: E402
+    check_prompt_files,
+    warm_prompt_cache,
+)
+
+# Preload every prompt file once per process so the first pipeline run
+# doesn't read them from disk. cache_resource keeps Streamlit's
+# per-interaction reruns from repeating the walk.
+st.cache_resource(warm_prompt_cache)()
+# Assembled prompts are cached until a lens file changes; one stat per
+# prompt on each rerun picks up edits (hot reload in dev).
+check_prompt_files()
 
 # Initialise session state defaults so pages never hit a missing key,
 # even if the sidebar fails to render on first load.
@@ -74,7 +86,7 @@ _defaults: dict[str, object] = {
     "run_count": 0,
     # [2.0] Per-role provenance/taste + per-agent temperature. Mirrors the
     # controls inside the sidebar's "WORKFLOW_ST2 CONTROLS" expander.
-    # cd_grader_st2_temperature is on AgencyState but not sidebar-exposed
+    # cd_grader_st2_temperature is on RunConfig but not sidebar-exposed
     # — included here so setdefault calls mirror the state shape and the
     # 0.0 default round-trips into recorded run metadata.
     "creative_a_st2_provenance": Provenance.NEUTRAL,
@@ -92,8 +104,9 @@ _defaults: dict[str, object] = {
 for _key, _val in _defaults.items():
     st.session_state.setdefault(_key, _val)
 
-from components.sidebar import render_sidebar  # noqa: E402
+from components.sidebar import build_run_config, render_sidebar  # noqa: E402
 
+st.session_state.setdefault("run_config", build_run_config())
 render_sidebar()
 
 # ---------------------------------------------------------------------------
@@ -2,8 +2,10 @@
 agt_sea — Agent Output Component
 
 Displays a single agent output: metadata row (provider, model,
-timestamp) + content. For Creative Director outputs, also renders
-score, strengths, weaknesses, and direction.
+timestamp, plus call metrics — LLM time, tokens, retries, reprompts —
+and prompt-cache token counts when recorded) + content. For Creative Director outputs, also renders
+score, strengths, weaknesses, and direction. Standard 2.0 typed payloads
+are rendered to text on demand with ``render_payload()``.
 
 Used inside expanders created by render_history(), and also by
 standalone pages (Strategy, Creative) to display results.
@@ -13,7 +15,7 @@ from __future__ import annotations
 
 import streamlit as st
 
-from agt_sea.models.state import AgentOutput
+from agt_sea.models.state import AgentOutput, render_payload
 
 
 def render_agent_output(entry: AgentOutput) -> None:
@@ -29,6 +31,22 @@ def render_agent_output(entry: AgentOutput) -> None:
     col3.markdown(
         f"**Date:** {entry.timestamp.strftime('%Y-%m-%d %H:%M:%S')}"
     )
+    if entry.latency_seconds is not None:
+        extras = ""
+        if entry.transport_retries:
+            extras += f" · retries: {entry.transport_retries}"
+        if entry.validation_reprompts:
+            extras += f" · reprompts: {entry.validation_reprompts}"
+        st.caption(
+            f"llm — {entry.latency_seconds:.2f}s · "
+            f"tokens in: {entry.input_tokens} · out: {entry.output_tokens}"
+            f"{extras}"
+        )
+    if entry.cache_read_tokens or entry.cache_creation_tokens:
+        st.caption(
+            f"prompt cache — read: {entry.cache_read_tokens} tokens · "
+            f"written: {entry.cache_creation_tokens} tokens"
+        )
     st.markdown("---")
 
     # --- CD evaluation (structured output) ---
@@ -48,4 +66,4 @@ def render_agent_output(entry: AgentOutput) -> None:
 
     # --- Content (strategist / creative) ---
     else:
-        st.markdown(entry.content)
+        st.markdown(render_payload(entry))
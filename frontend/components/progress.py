@@ -13,6 +13,11 @@ Per-node render shapes:
   the same way; creative_b_st2 / cd_feedback_st2 / cd_synthesis_st2
   render compact previews (campaign title + deliverable names; first
   paragraph of the direction; score summary + comparison notes only).
+  On the concurrent-feedback graph, grade_and_feedback_st2 renders the
+  score and, when the pass was rejected, the direction summary.
+  On the parallel-concepts graph, each develop_concept_st2 branch
+  renders its territory, campaign title, score and pass count, and
+  collect_concepts_st2 names the top-scoring concept.
   The full creative brief lives in a persistent expander on the
   Workflow v2 tab; the full agent outputs land in the pipeline history
   once the run terminates.
@@ -36,6 +41,10 @@ _NODE_LABELS: dict[str, tuple[str, str]] = {
     # --- Standard 2.0 ---
     "strategist_st2": ("strategist", "writing creative brief..."),
     "creative_a_st2": ("creative a", "generating territories..."),
+    "speculate_concepts_st2": (
+        "speculative concepts",
+        "pre-developing the first territories in the background...",
+    ),
     "interrupt_territory_selection": (
         "territory selection",
         "awaiting user selection...",
@@ -43,7 +52,16 @@ _NODE_LABELS: dict[str, tuple[str, str]] = {
     "creative_b_st2": ("creative b", "developing campaign..."),
     "cd_grader_st2": ("cd grader", "scoring campaign..."),
     "cd_feedback_st2": ("cd feedback", "writing revision direction..."),
+    "grade_and_feedback_st2": (
+        "cd grader + feedback",
+        "scoring campaign and drafting direction...",
+    ),
     "cd_synthesis_st2": ("cd synthesis", "writing final recommendation..."),
+    "develop_concept_st2": (
+        "creative b + cd grader",
+        "developing and scoring a territory...",
+    ),
+    "collect_concepts_st2": ("concepts collected", "comparing branches..."),
     "finalise_failed": ("failed", "run failed."),
 }
 
@@ -79,14 +97,18 @@ def _field(obj: Any, name: str, default: Any = None) -> Any:
     return getattr(obj, name, default)
 
 
-def render_node_progress(node_name: str, node_output: dict) -> None:
+def render_node_progress(node_name: str, node_output: dict | None) -> None:
     """Render a status container for a single graph node event.
 
     Args:
         node_name: The graph node name (e.g. "strategist_st1",
             "creative_a_st2").
-        node_output: The state update dict emitted by this node.
+        node_output: The partial state update emitted by this node —
+            only the fields it changed. LangGraph streams ``None`` for
+            nodes that write nothing (``check_iterations``,
+            ``speculate_concepts_st2``).
     """
+    node_output = node_output or {}
     label, description = _NODE_LABELS.get(
         node_name, (node_name, "processing...")
     )
@@ -206,6 +228,55 @@ def render_node_progress(node_name: str, node_output: dict) -> None:
                 st.markdown(_first_paragraph(direction))
             status.update(label=f"{label} ✓", state="complete")
 
+        elif node_name == "grade_and_feedback_st2":
+            # Concurrent-feedback graph: the score, plus the direction
+            # summary only when this pass kept one (the last history
+            # entry the node wrote is CD Feedback's).
+            evaluation = node_output.get("grader_evaluation")
+            if evaluation is not None:
+                score = _field(evaluation, "score")
+                if score is not None:
+                    st.metric("score", f"{score}/100")
+            history = node_output.get("history") or []
+            direction = node_output.get("cd_feedback_direction")
+            kept = history and _field(history[-1], "agent") == "cd_feedback_st2"
+            if kept and direction:
+                st.markdown("**direction (summary):**")
+                st.markdown(_first_paragraph(direction))
+            status.update(label=f"{label} ✓", state="complete")
+
+        elif node_name == "develop_concept_st2":
+            # One event per parallel branch; each carries a single
+            # ConceptCandidate.
+            for candidate in node_output.get("concept_candidates") or []:
+                territory = _field(candidate, "territory")
+                concept = _field(candidate, "campaign_concept")
+                evaluation = _field(candidate, "grader_evaluation")
+                iterations = _field(candidate, "iterations", 0)
+                error = _field(candidate, "error")
+                st.markdown(f"**territory:** {_field(territory, 'title', '')}")
+                if concept is not None:
+                    st.markdown(f"**campaign:** {_field(concept, 'title', '')}")
+                if evaluation is not None:
+                    st.metric("score", f"{_field(evaluation, 'score')}/100")
+                if error:
+                    st.markdown(f"**failed:** {error}")
+                status.update(
+                    label=(
+                        f"{label} · {_field(territory, 'title', '')} · "
+                        f"{iterations} pass(es) ✓"
+                    ),
+                    state="complete",
+                )
+
+        elif node_name == "collect_concepts_st2":
+            concept = node_output.get("campaign_concept")
+            if concept is not None:
+                st.markdown(
+                    f"**top-scoring concept:** {_field(concept, 'title', '')}"
+                )
+            status.update(label=f"{label} ✓", state="complete")
+
         elif node_name == "cd_synthesis_st2":
             # Compact v2 preview: score summary list + comparison
             # notes only. Selected title and recommendation narrative
@@ -4,19 +4,55 @@ agt_sea — Run Metadata Component
 Renders the metrics for a pipeline run across two rows:
 Row 1: iterations, history count, status.
 Row 2: per-agent philosophies (3 for Standard 1.0, 4 for Standard 2.0).
+
+Followed by a per-node breakdown of LLM time, tokens, transport retries
+and validation reprompts, aggregated from the history entries, so the
+node that dominates a run's wall-clock is visible at a glance.
 """
 
 from __future__ import annotations
 
-from typing import Literal
+from typing import Any, Literal
 
 import streamlit as st
 
-from agt_sea.models.state import AgencyState
+from agt_sea.models.state import AgencyState, AgentOutput
 
 from components.labels import CREATIVE_PHILOSOPHY_LABELS, STRATEGIC_PHILOSOPHY_LABELS
 
 
+def summarise_node_metrics(history: list[AgentOutput]) -> list[dict[str, Any]]:
+    """Aggregate per-call metrics from ``history`` into one row per agent.
+
+    Rows keep the order in which each agent first appears. ``llm seconds``
+    sums only the entries that recorded a latency — entries from runs
+    made before timing was captured contribute tokens but no time.
+    """
+    rows: dict[str, dict[str, Any]] = {}
+    for entry in history:
+        row = rows.setdefault(
+            entry.agent.value,
+            {
+                "node": entry.agent.value,
+                "calls": 0,
+                "llm seconds": 0.0,
+                "input tokens": 0,
+                "output tokens": 0,
+                "retries": 0,
+                "reprompts": 0,
+            },
+        )
+        row["calls"] += 1
+        row["llm seconds"] += entry.latency_seconds or 0.0
+        row["input tokens"] += entry.input_tokens
+        row["output tokens"] += entry.output_tokens
+        row["retries"] += entry.transport_retries
+        row["reprompts"] += entry.validation_reprompts
+    for row in rows.values():
+        row["llm seconds"] = round(row["llm seconds"], 2)
+    return list(rows.values())
+
+
 def render_run_metadata(
     state: AgencyState,
     mode: Literal["v1", "v2"],
@@ -84,3 +120,8 @@ def render_run_metadata(
                 state.creative_director_st2_creative_philosophy, ""
             ),
         )
+
+    breakdown = summarise_node_metrics(state.history)
+    if breakdown:
+        st.markdown("**per-node breakdown**")
+        st.dataframe(breakdown, hide_index=True)
@@ -11,8 +11,8 @@ import os
 
 import streamlit as st
 
-from agt_sea.config import AVAILABLE_MODELS, get_model_name
-from agt_sea.models.state import LLMProvider
+from agt_sea.config import AVAILABLE_MODELS, get_llm_provider, get_model_name
+from agt_sea.models.state import LLMProvider, RunConfig
 
 from components.labels import (
     CREATIVE_PHILOSOPHY_LABELS,
@@ -51,17 +51,25 @@ def render_sidebar() -> None:
             creative_director_st2_provenance,
             creative_director_st2_taste,
             cd_feedback_st2_temperature, cd_synthesis_st2_temperature.
+
+        run_config — every key above (plus the non-sidebar
+        cd_grader_st2_temperature default) frozen into one ``RunConfig``,
+        rebuilt on each rerun. Pages pass it to ``AgencyState`` whole
+        instead of copying the keys one by one.
     """
     # Logo is rendered via st.logo() in app.py, above the page nav.
 
     # --- LLM Provider (only providers with a valid API key) ---
-    available_providers = [
+    # The offline fake needs no key; it is offered only when configured
+    # as the active provider (LLM_PROVIDER=fake).
+    keyless = [LLMProvider.FAKE] if get_llm_provider() == LLMProvider.FAKE else []
+    available_providers = keyless + [
         p for p in LLMProvider
-        if os.environ.get(_api_key_name(p))
+        if p != LLMProvider.FAKE and os.environ.get(_api_key_name(p))
     ]
     if not available_providers:
         st.sidebar.warning("No API keys found. Set at least one in .env")
-        available_providers = list(LLMProvider)
+        available_providers = [p for p in LLMProvider if p != LLMProvider.FAKE]
 
     selected_provider = st.sidebar.selectbox(
         "LLM PROVIDER",
@@ -267,6 +275,8 @@ def render_sidebar() -> None:
 
     st.sidebar.markdown("---")
 
+    st.session_state.run_config = build_run_config()
+
     # --- Footer ---
     st.sidebar.markdown(
         '<div class="footer-badge">SM λ ©</div>',
@@ -274,8 +284,23 @@ def render_sidebar() -> None:
     )
 
 
+def build_run_config() -> RunConfig:
+    """Freeze the current sidebar selections into a ``RunConfig``.
+
+    Reads one session key per ``RunConfig`` field; ``app.py`` seeds
+    every one of them, so the sidebar's widgets need not all have
+    rendered yet.
+    """
+    return RunConfig.model_validate(
+        {name: st.session_state[name] for name in RunConfig.model_fields}
+    )
+
+
 def _api_key_name(provider: LLMProvider) -> str:
-    """Return the environment variable name for a provider's API key."""
+    """Return the environment variable name for a provider's API key.
+
+    Not defined for ``LLMProvider.FAKE``, which needs none.
+    """
     return {
         LLMProvider.ANTHROPIC: "ANTHROPIC_API_KEY",
         LLMProvider.GOOGLE: "GOOGLE_API_KEY",
@@ -5,8 +5,8 @@ Renders the CDSynthesis — the final user-facing editorial judgement at
 the end of the Standard 2.0 pipeline — followed by the underlying
 CampaignConcept. Title and recommendation narrative up top, per-concept
 score summaries below, optional comparison notes when populated
-(`comparison_notes` is None when only one concept was developed, which
-is the simplified v2 graph's current case).
+(`comparison_notes` is None when only one concept was developed — the
+serial v2 graph; the parallel-concepts graph compares several).
 
 Pure display: accepts a CDSynthesis plus an optional CampaignConcept
 and renders them. The component does not read from or write to
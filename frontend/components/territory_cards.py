@@ -11,10 +11,17 @@ must not read from or write to `st.session_state`, so future callers
 (e.g. the Workflow page's territory-selection interrupt UI in Phase E)
 can layer selection behaviour on top without the component needing to
 know about it.
+
+``LiveTerritoryCards`` draws the same cards incrementally while Creative
+A is still writing — fed one territory at a time by the agent's
+``on_territory`` callback (Creative page) or the v2 graph's
+``stream_mode="custom"`` events (Workflow page).
 """
 
 from __future__ import annotations
 
+from typing import Any
+
 import streamlit as st
 
 from agt_sea.models.state import Territory
@@ -84,3 +91,34 @@ def render_territory_body(territory: Territory) -> None:
         unsafe_allow_html=True,
     )
     st.markdown(territory.why_it_works)
+
+
+class LiveTerritoryCards:
+    """Cards that grow as territories stream in, in one placeholder.
+
+    The streamed set is a preview: call ``clear()`` once the agent
+    returns and render the final territories from state as usual.
+    """
+
+    def __init__(self) -> None:
+        self._territories: list[Territory] = []
+        self._placeholder: Any = None
+
+    def add(self, territory: Territory) -> None:
+        """Append a territory and redraw the cards."""
+        self._territories.append(territory)
+        if self._placeholder is None:
+            self._placeholder = st.empty()
+        with self._placeholder.container():
+            st.caption(
+                f"creative a · writing... {len(self._territories)} "
+                f"{'territory' if len(self._territories) == 1 else 'territories'} so far"
+            )
+            render_territory_cards(self._territories)
+
+    def clear(self) -> None:
+        """Remove the live cards."""
+        if self._placeholder is not None:
+            self._placeholder.empty()
+            self._placeholder = None
+        self._territories = []
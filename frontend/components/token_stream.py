@@ -0,0 +1,172 @@
+"""
+agt_sea — Token Stream Component
+
+Renders LLM tokens live while a graph node is still running, so the
+workflow page shows the strategist's brief, the CD's direction and
+Creative B's campaign as they are written instead of after the node
+returns.
+
+Fed by LangGraph's ``stream_mode="messages"`` events — ``(chunk,
+metadata)`` pairs where ``chunk`` is an ``AIMessageChunk`` and
+``metadata["langgraph_node"]`` names the node whose LLM call produced it.
+Free-text agents stream their prose; structured agents (Creative B's
+``CampaignConcept``, grader scores) stream JSON — either as tool-call
+argument fragments or as raw content, depending on the provider — which
+is parsed leniently on every update and rendered as a compact preview.
+
+One placeholder per running node task (keyed on the task's checkpoint
+namespace, so parallel Creative B branches stream side by side). When
+the node's update event arrives the caller calls ``finish(node_name)``
+and the live preview gives way to the regular ``render_node_progress``
+status widget.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import streamlit as st
+from langchain_core.messages import AIMessageChunk
+from langchain_core.utils.json import parse_partial_json
+
+
+# Nodes whose LLM tokens are worth showing live, with the label used for
+# the preview. Creative A / the CD graders are left out: their output
+# is short, or rendered in full the moment the node returns.
+_STREAMED_NODES: dict[str, str] = {
+    "strategist_st1": "strategist",
+    "creative_st1": "creative",
+    "strategist_st2": "strategist",
+    "creative_b_st2": "creative b",
+    "cd_feedback_st2": "cd feedback",
+    "develop_concept_st2": "creative b + cd grader",
+}
+
+# Fields surfaced from a partially parsed structured output, in order.
+_STRUCTURED_FIELDS: tuple[tuple[str, str], ...] = (
+    ("title", "campaign"),
+    ("core_idea", "core idea"),
+    ("score", "score"),
+    ("rationale", "rationale"),
+)
+
+
+# ---------------------------------------------------------------------------
+# Pure helpers (no Streamlit) — unit-tested directly
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _TokenBuffer:
+    """Accumulated output of the current LLM call within one node task."""
+
+    message_id: str | None = None
+    text: str = ""
+    args: str = ""
+
+    def add(self, chunk: AIMessageChunk) -> None:
+        # A new message id means a new LLM call in the same task (a
+        # validation reprompt, or the next agent in a parallel branch).
+        if chunk.id is not None and chunk.id != self.message_id:
+            self.message_id = chunk.id
+            self.text = ""
+            self.args = ""
+        self.text += _chunk_text(chunk.content)
+        for tool_chunk in chunk.tool_call_chunks:
+            self.args += tool_chunk.get("args") or ""
+
+    def render(self) -> str:
+        return render_partial_output(self.text, self.args)
+
+
+def _chunk_text(content: str | list[Any]) -> str:
+    """Extract the text from a chunk's content (string or content blocks)."""
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block.get("text", "")
+        for block in content
+        if isinstance(block, dict) and block.get("type") == "text"
+    )
+
+
+def render_partial_output(text: str, args: str = "") -> str:
+    """Render the output of an in-flight LLM call as markdown.
+
+    Tool-call arguments (or content that looks like JSON) are parsed
+    leniently and shown as a structured preview — title, core idea,
+    deliverable names, score, rationale — with whatever fields have
+    arrived so far. Anything else is shown as the text itself.
+    """
+    raw = args or (text if text.lstrip().startswith("{") else "")
+    if not raw:
+        return text
+
+    parsed = parse_partial_json(raw, strict=False)
+    if not isinstance(parsed, dict):
+        return ""
+    lines: list[str] = []
+    for key, label in _STRUCTURED_FIELDS:
+        value = parsed.get(key)
+        if value not in (None, ""):
+            lines.append(f"**{label}:** {value}")
+    deliverables = parsed.get("deliverables") or []
+    names = [
+        d.get("name") for d in deliverables if isinstance(d, dict) and d.get("name")
+    ]
+    if names:
+        lines.append("**deliverables:**")
+        lines.extend(f"- {name}" for name in names)
+    return "\n\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Streamlit renderer
+# ---------------------------------------------------------------------------
+
+
+class LiveTokenStream:
+    """Render ``stream_mode="messages"`` events into live placeholders.
+
+    Redraws are throttled to one per ``min_interval`` seconds per task —
+    every redraw is a websocket round-trip, and tokens arrive far faster
+    than anyone can read them.
+    """
+
+    def __init__(self, min_interval: float = 0.1) -> None:
+        self._min_interval = min_interval
+        self._buffers: dict[str, _TokenBuffer] = {}
+        self._placeholders: dict[str, tuple[str, Any]] = {}
+        self._drawn_at: dict[str, float] = {}
+
+    def on_message(self, chunk: Any, metadata: dict[str, Any]) -> None:
+        """Handle one ``(chunk, metadata)`` pair from the messages stream."""
+        node = metadata.get("langgraph_node")
+        if node not in _STREAMED_NODES or not isinstance(chunk, AIMessageChunk):
+            return
+        key = metadata.get("langgraph_checkpoint_ns") or node
+        buffer = self._buffers.setdefault(key, _TokenBuffer())
+        buffer.add(chunk)
+
+        now = time.monotonic()
+        if now - self._drawn_at.get(key, 0.0) < self._min_interval:
+            return
+        self._drawn_at[key] = now
+
+        if key not in self._placeholders:
+            self._placeholders[key] = (node, st.empty())
+        _, placeholder = self._placeholders[key]
+        preview = buffer.render()
+        with placeholder.container(border=True):
+            st.caption(f"{_STREAMED_NODES[node]} · writing...")
+            if preview:
+                st.markdown(preview)
+
+    def finish(self, node_name: str) -> None:
+        """Clear the live previews of ``node_name`` once its update lands."""
+        for key, (node, placeholder) in list(self._placeholders.items()):
+            if node == node_name:
+                placeholder.empty()
+                del self._placeholders[key]
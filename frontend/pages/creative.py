@@ -12,22 +12,35 @@ Standalone creative page. Two tabs:
 
 Each tab maintains its own input + result in ``st.session_state`` so
 switching tabs doesn't wipe the other tab's work.
+
+Territories are drawn as they stream in: the agent runs on a worker
+thread and hands each territory to a queue that the script thread drains
+into ``LiveTerritoryCards`` (Streamlit calls must stay on the script
+thread, and sharded Creative A emits from its shard threads).
 """
 
 from __future__ import annotations
 
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
 import streamlit as st
 
 from agt_sea.agents.creative_a_st2 import run_creative_a_st2
 from agt_sea.agents.creative_st1 import run_creative_st1
 from agt_sea.graph.workflow_st1 import format_node_error
-from agt_sea.models.state import AgencyState, WorkflowStatus
+from agt_sea.models.state import (
+    AgencyState,
+    Territory,
+    WorkflowStatus,
+    render_payload,
+)
 
 from components.agent_output import render_agent_output
 from components.error_state import render_error_state
 from components.footer import render_footer
 from components.run_guard import check_run_allowed, render_run_limit_reached
-from components.territory_cards import render_territory_cards
+from components.territory_cards import LiveTerritoryCards, render_territory_cards
 
 
 # ---------------------------------------------------------------------------
@@ -43,6 +56,22 @@ tab_st2, tab_st1 = st.tabs(["territory_st2", "campaign_st1"])
 # Tab: st2_territory — Standard 2.0 territory generation
 # ---------------------------------------------------------------------------
 
+def _run_creative_a_streaming(state: AgencyState) -> AgencyState:
+    """Run creative_a_st2, drawing each territory card as it arrives."""
+    arrived: queue.Queue[Territory] = queue.Queue()
+    live = LiveTerritoryCards()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(run_creative_a_st2, state, on_territory=arrived.put)
+        while True:
+            try:
+                live.add(arrived.get(timeout=0.1))
+            except queue.Empty:
+                if future.done():
+                    break
+    live.clear()
+    return future.result()
+
+
 def _render_st2_territory() -> None:
     """Render the creative_a_st2 territory-generation tab."""
     st.markdown(
@@ -91,16 +120,11 @@ def _render_st2_territory() -> None:
         state = AgencyState(
             creative_brief=brief_text,
             num_territories=int(num_territories),
-            creative_a_st2_creative_philosophy=st.session_state.creative_a_st2_creative_philosophy,
-            creative_a_st2_provenance=st.session_state.creative_a_st2_provenance,
-            creative_a_st2_taste=st.session_state.creative_a_st2_taste,
-            creative_a_st2_temperature=st.session_state.creative_a_st2_temperature,
-            llm_provider=st.session_state.llm_provider,
-            llm_model=st.session_state.llm_model,
+            run_config=st.session_state.run_config,
         )
         try:
             with st.spinner("creative_a_st2 is generating territories..."):
-                result = run_creative_a_st2(state)
+                result = _run_creative_a_streaming(state)
         except Exception as exc:
             # Standalone pages don't go through _safe_node, so we
             # reconstruct the same state.error format here via
@@ -124,7 +148,7 @@ def _render_st2_territory() -> None:
             render_territory_cards(result.territories)
 
             if st.toggle("</> & copy", key="st2_copy_toggle"):
-                st.code(result.history[-1].content, language="markdown")
+                st.code(render_payload(result.history[-1]), language="markdown")
 
             render_footer()
 
@@ -167,10 +191,7 @@ def _render_st1_campaign() -> None:
         # Clear stale result so a failed re-run doesn't show the prior output.
         st.session_state.pop("st1_result", None)
         state = AgencyState(
-            creative_brief=brief_text,
-            creative_st1_creative_philosophy=st.session_state.creative_st1_creative_philosophy,
-            llm_provider=st.session_state.llm_provider,
-            llm_model=st.session_state.llm_model,
+            creative_brief=brief_text, run_config=st.session_state.run_config
         )
         try:
             with st.spinner("creative is generating concepts..."):
@@ -57,10 +57,7 @@ if run_button and brief_text:
     # Clear stale result so a failed re-run doesn't show the prior output.
     st.session_state.pop("strategy_result", None)
     state = AgencyState(
-        client_brief=brief_text,
-        strategist_st2_strategic_philosophy=st.session_state.strategist_st2_strategic_philosophy,
-        llm_provider=st.session_state.llm_provider,
-        llm_model=st.session_state.llm_model,
+        client_brief=brief_text, run_config=st.session_state.run_config
     )
     try:
         with st.spinner("strategist is writing the creative brief..."):
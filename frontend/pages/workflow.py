@@ -17,15 +17,19 @@ session-state keys (all prefixed ``v2_``):
   survives page switches.
 * ``v2_thread_id`` (``str | None``) — UUID generated per run; the same
   ID links the initial invoke and every resume through the v2 graph's
-  module-scope MemorySaver.
+  module-scope checkpointer.
 * ``v2_phase`` (``"idle" | "interrupted" | "terminal"``) — explicit
   three-state machine driving UI dispatch between reruns. "idle" is
   pre-run or post-reset; "interrupted" is paused at the territory
   selection interrupt; "terminal" is END-reached (APPROVED,
   MAX_ITERATIONS_REACHED, or FAILED).
+* ``v2_parallel`` (``bool``) — whether the active run was started on
+  the parallel-concepts graph (several territories developed at once).
+  Fixed per run: a thread must be resumed on the topology it started on.
 * ``v2_pending_action`` (``dict | None``) — deferred-stream queue. A
   button click sets this to ``{"kind": "initial"}`` /
-  ``{"kind": "select", "index": int}`` / ``{"kind": "rerun",
+  ``{"kind": "select", "index": int}`` / ``{"kind": "select",
+  "indices": list[int]}`` / ``{"kind": "rerun",
   "context": str | None}`` and calls ``st.rerun()``; the next script
   run pops it atomically at the top of the handler and invokes the
   corresponding stream. Popping (not get-then-clear) is deliberate:
@@ -33,9 +37,13 @@ session-state keys (all prefixed ``v2_``):
 
 Two distinct concerns coexist during streaming and must stay separate:
 
-1. **Live progress display** uses the per-node events that
-   ``stream()`` yields. Purely a UI concern — fed to
-   ``render_node_progress()`` and gone at the next rerun.
+1. **Live progress display** uses the events that ``stream()`` yields
+   with ``stream_mode=["updates", "messages"]`` (plus ``"custom"`` on
+   v2): LLM tokens feed ``LiveTokenStream`` while a node runs, Creative
+   A's territories feed ``LiveTerritoryCards`` one by one as they are
+   written, and each per-node update replaces that node's live preview
+   with ``render_node_progress()``. Purely a UI concern — gone at the
+   next rerun.
 2. **Authoritative state** is read via ``agency_graph_st2.get_state(cfg)
    .values`` after the stream loop ends, then rehydrated with
    ``AgencyState.model_validate(...)``. This is what drives the
@@ -52,7 +60,7 @@ import streamlit as st
 from langgraph.types import Command
 
 from agt_sea.graph.workflow_st1 import build_graph_st1
-from agt_sea.graph.workflow_st2 import agency_graph_st2
+from agt_sea.graph.workflow_st2 import agency_graph_st2, agency_graph_st2_parallel
 from agt_sea.models.state import AgencyState, Territory, WorkflowStatus
 
 from components.error_state import render_error_state
@@ -62,7 +70,12 @@ from components.progress import render_node_progress
 from components.run_guard import check_run_allowed, render_run_limit_reached
 from components.run_metadata import render_run_metadata
 from components.synthesis_output import render_synthesis_output
-from components.territory_cards import render_territory_body, render_territory_cards
+from components.token_stream import LiveTokenStream
+from components.territory_cards import (
+    LiveTerritoryCards,
+    render_territory_body,
+    render_territory_cards,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -91,6 +104,13 @@ def _reset_v2_session() -> None:
     st.session_state.pop("v2_selected_territory_preview", None)
 
 
+def _v2_graph():
+    """Return the compiled v2 graph the active run was started on."""
+    if st.session_state.get("v2_parallel"):
+        return agency_graph_st2_parallel
+    return agency_graph_st2
+
+
 def _v2_thread_config() -> dict:
     """Build the LangGraph thread config for the active v2 run.
 
@@ -113,7 +133,7 @@ def _v2_update_phase_from_graph() -> None:
     * anything else → treat as terminal and let the terminal UI render
       whatever ``state.status`` reports (usually FAILED).
     """
-    snap = agency_graph_st2.get_state(_v2_thread_config())
+    snap = _v2_graph().get_state(_v2_thread_config())
     if snap.next == ("interrupt_territory_selection",):
         st.session_state.v2_phase = "interrupted"
     else:
@@ -128,26 +148,7 @@ def _v2_run_initial_stream(brief_text: str) -> None:
     consult it via ``_v2_update_phase_from_graph()`` once streaming ends.
     """
     initial_state = AgencyState(
-        client_brief=brief_text,
-        strategist_st2_strategic_philosophy=st.session_state.strategist_st2_strategic_philosophy,
-        creative_a_st2_creative_philosophy=st.session_state.creative_a_st2_creative_philosophy,
-        creative_b_st2_creative_philosophy=st.session_state.creative_b_st2_creative_philosophy,
-        creative_director_st2_creative_philosophy=st.session_state.creative_director_st2_creative_philosophy,
-        creative_a_st2_provenance=st.session_state.creative_a_st2_provenance,
-        creative_a_st2_taste=st.session_state.creative_a_st2_taste,
-        creative_b_st2_provenance=st.session_state.creative_b_st2_provenance,
-        creative_b_st2_taste=st.session_state.creative_b_st2_taste,
-        creative_director_st2_provenance=st.session_state.creative_director_st2_provenance,
-        creative_director_st2_taste=st.session_state.creative_director_st2_taste,
-        creative_a_st2_temperature=st.session_state.creative_a_st2_temperature,
-        creative_b_st2_temperature=st.session_state.creative_b_st2_temperature,
-        cd_grader_st2_temperature=st.session_state.cd_grader_st2_temperature,
-        cd_feedback_st2_temperature=st.session_state.cd_feedback_st2_temperature,
-        cd_synthesis_st2_temperature=st.session_state.cd_synthesis_st2_temperature,
-        max_iterations=st.session_state.max_iterations,
-        approval_threshold=st.session_state.approval_threshold,
-        llm_provider=st.session_state.llm_provider,
-        llm_model=st.session_state.llm_model,
+        client_brief=brief_text, run_config=st.session_state.run_config
     )
     _v2_stream(initial_state)
 
@@ -160,7 +161,10 @@ def _v2_run_resume_stream(command: Command) -> None:
 def _v2_stream(stream_input) -> None:
     """Drive the stream loop shared by initial and resume calls.
 
-    Per-node events feed ``render_node_progress()`` only. The
+    Token events (``"messages"`` mode) render live in
+    ``LiveTokenStream`` while their node runs, and territory events
+    (``"custom"`` mode, emitted by Creative A) grow a set of live cards;
+    per-node update events then feed ``render_node_progress()``. The
     ``__interrupt__`` event is skipped here — the pause is detected
     post-stream via the checkpointer snapshot in
     ``_v2_update_phase_from_graph()``, which is the authoritative
@@ -172,10 +176,26 @@ def _v2_stream(stream_input) -> None:
     the streaming section.
     """
     st.markdown("### pipeline executing...")
-    for event in agency_graph_st2.stream(stream_input, config=_v2_thread_config()):
-        for node_name, node_output in event.items():
+    live = LiveTokenStream()
+    live_territories = LiveTerritoryCards()
+    for mode, payload in _v2_graph().stream(
+        stream_input,
+        config=_v2_thread_config(),
+        stream_mode=["updates", "messages", "custom"],
+    ):
+        if mode == "messages":
+            live.on_message(*payload)
+            continue
+        if mode == "custom":
+            if isinstance(payload, dict) and "territory" in payload:
+                live_territories.add(payload["territory"])
+            continue
+        for node_name, node_output in payload.items():
             if node_name == "__interrupt__":
                 continue
+            if node_name == "creative_a_st2":
+                live_territories.clear()
+            live.finish(node_name)
             render_node_progress(node_name, node_output)
 
     _v2_update_phase_from_graph()
@@ -201,7 +221,7 @@ def _render_v2_persistent_brief() -> None:
     """
     if not st.session_state.get("v2_thread_id"):
         return
-    snap = agency_graph_st2.get_state(_v2_thread_config())
+    snap = _v2_graph().get_state(_v2_thread_config())
     if not snap.values:
         return
     state = AgencyState.model_validate(snap.values)
@@ -218,18 +238,23 @@ def _render_v2_persistent_brief() -> None:
     # rerun rather than only after the resume stream completes (which
     # is typically at terminal). Checkpointer wins when both are set,
     # so the preview is only the bridge between click and resume-end.
-    selected = state.selected_territory
-    if selected is None:
-        preview = st.session_state.get("v2_selected_territory_preview")
-        if preview:
-            selected = Territory.model_validate(preview)
-
-    if selected is not None:
+    # The preview is a list of territory dumps — one entry on the serial
+    # graph, one per selection on the parallel graph.
+    selected = [
+        state.territories[index]
+        for index in state.selected_territory_indices
+        if index < len(state.territories)
+    ]
+    if not selected:
+        preview = st.session_state.get("v2_selected_territory_preview") or []
+        selected = [Territory.model_validate(dump) for dump in preview]
+
+    for territory in selected:
         with st.expander(
-            f"selected territory · {selected.title}",
+            f"selected territory · {territory.title}",
             expanded=False,
         ):
-            render_territory_body(selected)
+            render_territory_body(territory)
 
     st.markdown("---")
 
@@ -242,7 +267,7 @@ def _render_v2_territory_selection() -> None:
     a pending action and call ``st.rerun()`` so the next run starts
     clean and processes the action at the top of the handler.
     """
-    snap = agency_graph_st2.get_state(_v2_thread_config())
+    snap = _v2_graph().get_state(_v2_thread_config())
     paused_state = AgencyState.model_validate(snap.values)
 
     if paused_state.status == WorkflowStatus.FAILED:
@@ -290,11 +315,36 @@ def _render_v2_territory_selection() -> None:
                     # the stream completes (typically at terminal),
                     # which is too late — the user wants visual
                     # confirmation as soon as they click.
-                    st.session_state.v2_selected_territory_preview = (
+                    st.session_state.v2_selected_territory_preview = [
                         territory.model_dump()
-                    )
+                    ]
                     st.rerun()
 
+    if st.session_state.get("v2_parallel"):
+        st.markdown("")
+        st.markdown("### ...or develop several in parallel")
+        picked = st.multiselect(
+            "territories to develop side by side",
+            options=list(range(n)),
+            format_func=lambda i: (
+                f"{i + 1} · {paused_state.territories[i].title}"
+            ),
+            key="v2_multi_select",
+        )
+        if st.button(
+            "develop selected territories",
+            key="v2_select_many_button",
+            disabled=not picked,
+        ):
+            st.session_state.v2_pending_action = {
+                "kind": "select",
+                "indices": sorted(picked),
+            }
+            st.session_state.v2_selected_territory_preview = [
+                paused_state.territories[i].model_dump() for i in sorted(picked)
+            ]
+            st.rerun()
+
     st.markdown("")
     st.markdown("### ...or regenerate territories")
     rejection_context = st.text_input(
@@ -317,7 +367,7 @@ def _render_v2_terminal() -> None:
     rendered one below the brief expander, which is directly above
     this section.
     """
-    snap = agency_graph_st2.get_state(_v2_thread_config())
+    snap = _v2_graph().get_state(_v2_thread_config())
     final_state = AgencyState.model_validate(snap.values)
 
     if final_state.status == WorkflowStatus.FAILED:
@@ -377,6 +427,15 @@ def _render_standard_v2() -> None:
         key="v2_brief_textarea",
     )
 
+    parallel = st.toggle(
+        "develop several territories in parallel",
+        key="v2_parallel_toggle",
+        help=(
+            "Pick more than one territory at the selection step; each is "
+            "developed and graded concurrently and the CD compares them."
+        ),
+    )
+
     run_button = st.button(
         "RUN PIPELINE",
         type="primary",
@@ -391,6 +450,7 @@ def _render_standard_v2() -> None:
         _reset_v2_session()
         st.session_state.v2_brief_input = brief_text
         st.session_state.v2_thread_id = str(uuid.uuid4())
+        st.session_state.v2_parallel = parallel
         st.session_state.v2_pending_action = {"kind": "initial"}
         st.rerun()
 
@@ -412,11 +472,11 @@ def _render_standard_v2() -> None:
         if kind == "initial":
             _v2_run_initial_stream(st.session_state.v2_brief_input)
         elif kind == "select":
-            _v2_run_resume_stream(
-                Command(
-                    resume={"action": "select", "index": pending["index"]}
-                )
-            )
+            if "indices" in pending:
+                resume = {"action": "select", "indices": pending["indices"]}
+            else:
+                resume = {"action": "select", "index": pending["index"]}
+            _v2_run_resume_stream(Command(resume=resume))
         elif kind == "rerun":
             _v2_run_resume_stream(
                 Command(
@@ -434,6 +494,16 @@ def _render_standard_v2() -> None:
         st.rerun()
 
     phase = st.session_state.get("v2_phase", "idle")
+    if phase != "idle" and not _v2_graph().get_state(
+        _v2_thread_config()
+    ).values:
+        # The checkpointer no longer holds this thread — the memory
+        # backend evicts idle threads and trims to a byte budget (see
+        # graph/checkpointer.py). Reset rather than render an empty state.
+        st.info("this run has expired — run the pipeline again to start over.")
+        _reset_v2_session()
+        return
+
     if phase == "interrupted":
         _render_v2_territory_selection()
     elif phase == "terminal":
@@ -490,14 +560,7 @@ def _render_standard_v1() -> None:
         graph = build_graph_st1()
 
         initial_state = AgencyState(
-            client_brief=brief_text,
-            strategist_st1_strategic_philosophy=st.session_state.strategist_st1_strategic_philosophy,
-            creative_st1_creative_philosophy=st.session_state.creative_st1_creative_philosophy,
-            creative_director_st1_creative_philosophy=st.session_state.creative_director_st1_creative_philosophy,
-            max_iterations=st.session_state.max_iterations,
-            approval_threshold=st.session_state.approval_threshold,
-            llm_provider=st.session_state.llm_provider,
-            llm_model=st.session_state.llm_model,
+            client_brief=brief_text, run_config=st.session_state.run_config
         )
 
         progress_container = st.container()
@@ -506,20 +569,32 @@ def _render_standard_v1() -> None:
             st.markdown("---")
             st.markdown("### pipeline executing...")
 
-            # LangGraph's stream yields per-node dict updates. We
-            # accumulate them into a running dict and then rehydrate to
-            # an AgencyState at the end so downstream code can use
-            # attribute access and typed nested models.
-            accumulated: dict = {}
-
-            for event in graph.stream(initial_state):
-                for node_name, node_output in event.items():
+            # LangGraph's stream yields per-node partial updates (only
+            # the fields each node changed) for the progress display,
+            # and the full state after every step in "values" mode; the
+            # last of those is rehydrated to an AgencyState so
+            # downstream code can use attribute access and typed nested
+            # models. Token events ("messages" mode) only drive the
+            # live previews.
+            final_values: dict = {}
+            live = LiveTokenStream()
+
+            for mode, payload in graph.stream(
+                initial_state, stream_mode=["updates", "messages", "values"]
+            ):
+                if mode == "messages":
+                    live.on_message(*payload)
+                    continue
+                if mode == "values":
+                    final_values = payload
+                    continue
+                for node_name, node_output in payload.items():
+                    live.finish(node_name)
                     render_node_progress(node_name, node_output)
-                    accumulated.update(node_output)
 
-            if accumulated:
+            if final_values:
                 st.session_state.workflow_result = AgencyState.model_validate(
-                    accumulated
+                    final_values
                 )
 
         # After streaming completes, rerun once so the script restarts
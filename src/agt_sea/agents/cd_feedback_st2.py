@@ -27,10 +27,17 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from langchain_core.runnables import Runnable
 
 from agt_sea.config import get_llm_provider, get_model_name
-from agt_sea.llm.provider import get_llm
+from agt_sea.llm.provider import (
+    LLMUsageTracker,
+    apply_prompt_caching,
+    get_llm,
+    track_llm_usage,
+    with_prompt_hash,
+)
 from agt_sea.models.state import (
     AgencyState,
     AgentOutput,
@@ -38,15 +45,18 @@ from agt_sea.models.state import (
     CampaignConcept,
     CreativePhilosophy,
     GraderEvaluation,
+    LLMProvider,
     Provenance,
     Taste,
     WorkflowStatus,
+    render_campaign_concept,
 )
 from agt_sea.prompts.loader import (
     load_creative_philosophy,
     load_provenance,
     load_taste,
 )
+from agt_sea.prompts.registry import assemble_prompt
 
 
 def _build_system_prompt(
@@ -101,19 +111,6 @@ literal — push the metaphor into the unexpected, and carry it through
 the deliverables\" is direction."""
 
 
-def _render_campaign_concept(concept: CampaignConcept) -> str:
-    """Render a CampaignConcept as a readable block for the human message."""
-    deliverables = "\n".join(
-        f"- {d.name}: {d.explanation}" for d in concept.deliverables
-    )
-    return (
-        f"Title: {concept.title}\n"
-        f"Core idea: {concept.core_idea}\n"
-        f"Deliverables:\n{deliverables}\n"
-        f"Why it works: {concept.why_it_works}"
-    )
-
-
 def _build_human_message(
     creative_brief: str | None,
     campaign_concept: CampaignConcept,
@@ -136,33 +133,16 @@ def _build_human_message(
     return (
         f"Here is the creative brief:\n\n{creative_brief}\n\n"
         f"Here is the current campaign concept:\n\n"
-        f"{_render_campaign_concept(campaign_concept)}"
+        f"{render_campaign_concept(campaign_concept)}"
         f"{grader_block}\n\n"
         "Produce directional coaching for the next iteration."
     )
 
 
-def run_cd_feedback_st2(state: AgencyState) -> AgencyState:
-    """Produce directional coaching on the current campaign concept.
-
-    Reads ``state.campaign_concept`` (required), ``state.creative_brief``,
-    ``state.grader_evaluation`` (optional — rendered when present), the
-    CD injection lenses (``creative_director_st2_creative_philosophy``,
-    ``creative_director_st2_provenance``, ``creative_director_st2_taste``),
-    and ``cd_feedback_st2_temperature``.
-
-    Writes free-text coaching to ``state.cd_feedback_direction`` and
-    appends an ``AgentOutput`` to ``state.history``.
-
-    Output is free-text (``str``) rather than a structured model — the
-    direction itself is the product. Uses ``llm.invoke(...).content``
-    directly; no structured output, no validation retry.
-
-    Raises:
-        ValueError: If ``state.campaign_concept`` is None. CD Feedback
-            operates on a campaign concept — caller contract violation,
-            surfaced before any LLM call.
-    """
+def _build_call(
+    state: AgencyState,
+) -> tuple[Runnable, list[BaseMessage], LLMProvider, str]:
+    """Resolve the model and build the prompt shared by the sync and async paths."""
     if state.campaign_concept is None:
         raise ValueError(
             "run_cd_feedback_st2 requires state.campaign_concept to be set."
@@ -179,7 +159,8 @@ def run_cd_feedback_st2(state: AgencyState) -> AgencyState:
         temperature=state.cd_feedback_st2_temperature,
     )
 
-    system_prompt = _build_system_prompt(
+    system_prompt = assemble_prompt(
+        _build_system_prompt,
         philosophy=state.creative_director_st2_creative_philosophy,
         provenance=state.creative_director_st2_provenance,
         taste=state.creative_director_st2_taste,
@@ -191,24 +172,68 @@ def run_cd_feedback_st2(state: AgencyState) -> AgencyState:
     )
 
     messages = [
-        SystemMessage(content=system_prompt),
+        SystemMessage(content=system_prompt.text),
         HumanMessage(content=human_content),
     ]
 
-    response = llm.invoke(messages)
-    direction = response.content
+    messages = apply_prompt_caching(messages, provider, brief=state.creative_brief)
+    llm = with_prompt_hash(llm, system_prompt.content_hash)
+    return llm, messages, provider, model
+
 
+def _apply_result(
+    state: AgencyState,
+    direction: str,
+    provider: LLMProvider,
+    model: str,
+    usage: LLMUsageTracker,
+) -> AgencyState:
+    """Write the coaching to state and append the history entry."""
     state.cd_feedback_direction = direction
     state.status = WorkflowStatus.REVIEW
     state.history.append(
         AgentOutput(
             agent=AgentRole.CD_FEEDBACK_ST2,
-            provider=provider,
-            model=model,
             iteration=state.iteration,
             content=direction,
+            **usage.output_fields(provider, model),
             timestamp=datetime.now(UTC),
         )
     )
 
     return state
+
+
+def run_cd_feedback_st2(state: AgencyState) -> AgencyState:
+    """Produce directional coaching on the current campaign concept.
+
+    Reads ``state.campaign_concept`` (required), ``state.creative_brief``,
+    ``state.grader_evaluation`` (optional — rendered when present), the
+    CD injection lenses (``creative_director_st2_creative_philosophy``,
+    ``creative_director_st2_provenance``, ``creative_director_st2_taste``),
+    and ``cd_feedback_st2_temperature``.
+
+    Writes free-text coaching to ``state.cd_feedback_direction`` and
+    appends an ``AgentOutput`` to ``state.history``.
+
+    Output is free-text (``str``) rather than a structured model — the
+    direction itself is the product. Uses ``llm.invoke(...).content``
+    directly; no structured output, no validation retry.
+
+    Raises:
+        ValueError: If ``state.campaign_concept`` is None. CD Feedback
+            operates on a campaign concept — caller contract violation,
+            surfaced before any LLM call.
+    """
+    llm, messages, provider, model = _build_call(state)
+    with track_llm_usage() as usage:
+        response = llm.invoke(messages)
+    return _apply_result(state, response.content, provider, model, usage)
+
+
+async def arun_cd_feedback_st2(state: AgencyState) -> AgencyState:
+    """Async variant of ``run_cd_feedback_st2`` — awaits the LLM call."""
+    llm, messages, provider, model = _build_call(state)
+    with track_llm_usage() as usage:
+        response = await llm.ainvoke(messages)
+    return _apply_result(state, response.content, provider, model, usage)
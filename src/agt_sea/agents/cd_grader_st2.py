@@ -24,22 +24,30 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from langchain_core.runnables import Runnable
 
 from agt_sea.config import get_llm_provider, get_model_name
 from agt_sea.llm.provider import (
-    get_llm,
+    LLMUsageTracker,
+    ainvoke_with_validation_retry,
+    apply_prompt_caching,
+    get_structured_llm,
     invoke_with_validation_retry,
-    wrap_with_transport_retry,
+    track_llm_usage,
+    with_prompt_hash,
 )
 from agt_sea.models.state import (
     AgencyState,
     AgentOutput,
     AgentRole,
-    CampaignConcept,
     GraderEvaluation,
+    GraderEvaluationPayload,
+    LLMProvider,
     WorkflowStatus,
+    render_campaign_concept,
 )
+from agt_sea.prompts.registry import assemble_prompt
 
 
 def _build_system_prompt() -> str:
@@ -71,32 +79,10 @@ that's all the prose required. Do not offer revision direction. Do not
 praise or encourage."""
 
 
-def _render_campaign_concept(concept: CampaignConcept) -> str:
-    """Render a CampaignConcept as a readable block for the human message."""
-    deliverables = "\n".join(
-        f"- {d.name}: {d.explanation}" for d in concept.deliverables
-    )
-    return (
-        f"Title: {concept.title}\n"
-        f"Core idea: {concept.core_idea}\n"
-        f"Deliverables:\n{deliverables}\n"
-        f"Why it works: {concept.why_it_works}"
-    )
-
-
-def run_cd_grader_st2(state: AgencyState) -> AgencyState:
-    """Score the current campaign concept out of 100 against the brief.
-
-    Reads ``state.campaign_concept`` (required) and ``state.creative_brief``.
-    Writes ``state.grader_evaluation`` and appends an ``AgentOutput`` to
-    ``state.history``. Temperature comes from
-    ``state.cd_grader_st2_temperature``.
-
-    Raises:
-        ValueError: If ``state.campaign_concept`` is None. The grader has
-            nothing to score without a campaign concept — caller contract
-            violation, surfaced before any LLM call.
-    """
+def _build_call(
+    state: AgencyState,
+) -> tuple[Runnable, list[BaseMessage], LLMProvider, str]:
+    """Compose the structured runnable and prompt for both sync and async paths."""
     if state.campaign_concept is None:
         raise ValueError(
             "run_cd_grader_st2 requires state.campaign_concept to be set. "
@@ -106,47 +92,78 @@ def run_cd_grader_st2(state: AgencyState) -> AgencyState:
     provider = state.llm_provider or get_llm_provider()
     model = state.llm_model or get_model_name(provider)
 
-    # Raw chat model so we can compose .with_structured_output() before
-    # wrapping with transport retry — same pattern as Creative B and CD.
-    llm = get_llm(
+    # Cached structured runnable — same pattern as Creative B and CD.
+    structured_llm = get_structured_llm(
+        GraderEvaluation,
         provider=provider,
         model=model,
         temperature=state.cd_grader_st2_temperature,
-        with_retry=False,
-    )
-    structured_llm = wrap_with_transport_retry(
-        llm.with_structured_output(GraderEvaluation), provider
     )
 
+    system_prompt = assemble_prompt(_build_system_prompt)
     messages = [
-        SystemMessage(content=_build_system_prompt()),
+        SystemMessage(content=system_prompt.text),
         HumanMessage(
             content=(
                 f"Here is the creative brief:\n\n{state.creative_brief}\n\n"
                 f"Here is the campaign concept to score (iteration "
                 f"{state.iteration}):\n\n"
-                f"{_render_campaign_concept(state.campaign_concept)}\n\n"
+                f"{render_campaign_concept(state.campaign_concept)}\n\n"
                 "Return a score out of 100 and a short rationale."
             )
         ),
     ]
 
-    evaluation = invoke_with_validation_retry(structured_llm, messages)
+    messages = apply_prompt_caching(messages, provider, brief=state.creative_brief)
+    structured_llm = with_prompt_hash(structured_llm, system_prompt.content_hash)
+    return structured_llm, messages, provider, model
 
+
+def _apply_result(
+    state: AgencyState,
+    evaluation: GraderEvaluation,
+    provider: LLMProvider,
+    model: str,
+    usage: LLMUsageTracker,
+) -> AgencyState:
+    """Write the grade to state and append the history entry."""
     state.grader_evaluation = evaluation
     state.status = WorkflowStatus.REVIEW
     state.history.append(
         AgentOutput(
             agent=AgentRole.CD_GRADER_ST2,
-            provider=provider,
-            model=model,
             iteration=state.iteration,
-            content=(
-                f"Score: {evaluation.score}/100\n"
-                f"Rationale: {evaluation.rationale}"
-            ),
+            payload=GraderEvaluationPayload(evaluation=evaluation),
+            **usage.output_fields(provider, model),
             timestamp=datetime.now(UTC),
         )
     )
 
     return state
+
+
+def run_cd_grader_st2(state: AgencyState) -> AgencyState:
+    """Score the current campaign concept out of 100 against the brief.
+
+    Reads ``state.campaign_concept`` (required) and ``state.creative_brief``.
+    Writes ``state.grader_evaluation`` and appends an ``AgentOutput`` to
+    ``state.history``. Temperature comes from
+    ``state.cd_grader_st2_temperature``.
+
+    Raises:
+        ValueError: If ``state.campaign_concept`` is None. The grader has
+            nothing to score without a campaign concept — caller contract
+            violation, surfaced before any LLM call.
+    """
+    structured_llm, messages, provider, model = _build_call(state)
+    with track_llm_usage() as usage:
+        evaluation = invoke_with_validation_retry(structured_llm, messages)
+    return _apply_result(state, evaluation, provider, model, usage)
+
+
+async def arun_cd_grader_st2(state: AgencyState) -> AgencyState:
+    """Async variant of ``run_cd_grader_st2`` — awaits the LLM call."""
+    structured_llm, messages, provider, model = _build_call(state)
+    with track_llm_usage() as usage:
+        evaluation = await ainvoke_with_validation_retry(structured_llm, messages)
+    return _apply_result(state, evaluation, provider, model, usage)
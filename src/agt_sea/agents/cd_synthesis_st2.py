@@ -5,10 +5,10 @@ Final editorial judgement — the output the user sees at the end of the
 Standard 2.0 pipeline. The Creative Director, standing behind the work,
 presents the recommendation as a structured ``CDSynthesis``.
 
-Schema built for N concepts even though the simplified v2 graph supplies
-one. When exactly one campaign concept is passed in, ``comparison_notes``
-must be ``None`` (see ``CDSynthesis``); when multiple are passed (future
-parallel variant), the LLM should populate it.
+Schema built for N concepts. The serial v2 graph supplies one, in which
+case ``comparison_notes`` must be ``None`` (see ``CDSynthesis``); the
+parallel graph supplies one per selected territory via
+``state.concept_candidates``, and the LLM compares them.
 
 Philosophy, provenance, and taste are injected via the neutral-skip
 pattern. Temperature comes from ``state.cd_synthesis_st2_temperature``.
@@ -23,31 +23,42 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from langchain_core.runnables import Runnable
 
 from agt_sea.config import get_llm_provider, get_model_name
 from agt_sea.llm.provider import (
-    get_llm,
+    LLMUsageTracker,
+    ainvoke_with_validation_retry,
+    apply_prompt_caching,
+    get_structured_llm,
     invoke_with_validation_retry,
-    wrap_with_transport_retry,
+    track_llm_usage,
+    with_prompt_hash,
 )
 from agt_sea.models.state import (
     AgencyState,
     AgentOutput,
     AgentRole,
-    CampaignConcept,
     CDSynthesis,
+    CDSynthesisPayload,
     CreativePhilosophy,
     GraderEvaluation,
+    LLMProvider,
     Provenance,
     Taste,
+    TerritoriesPayload,
     WorkflowStatus,
+    render_campaign_concept,
+    render_grader_evaluation,
+    render_payload,
 )
 from agt_sea.prompts.loader import (
     load_creative_philosophy,
     load_provenance,
     load_taste,
 )
+from agt_sea.prompts.registry import assemble_prompt
 
 
 def _build_system_prompt(
@@ -104,24 +115,18 @@ Your tone is that of a senior creative who believes in the work. The
 recommendation should read as a presentation, not a review."""
 
 
-def _render_campaign_concept(concept: CampaignConcept) -> str:
-    """Render a CampaignConcept as a readable block for the human message."""
-    deliverables = "\n".join(
-        f"- {d.name}: {d.explanation}" for d in concept.deliverables
-    )
-    return (
-        f"Title: {concept.title}\n"
-        f"Core idea: {concept.core_idea}\n"
-        f"Deliverables:\n{deliverables}\n"
-        f"Why it works: {concept.why_it_works}"
-    )
-
-
 def _render_grader_evaluation(grader: GraderEvaluation | None) -> str:
     """Render a grader evaluation for the human message, or a placeholder."""
     if grader is None:
         return "(no grader evaluation recorded for this concept)"
-    return f"Score: {grader.score}/100\nRationale: {grader.rationale}"
+    return render_grader_evaluation(grader)
+
+
+def _render_entry(entry: AgentOutput) -> str:
+    """Render one history entry for the log — territories by title only."""
+    if isinstance(entry.payload, TerritoriesPayload):
+        return "; ".join(t.title for t in entry.payload.territories)
+    return render_payload(entry)
 
 
 def _render_history(state: AgencyState) -> str:
@@ -131,13 +136,14 @@ def _render_history(state: AgencyState) -> str:
     particularly for revision runs where the graded concept is the last
     of several. A full dump of every agent's content would be too long;
     this helper emits a one-line-per-entry summary with iteration,
-    agent, and the first ~120 characters of content.
+    agent, and the first ~120 characters of content — rendered from the
+    entry's typed payload where it has one.
     """
     if not state.history:
         return "(no history recorded)"
     lines: list[str] = []
     for entry in state.history:
-        snippet = entry.content.replace("\n", " ").strip()
+        snippet = _render_entry(entry).replace("\n", " ").strip()
         if len(snippet) > 120:
             snippet = snippet[:117] + "..."
         lines.append(
@@ -146,28 +152,53 @@ def _render_history(state: AgencyState) -> str:
     return "\n".join(lines)
 
 
-def run_cd_synthesis_st2(state: AgencyState) -> AgencyState:
-    """Produce the final editorial judgement on the campaign work.
+def _render_concepts_section(state: AgencyState) -> str:
+    """Render the concept(s) under review plus the closing instruction.
 
-    Simplified v2 graph: evaluates a single ``state.campaign_concept``
-    and ``state.grader_evaluation``. Schema and prompt support N
-    concepts for the future parallel variant — when only one is passed,
-    the system prompt instructs the LLM to leave ``comparison_notes``
-    as ``None``.
+    One concept on the serial graph; on the parallel graph every
+    ``ConceptCandidate`` is listed with its territory and grader score,
+    and the LLM is asked to compare them.
+    """
+    candidates = [
+        candidate
+        for candidate in state.concept_candidates
+        if candidate.campaign_concept is not None
+    ]
+    if len(candidates) <= 1:
+        concept_block = render_campaign_concept(state.campaign_concept)
+        grader_block = _render_grader_evaluation(state.grader_evaluation)
+        return (
+            f"Here is the finished campaign concept (one concept total):\n\n"
+            f"{concept_block}\n\n"
+            f"Grader evaluation for this concept:\n\n{grader_block}\n\n"
+            f"Iteration history:\n\n{_render_history(state)}\n\n"
+            "Produce the final CDSynthesis. Since only one concept was "
+            "developed, leave `comparison_notes` as null."
+        )
 
-    Reads ``state.campaign_concept`` (required), ``state.grader_evaluation``
-    (optional — rendered as a placeholder when absent), ``state.history``,
-    and the CD injection lenses (``creative_director_st2_creative_philosophy``,
-    ``creative_director_st2_provenance``, ``creative_director_st2_taste``).
-    Temperature from ``state.cd_synthesis_st2_temperature``.
+    blocks = [
+        f"Concept {position} (from territory \"{candidate.territory.title}\"):\n\n"
+        f"{render_campaign_concept(candidate.campaign_concept)}\n\n"
+        f"Grader evaluation:\n\n"
+        f"{_render_grader_evaluation(candidate.grader_evaluation)}"
+        for position, candidate in enumerate(candidates, start=1)
+    ]
+    concepts_block = "\n\n---\n\n".join(blocks)
+    return (
+        f"Here are the finished campaign concepts ({len(candidates)} concepts "
+        f"total), each developed in parallel from a different territory:\n\n"
+        f"{concepts_block}\n\n"
+        f"Iteration history:\n\n{_render_history(state)}\n\n"
+        "Produce the final CDSynthesis. Recommend the strongest concept, "
+        "summarise every concept in `score_summary`, and compare them in "
+        "`comparison_notes`."
+    )
 
-    Writes ``state.cd_synthesis`` and appends an ``AgentOutput`` to
-    ``state.history``.
 
-    Raises:
-        ValueError: If ``state.campaign_concept`` is None. Synthesis has
-            nothing to present without a finished campaign concept.
-    """
+def _build_call(
+    state: AgencyState,
+) -> tuple[Runnable, list[BaseMessage], LLMProvider, str]:
+    """Compose the structured runnable and prompt for both sync and async paths."""
     if state.campaign_concept is None:
         raise ValueError(
             "run_cd_synthesis_st2 requires state.campaign_concept to be set. "
@@ -178,59 +209,101 @@ def run_cd_synthesis_st2(state: AgencyState) -> AgencyState:
     provider = state.llm_provider or get_llm_provider()
     model = state.llm_model or get_model_name(provider)
 
-    # Raw chat model so we can compose .with_structured_output() before
-    # wrapping with transport retry.
-    llm = get_llm(
+    # Cached structured runnable with transport retry.
+    structured_llm = get_structured_llm(
+        CDSynthesis,
         provider=provider,
         model=model,
         temperature=state.cd_synthesis_st2_temperature,
-        with_retry=False,
-    )
-    structured_llm = wrap_with_transport_retry(
-        llm.with_structured_output(CDSynthesis), provider
     )
 
-    system_prompt = _build_system_prompt(
+    system_prompt = assemble_prompt(
+        _build_system_prompt,
         philosophy=state.creative_director_st2_creative_philosophy,
         provenance=state.creative_director_st2_provenance,
         taste=state.creative_director_st2_taste,
     )
 
-    concept_block = _render_campaign_concept(state.campaign_concept)
-    grader_block = _render_grader_evaluation(state.grader_evaluation)
-    history_block = _render_history(state)
-
     human_content = (
         f"Here is the creative brief:\n\n{state.creative_brief}\n\n"
-        f"Here is the finished campaign concept (one concept total):\n\n"
-        f"{concept_block}\n\n"
-        f"Grader evaluation for this concept:\n\n{grader_block}\n\n"
-        f"Iteration history:\n\n{history_block}\n\n"
-        "Produce the final CDSynthesis. Since only one concept was "
-        "developed, leave `comparison_notes` as null."
+        f"{_render_concepts_section(state)}"
     )
 
     messages = [
-        SystemMessage(content=system_prompt),
+        SystemMessage(content=system_prompt.text),
         HumanMessage(content=human_content),
     ]
 
-    synthesis = invoke_with_validation_retry(structured_llm, messages)
+    messages = apply_prompt_caching(messages, provider, brief=state.creative_brief)
+    structured_llm = with_prompt_hash(structured_llm, system_prompt.content_hash)
+    return structured_llm, messages, provider, model
+
 
+def _apply_result(
+    state: AgencyState,
+    synthesis: CDSynthesis,
+    provider: LLMProvider,
+    model: str,
+    usage: LLMUsageTracker,
+) -> AgencyState:
+    """Write the synthesis to state and append the history entry.
+
+    With several concepts on state, ``campaign_concept`` and
+    ``grader_evaluation`` are pointed at the one the CD recommended, so
+    the approval routing and the final render follow the recommendation.
+    """
     state.cd_synthesis = synthesis
+    for candidate in state.concept_candidates:
+        concept = candidate.campaign_concept
+        if concept is not None and concept.title == synthesis.selected_title:
+            state.selected_territory = candidate.territory
+            state.campaign_concept = concept
+            state.grader_evaluation = candidate.grader_evaluation
+            break
     state.status = WorkflowStatus.REVIEW
     state.history.append(
         AgentOutput(
             agent=AgentRole.CD_SYNTHESIS_ST2,
-            provider=provider,
-            model=model,
             iteration=state.iteration,
-            content=(
-                f"Recommendation: {synthesis.selected_title}\n\n"
-                f"{synthesis.recommendation}"
-            ),
+            payload=CDSynthesisPayload(synthesis=synthesis),
+            **usage.output_fields(provider, model),
             timestamp=datetime.now(UTC),
         )
     )
 
     return state
+
+
+def run_cd_synthesis_st2(state: AgencyState) -> AgencyState:
+    """Produce the final editorial judgement on the campaign work.
+
+    Serial v2 graph: evaluates a single ``state.campaign_concept`` and
+    ``state.grader_evaluation`` — the system prompt instructs the LLM to
+    leave ``comparison_notes`` as ``None``. Parallel graph: evaluates
+    every entry in ``state.concept_candidates`` and compares them.
+
+    Reads ``state.campaign_concept`` (required), ``state.grader_evaluation``
+    (optional — rendered as a placeholder when absent), ``state.history``,
+    and the CD injection lenses (``creative_director_st2_creative_philosophy``,
+    ``creative_director_st2_provenance``, ``creative_director_st2_taste``).
+    Temperature from ``state.cd_synthesis_st2_temperature``.
+
+    Writes ``state.cd_synthesis`` and appends an ``AgentOutput`` to
+    ``state.history``.
+
+    Raises:
+        ValueError: If ``state.campaign_concept`` is None. Synthesis has
+            nothing to present without a finished campaign concept.
+    """
+    structured_llm, messages, provider, model = _build_call(state)
+    with track_llm_usage() as usage:
+        synthesis = invoke_with_validation_retry(structured_llm, messages)
+    return _apply_result(state, synthesis, provider, model, usage)
+
+
+async def arun_cd_synthesis_st2(state: AgencyState) -> AgencyState:
+    """Async variant of ``run_cd_synthesis_st2`` — awaits the LLM call."""
+    structured_llm, messages, provider, model = _build_call(state)
+    with track_llm_usage() as usage:
+        synthesis = await ainvoke_with_validation_retry(structured_llm, messages)
+    return _apply_result(state, synthesis, provider, model, usage)
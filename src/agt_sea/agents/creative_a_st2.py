@@ -13,28 +13,65 @@ aliases such as ``list[Territory]`` (raises ``ValueError: callable
 list[...] is not supported by signature`` at composition time). The
 wrapper is an implementation detail of this agent, not part of the
 shared state contract, so it lives here rather than in ``models/state.py``.
+
+With ``CREATIVE_A_SHARD_SIZE`` set, a large request is sharded: split
+into concurrent calls of at most that many territories, each steered
+towards a different creative direction, then merged with near-duplicate
+detection (see "Sharded generation" below).
+
+Territories can also be consumed as they are written: the structured
+call is streamed and each ``Territory`` is handed to ``on_territory`` —
+or, inside a graph, to LangGraph's ``stream_mode="custom"`` writer — as
+soon as its JSON object closes (see "Territory streaming" below).
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
+import logging
+import math
+import re
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import (
+    AIMessageChunk,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+)
+from langchain_core.runnables import Runnable
+from langchain_core.runnables.config import ContextThreadPoolExecutor
+from langchain_core.tracers.context import register_configure_hook
+from langgraph.config import get_stream_writer
+from pydantic import BaseModel, Field, ValidationError
 
-from langchain_core.messages import HumanMessage, SystemMessage
-from pydantic import BaseModel, Field
-
-from agt_sea.config import get_llm_provider, get_model_name
+from agt_sea.config import CREATIVE_A_SHARD_SIZE, get_llm_provider, get_model_name
 from agt_sea.llm.provider import (
-    get_llm,
+    LLMUsageTracker,
+    ainvoke_with_validation_retry,
+    apply_prompt_caching,
+    get_structured_llm,
     invoke_with_validation_retry,
-    wrap_with_transport_retry,
+    track_llm_usage,
+    with_prompt_hash,
 )
 from agt_sea.models.state import (
     AgencyState,
     AgentOutput,
     AgentRole,
     CreativePhilosophy,
+    LLMProvider,
     Provenance,
     Taste,
+    TerritoriesPayload,
     Territory,
     WorkflowStatus,
 )
@@ -43,6 +80,9 @@ from agt_sea.prompts.loader import (
     load_provenance,
     load_taste,
 )
+from agt_sea.prompts.registry import assemble_prompt
+
+logger = logging.getLogger(__name__)
 
 
 class TerritorySet(BaseModel):
@@ -123,6 +163,7 @@ def _build_human_message(
     creative_brief: str,
     num_territories: int,
     rejection_context: str | None,
+    shard_context: str | None = None,
 ) -> str:
     """Build the Creative A human message.
 
@@ -131,6 +172,7 @@ def _build_human_message(
     when ``None`` the message reads exactly as the no-rejection path.
     Rejection context is run-specific steering rather than a persistent
     lens, so it lives in the human turn rather than the system prompt.
+    ``shard_context`` follows the same rule — set only for sharded calls.
     """
     rejection_paragraph = ""
     if rejection_context:
@@ -140,97 +182,490 @@ def _build_human_message(
             "Avoid that direction and produce genuinely different territories."
         )
 
+    shard_paragraph = f"\n\n{shard_context}" if shard_context else ""
+
     return (
         f"Here is the creative brief:\n\n{creative_brief}\n\n"
         f"Please produce {num_territories} distinct creative territories."
-        f"{rejection_paragraph}"
+        f"{rejection_paragraph}{shard_paragraph}"
     )
 
 
-def run_creative_a_st2(state: AgencyState) -> AgencyState:
-    """Generate ``state.num_territories`` creative territories from the brief.
-
-    Reads the creative brief plus the Creative A prompt-injection lenses
-    (creative_a_st2_creative_philosophy, creative_a_st2_provenance,
-    creative_a_st2_taste), the per-agent temperature
-    (creative_a_st2_temperature), the territory count
-    (num_territories), and the optional rerun feedback
-    (territory_rejection_context). Writes the generated territories to
-    ``state.territories`` and appends an ``AgentOutput`` to
-    ``state.history``.
-
-    Structured output: the underlying LLM call uses
-    ``with_structured_output(TerritorySet)``; the returned wrapper is
-    unwrapped to ``list[Territory]`` before writing to state.
+def _build_call(
+    state: AgencyState,
+    num_territories: int | None = None,
+    shard_context: str | None = None,
+) -> tuple[Runnable, list[BaseMessage], LLMProvider, str]:
+    """Compose the structured runnable and prompt for both sync and async paths.
 
-    Args:
-        state: The current agency state containing the creative brief
-            and Creative A configuration.
-
-    Returns:
-        Updated state with populated ``territories`` and a new history
-        entry.
+    ``num_territories`` and ``shard_context`` override the count and add
+    the direction steering for one shard of a sharded call.
     """
     provider = state.llm_provider or get_llm_provider()
     model = state.llm_model or get_model_name(provider)
+    num_territories = num_territories or state.num_territories
 
-    # Fetch the raw chat model so we can compose .with_structured_output()
-    # on a BaseChatModel (the retry wrapper's RunnableRetry does not
-    # expose that method). Wrap the composed runnable with transport
-    # retries manually — same pattern as the Creative Director (ADR 0012).
-    llm = get_llm(
+    # Composed structured-output runnable, cached per schema — same
+    # retry layering as the Creative Director (ADR 0012).
+    structured_llm = get_structured_llm(
+        TerritorySet,
         provider=provider,
         model=model,
         temperature=state.creative_a_st2_temperature,
-        with_retry=False,
-    )
-    structured_llm = wrap_with_transport_retry(
-        llm.with_structured_output(TerritorySet), provider
     )
 
-    system_prompt = _build_system_prompt(
+    system_prompt = assemble_prompt(
+        _build_system_prompt,
         philosophy=state.creative_a_st2_creative_philosophy,
         provenance=state.creative_a_st2_provenance,
         taste=state.creative_a_st2_taste,
-        num_territories=state.num_territories,
+        num_territories=num_territories,
     )
     human_content = _build_human_message(
         creative_brief=state.creative_brief or "",
-        num_territories=state.num_territories,
+        num_territories=num_territories,
         rejection_context=state.territory_rejection_context,
+        shard_context=shard_context,
     )
 
     messages = [
-        SystemMessage(content=system_prompt),
+        SystemMessage(content=system_prompt.text),
         HumanMessage(content=human_content),
     ]
 
-    result = invoke_with_validation_retry(structured_llm, messages)
-    territories = result.territories
+    messages = apply_prompt_caching(messages, provider, brief=state.creative_brief)
+    structured_llm = with_prompt_hash(structured_llm, system_prompt.content_hash)
+    return structured_llm, messages, provider, model
+
+
+# ---------------------------------------------------------------------------
+# Sharded generation
+# ---------------------------------------------------------------------------
+#
+# One structured call for twelve territories is slow — output length, and
+# so latency, grows with the count — and a single validation failure
+# reprompts for the whole set. Sharding splits the count into concurrent
+# calls of at most CREATIVE_A_SHARD_SIZE territories. Each shard is told
+# which direction it owns and which the others are covering, so the
+# shards don't converge on the same obvious idea; the merge then drops
+# near-duplicates that slip through and, if that leaves the set short,
+# makes a top-up call that is shown the surviving titles. A top-up can
+# echo what exists too, so it is retried up to _MAX_TOP_UPS times; a set
+# still short after that is returned short, with a warning. Every shard
+# goes through invoke_with_validation_retry() on its own, so a malformed
+# response reprompts only that shard.
+
+_SHARD_DIRECTIONS = (
+    "the audience's emotional truth — feelings, relationships, identity",
+    "the product itself — what it does, how it's made, its quirks",
+    "culture and the moment — tensions, trends and conversations to join "
+    "or provoke",
+    "brand behaviour — something the brand does rather than says",
+    "play and surprise — humour, absurdity, formats nobody expects",
+    "the enemy — what the category gets wrong, and taking a stand against it",
+)
+
+# Token-set overlap (title + core idea) at or above which two territories
+# count as the same idea.
+_DUPLICATE_SIMILARITY = 0.6
+
+_WORD = re.compile(r"[a-z0-9']+")
+
+# Top-up calls made before a short merge is accepted as it is.
+_MAX_TOP_UPS = 2
 
-    # Plain-text rendering for the history entry so AgentOutput.content
-    # stays consistent with other agents (all store a single string).
-    # The typed territories remain on state.territories for programmatic
-    # access.
-    content_lines: list[str] = []
-    for idx, territory in enumerate(territories, start=1):
-        content_lines.append(f"Territory {idx}: {territory.title}")
-        content_lines.append(f"Core idea: {territory.core_idea}")
-        content_lines.append(f"Why it works: {territory.why_it_works}")
-        content_lines.append("")
-    content = "\n".join(content_lines).rstrip()
+
+def _shard_sizes(num_territories: int, shard_size: int) -> list[int]:
+    """Split ``num_territories`` into near-equal shards of at most ``shard_size``."""
+    shards = math.ceil(num_territories / shard_size)
+    base, extra = divmod(num_territories, shards)
+    return [base + (1 if i < extra else 0) for i in range(shards)]
+
+
+def _shard_context(index: int, shards: int) -> str:
+    """The direction steering for shard ``index`` of ``shards``."""
+    directions = [
+        _SHARD_DIRECTIONS[i % len(_SHARD_DIRECTIONS)] for i in range(shards)
+    ]
+    others = "; ".join(d for i, d in enumerate(directions) if i != index)
+    return (
+        f"You are one of {shards} creatives working on this brief in parallel. "
+        f"Build your territories from this direction: {directions[index]}. "
+        f"The others are covering: {others}. Stay clear of their ground."
+    )
+
+
+def _top_up_context(existing: list[Territory]) -> str:
+    """Steering for the top-up call: don't echo what already exists."""
+    titles = "; ".join(t.title for t in existing)
+    return (
+        f"These territories already exist: {titles}. Do not repeat or "
+        "echo them — find directions none of them touch."
+    )
+
+
+def _idea_words(territory: Territory) -> frozenset[str]:
+    return frozenset(_WORD.findall(f"{territory.title} {territory.core_idea}".lower()))
+
+
+def _is_near_duplicate(a: Territory, b: Territory) -> bool:
+    """Same title (ignoring case / punctuation) or heavily overlapping idea."""
+    if _WORD.findall(a.title.lower()) == _WORD.findall(b.title.lower()):
+        return True
+    words_a, words_b = _idea_words(a), _idea_words(b)
+    if not words_a or not words_b:
+        return False
+    overlap = len(words_a & words_b) / len(words_a | words_b)
+    return overlap >= _DUPLICATE_SIMILARITY
+
+
+def _merge_territories(batches: list[list[Territory]]) -> list[Territory]:
+    """Concatenate shard results in order, dropping near-duplicates."""
+    merged: list[Territory] = []
+    for batch in batches:
+        for territory in batch:
+            if not any(_is_near_duplicate(territory, kept) for kept in merged):
+                merged.append(territory)
+    return merged
+
+
+def _shard_calls(
+    state: AgencyState, shard_size: int
+) -> list[tuple[Runnable, list[BaseMessage]]]:
+    """One (runnable, messages) pair per shard."""
+    sizes = _shard_sizes(state.num_territories, shard_size)
+    calls = []
+    for index, size in enumerate(sizes):
+        structured_llm, messages, _, _ = _build_call(
+            state, size, _shard_context(index, len(sizes))
+        )
+        calls.append((structured_llm, messages))
+    return calls
+
+
+def _top_up_call(
+    state: AgencyState, merged: list[Territory]
+) -> tuple[Runnable, list[BaseMessage]] | None:
+    """The top-up call when the merge came up short, else None."""
+    missing = state.num_territories - len(merged)
+    if missing <= 0:
+        return None
+    structured_llm, messages, _, _ = _build_call(
+        state, missing, _top_up_context(merged)
+    )
+    return structured_llm, messages
+
+
+def _finish_merge(state: AgencyState, merged: list[Territory]) -> TerritorySet:
+    """Trim the merged set to the requested count, warning if it is short."""
+    shortfall = state.num_territories - len(merged)
+    if shortfall > 0:
+        logger.warning(
+            "Creative A returned %d of %d territories: still %d short after "
+            "%d top-up calls",
+            len(merged),
+            state.num_territories,
+            shortfall,
+            _MAX_TOP_UPS,
+        )
+    return TerritorySet(territories=merged[: state.num_territories])
+
+
+def _generate_sharded(state: AgencyState, shard_size: int) -> TerritorySet:
+    """Sync sharded generation — shards run on worker threads."""
+    calls = _shard_calls(state, shard_size)
+    # ContextThreadPoolExecutor carries the usage tracker into each shard.
+    with ContextThreadPoolExecutor(max_workers=len(calls)) as pool:
+        results = list(
+            pool.map(lambda call: invoke_with_validation_retry(*call), calls)
+        )
+    merged = _merge_territories([r.territories for r in results])
+    for _ in range(_MAX_TOP_UPS):
+        top_up = _top_up_call(state, merged)
+        if top_up is None:
+            break
+        extra = invoke_with_validation_retry(*top_up)
+        merged = _merge_territories([merged, extra.territories])
+    return _finish_merge(state, merged)
+
+
+async def _agenerate_sharded(state: AgencyState, shard_size: int) -> TerritorySet:
+    """Async sharded generation — shards are gathered on the event loop."""
+    calls = _shard_calls(state, shard_size)
+    results = await asyncio.gather(
+        *(ainvoke_with_validation_retry(*call) for call in calls)
+    )
+    merged = _merge_territories([r.territories for r in results])
+    for _ in range(_MAX_TOP_UPS):
+        top_up = _top_up_call(state, merged)
+        if top_up is None:
+            break
+        extra = await ainvoke_with_validation_retry(*top_up)
+        merged = _merge_territories([merged, extra.territories])
+    return _finish_merge(state, merged)
+
+
+def _sharded(state: AgencyState, shard_size: int) -> bool:
+    return 0 < shard_size < state.num_territories
+
+
+# ---------------------------------------------------------------------------
+# Territory streaming
+# ---------------------------------------------------------------------------
+#
+# A TerritorySet arrives as one JSON document, but its territories are
+# independent: each can be shown the moment its object closes. While a
+# sink is active, a callback handler registered as a configure hook (the
+# track_llm_usage mechanism) rides on every chat-model call; because it
+# is a streaming handler, LangChain switches those calls to the
+# provider's streaming API, and each chunk — tool-call argument
+# fragments or raw JSON content, depending on the provider — is fed to a
+# TerritoryStreamParser per call. Shards stream side by side.
+#
+# Streamed territories are a preview. A validation reprompt or the shard
+# merge can replace or drop some, and a cached response doesn't stream
+# at all; after the call, any final territory not already streamed is
+# emitted, so every territory on state reaches the sink once.
+
+TerritorySink = Callable[[Territory], None]
+
+
+class TerritoryStreamParser:
+    """Finds each territory in a streamed ``TerritorySet`` as its object closes.
+
+    Feed it JSON fragments in order; ``feed()`` returns the territories
+    completed by that fragment. It tracks nesting and strings only — the
+    document is ``{"territories": [{...}, ...]}``, so a territory is an
+    object closing at depth three. An object that does not validate as a
+    ``Territory`` is skipped.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._start: int | None = None
+
+    def feed(self, fragment: str) -> list[Territory]:
+        completed: list[Territory] = []
+        offset = len(self._buffer)
+        self._buffer += fragment
+        for index, char in enumerate(fragment, start=offset):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+                if char == "{" and self._depth == 3:
+                    self._start = index
+            elif char in "}]":
+                if char == "}" and self._depth == 3 and self._start is not None:
+                    territory = self._parse(self._buffer[self._start : index + 1])
+                    if territory is not None:
+                        completed.append(territory)
+                    self._start = None
+                self._depth -= 1
+        return completed
+
+    @staticmethod
+    def _parse(raw: str) -> Territory | None:
+        try:
+            return Territory.model_validate(json.loads(raw))
+        except (json.JSONDecodeError, ValidationError):
+            return None
+
+
+class _TerritoryStreamHandler(BaseCallbackHandler):
+    """Feeds streamed tokens to one parser per LLM call and emits territories.
+
+    ``tap_output_iter`` / ``tap_output_aiter`` make this a LangChain
+    streaming handler, which is what switches ``invoke()`` to streaming.
+    """
+
+    run_inline = True
+
+    def __init__(self, sink: TerritorySink) -> None:
+        super().__init__()
+        self._sink = sink
+        self._lock = threading.Lock()
+        self._parsers: dict[UUID, TerritoryStreamParser] = {}
+        self.emitted: list[Territory] = []
+
+    def tap_output_iter(self, run_id: UUID, output: Iterator[Any]) -> Iterator[Any]:
+        return output
+
+    def tap_output_aiter(self, run_id: UUID, output: Any) -> Any:
+        return output
+
+    def on_llm_new_token(
+        self, token: str, *, chunk: Any = None, run_id: UUID, **kwargs: Any
+    ) -> None:
+        message = getattr(chunk, "message", None)
+        fragment = token if isinstance(token, str) else ""
+        if isinstance(message, AIMessageChunk) and message.tool_call_chunks:
+            fragment = "".join(c.get("args") or "" for c in message.tool_call_chunks)
+        if not fragment:
+            return
+        with self._lock:
+            parser = self._parsers.setdefault(run_id, TerritoryStreamParser())
+            territories = parser.feed(fragment)
+        for territory in territories:
+            self.emit(territory)
+
+    def on_llm_end(self, response: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            self._parsers.pop(run_id, None)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            self._parsers.pop(run_id, None)
+
+    def emit(self, territory: Territory) -> None:
+        with self._lock:
+            self.emitted.append(territory)
+        self._sink(territory)
+
+    def emit_remaining(self, territories: list[Territory]) -> None:
+        for territory in territories:
+            if territory not in self.emitted:
+                self.emit(territory)
+
+
+_TERRITORY_STREAM: ContextVar[_TerritoryStreamHandler | None] = ContextVar(
+    "agt_sea_territory_stream", default=None
+)
+register_configure_hook(_TERRITORY_STREAM, inheritable=True)
+
+
+def _territory_sink(on_territory: TerritorySink | None) -> TerritorySink | None:
+    """``on_territory``, else the graph's custom stream writer, else None."""
+    if on_territory is not None:
+        return on_territory
+    try:
+        writer = get_stream_writer()
+    except RuntimeError:  # not running inside a graph
+        return None
+    return lambda territory: writer({"territory": territory})
+
+
+@contextmanager
+def _streaming_territories(
+    on_territory: TerritorySink | None,
+) -> Iterator[_TerritoryStreamHandler | None]:
+    """Stream the territories of every call in the block to the sink."""
+    sink = _territory_sink(on_territory)
+    if sink is None:
+        yield None
+        return
+    handler = _TerritoryStreamHandler(sink)
+    token = _TERRITORY_STREAM.set(handler)
+    try:
+        yield handler
+    finally:
+        _TERRITORY_STREAM.reset(token)
+
+
+# ---------------------------------------------------------------------------
+# Agent
+# ---------------------------------------------------------------------------
+
+
+def _apply_result(
+    state: AgencyState,
+    result: TerritorySet,
+    provider: LLMProvider,
+    model: str,
+    usage: LLMUsageTracker,
+) -> AgencyState:
+    """Write the unwrapped territories to state and append history."""
+    territories = result.territories
 
     state.territories = territories
     state.status = WorkflowStatus.IN_PROGRESS
     state.history.append(
         AgentOutput(
             agent=AgentRole.CREATIVE_A_ST2,
-            provider=provider,
-            model=model,
             iteration=state.iteration,
-            content=content,
+            # Typed, not pre-rendered: display text is built on demand.
+            payload=TerritoriesPayload(territories=territories),
+            **usage.output_fields(provider, model),
             timestamp=datetime.now(UTC),
         )
     )
 
     return state
+
+
+def run_creative_a_st2(
+    state: AgencyState,
+    shard_size: int = CREATIVE_A_SHARD_SIZE,
+    on_territory: TerritorySink | None = None,
+) -> AgencyState:
+    """Generate ``state.num_territories`` creative territories from the brief.
+
+    Reads the creative brief plus the Creative A prompt-injection lenses
+    (creative_a_st2_creative_philosophy, creative_a_st2_provenance,
+    creative_a_st2_taste), the per-agent temperature
+    (creative_a_st2_temperature), the territory count
+    (num_territories), and the optional rerun feedback
+    (territory_rejection_context). Writes the generated territories to
+    ``state.territories`` and appends an ``AgentOutput`` to
+    ``state.history``.
+
+    Structured output: the underlying LLM call uses
+    ``with_structured_output(TerritorySet)``; the returned wrapper is
+    unwrapped to ``list[Territory]`` before writing to state.
+
+    When ``shard_size`` (default ``CREATIVE_A_SHARD_SIZE``) is set and
+    smaller than ``num_territories``, the territories come from
+    concurrent shard calls merged into one set; the history entry then
+    sums the usage of every shard.
+
+    Each territory is also handed to ``on_territory`` as soon as it has
+    been written (streamed territories are a preview — see "Territory
+    streaming"). Without a callback, a run inside a graph emits
+    ``{"territory": Territory}`` on the ``stream_mode="custom"`` stream.
+
+    Args:
+        state: The current agency state containing the creative brief
+            and Creative A configuration.
+        shard_size: Most territories per call; 0 makes a single call.
+        on_territory: Called with each territory as it arrives.
+
+    Returns:
+        Updated state with populated ``territories`` and a new history
+        entry.
+    """
+    structured_llm, messages, provider, model = _build_call(state)
+    with track_llm_usage() as usage, _streaming_territories(on_territory) as stream:
+        if _sharded(state, shard_size):
+            result = _generate_sharded(state, shard_size)
+        else:
+            result = invoke_with_validation_retry(structured_llm, messages)
+    if stream is not None:
+        stream.emit_remaining(result.territories)
+    return _apply_result(state, result, provider, model, usage)
+
+
+async def arun_creative_a_st2(
+    state: AgencyState,
+    shard_size: int = CREATIVE_A_SHARD_SIZE,
+    on_territory: TerritorySink | None = None,
+) -> AgencyState:
+    """Async variant of ``run_creative_a_st2`` — awaits the LLM call."""
+    structured_llm, messages, provider, model = _build_call(state)
+    with track_llm_usage() as usage, _streaming_territories(on_territory) as stream:
+        if _sharded(state, shard_size):
+            result = await _agenerate_sharded(state, shard_size)
+        else:
+            result = await ainvoke_with_validation_retry(structured_llm, messages)
+    if stream is not None:
+        stream.emit_remaining(result.territories)
+    return _apply_result(state, result, provider, model, usage)
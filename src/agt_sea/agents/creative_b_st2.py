@@ -21,30 +21,39 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from langchain_core.runnables import Runnable
 
 from agt_sea.config import get_llm_provider, get_model_name
 from agt_sea.llm.provider import (
-    get_llm,
+    LLMUsageTracker,
+    ainvoke_with_validation_retry,
+    apply_prompt_caching,
+    get_structured_llm,
     invoke_with_validation_retry,
-    wrap_with_transport_retry,
+    track_llm_usage,
+    with_prompt_hash,
 )
 from agt_sea.models.state import (
     AgencyState,
     AgentOutput,
     AgentRole,
     CampaignConcept,
+    CampaignConceptPayload,
     CreativePhilosophy,
+    LLMProvider,
     Provenance,
     Taste,
     Territory,
     WorkflowStatus,
+    render_campaign_concept,
 )
 from agt_sea.prompts.loader import (
     load_creative_philosophy,
     load_provenance,
     load_taste,
 )
+from agt_sea.prompts.registry import assemble_prompt
 
 
 def _build_system_prompt(
@@ -159,43 +168,10 @@ def _render_territory(territory: Territory) -> str:
     )
 
 
-def _render_campaign_concept(concept: CampaignConcept) -> str:
-    """Render a CampaignConcept as a readable block for the human message."""
-    deliverables = "\n".join(
-        f"- {d.name}: {d.explanation}" for d in concept.deliverables
-    )
-    return (
-        f"Title: {concept.title}\n"
-        f"Core idea: {concept.core_idea}\n"
-        f"Deliverables:\n{deliverables}\n"
-        f"Why it works: {concept.why_it_works}"
-    )
-
-
-def run_creative_b_st2(state: AgencyState) -> AgencyState:
-    """Develop the selected territory into a full campaign concept.
-
-    On the initial pass, works from the creative brief plus the selected
-    territory alone. On revision passes (``grader_evaluation`` and
-    ``cd_feedback_direction`` both populated), incorporates the grader's
-    score and the CD's coaching.
-
-    Reads ``state.selected_territory`` (required), ``state.creative_brief``,
-    the Creative B injection lenses (``creative_b_st2_creative_philosophy``,
-    ``creative_b_st2_provenance``, ``creative_b_st2_taste``), the per-agent
-    temperature (``creative_b_st2_temperature``), and the optional revision
-    inputs (``grader_evaluation``, ``cd_feedback_direction``,
-    ``campaign_concept``).
-
-    Writes ``state.campaign_concept`` and appends an ``AgentOutput`` to
-    ``state.history``.
-
-    Raises:
-        ValueError: If ``state.selected_territory`` is None. Creative B
-            cannot run without a territory to develop — this is a caller
-            contract violation, not a recoverable runtime condition, so
-            it short-circuits with a clear error before any LLM call.
-    """
+def _build_call(
+    state: AgencyState,
+) -> tuple[Runnable, list[BaseMessage], LLMProvider, str]:
+    """Compose the structured runnable and prompt for both sync and async paths."""
     if state.selected_territory is None:
         raise ValueError(
             "run_creative_b_st2 requires state.selected_territory to be set. "
@@ -206,16 +182,12 @@ def run_creative_b_st2(state: AgencyState) -> AgencyState:
     provider = state.llm_provider or get_llm_provider()
     model = state.llm_model or get_model_name(provider)
 
-    # Raw chat model so we can compose .with_structured_output() before
-    # wrapping with transport retry — same pattern as Creative A / CD.
-    llm = get_llm(
+    # Cached structured runnable — same pattern as Creative A / CD.
+    structured_llm = get_structured_llm(
+        CampaignConcept,
         provider=provider,
         model=model,
         temperature=state.creative_b_st2_temperature,
-        with_retry=False,
-    )
-    structured_llm = wrap_with_transport_retry(
-        llm.with_structured_output(CampaignConcept), provider
     )
 
     is_revision = (
@@ -224,13 +196,14 @@ def run_creative_b_st2(state: AgencyState) -> AgencyState:
     )
 
     if is_revision:
-        system_prompt = _build_revision_prompt(
+        system_prompt = assemble_prompt(
+            _build_revision_prompt,
             philosophy=state.creative_b_st2_creative_philosophy,
             provenance=state.creative_b_st2_provenance,
             taste=state.creative_b_st2_taste,
         )
         previous_concept_block = (
-            _render_campaign_concept(state.campaign_concept)
+            render_campaign_concept(state.campaign_concept)
             if state.campaign_concept is not None
             else "(no prior campaign concept recorded)"
         )
@@ -248,7 +221,8 @@ def run_creative_b_st2(state: AgencyState) -> AgencyState:
             "Produce an improved campaign concept."
         )
     else:
-        system_prompt = _build_system_prompt(
+        system_prompt = assemble_prompt(
+            _build_system_prompt,
             philosophy=state.creative_b_st2_creative_philosophy,
             provenance=state.creative_b_st2_provenance,
             taste=state.creative_b_st2_taste,
@@ -261,30 +235,73 @@ def run_creative_b_st2(state: AgencyState) -> AgencyState:
         )
 
     messages = [
-        SystemMessage(content=system_prompt),
+        SystemMessage(content=system_prompt.text),
         HumanMessage(content=human_content),
     ]
 
-    campaign_concept = invoke_with_validation_retry(structured_llm, messages)
+    messages = apply_prompt_caching(messages, provider, brief=state.creative_brief)
+    structured_llm = with_prompt_hash(structured_llm, system_prompt.content_hash)
+    return structured_llm, messages, provider, model
 
-    # Plain-text rendering for AgentOutput.content so history display stays
-    # consistent across agents (all store a single string). The typed
-    # CampaignConcept remains on state.campaign_concept for programmatic
-    # access and downstream agents.
-    content = _render_campaign_concept(campaign_concept)
 
+def _apply_result(
+    state: AgencyState,
+    campaign_concept: CampaignConcept,
+    provider: LLMProvider,
+    model: str,
+    usage: LLMUsageTracker,
+) -> AgencyState:
+    """Write the concept to state, bump the iteration, append history."""
     state.campaign_concept = campaign_concept
     state.iteration += 1
     state.status = WorkflowStatus.REVIEW
     state.history.append(
         AgentOutput(
             agent=AgentRole.CREATIVE_B_ST2,
-            provider=provider,
-            model=model,
             iteration=state.iteration,
-            content=content,
+            # The typed concept per iteration is what best-of scans for.
+            payload=CampaignConceptPayload(concept=campaign_concept),
+            **usage.output_fields(provider, model),
             timestamp=datetime.now(UTC),
         )
     )
 
     return state
+
+
+def run_creative_b_st2(state: AgencyState) -> AgencyState:
+    """Develop the selected territory into a full campaign concept.
+
+    On the initial pass, works from the creative brief plus the selected
+    territory alone. On revision passes (``grader_evaluation`` and
+    ``cd_feedback_direction`` both populated), incorporates the grader's
+    score and the CD's coaching.
+
+    Reads ``state.selected_territory`` (required), ``state.creative_brief``,
+    the Creative B injection lenses (``creative_b_st2_creative_philosophy``,
+    ``creative_b_st2_provenance``, ``creative_b_st2_taste``), the per-agent
+    temperature (``creative_b_st2_temperature``), and the optional revision
+    inputs (``grader_evaluation``, ``cd_feedback_direction``,
+    ``campaign_concept``).
+
+    Writes ``state.campaign_concept`` and appends an ``AgentOutput`` to
+    ``state.history``.
+
+    Raises:
+        ValueError: If ``state.selected_territory`` is None. Creative B
+            cannot run without a territory to develop — this is a caller
+            contract violation, not a recoverable runtime condition, so
+            it short-circuits with a clear error before any LLM call.
+    """
+    structured_llm, messages, provider, model = _build_call(state)
+    with track_llm_usage() as usage:
+        campaign_concept = invoke_with_validation_retry(structured_llm, messages)
+    return _apply_result(state, campaign_concept, provider, model, usage)
+
+
+async def arun_creative_b_st2(state: AgencyState) -> AgencyState:
+    """Async variant of ``run_creative_b_st2`` — awaits the LLM call."""
+    structured_llm, messages, provider, model = _build_call(state)
+    with track_llm_usage() as usage:
+        campaign_concept = await ainvoke_with_validation_retry(structured_llm, messages)
+    return _apply_result(state, campaign_concept, provider, model, usage)
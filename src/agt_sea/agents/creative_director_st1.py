@@ -11,12 +11,17 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from langchain_core.runnables import Runnable
 
 from agt_sea.llm.provider import (
-    get_llm,
+    LLMUsageTracker,
+    ainvoke_with_validation_retry,
+    apply_prompt_caching,
+    get_structured_llm,
     invoke_with_validation_retry,
-    wrap_with_transport_retry,
+    track_llm_usage,
+    with_prompt_hash,
 )
 from agt_sea.models.state import (
     AgencyState,
@@ -24,10 +29,12 @@ from agt_sea.models.state import (
     AgentRole,
     CDEvaluation,
     CreativePhilosophy,
+    LLMProvider,
     WorkflowStatus,
 )
 from agt_sea.config import get_llm_provider, get_model_name
 from agt_sea.prompts.loader import load_creative_philosophy
+from agt_sea.prompts.registry import assemble_prompt
 
 
 def _build_system_prompt(philosophy: CreativePhilosophy) -> str:
@@ -64,37 +71,28 @@ Score the work out of 100:
 Be honest. A generous score helps nobody."""
 
 
-def run_creative_director_st1(state: AgencyState) -> AgencyState:
-    """Evaluate the creative concepts and return structured feedback.
-
-    Uses with_structured_output to ensure the LLM returns a valid
-    CDEvaluation object with score, strengths, weaknesses, and direction.
-
-    Args:
-        state: The current agency state containing the creative brief
-            and creative concepts to evaluate.
-
-    Returns:
-        Updated state with the CD evaluation and history entry.
-    """
+def _build_call(
+    state: AgencyState,
+) -> tuple[Runnable, list[BaseMessage], LLMProvider, str]:
+    """Compose the structured runnable and prompt shared by sync and async paths."""
     provider = state.llm_provider or get_llm_provider()
     model = state.llm_model or get_model_name(provider)
-    # Transport retries can't wrap a BaseChatModel before .with_structured_output()
-    # is applied — .with_retry() returns a RunnableRetry that has no
-    # with_structured_output method. So we fetch the raw chat model, apply
-    # structured output, then wrap the composed runnable with transport retry.
-    llm = get_llm(provider=provider, model=model, temperature=0.7, with_retry=False)
-
-    system_prompt = _build_system_prompt(state.creative_director_st1_creative_philosophy)
-
-    # Use structured output to get a validated CDEvaluation, then wrap the
-    # composed runnable with transport-level retries.
-    structured_llm = wrap_with_transport_retry(
-        llm.with_structured_output(CDEvaluation), provider
+
+    # Structured output composed under transport retry (ADR 0012). The
+    # composed runnable is cached, so revision loops skip schema binding.
+    structured_llm = get_structured_llm(
+        CDEvaluation,
+        provider=provider,
+        model=model,
+        temperature=0.7,
+    )
+
+    system_prompt = assemble_prompt(
+        _build_system_prompt, state.creative_director_st1_creative_philosophy
     )
 
     messages = [
-        SystemMessage(content=system_prompt),
+        SystemMessage(content=system_prompt.text),
         HumanMessage(content=(
             f"Here is the creative brief:\n\n{state.creative_brief}\n\n"
             f"Here is the creative work to evaluate (iteration "
@@ -102,17 +100,24 @@ def run_creative_director_st1(state: AgencyState) -> AgencyState:
             "Please evaluate this work."
         )),
     ]
-
-    evaluation = invoke_with_validation_retry(structured_llm, messages)
-
-    # Update state
+    messages = apply_prompt_caching(messages, provider, brief=state.creative_brief)
+    structured_llm = with_prompt_hash(structured_llm, system_prompt.content_hash)
+    return structured_llm, messages, provider, model
+
+
+def _apply_result(
+    state: AgencyState,
+    evaluation: CDEvaluation,
+    provider: LLMProvider,
+    model: str,
+    usage: LLMUsageTracker,
+) -> AgencyState:
+    """Write the evaluation to state and append the history entry."""
     state.cd_evaluation = evaluation
     state.status = WorkflowStatus.REVIEW
     state.history.append(
         AgentOutput(
             agent=AgentRole.CREATIVE_DIRECTOR_ST1,
-            provider=provider,
-            model=model,
             iteration=state.iteration,
             content=(
                 f"Score: {evaluation.score}/100\n"
@@ -121,6 +126,7 @@ def run_creative_director_st1(state: AgencyState) -> AgencyState:
                 f"Direction: {evaluation.direction}"
             ),
             evaluation=evaluation,
+            **usage.output_fields(provider, model),
             timestamp=datetime.now(UTC),
         )
     )
@@ -128,6 +134,33 @@ def run_creative_director_st1(state: AgencyState) -> AgencyState:
     return state
 
 
+def run_creative_director_st1(state: AgencyState) -> AgencyState:
+    """Evaluate the creative concepts and return structured feedback.
+
+    Uses with_structured_output to ensure the LLM returns a valid
+    CDEvaluation object with score, strengths, weaknesses, and direction.
+
+    Args:
+        state: The current agency state containing the creative brief
+            and creative concepts to evaluate.
+
+    Returns:
+        Updated state with the CD evaluation and history entry.
+    """
+    structured_llm, messages, provider, model = _build_call(state)
+    with track_llm_usage() as usage:
+        evaluation = invoke_with_validation_retry(structured_llm, messages)
+    return _apply_result(state, evaluation, provider, model, usage)
+
+
+async def arun_creative_director_st1(state: AgencyState) -> AgencyState:
+    """Async variant of ``run_creative_director_st1`` — awaits the LLM call."""
+    structured_llm, messages, provider, model = _build_call(state)
+    with track_llm_usage() as usage:
+        evaluation = await ainvoke_with_validation_retry(structured_llm, messages)
+    return _apply_result(state, evaluation, provider, model, usage)
+
+
 # ---------------------------------------------------------------------------
 # Routing functions — pure logic, no state mutation
 # ---------------------------------------------------------------------------
@@ -9,18 +9,27 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 
-from langchain_core.messages import SystemMessage, HumanMessage
-
-from agt_sea.llm.provider import get_llm
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from langchain_core.runnables import Runnable
+
+from agt_sea.llm.provider import (
+    LLMUsageTracker,
+    apply_prompt_caching,
+    get_llm,
+    track_llm_usage,
+    with_prompt_hash,
+)
 from agt_sea.models.state import (
     AgencyState,
     AgentOutput,
     AgentRole,
     CreativePhilosophy,
+    LLMProvider,
     WorkflowStatus,
 )
 from agt_sea.config import get_llm_provider, get_model_name
 from agt_sea.prompts.loader import load_creative_philosophy
+from agt_sea.prompts.registry import assemble_prompt
 
 
 def _build_system_prompt(philosophy: CreativePhilosophy) -> str:
@@ -92,18 +101,13 @@ For each approach, provide:
    the feedback."""
 
 
-def run_creative_st1(state: AgencyState) -> AgencyState:
-    """Generate three creative approaches based on the creative brief.
-
-    On first iteration, works from the creative brief alone. On subsequent
-    iterations, incorporates the Creative Director's feedback.
-
-    Args:
-        state: The current agency state containing the creative brief
-            and any prior evaluation feedback.
+def _build_call(
+    state: AgencyState,
+) -> tuple[Runnable, list[BaseMessage], LLMProvider, str]:
+    """Resolve the model and build the prompt shared by the sync and async paths.
 
-    Returns:
-        Updated state with the creative concept and history entry.
+    First iteration works from the brief only; subsequent iterations
+    incorporate the CD's feedback.
     """
     provider = state.llm_provider or get_llm_provider()
     model = state.llm_model or get_model_name(provider)
@@ -114,7 +118,9 @@ def run_creative_st1(state: AgencyState) -> AgencyState:
     is_revision = state.cd_evaluation is not None
 
     if is_revision:
-        system_prompt = _build_revision_prompt(state.creative_st1_creative_philosophy)
+        system_prompt = assemble_prompt(
+            _build_revision_prompt, state.creative_st1_creative_philosophy
+        )
         human_content = (
             f"Here is the creative brief:\n\n{state.creative_brief}\n\n"
             f"Here was your previous creative work:\n\n{state.creative_concept}\n\n"
@@ -126,33 +132,69 @@ def run_creative_st1(state: AgencyState) -> AgencyState:
             "Please produce three improved creative approaches."
         )
     else:
-        system_prompt = _build_system_prompt(state.creative_st1_creative_philosophy)
+        system_prompt = assemble_prompt(
+            _build_system_prompt, state.creative_st1_creative_philosophy
+        )
         human_content = (
             f"Here is the creative brief:\n\n{state.creative_brief}\n\n"
             "Please produce three distinct creative approaches."
         )
 
     messages = [
-        SystemMessage(content=system_prompt),
+        SystemMessage(content=system_prompt.text),
         HumanMessage(content=human_content),
     ]
-
-    response = llm.invoke(messages)
-    creative_concept = response.content
-
-    # Update state
+    messages = apply_prompt_caching(messages, provider, brief=state.creative_brief)
+    llm = with_prompt_hash(llm, system_prompt.content_hash)
+    return llm, messages, provider, model
+
+
+def _apply_result(
+    state: AgencyState,
+    creative_concept: str,
+    provider: LLMProvider,
+    model: str,
+    usage: LLMUsageTracker,
+) -> AgencyState:
+    """Write the concepts to state, bump the iteration, append history."""
     state.creative_concept = creative_concept
     state.iteration += 1
     state.status = WorkflowStatus.REVIEW
     state.history.append(
         AgentOutput(
             agent=AgentRole.CREATIVE_ST1,
-            provider=provider,
-            model=model,
             iteration=state.iteration,
             content=creative_concept,
+            **usage.output_fields(provider, model),
             timestamp=datetime.now(UTC),
         )
     )
 
     return state
+
+
+def run_creative_st1(state: AgencyState) -> AgencyState:
+    """Generate three creative approaches based on the creative brief.
+
+    On first iteration, works from the creative brief alone. On subsequent
+    iterations, incorporates the Creative Director's feedback.
+
+    Args:
+        state: The current agency state containing the creative brief
+            and any prior evaluation feedback.
+
+    Returns:
+        Updated state with the creative concept and history entry.
+    """
+    llm, messages, provider, model = _build_call(state)
+    with track_llm_usage() as usage:
+        response = llm.invoke(messages)
+    return _apply_result(state, response.content, provider, model, usage)
+
+
+async def arun_creative_st1(state: AgencyState) -> AgencyState:
+    """Async variant of ``run_creative_st1`` — awaits the LLM call."""
+    llm, messages, provider, model = _build_call(state)
+    with track_llm_usage() as usage:
+        response = await llm.ainvoke(messages)
+    return _apply_result(state, response.content, provider, model, usage)
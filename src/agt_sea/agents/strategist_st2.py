@@ -10,14 +10,22 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from langchain_core.runnables import Runnable
 
 from agt_sea.config import get_llm_provider, get_model_name
-from agt_sea.llm.provider import get_llm
+from agt_sea.llm.provider import (
+    LLMUsageTracker,
+    apply_prompt_caching,
+    get_llm,
+    track_llm_usage,
+    with_prompt_hash,
+)
 from agt_sea.models.state import (
     AgencyState,
     AgentOutput,
     AgentRole,
+    LLMProvider,
     StrategicPhilosophy,
     WorkflowStatus,
 )
@@ -26,6 +34,7 @@ from agt_sea.prompts.loader import (
     load_strategic_philosophy,
     load_template,
 )
+from agt_sea.prompts.registry import assemble_prompt
 
 
 def _build_system_prompt(philosophy: StrategicPhilosophy) -> str:
@@ -64,36 +73,63 @@ def _build_system_prompt(philosophy: StrategicPhilosophy) -> str:
     )
 
 
-def run_strategist_st2(state: AgencyState) -> AgencyState:
-    """Standard 2.0 strategist — reads ``strategist_st2_strategic_philosophy``."""
+def _build_call(
+    state: AgencyState,
+) -> tuple[Runnable, list[BaseMessage], LLMProvider, str]:
+    """Resolve the model and build the prompt shared by the sync and async paths."""
     provider = state.llm_provider or get_llm_provider()
     model = state.llm_model or get_model_name(provider)
     llm = get_llm(provider=provider, model=model, temperature=0.7)
 
+    system_prompt = assemble_prompt(
+        _build_system_prompt, state.strategist_st2_strategic_philosophy
+    )
     messages = [
-        SystemMessage(
-            content=_build_system_prompt(state.strategist_st2_strategic_philosophy)
-        ),
+        SystemMessage(content=system_prompt.text),
         HumanMessage(content=(
             f"Here is the client brief:\n\n{state.client_brief}\n\n"
             "Please produce a creative brief."
         )),
     ]
-
-    response = llm.invoke(messages)
-    creative_brief = response.content
-
+    messages = apply_prompt_caching(messages, provider, brief=state.client_brief)
+    llm = with_prompt_hash(llm, system_prompt.content_hash)
+    return llm, messages, provider, model
+
+
+def _apply_result(
+    state: AgencyState,
+    creative_brief: str,
+    provider: LLMProvider,
+    model: str,
+    usage: LLMUsageTracker,
+) -> AgencyState:
+    """Write the creative brief to state and append the history entry."""
     state.creative_brief = creative_brief
     state.status = WorkflowStatus.IN_PROGRESS
     state.history.append(
         AgentOutput(
             agent=AgentRole.STRATEGIST_ST2,
-            provider=provider,
-            model=model,
             iteration=state.iteration,
             content=creative_brief,
+            **usage.output_fields(provider, model),
             timestamp=datetime.now(UTC),
         )
     )
 
     return state
+
+
+def run_strategist_st2(state: AgencyState) -> AgencyState:
+    """Standard 2.0 strategist — reads ``strategist_st2_strategic_philosophy``."""
+    llm, messages, provider, model = _build_call(state)
+    with track_llm_usage() as usage:
+        response = llm.invoke(messages)
+    return _apply_result(state, response.content, provider, model, usage)
+
+
+async def arun_strategist_st2(state: AgencyState) -> AgencyState:
+    """Async variant of ``run_strategist_st2`` — awaits the LLM call."""
+    llm, messages, provider, model = _build_call(state)
+    with track_llm_usage() as usage:
+        response = await llm.ainvoke(messages)
+    return _apply_result(state, response.content, provider, model, usage)
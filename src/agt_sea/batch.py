@@ -0,0 +1,326 @@
+"""
+agt_sea — Batch Runs
+
+Headless, concurrent runs of the Standard 1.0 / 2.0 pipelines over many
+briefs — the engine behind ``agt-sea batch`` (``cli.py``).
+
+* **Jobs.** ``load_jobs()`` reads either a directory of ``*.txt`` briefs
+  or a JSONL file with one object per brief. A JSONL line carries the
+  brief (``client_brief``, or ``brief``), an optional ``id``, and any
+  other ``AgencyState`` field — lenses, temperatures,
+  ``num_territories``, provider / model — which override the batch-wide
+  defaults for that brief.
+* **Concurrency.** At most ``concurrency`` runs are in flight at once,
+  and ``rate_limits`` caps how many runs may *start* per minute for each
+  provider, so a large batch ramps up instead of opening with a burst.
+  A run takes its start slot before a concurrency slot, so a throttled
+  start never holds a slot that a run on another provider could use.
+  Start limits only shape the ramp. Request throughput is enforced
+  per call by the ``LLM_RATE_LIMITS`` token buckets. With both set, a
+  start rate above ``LLM_RATE_LIMITS`` requests per minute divided by a
+  run's request count just moves the queue from run starts to requests.
+* **Territory selection.** The v2 interrupt is resolved by a
+  ``SelectionPolicy``: the first territory, the territory the CD Grader
+  scores highest (one extra grader call per territory), or all of them
+  — the latter runs the parallel graph and lets CD Synthesis compare.
+* **Output.** ``run_batch()`` yields one record per brief as each run
+  finishes (not in input order); ``cli.py`` writes them as JSONL. A run
+  that raises is recorded with ``status="failed"`` and the batch moves
+  on.
+
+Runs use the async graphs (``asynchronous=True``) on one event loop and
+their own in-memory checkpointer; each thread is deleted once its record
+is produced.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+import uuid
+from collections.abc import AsyncIterator, Mapping
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from langgraph.types import Command
+
+from agt_sea.agents.cd_grader_st2 import arun_cd_grader_st2
+from agt_sea.config import BATCH_CONCURRENCY, get_llm_provider
+from agt_sea.graph.checkpointer import BoundedMemorySaver
+from agt_sea.graph.workflow_st1 import build_graph_st1
+from agt_sea.graph.workflow_st2 import build_graph_st2
+from agt_sea.models.state import (
+    AgencyState,
+    CampaignConcept,
+    LLMProvider,
+    Territory,
+    WorkflowStatus,
+)
+
+
+class Workflow(str, Enum):
+    """Which pipeline a batch runs."""
+    ST1 = "st1"
+    ST2 = "st2"
+
+
+class SelectionPolicy(str, Enum):
+    """How a batch resolves the v2 territory-selection interrupt."""
+    FIRST = "index0"
+    TOP_SCORED = "top-scored"
+    ALL = "all"
+
+
+@dataclass(frozen=True)
+class BriefJob:
+    """One brief to run, with its per-brief ``AgencyState`` overrides."""
+    id: str
+    source: str
+    fields: Mapping[str, Any] = field(default_factory=dict)
+
+
+# ---------------------------------------------------------------------------
+# Loading
+# ---------------------------------------------------------------------------
+
+
+def load_jobs(path: str | Path) -> list[BriefJob]:
+    """Read briefs from a directory of ``*.txt`` files or a JSONL file.
+
+    Raises:
+        ValueError: If ``path`` does not exist, the directory holds no
+            briefs, or a JSONL line is not an object with a brief.
+    """
+    path = Path(path)
+    if path.is_dir():
+        jobs = [
+            BriefJob(
+                id=brief.stem,
+                source=str(brief),
+                fields={"client_brief": brief.read_text().strip()},
+            )
+            for brief in sorted(path.glob("*.txt"))
+        ]
+        if not jobs:
+            raise ValueError(f"No *.txt briefs found in {path}.")
+        return jobs
+    if not path.is_file():
+        raise ValueError(f"Brief source {path} does not exist.")
+
+    jobs = []
+    for number, line in enumerate(path.read_text().splitlines(), start=1):
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        if not isinstance(record, dict):
+            raise ValueError(f"{path}:{number}: expected a JSON object.")
+        record = dict(record)
+        if "brief" in record:
+            record["client_brief"] = record.pop("brief")
+        if not record.get("client_brief"):
+            raise ValueError(f"{path}:{number}: missing 'client_brief'.")
+        job_id = str(record.pop("id", f"{path.stem}-{number}"))
+        jobs.append(BriefJob(id=job_id, source=f"{path}:{number}", fields=record))
+    return jobs
+
+
+# ---------------------------------------------------------------------------
+# Rate limiting
+# ---------------------------------------------------------------------------
+
+
+class RunStartLimiter:
+    """Spaces run starts to at most ``per_minute`` per provider.
+
+    Providers without a limit start immediately. Waiters are served in
+    arrival order; each acquire reserves the next slot, so a queue of
+    runs drains at the configured rate rather than in bursts.
+    """
+
+    def __init__(self, per_minute: Mapping[LLMProvider, float]) -> None:
+        self._interval = {
+            provider: 60.0 / rate for provider, rate in per_minute.items() if rate > 0
+        }
+        self._next_slot: dict[LLMProvider, float] = {}
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, provider: LLMProvider) -> None:
+        interval = self._interval.get(provider)
+        if interval is None:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(provider, now))
+            self._next_slot[provider] = slot + interval
+        await asyncio.sleep(slot - now)
+
+
+# ---------------------------------------------------------------------------
+# Territory selection
+# ---------------------------------------------------------------------------
+
+
+async def ascore_territories(state: AgencyState) -> list[float | None]:
+    """Score each territory with the CD Grader, concurrently.
+
+    A territory is graded as a campaign concept with no deliverables.
+    A territory whose grading call fails scores None.
+    """
+
+    async def score(territory: Territory) -> float:
+        fork = state.model_copy(
+            update={
+                "campaign_concept": CampaignConcept(
+                    title=territory.title,
+                    core_idea=territory.core_idea,
+                    why_it_works=territory.why_it_works,
+                ),
+                "grader_evaluation": None,
+                "history": [],
+            }
+        )
+        graded = await arun_cd_grader_st2(fork)
+        return graded.grader_evaluation.score
+
+    results = await asyncio.gather(
+        *(score(t) for t in state.territories), return_exceptions=True
+    )
+    return [None if isinstance(r, BaseException) else r for r in results]
+
+
+def select_indices(
+    policy: SelectionPolicy, scores: list[float | None], count: int
+) -> list[int]:
+    """Territory indices to resume with under ``policy``.
+
+    ``TOP_SCORED`` falls back to index 0 when no territory could be scored.
+    """
+    if policy == SelectionPolicy.ALL:
+        return list(range(count))
+    if policy == SelectionPolicy.TOP_SCORED:
+        scored = [(s, i) for i, s in enumerate(scores) if s is not None]
+        if scored:
+            # Highest score wins; ties go to the earlier territory.
+            return [max(scored, key=lambda pair: (pair[0], -pair[1]))[1]]
+    return [0]
+
+
+# ---------------------------------------------------------------------------
+# Running
+# ---------------------------------------------------------------------------
+
+
+class BatchRunner:
+    """Runs ``BriefJob``s through one pipeline with bounded concurrency."""
+
+    def __init__(
+        self,
+        workflow: Workflow = Workflow.ST2,
+        *,
+        policy: SelectionPolicy = SelectionPolicy.FIRST,
+        defaults: Mapping[str, Any] | None = None,
+        concurrency: int = BATCH_CONCURRENCY,
+        rate_limits: Mapping[LLMProvider, float] | None = None,
+    ) -> None:
+        self.workflow = workflow
+        self.policy = policy
+        self.defaults = dict(defaults or {})
+        self.concurrency = max(1, concurrency)
+        self._limiter = RunStartLimiter(rate_limits or {})
+        self._checkpointer = BoundedMemorySaver()
+        if workflow == Workflow.ST1:
+            self._graph = build_graph_st1(asynchronous=True)
+        else:
+            self._graph = build_graph_st2(
+                checkpointer=self._checkpointer,
+                asynchronous=True,
+                parallel_concepts=policy == SelectionPolicy.ALL,
+            )
+
+    def initial_state(self, job: BriefJob) -> AgencyState:
+        """The job's starting state: batch defaults, then its own fields."""
+        return AgencyState(**{**self.defaults, **job.fields})
+
+    async def run(self, jobs: list[BriefJob]) -> AsyncIterator[dict[str, Any]]:
+        """Run ``jobs``, yielding each record as its run finishes."""
+        gate = asyncio.Semaphore(self.concurrency)
+
+        async def bounded(job: BriefJob) -> dict[str, Any]:
+            # Wait for the start slot first, so the wait holds no gate slot.
+            await self._limiter.acquire(self._provider_for(job))
+            async with gate:
+                return await self.run_one(job)
+
+        for finished in asyncio.as_completed([bounded(job) for job in jobs]):
+            yield await finished
+
+    def _provider_for(self, job: BriefJob) -> LLMProvider:
+        """The provider ``job`` will run on, for its start slot."""
+        try:
+            provider = self.initial_state(job).llm_provider
+        except Exception:
+            provider = None  # run_one() records the invalid job
+        return provider or get_llm_provider()
+
+    async def run_one(self, job: BriefJob) -> dict[str, Any]:
+        """Run one job to completion and return its output record.
+
+        Start limits are applied by ``run()``, not here.
+        """
+        record: dict[str, Any] = {
+            "id": job.id,
+            "source": job.source,
+            "workflow": self.workflow.value,
+        }
+        start = time.perf_counter()
+        thread_id = f"batch-{job.id}-{uuid.uuid4()}"
+        try:
+            state = self.initial_state(job)
+            if self.workflow == Workflow.ST1:
+                final = await self._graph.ainvoke(state)
+            else:
+                final = await self._run_st2(state, thread_id, record)
+            final_state = AgencyState.model_validate(final)
+            record["status"] = final_state.status.value
+            record["error"] = final_state.error
+            record["state"] = final_state.model_dump(mode="json")
+        except Exception as exc:
+            record["status"] = WorkflowStatus.FAILED.value
+            record["error"] = f"{type(exc).__name__}: {exc}"
+        finally:
+            self._checkpointer.delete_thread(thread_id)
+        record["seconds"] = round(time.perf_counter() - start, 3)
+        return record
+
+    async def _run_st2(
+        self, state: AgencyState, thread_id: str, record: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Run the v2 graph, resolving the territory interrupt by policy."""
+        config = {"configurable": {"thread_id": thread_id}}
+        final = await self._graph.ainvoke(state, config=config)
+        snapshot = await self._graph.aget_state(config)
+        if not snapshot.interrupts:
+            # Failed before reaching the interrupt.
+            return final
+
+        paused = AgencyState.model_validate(snapshot.values)
+        scores: list[float | None] = []
+        if self.policy == SelectionPolicy.TOP_SCORED:
+            scores = await ascore_territories(paused)
+            record["territory_scores"] = scores
+        indices = select_indices(self.policy, scores, len(paused.territories))
+        record["selected_indices"] = indices
+        return await self._graph.ainvoke(
+            Command(resume={"action": "select", "indices": indices}), config=config
+        )
+
+
+async def run_batch(
+    jobs: list[BriefJob], **kwargs: Any
+) -> AsyncIterator[dict[str, Any]]:
+    """Convenience wrapper: ``BatchRunner(**kwargs).run(jobs)``."""
+    async for record in BatchRunner(**kwargs).run(jobs):
+        yield record
@@ -0,0 +1,186 @@
+"""
+agt_sea — Command Line
+
+Entry point for the ``agt-sea`` console script (``[project.scripts]`` in
+pyproject.toml). One subcommand today:
+
+``agt-sea batch SOURCE`` — run the v1 or v2 pipeline over every brief in
+SOURCE (a directory of ``*.txt`` briefs or a JSONL file) and stream one
+JSON record per brief to ``--output`` as each run finishes. See
+``batch.py`` for the input format, selection policies and the record
+shape. Examples::
+
+    agt-sea batch briefs/ --output results.jsonl
+    agt-sea batch overnight.jsonl --policy top-scored --concurrency 8 \\
+        --rate-limit anthropic=30 --set creative_a_st2_taste=pop_maximalist
+
+Exits 1 when any run failed, so a scheduler can flag the batch.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from collections import Counter
+from collections.abc import Sequence
+from typing import IO, Any
+
+from agt_sea.batch import BatchRunner, SelectionPolicy, Workflow, load_jobs
+from agt_sea.config import BATCH_CONCURRENCY
+from agt_sea.models.state import LLMProvider, WorkflowStatus
+
+
+def _key_value(raw: str) -> tuple[str, str]:
+    """Parse a ``KEY=VALUE`` argument."""
+    key, sep, value = raw.partition("=")
+    if not sep or not key:
+        raise argparse.ArgumentTypeError(f"expected KEY=VALUE, got {raw!r}")
+    return key.strip(), value.strip()
+
+
+def _rate_limit(raw: str) -> tuple[LLMProvider, float]:
+    """Parse a ``PROVIDER=RUNS_PER_MINUTE`` argument."""
+    key, value = _key_value(raw)
+    try:
+        return LLMProvider(key.lower()), float(value)
+    except ValueError:
+        valid = ", ".join(p.value for p in LLMProvider)
+        raise argparse.ArgumentTypeError(
+            f"expected PROVIDER=RUNS_PER_MINUTE with PROVIDER one of {valid}, "
+            f"got {raw!r}"
+        )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """The ``agt-sea`` argument parser."""
+    parser = argparse.ArgumentParser(prog="agt-sea")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    batch = commands.add_parser(
+        "batch",
+        help="Run a pipeline over many briefs, streaming results as JSONL.",
+        description="Run a pipeline over many briefs, streaming results as JSONL.",
+    )
+    batch.add_argument(
+        "source", help="Directory of *.txt briefs, or a JSONL file of briefs."
+    )
+    batch.add_argument(
+        "--workflow",
+        type=Workflow,
+        default=Workflow.ST2,
+        metavar="{" + ",".join(w.value for w in Workflow) + "}",
+        help="Pipeline to run (default: st2).",
+    )
+    batch.add_argument(
+        "--policy",
+        type=SelectionPolicy,
+        default=SelectionPolicy.FIRST,
+        metavar="{" + ",".join(p.value for p in SelectionPolicy) + "}",
+        help="How st2 resolves territory selection (default: index0).",
+    )
+    batch.add_argument(
+        "--output",
+        "-o",
+        default="-",
+        help="JSONL file to write records to (default: stdout).",
+    )
+    batch.add_argument(
+        "--concurrency",
+        type=int,
+        default=BATCH_CONCURRENCY,
+        help=f"Runs in flight at once (default: {BATCH_CONCURRENCY}).",
+    )
+    batch.add_argument(
+        "--rate-limit",
+        type=_rate_limit,
+        action="append",
+        default=[],
+        metavar="PROVIDER=RUNS_PER_MINUTE",
+        help=(
+            "Cap run starts per minute for a provider. Repeatable. Request "
+            "rates are capped separately by LLM_RATE_LIMITS."
+        ),
+    )
+    batch.add_argument(
+        "--provider",
+        type=LLMProvider,
+        metavar="{" + ",".join(p.value for p in LLMProvider) + "}",
+    )
+    batch.add_argument("--model")
+    batch.add_argument("--max-iterations", type=int)
+    batch.add_argument("--threshold", type=float, help="Approval threshold.")
+    batch.add_argument("--num-territories", type=int)
+    batch.add_argument(
+        "--set",
+        type=_key_value,
+        action="append",
+        default=[],
+        metavar="FIELD=VALUE",
+        help=(
+            "Set any AgencyState field for every brief (lenses, temperatures, "
+            "...). Repeatable; JSONL fields override it per brief."
+        ),
+    )
+    return parser
+
+
+def _defaults(args: argparse.Namespace) -> dict[str, Any]:
+    """Batch-wide ``AgencyState`` fields from the command line."""
+    defaults: dict[str, Any] = dict(args.set)
+    for field_name, value in (
+        ("llm_provider", args.provider),
+        ("llm_model", args.model),
+        ("max_iterations", args.max_iterations),
+        ("approval_threshold", args.threshold),
+        ("num_territories", args.num_territories),
+    ):
+        if value is not None:
+            defaults[field_name] = value
+    return defaults
+
+
+async def _run_batch(args: argparse.Namespace, out: IO[str]) -> Counter[str]:
+    jobs = load_jobs(args.source)
+    runner = BatchRunner(
+        args.workflow,
+        policy=args.policy,
+        defaults=_defaults(args),
+        concurrency=args.concurrency,
+        rate_limits=dict(args.rate_limit),
+    )
+    statuses: Counter[str] = Counter()
+    async for record in runner.run(jobs):
+        out.write(json.dumps(record) + "\n")
+        out.flush()
+        statuses[record["status"]] += 1
+        print(
+            f"[{sum(statuses.values())}/{len(jobs)}] {record['id']}: "
+            f"{record['status']} ({record['seconds']}s)",
+            file=sys.stderr,
+        )
+    return statuses
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the ``agt-sea`` command line; returns the exit status."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        if args.output == "-":
+            statuses = asyncio.run(_run_batch(args, sys.stdout))
+        else:
+            with open(args.output, "w") as out:
+                statuses = asyncio.run(_run_batch(args, out))
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    summary = ", ".join(f"{count} {status}" for status, count in sorted(statuses.items()))
+    print(f"Done: {summary or 'no briefs'}", file=sys.stderr)
+    return 1 if statuses[WorkflowStatus.FAILED.value] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -93,6 +93,7 @@ DEFAULT_MODELS: dict[LLMProvider, str] = {
     LLMProvider.ANTHROPIC: "claude-sonnet-4-6",
     LLMProvider.GOOGLE: "gemini-3-flash-preview",
     LLMProvider.OPENAI: "gpt-5.4-mini",
+    LLMProvider.FAKE: "fake-model",
 }
 
 # Full list of models selectable in the frontend sidebar, per provider.
@@ -114,12 +115,16 @@ AVAILABLE_MODELS: dict[LLMProvider, list[str]] = {
         "gpt-5.4-mini",
         "gpt-5.4",
     ],
+    LLMProvider.FAKE: [
+        "fake-model",
+    ],
 }
 
 _PROVIDER_MODEL_KEYS: dict[LLMProvider, str] = {
     LLMProvider.ANTHROPIC: "ANTHROPIC_MODEL",
     LLMProvider.GOOGLE: "GOOGLE_MODEL",
     LLMProvider.OPENAI: "OPENAI_MODEL",
+    LLMProvider.FAKE: "FAKE_MODEL",
 }
 
 
@@ -144,6 +149,34 @@ APPROVAL_THRESHOLD: float = float(_get_secret("APPROVAL_THRESHOLD") or "80.0")
 DEMO_RUN_CAP: int = int(_get_secret("DEMO_RUN_CAP") or "10")
 
 
+# ---------------------------------------------------------------------------
+# Fake provider
+# ---------------------------------------------------------------------------
+# LLM_PROVIDER=fake swaps every chat model for llm/fake.py's
+# FakeChatModel: no network, no API key, schema-valid structured output.
+# Responses are seeded from FAKE_LLM_SEED and the prompt, so a run is
+# reproducible. Latency is drawn uniformly from FAKE_LLM_LATENCY_SECONDS
+# ("min,max" or a single value), each request fails with a retryable
+# transport error at FAKE_LLM_FAILURE_RATE, and scores (CD Grader,
+# Synthesis, the 1.0 CD) are drawn uniformly from FAKE_LLM_SCORE_RANGE.
+
+
+def _float_range(raw: str) -> tuple[float, float]:
+    """Parse ``"min,max"`` (or a single value) into a ``(min, max)`` pair."""
+    low, _, high = raw.partition(",")
+    return float(low), float(high or low)
+
+
+FAKE_LLM_LATENCY_SECONDS: tuple[float, float] = _float_range(
+    _get_secret("FAKE_LLM_LATENCY_SECONDS") or "0"
+)
+FAKE_LLM_FAILURE_RATE: float = float(_get_secret("FAKE_LLM_FAILURE_RATE") or "0")
+FAKE_LLM_SCORE_RANGE: tuple[float, float] = _float_range(
+    _get_secret("FAKE_LLM_SCORE_RANGE") or "60,95"
+)
+FAKE_LLM_SEED: int = int(_get_secret("FAKE_LLM_SEED") or "0")
+
+
 # ---------------------------------------------------------------------------
 # Transport-level retry policy
 # ---------------------------------------------------------------------------
@@ -153,3 +186,282 @@ DEMO_RUN_CAP: int = int(_get_secret("DEMO_RUN_CAP") or "10")
 # just bounds how many attempts are made before the error propagates.
 
 LLM_MAX_RETRIES: int = int(_get_secret("LLM_MAX_RETRIES") or "3")
+
+
+# ---------------------------------------------------------------------------
+# Client-side rate limits
+# ---------------------------------------------------------------------------
+# Opt-in. Token buckets applied to every chat-model request before it is
+# sent (see TokenBucketRateLimiter in llm/provider.py), so concurrent runs
+# queue instead of tripping the provider's 429s — which are retried after
+# the fact at best, and for Google not at all. Comma-separated entries of
+# ``provider[:model]=requests_per_minute[/tokens_per_minute]``; a
+# provider-wide entry applies to each of its models separately (providers
+# meter per model), a ``provider:model`` entry overrides it for that
+# model. 0 or an omitted value leaves that dimension unlimited. Example:
+#   LLM_RATE_LIMITS=anthropic=50/30000,openai:gpt-5.4=500/200000
+
+RateLimitKey = tuple[LLMProvider, str | None]
+
+
+def parse_rate_limits(raw: str) -> dict[RateLimitKey, tuple[float, float]]:
+    """Parse an ``LLM_RATE_LIMITS`` value into ``{(provider, model): (rpm, tpm)}``.
+
+    ``model`` is None for provider-wide entries.
+
+    Raises:
+        ValueError: If an entry is malformed or names an unknown provider.
+    """
+    limits: dict[RateLimitKey, tuple[float, float]] = {}
+    for entry in filter(None, (part.strip() for part in raw.split(","))):
+        target, sep, rates = entry.partition("=")
+        provider_name, _, model = target.strip().partition(":")
+        rpm, _, tpm = rates.partition("/")
+        try:
+            if not sep:
+                raise ValueError
+            key = (LLMProvider(provider_name.lower()), model or None)
+            limits[key] = (float(rpm or 0), float(tpm or 0))
+        except ValueError:
+            raise ValueError(
+                f"Invalid LLM_RATE_LIMITS entry '{entry}'. Expected "
+                "provider[:model]=requests_per_minute[/tokens_per_minute]."
+            )
+    return limits
+
+
+LLM_RATE_LIMITS: dict[RateLimitKey, tuple[float, float]] = parse_rate_limits(
+    _get_secret("LLM_RATE_LIMITS") or ""
+)
+
+
+# ---------------------------------------------------------------------------
+# Provider failover and hedged requests
+# ---------------------------------------------------------------------------
+# Opt-in. LLM_FAILOVER lists backup targets, in order, as comma-separated
+# ``provider[:model]`` entries; a provider without a model uses that
+# provider's configured model. When set, each target gets
+# LLM_FAILOVER_AFTER transport attempts before the call moves on to the
+# next, and the last target's error propagates. The model that actually
+# answered is recorded on the AgentOutput. Example:
+#   LLM_FAILOVER=openai:gpt-5.4-mini,google
+#
+# LLM_HEDGE sends a second, duplicate request once a call has run past
+# the p95 latency of that model's recent calls and takes whichever
+# answers first — to the first failover target when there is one, else
+# to the same model. Hedging starts after LLM_HEDGE_MIN_SAMPLES calls
+# have been timed. Each hedge is a paid request, so this trades spend
+# for tail latency.
+
+FailoverTarget = tuple[LLMProvider, str | None]
+
+
+def parse_failover(raw: str) -> list[FailoverTarget]:
+    """Parse an ``LLM_FAILOVER`` value into ``[(provider, model), ...]``.
+
+    ``model`` is None when an entry names only the provider.
+
+    Raises:
+        ValueError: If an entry names an unknown provider or a model not
+            listed for it in AVAILABLE_MODELS.
+    """
+    targets: list[FailoverTarget] = []
+    for entry in filter(None, (part.strip() for part in raw.split(","))):
+        provider_name, _, model = entry.partition(":")
+        try:
+            provider = LLMProvider(provider_name.strip().lower())
+        except ValueError:
+            valid = ", ".join(p.value for p in LLMProvider)
+            raise ValueError(
+                f"Invalid LLM_FAILOVER entry '{entry}'. Provider must be one "
+                f"of: {valid}"
+            )
+        model = model.strip() or None
+        if model is not None and model not in AVAILABLE_MODELS[provider]:
+            valid = ", ".join(AVAILABLE_MODELS[provider])
+            raise ValueError(
+                f"Invalid LLM_FAILOVER entry '{entry}'. Model must be one "
+                f"of: {valid}"
+            )
+        targets.append((provider, model))
+    return targets
+
+
+LLM_FAILOVER: list[FailoverTarget] = parse_failover(
+    _get_secret("LLM_FAILOVER") or ""
+)
+LLM_FAILOVER_AFTER: int = int(_get_secret("LLM_FAILOVER_AFTER") or "2")
+LLM_HEDGE: bool = (
+    (_get_secret("LLM_HEDGE") or "false").lower() in ("1", "true", "yes")
+)
+LLM_HEDGE_MIN_SAMPLES: int = int(_get_secret("LLM_HEDGE_MIN_SAMPLES") or "20")
+
+
+# ---------------------------------------------------------------------------
+# Circuit breaker
+# ---------------------------------------------------------------------------
+# Opt-in. One breaker per provider, shared by every run in the process
+# (CircuitBreaker in llm/provider.py). It watches the outcome of the last
+# LLM_CIRCUIT_WINDOW transport attempts; once at least
+# LLM_CIRCUIT_MIN_CALLS have been seen and the share that failed with a
+# transient transport error reaches LLM_CIRCUIT_FAILURE_RATE, the breaker
+# opens. Open, calls to that provider fail immediately with
+# CircuitOpenError — or move on to the next LLM_FAILOVER target — instead
+# of each spending LLM_MAX_RETRIES backed-off attempts. After
+# LLM_CIRCUIT_OPEN_SECONDS one trial call is let through (half-open): it
+# closes the breaker on success and re-opens it on failure.
+
+LLM_CIRCUIT_BREAKER: bool = (
+    (_get_secret("LLM_CIRCUIT_BREAKER") or "false").lower() in ("1", "true", "yes")
+)
+LLM_CIRCUIT_FAILURE_RATE: float = float(
+    _get_secret("LLM_CIRCUIT_FAILURE_RATE") or "0.5"
+)
+LLM_CIRCUIT_MIN_CALLS: int = int(_get_secret("LLM_CIRCUIT_MIN_CALLS") or "10")
+LLM_CIRCUIT_WINDOW: int = int(_get_secret("LLM_CIRCUIT_WINDOW") or "20")
+LLM_CIRCUIT_OPEN_SECONDS: float = float(
+    _get_secret("LLM_CIRCUIT_OPEN_SECONDS") or "30"
+)
+
+
+# ---------------------------------------------------------------------------
+# Chat model cache
+# ---------------------------------------------------------------------------
+# get_llm() in llm/provider.py reuses one chat-model instance (and so one
+# SDK client / HTTP connection pool) per (provider, model, temperature,
+# retry policy). This bounds how many distinct instances are kept; the
+# least recently used is dropped beyond it. 0 disables caching.
+
+LLM_CLIENT_CACHE_SIZE: int = int(_get_secret("LLM_CLIENT_CACHE_SIZE") or "32")
+
+
+# ---------------------------------------------------------------------------
+# Provider prompt caching
+# ---------------------------------------------------------------------------
+# Opt-in. When enabled, agents mark the static prefix of each prompt (the
+# system prompt, then the brief at the top of the human turn) with the
+# provider's prompt-cache breakpoints, so revision loops re-read it from
+# the provider's cache instead of reprocessing it. Only Anthropic takes
+# explicit markers; OpenAI caches long prefixes automatically and Google
+# needs a separately managed cache, so for those this is a no-op. Cache
+# read / write token counts land on each AgentOutput either way.
+
+LLM_PROMPT_CACHING: bool = (
+    (_get_secret("LLM_PROMPT_CACHING") or "false").lower() in ("1", "true", "yes")
+)
+
+
+# ---------------------------------------------------------------------------
+# LLM response cache
+# ---------------------------------------------------------------------------
+# Opt-in. When enabled, get_llm() attaches an on-disk response cache
+# (llm/response_cache.py) keyed on provider, model, temperature, the
+# message list and any bound structured-output schema, so a repeated
+# deterministic call is answered from disk instead of the provider. Only
+# temperature-0 models use it by default — caching a sampled call would
+# pin the first sample forever; set LLM_RESPONSE_CACHE_ALL_TEMPERATURES to
+# cache those too (useful for replaying demos offline). The file is
+# trimmed least-recently-used first to LLM_RESPONSE_CACHE_MAX_BYTES.
+
+LLM_RESPONSE_CACHE: bool = (
+    (_get_secret("LLM_RESPONSE_CACHE") or "false").lower() in ("1", "true", "yes")
+)
+LLM_RESPONSE_CACHE_PATH: str = (
+    _get_secret("LLM_RESPONSE_CACHE_PATH") or ".cache/llm_responses.sqlite"
+)
+LLM_RESPONSE_CACHE_MAX_BYTES: int = int(
+    _get_secret("LLM_RESPONSE_CACHE_MAX_BYTES") or str(64 * 1024 * 1024)
+)
+LLM_RESPONSE_CACHE_ALL_TEMPERATURES: bool = (
+    (_get_secret("LLM_RESPONSE_CACHE_ALL_TEMPERATURES") or "false").lower()
+    in ("1", "true", "yes")
+)
+
+
+# ---------------------------------------------------------------------------
+# Prompt cache
+# ---------------------------------------------------------------------------
+# prompts/loader.py caches prompt files in memory. A cached prompt is
+# served without touching the disk for this many seconds; after that the
+# file's mtime is checked and the prompt re-read if it changed. 0 checks
+# the mtime on every load.
+
+PROMPT_CACHE_CHECK_SECONDS: float = float(
+    _get_secret("PROMPT_CACHE_CHECK_SECONDS") or "2"
+)
+
+
+# ---------------------------------------------------------------------------
+# Standard 2.0 checkpointer
+# ---------------------------------------------------------------------------
+# Backend for the v2 graph's checkpointer (see graph/checkpointer.py).
+# "memory" keeps paused territory-selection runs in-process only; "sqlite"
+# writes them to CHECKPOINT_DB_PATH so they survive restarts / redeploys.
+# CHECKPOINT_BATCH_SIZE caps how many write batches the SQLite saver holds
+# before forcing a commit between checkpoint boundaries.
+#
+# The memory backend is bounded: threads idle for longer than
+# CHECKPOINT_MEMORY_TTL_SECONDS are dropped, and once the serialised
+# checkpoint bytes exceed CHECKPOINT_MEMORY_MAX_BYTES the least recently
+# used threads are dropped until the store fits. 0 disables either bound.
+
+CHECKPOINTER_BACKEND: str = (_get_secret("CHECKPOINTER_BACKEND") or "memory").lower()
+CHECKPOINT_DB_PATH: str = _get_secret("CHECKPOINT_DB_PATH") or ".checkpoints/agt_sea.sqlite"
+CHECKPOINT_BATCH_SIZE: int = int(_get_secret("CHECKPOINT_BATCH_SIZE") or "16")
+CHECKPOINT_MEMORY_TTL_SECONDS: float = float(
+    _get_secret("CHECKPOINT_MEMORY_TTL_SECONDS") or "21600"
+)
+CHECKPOINT_MEMORY_MAX_BYTES: int = int(
+    _get_secret("CHECKPOINT_MEMORY_MAX_BYTES") or str(256 * 1024 * 1024)
+)
+
+
+# ---------------------------------------------------------------------------
+# Standard 2.0 speculative concepts
+# ---------------------------------------------------------------------------
+# Opt-in. While the v2 graph is paused at the territory-selection
+# interrupt, Creative B starts developing the first N territories in
+# background threads (graph/speculation.py). Selecting one of them then
+# reuses the finished concept instead of making a fresh call; the rest are
+# cancelled. Each speculative concept is a real LLM call whether or not
+# it is picked, so this trades spend for latency. 0 disables.
+
+SPECULATIVE_CONCEPTS: int = int(_get_secret("SPECULATIVE_CONCEPTS") or "0")
+
+
+# ---------------------------------------------------------------------------
+# Standard 2.0 concurrent feedback
+# ---------------------------------------------------------------------------
+# Opt-in. The v2 revision loop normally runs CD Grader, then CD Feedback —
+# two LLM latencies per rejected iteration. When enabled, Feedback starts
+# alongside the Grader and its direction is kept only if the Grader
+# rejects with budget left; otherwise it is dropped. Feedback then coaches
+# without seeing the grader's score and rationale, and an approved pass
+# may still pay for a Feedback call that is thrown away.
+
+CONCURRENT_FEEDBACK: bool = (
+    (_get_secret("CONCURRENT_FEEDBACK") or "false").lower() in ("1", "true", "yes")
+)
+
+
+# ---------------------------------------------------------------------------
+# Standard 2.0 sharded territory generation
+# ---------------------------------------------------------------------------
+# Opt-in. Creative A normally asks for all num_territories in one
+# structured call, so latency grows with the count and one validation
+# failure throws the whole set away. With CREATIVE_A_SHARD_SIZE > 0, a
+# request for more than that many territories is split into concurrent
+# calls of at most CREATIVE_A_SHARD_SIZE each, every one steered towards a
+# different creative direction. The results are merged with near-duplicate
+# detection, and a validation failure only reprompts its own shard.
+
+CREATIVE_A_SHARD_SIZE: int = int(_get_secret("CREATIVE_A_SHARD_SIZE") or "0")
+
+
+# ---------------------------------------------------------------------------
+# Batch runs
+# ---------------------------------------------------------------------------
+# Default number of briefs ``agt-sea batch`` (batch.py) runs at once.
+# Overridden per invocation with --concurrency.
+
+BATCH_CONCURRENCY: int = int(_get_secret("BATCH_CONCURRENCY") or "4")
@@ -0,0 +1,467 @@
+"""
+agt_sea — Checkpointer Backends
+
+Factory and concrete savers for the Standard 2.0 graph's checkpointer.
+LangGraph's ``interrupt()`` only works when the compiled graph is given
+a checkpointer, and the paused territory-selection run lives entirely
+inside it — so where the checkpointer stores its data decides whether a
+paused run survives a redeploy.
+
+Two backends, selected via ``CHECKPOINTER_BACKEND`` in ``config.py``:
+
+* ``"memory"`` (default) — ``BoundedMemorySaver``, LangGraph's
+  ``MemorySaver`` with idle-TTL and LRU byte-budget eviction so a busy
+  process doesn't accumulate a snapshot for every run ever started.
+  Process-local: paused runs are lost on restart.
+* ``"sqlite"`` — ``BatchedSqliteSaver``, a file-backed saver at
+  ``CHECKPOINT_DB_PATH``. Paused runs survive restarts and resident
+  memory stays flat because checkpoints live on disk, not on the heap.
+
+The SQLite backend builds on ``langgraph-checkpoint-sqlite``'s
+``SqliteSaver`` rather than a hand-rolled schema, so the on-disk format
+stays whatever LangGraph's own tooling expects.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.sqlite import SqliteSaver
+
+from pydantic import BaseModel
+
+from agt_sea.config import (
+    CHECKPOINT_BATCH_SIZE,
+    CHECKPOINT_DB_PATH,
+    CHECKPOINT_MEMORY_MAX_BYTES,
+    CHECKPOINT_MEMORY_TTL_SECONDS,
+    CHECKPOINTER_BACKEND,
+)
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINTER_BACKENDS: tuple[str, ...] = ("memory", "sqlite")
+
+# Pending-write channels that must hit disk immediately. An interrupt
+# (or a captured task error) is the last thing written before the graph
+# pauses — there is no following ``put()`` to flush it, so deferring the
+# commit would leave the paused state in the uncommitted batch. Spelled
+# out literally because ``langgraph.constants`` deprecated the exports.
+_FLUSH_ON_CHANNELS: frozenset[str] = frozenset({"__interrupt__", "__error__"})
+
+
+# ---------------------------------------------------------------------------
+# Memory backend — bounded MemorySaver
+# ---------------------------------------------------------------------------
+
+
+class CheckpointStoreStats(BaseModel):
+    """Point-in-time counters for a ``BoundedMemorySaver``.
+
+    Eviction counts are cumulative for the life of the saver; ``threads``
+    and ``bytes`` describe what is resident right now. ``bytes`` is the
+    serialised checkpoint / blob / write payload size — a floor on the
+    real heap cost, but proportional to it, which is what sizing needs.
+    """
+    threads: int
+    bytes: int
+    ttl_evictions: int
+    budget_evictions: int
+
+
+class BoundedMemorySaver(MemorySaver):
+    """``MemorySaver`` that forgets idle threads and respects a byte budget.
+
+    The stock saver keeps every ``thread_id`` it has ever seen, and the
+    frontend mints a fresh UUID per run, so a long-lived process leaks a
+    full ``AgencyState`` snapshot history per run. Two bounds apply,
+    checked on every read and write:
+
+    * **Idle TTL** — a thread not read or written for ``ttl_seconds`` is
+      deleted. Paused runs count as idle while the user is deciding, so
+      the TTL should comfortably exceed a realistic think time.
+    * **Byte budget** — when the resident serialised size exceeds
+      ``max_bytes``, least-recently-used threads are deleted until it
+      fits. The thread being written is never evicted by its own write.
+
+    All bookkeeping happens under one lock because LangGraph writes
+    checkpoints from background threads.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = CHECKPOINT_MEMORY_TTL_SECONDS,
+        max_bytes: int = CHECKPOINT_MEMORY_MAX_BYTES,
+        clock: Any = time.monotonic,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.RLock()
+        # thread_id -> last access time, least recently used first.
+        self._last_access: OrderedDict[str, float] = OrderedDict()
+        self._thread_bytes: dict[str, int] = {}
+        self._total_bytes = 0
+        self._ttl_evictions = 0
+        self._budget_evictions = 0
+
+    # --- Bookkeeping -------------------------------------------------------
+
+    def _touch(self, thread_id: str) -> None:
+        self._last_access[thread_id] = self._clock()
+        self._last_access.move_to_end(thread_id)
+
+    def _add_bytes(self, thread_id: str, size: int) -> None:
+        self._thread_bytes[thread_id] = self._thread_bytes.get(thread_id, 0) + size
+        self._total_bytes += size
+
+    def _evict(self, thread_id: str) -> None:
+        super().delete_thread(thread_id)
+        self._last_access.pop(thread_id, None)
+        self._total_bytes -= self._thread_bytes.pop(thread_id, 0)
+
+    def _sweep(self, keep: str | None = None) -> None:
+        """Apply the TTL, then the byte budget. Caller holds ``self._lock``."""
+        if self.ttl_seconds > 0:
+            cutoff = self._clock() - self.ttl_seconds
+            while self._last_access:
+                oldest, last_seen = next(iter(self._last_access.items()))
+                if last_seen > cutoff or oldest == keep:
+                    break
+                self._evict(oldest)
+                self._ttl_evictions += 1
+                logger.info("Evicted idle checkpoint thread %s (TTL)", oldest)
+
+        if self.max_bytes > 0:
+            while self._total_bytes > self.max_bytes:
+                victim = next(
+                    (t for t in self._last_access if t != keep), None
+                )
+                if victim is None:
+                    break
+                self._evict(victim)
+                self._budget_evictions += 1
+                logger.info(
+                    "Evicted checkpoint thread %s (byte budget)", victim
+                )
+
+    # --- Saver API ---------------------------------------------------------
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        thread_id = config["configurable"]["thread_id"]
+        with self._lock:
+            self._sweep()
+            if thread_id not in self._last_access:
+                # Unknown (or already evicted) thread. Answer without
+                # touching ``self.storage`` — the base class's defaultdict
+                # lookups would otherwise create empty entries for every
+                # probed thread_id.
+                return None
+            self._touch(thread_id)
+            return super().get_tuple(config)
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        **kwargs: Any,
+    ) -> Iterator[CheckpointTuple]:
+        with self._lock:
+            self._sweep()
+            if config is not None:
+                thread_id = config["configurable"]["thread_id"]
+                if thread_id not in self._last_access:
+                    return iter(())
+                self._touch(thread_id)
+            # Materialise under the lock so a concurrent eviction can't
+            # mutate the dicts the base generator is walking.
+            return iter(list(super().list(config, **kwargs)))
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        with self._lock:
+            result = super().put(config, checkpoint, metadata, new_versions)
+            saved, saved_metadata, _ = self.storage[thread_id][checkpoint_ns][
+                checkpoint["id"]
+            ]
+            size = len(saved[1]) + len(saved_metadata[1])
+            for channel, version in new_versions.items():
+                blob = self.blobs.get((thread_id, checkpoint_ns, channel, version))
+                if blob is not None:
+                    size += len(blob[1])
+            self._add_bytes(thread_id, size)
+            self._touch(thread_id)
+            self._sweep(keep=thread_id)
+            return result
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        thread_id = config["configurable"]["thread_id"]
+        outer_key = (
+            thread_id,
+            config["configurable"].get("checkpoint_ns", ""),
+            config["configurable"]["checkpoint_id"],
+        )
+        with self._lock:
+            before = sum(
+                len(w[2][1]) for w in self.writes.get(outer_key, {}).values()
+            )
+            super().put_writes(config, writes, task_id, task_path)
+            after = sum(
+                len(w[2][1]) for w in self.writes.get(outer_key, {}).values()
+            )
+            self._add_bytes(thread_id, after - before)
+            self._touch(thread_id)
+            self._sweep(keep=thread_id)
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._lock:
+            self._evict(thread_id)
+
+    def stats(self) -> CheckpointStoreStats:
+        """Return current residency and cumulative eviction counters."""
+        with self._lock:
+            return CheckpointStoreStats(
+                threads=len(self._last_access),
+                bytes=self._total_bytes,
+                ttl_evictions=self._ttl_evictions,
+                budget_evictions=self._budget_evictions,
+            )
+
+
+# ---------------------------------------------------------------------------
+# SQLite backend — batched, WAL-mode SqliteSaver
+# ---------------------------------------------------------------------------
+
+
+class BatchedSqliteSaver(SqliteSaver):
+    """``SqliteSaver`` in WAL mode with batched commits.
+
+    The stock saver commits after every ``put_writes()`` call — one
+    fsync per task write, several per graph step. This subclass
+    defers commits and flushes them in groups:
+
+    * every ``put()`` (a checkpoint boundary) commits everything
+      written since the previous boundary in one transaction;
+    * a write batch touching an interrupt or error channel commits
+      immediately, so a paused run is durable the moment it pauses;
+    * otherwise, at most ``batch_size`` write batches are held
+      before a commit is forced.
+
+    Reads go through the same connection, so uncommitted writes are
+    visible to this process straight away — batching only changes
+    what another process (or a restarted one) can see.
+
+    The stock ``SqliteSaver`` is sync-only (its ``a*`` methods raise).
+    The async methods here run the sync ones in a worker thread — the
+    saver's lock already serialises connection access — so the async
+    graph (``build_graph_st2(asynchronous=True)``) can use this backend
+    without an ``aiosqlite`` dependency.
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        batch_size: int = CHECKPOINT_BATCH_SIZE,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(conn, **kwargs)
+        self.batch_size = max(1, batch_size)
+        self._uncommitted = 0
+
+    @classmethod
+    def from_path(
+        cls,
+        path: str | Path,
+        *,
+        batch_size: int = CHECKPOINT_BATCH_SIZE,
+    ) -> BatchedSqliteSaver:
+        """Open (or create) a checkpoint database at ``path``.
+
+        Switches the connection to WAL with ``synchronous=NORMAL``:
+        readers never block the writer, and commits skip the
+        per-transaction fsync that the default rollback journal
+        needs. ``check_same_thread=False`` is safe because the base
+        class serialises every cursor behind ``self.lock``.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(path), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return cls(conn, batch_size=batch_size)
+
+    @contextmanager
+    def cursor(self, transaction: bool = True) -> Iterator[sqlite3.Cursor]:
+        """Yield a cursor, counting (not committing) transactional use."""
+        with self.lock:
+            self.setup()
+            cur = self.conn.cursor()
+            try:
+                yield cur
+            finally:
+                if transaction:
+                    self._uncommitted += 1
+                    if self._uncommitted >= self.batch_size:
+                        self._commit_locked()
+                cur.close()
+
+    def _commit_locked(self) -> None:
+        """Commit the open batch. Caller must hold ``self.lock``."""
+        self.conn.commit()
+        self._uncommitted = 0
+
+    def flush(self) -> None:
+        """Commit any writes still held in the current batch."""
+        with self.lock:
+            if self._uncommitted:
+                self._commit_locked()
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        result = super().put(config, checkpoint, metadata, new_versions)
+        self.flush()
+        return result
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        super().put_writes(config, writes, task_id, task_path)
+        if any(channel in _FLUSH_ON_CHANNELS for channel, _ in writes):
+            self.flush()
+
+    def close(self) -> None:
+        """Flush the open batch and close the connection."""
+        self.flush()
+        self.conn.close()
+
+    # --- Async API (thread offload) ---
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        items = await asyncio.to_thread(
+            lambda: list(
+                self.list(config, filter=filter, before=before, limit=limit)
+            )
+        )
+        for item in items:
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await asyncio.to_thread(
+            self.put, config, checkpoint, metadata, new_versions
+        )
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+
+# ---------------------------------------------------------------------------
+# Factory
+# ---------------------------------------------------------------------------
+
+
+def build_checkpointer(
+    backend: str | None = None,
+    *,
+    db_path: str | Path | None = None,
+    batch_size: int | None = None,
+) -> BaseCheckpointSaver:
+    """Build a checkpointer for the Standard 2.0 graph.
+
+    Args:
+        backend: ``"memory"`` or ``"sqlite"``. Defaults to
+            ``CHECKPOINTER_BACKEND`` from config. The memory backend
+            reads its TTL and byte budget from
+            ``CHECKPOINT_MEMORY_TTL_SECONDS`` / ``CHECKPOINT_MEMORY_MAX_BYTES``.
+        db_path: SQLite database file. Defaults to ``CHECKPOINT_DB_PATH``.
+            Ignored by the memory backend.
+        batch_size: Maximum write batches held before a forced commit.
+            Defaults to ``CHECKPOINT_BATCH_SIZE``. Ignored by the memory
+            backend.
+
+    Returns:
+        A ``BaseCheckpointSaver`` ready to pass to
+        ``build_graph_st2(checkpointer=...)``.
+
+    Raises:
+        ValueError: If ``backend`` is not one of ``CHECKPOINTER_BACKENDS``.
+    """
+    backend = (backend or CHECKPOINTER_BACKEND).lower()
+    if backend == "memory":
+        return BoundedMemorySaver()
+    if backend == "sqlite":
+        return BatchedSqliteSaver.from_path(
+            db_path or CHECKPOINT_DB_PATH,
+            batch_size=batch_size or CHECKPOINT_BATCH_SIZE,
+        )
+    valid = ", ".join(CHECKPOINTER_BACKENDS)
+    raise ValueError(
+        f"Invalid checkpointer backend '{backend}'. Must be one of: {valid}"
+    )
@@ -0,0 +1,211 @@
+"""
+agt_sea — Speculative Creative B
+
+Pre-develops campaign concepts while the Standard 2.0 graph is paused at
+the territory-selection interrupt. The human may take minutes to choose;
+the workers would otherwise sit idle, and the chosen territory then pays
+a full Creative B latency after the click.
+
+``SpeculativeConceptPool`` runs Creative B for the first few territories
+in background threads as soon as Creative A returns, keyed on the graph
+thread. When the user selects, Creative B's node asks the pool first: a
+speculative concept developed from exactly the same inputs is adopted
+(waiting for it if it is still running), and everything else in the
+batch is cancelled.
+
+Matching is by fingerprint, not territory index: the fingerprint covers
+every field Creative B reads on its initial pass (brief, territory,
+lenses, temperature, provider, model), so a concept is only reused when
+a fresh call would have been made with identical inputs. Revision passes
+never use the pool.
+
+Cancellation is best-effort. Speculative calls that have not started
+are cancelled outright; a call already in flight cannot be interrupted
+from another thread, so it finishes and its result is dropped.
+
+The pool is process-local, like the memory checkpointer. A run resumed
+in another process (SQLite checkpointer after a restart) simply finds
+nothing and makes the call as usual.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from agt_sea.models.state import AgencyState
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on concurrent speculative LLM calls across all runs.
+_MAX_WORKERS = 8
+# Paused runs whose speculation is kept; the oldest batch is cancelled
+# and dropped beyond this (abandoned runs never take theirs).
+_MAX_BATCHES = 64
+
+
+def concept_fingerprint(state: AgencyState) -> str:
+    """Return the identity of Creative B's initial-pass inputs for ``state``."""
+    territory = state.selected_territory
+    payload = {
+        "brief": state.creative_brief,
+        "territory": territory.model_dump() if territory is not None else None,
+        "philosophy": state.creative_b_st2_creative_philosophy.value,
+        "provenance": state.creative_b_st2_provenance.value,
+        "taste": state.creative_b_st2_taste.value,
+        "temperature": state.creative_b_st2_temperature,
+        "provider": state.llm_provider.value if state.llm_provider else None,
+        "model": state.llm_model,
+    }
+    encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def is_initial_pass(state: AgencyState) -> bool:
+    """True when Creative B would take its initial (non-revision) path."""
+    return state.grader_evaluation is None and state.cd_feedback_direction is None
+
+
+def adopt_speculative_concept(
+    state: AgencyState,
+    speculative: AgencyState,
+) -> AgencyState:
+    """Copy a speculative Creative B result onto the live state.
+
+    The speculative run started from an empty ``history``, so every
+    entry it holds is one Creative B produced and is appended as-is.
+    """
+    state.campaign_concept = speculative.campaign_concept
+    state.iteration = speculative.iteration
+    state.status = speculative.status
+    state.history.extend(speculative.history)
+    return state
+
+
+class SpeculativeConceptPool:
+    """Background Creative B calls, batched per graph thread."""
+
+    def __init__(
+        self,
+        max_workers: int = _MAX_WORKERS,
+        max_batches: int = _MAX_BATCHES,
+    ) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="speculative-concept"
+        )
+        self._max_batches = max_batches
+        self._batches: OrderedDict[str, dict[str, Future[AgencyState]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def start(
+        self,
+        thread_id: str,
+        state: AgencyState,
+        indices: Sequence[int],
+        develop: Callable[[AgencyState], AgencyState],
+    ) -> int:
+        """Start developing ``state.territories[i]`` for each of ``indices``.
+
+        Replaces (and cancels) any earlier batch for ``thread_id`` — a
+        territory rerun makes the previous speculation worthless. Calling
+        again with the same territories is a no-op.
+
+        Returns:
+            The number of speculative calls in the batch.
+        """
+        branches = {}
+        for index in indices:
+            branch = state.model_copy(
+                update={
+                    "selected_territory": state.territories[index],
+                    "selected_territory_indices": [index],
+                    "history": [],
+                }
+            )
+            branches[concept_fingerprint(branch)] = branch
+
+        with self._lock:
+            existing = self._batches.get(thread_id)
+            if existing is not None and existing.keys() == branches.keys():
+                return len(existing)
+            stale = [existing] if existing is not None else []
+            batch = {
+                fingerprint: self._executor.submit(develop, branch)
+                for fingerprint, branch in branches.items()
+            }
+            self._batches[thread_id] = batch
+            self._batches.move_to_end(thread_id)
+            while len(self._batches) > self._max_batches:
+                stale.append(self._batches.popitem(last=False)[1])
+
+        for old in stale:
+            _cancel_all(old.values())
+        return len(batch)
+
+    def _claim(self, thread_id: str, state: AgencyState) -> Future[AgencyState] | None:
+        with self._lock:
+            batch = self._batches.pop(thread_id, None)
+        if batch is None:
+            return None
+        future = batch.pop(concept_fingerprint(state), None)
+        _cancel_all(batch.values())
+        return future
+
+    def take(self, thread_id: str, state: AgencyState) -> AgencyState | None:
+        """Return the speculative result matching ``state``, or None.
+
+        Consumes the thread's batch: the match (if any) is returned —
+        after waiting for it if it is still running — and every other
+        speculative call is cancelled. A speculative call that failed
+        returns None so the caller falls back to a fresh call.
+        """
+        future = self._claim(thread_id, state)
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except Exception:
+            logger.warning("Speculative Creative B call failed", exc_info=True)
+            return None
+
+    async def atake(self, thread_id: str, state: AgencyState) -> AgencyState | None:
+        """Async variant of ``take`` — awaits the speculative call."""
+        future = self._claim(thread_id, state)
+        if future is None:
+            return None
+        try:
+            return await asyncio.wrap_future(future)
+        except Exception:
+            logger.warning("Speculative Creative B call failed", exc_info=True)
+            return None
+
+    def discard(self, thread_id: str) -> None:
+        """Cancel and drop any speculation for ``thread_id``."""
+        with self._lock:
+            batch = self._batches.pop(thread_id, None)
+        if batch is not None:
+            _cancel_all(batch.values())
+
+    def pending(self, thread_id: str) -> list[Future[AgencyState]]:
+        """Return the thread's speculative futures (for tests / diagnostics)."""
+        with self._lock:
+            return list(self._batches.get(thread_id, {}).values())
+
+
+def _cancel_all(futures) -> None:
+    for future in futures:
+        future.cancel()
+
+
+# Module-scope pool shared by every speculative graph in the process, for
+# the same reason the checkpointer is a module singleton: Streamlit's
+# reruns rebuild the graph, but the paused run's speculation must survive.
+SPECULATIVE_POOL = SpeculativeConceptPool()
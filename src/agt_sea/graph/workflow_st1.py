@@ -4,11 +4,25 @@ agt_sea — Graph Workflow (Standard 1.0)
 Defines the LangGraph state graph that orchestrates the full
 creative agency pipeline: Strategist → Creative → Creative Director
 with conditional approval/revision routing.
+
+``build_graph_st1(asynchronous=True)`` compiles the same topology over
+the ``arun_*`` agent variants for ``ainvoke()`` / ``astream()`` callers
+(batch jobs, async servers) that need many runs in flight on one event
+loop.
+
+Nodes return partial update dicts — only the fields they changed — not
+the whole ``AgencyState``. Agents keep their standalone contract
+(mutate and return the state); ``_safe_node`` turns the result into
+the update with ``state_update()``, and ``history`` is append-reduced
+so each write carries only the new entries. Checkpoint writes and
+``stream_mode="updates"`` payloads therefore scale with what a step
+changed, not with the size of the run.
 """
 
 from __future__ import annotations
 
-from typing import Callable
+import inspect
+from typing import Any, Awaitable, Callable
 
 from langgraph.graph import StateGraph, END
 
@@ -17,23 +31,24 @@ from agt_sea.models.state import (
     AgentRole,
     WorkflowStatus,
 )
-from agt_sea.agents.strategist_st1 import run_strategist_st1
-from agt_sea.agents.creative_st1 import run_creative_st1
+from agt_sea.agents.strategist_st1 import arun_strategist_st1, run_strategist_st1
+from agt_sea.agents.creative_st1 import arun_creative_st1, run_creative_st1
 from agt_sea.agents.creative_director_st1 import (
+    arun_creative_director_st1,
     run_creative_director_st1,
     check_approval,
     check_max_iterations,
 )
+from agt_sea.tracing import node_name_for, node_span, record_node_error
 
 
 # ---------------------------------------------------------------------------
 # Finalisation nodes — handle state changes before the graph ends
 # ---------------------------------------------------------------------------
 
-def _finalise_approved(state: AgencyState) -> AgencyState:
+def _finalise_approved(state: AgencyState) -> dict[str, Any]:
     """Mark the workflow as approved."""
-    state.status = WorkflowStatus.APPROVED
-    return state
+    return {"status": WorkflowStatus.APPROVED}
 
 
 def format_node_error(fn_name: str, exc: Exception) -> str:
@@ -55,17 +70,53 @@ def format_node_error(fn_name: str, exc: Exception) -> str:
     return f"{fn_name} failed: {type(exc).__name__}: {exc}"
 
 
-def _finalise_failed(state: AgencyState) -> AgencyState:
+def snapshot_state(state: AgencyState) -> dict[str, Any]:
+    """Record ``state`` ahead of a node call, for ``state_update()``.
+
+    Field values are held by reference — agents replace fields rather
+    than mutating them, with the one exception of ``history``, which
+    they append to in place, so its length is recorded instead.
+    """
+    snapshot = dict(state)
+    snapshot["history"] = len(state.history)
+    return snapshot
+
+
+def state_update(
+    snapshot: dict[str, Any],
+    result: AgencyState | dict[str, Any],
+) -> dict[str, Any]:
+    """Reduce a node's returned state to the partial update LangGraph writes.
+
+    Shared with ``workflow_st2``. Only fields whose value differs from
+    ``snapshot`` are kept, and ``history`` holds just the entries
+    appended since — the ``AgencyState.history`` reducer appends them.
+    A node that already returns an update dict is passed through.
+    """
+    if isinstance(result, dict):
+        return result
+    update = {
+        name: value
+        for name, value in result
+        if name != "history" and value != snapshot[name]
+    }
+    appended = result.history[snapshot["history"]:]
+    if appended:
+        update["history"] = appended
+    return update
+
+
+def _finalise_failed(state: AgencyState) -> dict[str, Any]:
     """Mark the workflow as failed and ensure an error message is present."""
+    update: dict[str, Any] = {"status": WorkflowStatus.FAILED}
     if state.error is None:
-        state.error = "Unknown failure (no error detail captured)"
-    state.status = WorkflowStatus.FAILED
-    return state
+        update["error"] = "Unknown failure (no error detail captured)"
+    return update
 
 
 def _safe_node(
-    agent_fn: Callable[[AgencyState], AgencyState],
-) -> Callable[[AgencyState], AgencyState]:
+    agent_fn: Callable[[AgencyState], AgencyState | Awaitable[AgencyState]],
+) -> Callable[[AgencyState], dict[str, Any] | Awaitable[dict[str, Any]]]:
     """Wrap an agent node so escaped exceptions become clean FAILED exits.
 
     Try/except lives at the orchestration layer — agent functions stay clean.
@@ -73,18 +124,45 @@ def _safe_node(
     returned; routing functions (each guarded with ``if state.error``) then
     divert the run to ``finalise_failed``.
 
+    Either way the returned state is reduced to a partial update with
+    ``state_update()``, so the node writes only what the agent changed.
+
     Bare ``except Exception`` is deliberate: it catches ``pydantic.
     ValidationError`` (including the second-attempt failure re-raised by
     ``invoke_with_validation_retry`` in ``llm/provider.py``) via
     ``ValidationError → ValueError → Exception``, but does NOT catch
     ``KeyboardInterrupt`` or ``SystemExit``.
+
+    Each call runs inside a ``node_span`` (``agt_sea/tracing.py``; a no-op
+    without OpenTelemetry), which records the failure when there is one.
+
+    Coroutine functions (the ``arun_*`` agents) get an ``async`` wrapper
+    with the same semantics, so LangGraph awaits them natively.
     """
-    def wrapped(state: AgencyState) -> AgencyState:
-        try:
-            return agent_fn(state)
-        except Exception as exc:
-            state.error = format_node_error(agent_fn.__name__, exc)
-            return state
+    node = node_name_for(agent_fn.__name__)
+    if inspect.iscoroutinefunction(agent_fn):
+        async def awrapped(state: AgencyState) -> dict[str, Any]:
+            snapshot = snapshot_state(state)
+            with node_span(node, state) as span:
+                try:
+                    return state_update(snapshot, await agent_fn(state))
+                except Exception as exc:
+                    record_node_error(span, exc)
+                    state.error = format_node_error(agent_fn.__name__, exc)
+                    return state_update(snapshot, state)
+
+        awrapped.__name__ = f"safe_{agent_fn.__name__}"
+        return awrapped
+
+    def wrapped(state: AgencyState) -> dict[str, Any]:
+        snapshot = snapshot_state(state)
+        with node_span(node, state) as span:
+            try:
+                return state_update(snapshot, agent_fn(state))
+            except Exception as exc:
+                record_node_error(span, exc)
+                state.error = format_node_error(agent_fn.__name__, exc)
+                return state_update(snapshot, state)
 
     wrapped.__name__ = f"safe_{agent_fn.__name__}"
     return wrapped
@@ -104,7 +182,7 @@ def _check_failed(state: AgencyState) -> str:
     return "ok"
 
 
-def _finalise_max_iterations(state: AgencyState) -> AgencyState:
+def _finalise_max_iterations(state: AgencyState) -> dict[str, Any]:
     """Mark the workflow as max iterations reached and select the
     best-scoring creative concept from history."""
     best_score = -1.0
@@ -122,16 +200,17 @@ def _finalise_max_iterations(state: AgencyState) -> AgencyState:
     if best_iteration in creative_by_iteration:
         best_concept = creative_by_iteration[best_iteration]
 
-    state.creative_concept = best_concept
-    state.status = WorkflowStatus.MAX_ITERATIONS_REACHED
-    return state
+    return {
+        "creative_concept": best_concept,
+        "status": WorkflowStatus.MAX_ITERATIONS_REACHED,
+    }
 
 
 # ---------------------------------------------------------------------------
 # Graph definition
 # ---------------------------------------------------------------------------
 
-def build_graph_st1() -> StateGraph:
+def build_graph_st1(*, asynchronous: bool = False) -> StateGraph:
     """Build and compile the creative agency workflow graph.
 
     Graph structure (success path):
@@ -147,17 +226,38 @@ def build_graph_st1() -> StateGraph:
         following routing function's error guard diverts the run to
         ``finalise_failed`` → END.
 
+    Args:
+        asynchronous: When True, agent nodes use the ``arun_*`` coroutine
+            variants and the compiled graph must be driven with
+            ``ainvoke()`` / ``astream()``. Topology and routing are
+            identical to the sync graph.
+
     Returns:
         A compiled LangGraph StateGraph ready to invoke.
     """
     graph = StateGraph(AgencyState)
 
+    # Agent functions are looked up at build time (not bound at import) so
+    # tests that monkeypatch this module's names see their stubs.
+    if asynchronous:
+        strategist, creative, creative_director = (
+            arun_strategist_st1,
+            arun_creative_st1,
+            arun_creative_director_st1,
+        )
+    else:
+        strategist, creative, creative_director = (
+            run_strategist_st1,
+            run_creative_st1,
+            run_creative_director_st1,
+        )
+
     # --- Add nodes (agents wrapped with _safe_node for orchestration-layer
     # exception handling — agent functions themselves stay untouched) ---
-    graph.add_node("strategist_st1", _safe_node(run_strategist_st1))
-    graph.add_node("creative_st1", _safe_node(run_creative_st1))
-    graph.add_node("creative_director_st1", _safe_node(run_creative_director_st1))
-    graph.add_node("check_iterations", lambda state: state)  # pass-through
+    graph.add_node("strategist_st1", _safe_node(strategist))
+    graph.add_node("creative_st1", _safe_node(creative))
+    graph.add_node("creative_director_st1", _safe_node(creative_director))
+    graph.add_node("check_iterations", lambda state: {})  # pass-through
     graph.add_node("finalise_approved", _finalise_approved)
     graph.add_node("finalise_max_iterations", _finalise_max_iterations)
     graph.add_node("finalise_failed", _finalise_failed)
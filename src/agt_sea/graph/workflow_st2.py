@@ -8,17 +8,19 @@ concept) -> CD Grader -> [CD Feedback loop | CD Synthesis] -> END.
 Differences from ``workflow_st1.py`` (Standard 1.0) that matter to readers:
 
 1. **Checkpointer is required** — LangGraph's ``interrupt()`` primitive
-   only works when the compiled graph is given a checkpointer. We use
-   ``MemorySaver`` for zero-dependency, in-memory persistence. The
+   only works when the compiled graph is given a checkpointer. The
+   backend is pluggable (``graph/checkpointer.py``, selected by
+   ``CHECKPOINTER_BACKEND`` in config): ``MemorySaver`` by default for
+   zero-dependency, in-memory persistence, or a file-backed SQLite saver
+   when paused runs must survive a process restart / redeploy. The
    checkpointer is instantiated at **module scope** (see ``_CHECKPOINTER``
    below) and shared across every ``build_graph_st2()`` call — this is
    deliberate: Streamlit re-runs the whole page script on every user
    interaction, which means ``build_graph_st2()`` is called afresh each
    time. A per-call ``MemorySaver()`` would erase in-flight interrupts
    on the next rerun. A module-level singleton survives within the
-   Python process. It does NOT survive a process restart / redeploy —
-   persistent checkpointing (SQLite / Postgres) is the upgrade path
-   when that matters.
+   Python process; with the SQLite backend it survives across processes
+   too.
 
 2. **Interrupt node must be side-effect-free.** LangGraph resumes an
    interrupted node by **re-executing it from the top** — everything
@@ -50,25 +52,112 @@ Differences from ``workflow_st1.py`` (Standard 1.0) that matter to readers:
    ``config={"configurable": {"thread_id": "<id>"}}`` — LangGraph
    raises ``ValueError`` otherwise. Callers choose the thread_id; the
    same value must be reused on resume to hit the right checkpoint.
+
+6. **Async variant.** ``build_graph_st2(asynchronous=True)`` wires the
+   ``arun_*`` agent coroutines into the same topology for
+   ``ainvoke()`` / ``astream()`` callers. The interrupt node and the
+   finalisers stay synchronous — they do no I/O, and LangGraph runs sync
+   nodes inside an async graph transparently. Interrupt / resume works
+   the same way: ``await graph.ainvoke(Command(resume=...), config)``.
+
+7. **Parallel concept mode.** ``build_graph_st2(parallel_concepts=True)``
+   lets the user select several territories at the interrupt
+   (``{"action": "select", "indices": [...]}``). Each selection is sent
+   to its own ``develop_concept_st2`` branch with LangGraph ``Send`` —
+   Creative B, CD Grader and (on rejection) the CD Feedback loop, run
+   concurrently per territory — and ``collect_concepts_st2`` merges the
+   branches back before CD Synthesis compares them. Branches work on a
+   private copy of state and write only ``concept_candidates`` and
+   their own ``history`` entries (both reducer-merged channels), so
+   concurrent writes never collide.
+
+8. **Speculative concepts.** ``build_graph_st2(speculative_concepts=k)``
+   (default ``SPECULATIVE_CONCEPTS`` from config, 0 = off) inserts a
+   ``speculate_concepts_st2`` node between Creative A and the interrupt.
+   It hands the first k territories to the process-wide pool in
+   ``graph/speculation.py``, which develops them with Creative B in
+   background threads while the user is choosing. On the initial
+   Creative B pass after a selection the node takes the matching
+   speculative concept (identical inputs, keyed by fingerprint) instead
+   of calling the LLM, and the rest of the batch is cancelled. Revision
+   passes, unmatched selections and failed speculation fall through to
+   a normal call. Serial graph only — ignored with ``parallel_concepts``.
+
+9. **Concurrent feedback.** ``build_graph_st2(concurrent_feedback=True)``
+   (default ``CONCURRENT_FEEDBACK`` from config) replaces the
+   ``cd_grader_st2`` -> ``cd_feedback_st2`` pair with one
+   ``grade_and_feedback_st2`` node that runs both agents at once and
+   keeps Feedback's direction only when ``_check_approval`` says
+   ``rejected_budget``. A rejected iteration then costs one LLM latency
+   instead of two. Feedback is started without a grade (the grade does
+   not exist yet); CD Feedback already supports that. In parallel
+   concept mode each branch's loop uses the same pairing.
+
+10. **Partial updates.** As on v1, every node returns a dict of only the
+    fields it changed, with ``history`` holding just its new entries
+    (append-reduced on ``AgencyState``). ``_safe_node`` derives the
+    update from the agent's returned state with v1's
+    ``state_update()``; the graph-internal nodes build theirs directly.
+    Branch loops and the concurrent grader / feedback pair call agents
+    through ``_guard`` instead, which keeps the state-in / state-out
+    contract they iterate on.
+
+11. **Best-of on exhaustion.** History entries carry typed payloads, so
+    when the serial loop runs out of iterations ``_best_of`` scans them
+    for the highest-scoring concept and CD Synthesis presents that one
+    rather than the last revision — v1's best-of, without parsing text.
 """
 
 from __future__ import annotations
 
-from typing import Callable
-
-from langgraph.checkpoint.memory import MemorySaver
+import asyncio
+import inspect
+import logging
+from typing import Any, Awaitable, Callable
+
+from langchain_core.runnables.config import (
+    ContextThreadPoolExecutor,
+    var_child_runnable_config,
+)
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.config import get_config
 from langgraph.errors import GraphBubbleUp
 from langgraph.graph import END, StateGraph
-from langgraph.types import interrupt
-
-from agt_sea.agents.cd_feedback_st2 import run_cd_feedback_st2
-from agt_sea.agents.cd_grader_st2 import run_cd_grader_st2
-from agt_sea.agents.cd_synthesis_st2 import run_cd_synthesis_st2
-from agt_sea.agents.creative_a_st2 import run_creative_a_st2
-from agt_sea.agents.creative_b_st2 import run_creative_b_st2
-from agt_sea.agents.strategist_st2 import run_strategist_st2
-from agt_sea.graph.workflow_st1 import format_node_error
-from agt_sea.models.state import AgencyState, WorkflowStatus
+from langgraph.types import Send, interrupt
+
+from agt_sea.agents.cd_feedback_st2 import arun_cd_feedback_st2, run_cd_feedback_st2
+from agt_sea.agents.cd_grader_st2 import arun_cd_grader_st2, run_cd_grader_st2
+from agt_sea.agents.cd_synthesis_st2 import (
+    arun_cd_synthesis_st2,
+    run_cd_synthesis_st2,
+)
+from agt_sea.agents.creative_a_st2 import arun_creative_a_st2, run_creative_a_st2
+from agt_sea.agents.creative_b_st2 import arun_creative_b_st2, run_creative_b_st2
+from agt_sea.agents.strategist_st2 import arun_strategist_st2, run_strategist_st2
+from agt_sea.config import CONCURRENT_FEEDBACK, SPECULATIVE_CONCEPTS
+from agt_sea.graph.checkpointer import build_checkpointer
+from agt_sea.graph.speculation import (
+    SPECULATIVE_POOL,
+    adopt_speculative_concept,
+    is_initial_pass,
+)
+from agt_sea.graph.workflow_st1 import (
+    format_node_error,
+    snapshot_state,
+    state_update,
+)
+from agt_sea.models.state import (
+    AgencyState,
+    CampaignConcept,
+    CampaignConceptPayload,
+    ConceptCandidate,
+    GraderEvaluation,
+    GraderEvaluationPayload,
+    WorkflowStatus,
+)
+from agt_sea.tracing import node_name_for, node_span, record_node_error
+
+logger = logging.getLogger(__name__)
 
 
 # ---------------------------------------------------------------------------
@@ -78,9 +167,10 @@ from agt_sea.models.state import AgencyState, WorkflowStatus
 # Instantiated once at import time. Every call to ``build_graph_st2()``
 # passes this same instance to ``StateGraph.compile(checkpointer=...)``,
 # so interrupted runs survive Streamlit's per-interaction script reruns
-# within a process. See the module docstring for the rationale.
+# within a process. See the module docstring for the rationale. The
+# backend comes from ``CHECKPOINTER_BACKEND`` via ``build_checkpointer()``.
 
-_CHECKPOINTER = MemorySaver()
+_CHECKPOINTER = build_checkpointer()
 
 
 # ---------------------------------------------------------------------------
@@ -88,10 +178,10 @@ _CHECKPOINTER = MemorySaver()
 # ---------------------------------------------------------------------------
 
 
-def _safe_node(
-    agent_fn: Callable[[AgencyState], AgencyState],
-) -> Callable[[AgencyState], AgencyState]:
-    """Wrap an agent node so escaped exceptions become clean FAILED exits.
+def _guard(
+    agent_fn: Callable[[AgencyState], AgencyState | Awaitable[AgencyState]],
+) -> Callable[[AgencyState], AgencyState | Awaitable[AgencyState]]:
+    """Wrap an agent call so escaped exceptions become clean FAILED exits.
 
     Differs from v1's ``_safe_node`` in one important respect: it
     re-raises ``GraphBubbleUp``. ``GraphInterrupt`` (and any other
@@ -105,38 +195,92 @@ def _safe_node(
     v1) and the state is returned; routing functions, each guarded with
     ``if state.error is not None: return "failed"``, then divert the run
     to ``finalise_failed``.
+
+    Each call runs inside a ``node_span`` (``agt_sea/tracing.py``; a no-op
+    without OpenTelemetry). Real failures are recorded on the span; the
+    interrupt's ``GraphBubbleUp`` is not.
+
+    Coroutine functions get an ``async`` wrapper with identical semantics.
+    The wrapped call still returns a state; graph nodes go through
+    ``_safe_node``, which reduces it to a partial update.
     """
+    node = node_name_for(agent_fn.__name__)
+    if inspect.iscoroutinefunction(agent_fn):
+        async def awrapped(state: AgencyState) -> AgencyState:
+            with node_span(node, state) as span:
+                try:
+                    return await agent_fn(state)
+                except GraphBubbleUp:
+                    raise
+                except Exception as exc:
+                    record_node_error(span, exc)
+                    state.error = format_node_error(agent_fn.__name__, exc)
+                    return state
+
+        awrapped.__name__ = f"safe_{agent_fn.__name__}"
+        return awrapped
+
     def wrapped(state: AgencyState) -> AgencyState:
-        try:
-            return agent_fn(state)
-        except GraphBubbleUp:
-            # Control-flow signals (GraphInterrupt and friends) must
-            # reach the runtime — never swallow them.
-            raise
-        except Exception as exc:
-            state.error = format_node_error(agent_fn.__name__, exc)
-            return state
+        with node_span(node, state) as span:
+            try:
+                return agent_fn(state)
+            except GraphBubbleUp:
+                # Control-flow signals (GraphInterrupt and friends) must
+                # reach the runtime — never swallow them.
+                raise
+            except Exception as exc:
+                record_node_error(span, exc)
+                state.error = format_node_error(agent_fn.__name__, exc)
+                return state
 
     wrapped.__name__ = f"safe_{agent_fn.__name__}"
     return wrapped
 
 
+def _partial_update(
+    node_fn: Callable[[AgencyState], Any],
+) -> Callable[[AgencyState], Any]:
+    """Make ``node_fn`` write only what it changed (see v1's ``state_update``)."""
+    if inspect.iscoroutinefunction(node_fn):
+        async def anode(state: AgencyState) -> dict[str, Any]:
+            snapshot = snapshot_state(state)
+            return state_update(snapshot, await node_fn(state))
+
+        anode.__name__ = node_fn.__name__
+        return anode
+
+    def node(state: AgencyState) -> dict[str, Any]:
+        snapshot = snapshot_state(state)
+        return state_update(snapshot, node_fn(state))
+
+    node.__name__ = node_fn.__name__
+    return node
+
+
+def _safe_node(
+    agent_fn: Callable[[AgencyState], AgencyState | Awaitable[AgencyState]],
+) -> Callable[[AgencyState], dict[str, Any] | Awaitable[dict[str, Any]]]:
+    """Wrap an agent as a graph node: ``_guard``, then a partial update."""
+    return _partial_update(_guard(agent_fn))
+
+
 # ---------------------------------------------------------------------------
 # Interrupt node — human-in-the-loop territory selection
 # ---------------------------------------------------------------------------
 
 
-def _interrupt_territory_selection(state: AgencyState) -> AgencyState:
+def _interrupt_territory_selection(state: AgencyState) -> dict[str, Any]:
     """Pause the graph until the user picks a territory or asks for a rerun.
 
     Idempotency contract: this node re-executes in full on every resume
     (LangGraph's documented behaviour). Do not append to ``state.history``,
-    do not bump counters, do not call out to LLMs. The only mutations
-    safe to perform are the ones derived from the resume value, after
-    ``interrupt()`` returns — mutations made *before* the ``interrupt()``
-    call are not captured in the paused checkpoint (LangGraph snapshots
-    at the boundary of the previous node, not at the start of the
-    interrupted one), so they would be lost on resume anyway.
+    do not bump counters, do not call out to LLMs. The only writes safe
+    to return are the ones derived from the resume value, after
+    ``interrupt()`` returns — anything computed *before* the
+    ``interrupt()`` call is not captured in the paused checkpoint
+    (LangGraph snapshots at the boundary of the previous node, not at
+    the start of the interrupted one), so it would be lost on resume
+    anyway.
 
     The paused-state signal is therefore LangGraph's own:
     ``graph.get_state(config).interrupts`` (or ``snap.next ==
@@ -148,6 +292,9 @@ def _interrupt_territory_selection(state: AgencyState) -> AgencyState:
 
     * ``{"action": "select", "index": int}`` — pick the territory at
       that index in ``state.territories``.
+    * ``{"action": "select", "indices": list[int]}`` — pick several
+      (parallel graph); each is developed in its own Creative B branch.
+      ``selected_territory`` is set to the first.
     * ``{"action": "rerun", "rejection_context": str | None}`` — loop
       back to Creative A with optional steering text.
 
@@ -166,63 +313,466 @@ def _interrupt_territory_selection(state: AgencyState) -> AgencyState:
     action = resume_value.get("action")
     if action == "rerun":
         # Clear any prior selection and carry optional steering forward.
-        state.selected_territory = None
-        state.territory_rejection_context = resume_value.get(
-            "rejection_context"
-        )
-    elif action == "select":
-        index = resume_value["index"]
-        state.selected_territory = state.territories[index]
+        return {
+            "selected_territory": None,
+            "selected_territory_indices": [],
+            "territory_rejection_context": resume_value.get("rejection_context"),
+        }
+    if action == "select":
+        indices = resume_value.get("indices")
+        if indices is None:
+            indices = [resume_value["index"]]
+        if not indices:
+            raise ValueError(
+                "interrupt_territory_selection: 'select' needs at least one "
+                "territory index."
+            )
         # Clear rerun steering now that we're moving to campaign
         # development — stale context would otherwise leak into a later
         # rerun in the same run.
-        state.territory_rejection_context = None
-    else:
-        raise ValueError(
-            f"interrupt_territory_selection: unknown resume action "
-            f"{action!r}. Expected 'select' or 'rerun'."
+        return {
+            "selected_territory_indices": list(indices),
+            "selected_territory": state.territories[indices[0]],
+            "territory_rejection_context": None,
+        }
+    raise ValueError(
+        f"interrupt_territory_selection: unknown resume action "
+        f"{action!r}. Expected 'select' or 'rerun'."
+    )
+
+
+# ---------------------------------------------------------------------------
+# Parallel concept development — Send fan-out / collect
+# ---------------------------------------------------------------------------
+
+
+def _fan_out_concepts(state: AgencyState) -> str | list[Send]:
+    """Route the post-interrupt edge on the parallel graph.
+
+    ``failed`` and ``rerun`` behave as in ``_route_after_interrupt``. On a
+    selection, emits one ``Send`` per selected territory; LangGraph runs
+    the ``develop_concept_st2`` branches in the same step, concurrently.
+
+    Each branch gets a shallow copy of state narrowed to its territory,
+    with an empty ``history`` so branches never append to a shared list.
+    """
+    route = _route_after_interrupt(state)
+    if route != "selected":
+        return route
+    return [
+        Send(
+            "develop_concept_st2",
+            state.model_copy(
+                update={
+                    "selected_territory": state.territories[index],
+                    "selected_territory_indices": [index],
+                    "history": [],
+                    "concept_candidates": [],
+                }
+            ),
         )
+        for index in state.selected_territory_indices
+    ]
+
+
+def _to_candidate(branch: AgencyState) -> dict[str, list[Any]]:
+    """Package a finished branch as its ``concept_candidates`` write.
+
+    The branch started from an empty ``history``, so its history is
+    exactly the entries it produced; they are appended to the main
+    history directly rather than carried on the candidate.
+    """
+    candidate = ConceptCandidate(
+        territory_index=branch.selected_territory_indices[0],
+        territory=branch.selected_territory,
+        campaign_concept=branch.campaign_concept,
+        grader_evaluation=branch.grader_evaluation,
+        iterations=branch.iteration,
+        error=branch.error,
+    )
+    return {"concept_candidates": [candidate], "history": branch.history}
+
+
+def _develop_concept_node(
+    agents: dict[str, Callable[..., Any]],
+    concurrent_feedback: bool = False,
+) -> Callable[[AgencyState], Any]:
+    """Build the ``develop_concept_st2`` branch node for ``agents``.
+
+    One branch runs the serial graph's campaign loop for a single
+    territory — Creative B, CD Grader, then CD Feedback and another
+    Creative B pass while ``_check_approval`` says ``rejected_budget`` —
+    and returns its ``ConceptCandidate`` plus the history it produced.
+    Each agent call goes through ``_guard``, so a failure stops the
+    branch and is carried on the candidate's ``error`` for
+    ``_collect_concepts`` to surface.
+
+    With ``concurrent_feedback`` the grader and feedback calls run as one
+    ``_grade_and_feedback_node`` step, as on the serial graph.
+    """
+    creative_b = _guard(agents["creative_b_st2"])
+    grader = _guard(agents["cd_grader_st2"])
+    feedback = _guard(agents["cd_feedback_st2"])
+    if concurrent_feedback:
+        grader = _grade_and_feedback_node(agents)
+        feedback = None
+
+    if inspect.iscoroutinefunction(creative_b):
+        async def adevelop(state: AgencyState) -> dict:
+            branch = await creative_b(state)
+            while branch.error is None:
+                branch = await grader(branch)
+                if _check_approval(branch) != "rejected_budget":
+                    break
+                if feedback is not None:
+                    branch = await feedback(branch)
+                    if branch.error is not None:
+                        break
+                branch = await creative_b(branch)
+            return _to_candidate(branch)
+
+        return adevelop
+
+    def develop(state: AgencyState) -> dict:
+        branch = creative_b(state)
+        while branch.error is None:
+            branch = grader(branch)
+            if _check_approval(branch) != "rejected_budget":
+                break
+            if feedback is not None:
+                branch = feedback(branch)
+                if branch.error is not None:
+                    break
+            branch = creative_b(branch)
+        return _to_candidate(branch)
+
+    return develop
+
+
+def _collect_concepts(state: AgencyState) -> dict[str, Any]:
+    """Merge the parallel branches back into the main state.
+
+    Runs once, after every ``develop_concept_st2`` branch has finished.
+    The branches have already appended their history entries; the
+    iteration counter advances to the longest branch. The top-scoring
+    candidate becomes ``selected_territory`` / ``campaign_concept`` /
+    ``grader_evaluation`` so CD Synthesis, the post-synthesis router and
+    the frontend read the same fields as on the serial graph.
+
+    Any failed branch fails the run — the same fail-fast contract as a
+    failing node on the serial graph.
+    """
+    candidates = state.concept_candidates
+    update: dict[str, Any] = {
+        "iteration": max(
+            [state.iteration, *(candidate.iterations for candidate in candidates)]
+        ),
+    }
+
+    failed = [candidate for candidate in candidates if candidate.error is not None]
+    if failed:
+        return update | {"error": failed[0].error}
+    if not candidates:
+        return update | {
+            "error": "collect_concepts_st2: no concept branches produced output"
+        }
+
+    best = max(
+        candidates,
+        key=lambda candidate: (
+            candidate.grader_evaluation.score
+            if candidate.grader_evaluation is not None
+            else -1.0
+        ),
+    )
+    return update | {
+        "selected_territory": best.territory,
+        "campaign_concept": best.campaign_concept,
+        "grader_evaluation": best.grader_evaluation,
+        "status": WorkflowStatus.REVIEW,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Speculative concepts — background Creative B while the user chooses
+# ---------------------------------------------------------------------------
+
+
+def _thread_id() -> str:
+    """Return the ``thread_id`` of the run executing the current node."""
+    return get_config()["configurable"]["thread_id"]
+
+
+def _speculate_concepts_node(
+    count: int,
+    develop: Callable[[AgencyState], AgencyState],
+) -> Callable[[AgencyState], dict[str, Any]]:
+    """Build the ``speculate_concepts_st2`` node.
+
+    Starts background Creative B calls for the first ``count``
+    territories and returns immediately — the graph goes straight on to
+    the interrupt, with nothing written to state. Speculation is an
+    optimisation only, so a failure to start it is swallowed and never
+    fails the run.
+    """
+
+    def speculate(state: AgencyState) -> dict[str, Any]:
+        indices = range(min(count, len(state.territories)))
+        try:
+            SPECULATIVE_POOL.start(_thread_id(), state, indices, develop)
+        except Exception:  # noqa: BLE001 — speculation must not fail the run
+            logger.warning("Could not start speculative concepts", exc_info=True)
+        return {}
+
+    return speculate
+
+
+def _speculative_creative_b(
+    agent_fn: Callable[[AgencyState], AgencyState | Awaitable[AgencyState]],
+) -> Callable[[AgencyState], AgencyState | Awaitable[AgencyState]]:
+    """Let Creative B's initial pass reuse a speculative concept.
+
+    Keeps ``agent_fn``'s name so ``_safe_node`` error strings are
+    unchanged; the sync / async split mirrors ``_safe_node``.
+    """
+    if inspect.iscoroutinefunction(agent_fn):
+        async def awrapped(state: AgencyState) -> AgencyState:
+            if is_initial_pass(state):
+                speculative = await SPECULATIVE_POOL.atake(_thread_id(), state)
+                if speculative is not None:
+                    return adopt_speculative_concept(state, speculative)
+            return await agent_fn(state)
+
+        awrapped.__name__ = agent_fn.__name__
+        return awrapped
+
+    def wrapped(state: AgencyState) -> AgencyState:
+        if is_initial_pass(state):
+            speculative = SPECULATIVE_POOL.take(_thread_id(), state)
+            if speculative is not None:
+                return adopt_speculative_concept(state, speculative)
+        return agent_fn(state)
+
+    wrapped.__name__ = agent_fn.__name__
+    return wrapped
 
+
+# ---------------------------------------------------------------------------
+# Best-of restoration
+# ---------------------------------------------------------------------------
+
+
+def _best_of(state: AgencyState) -> dict[str, Any]:
+    """Find the highest-scoring concept of the serial loop in history.
+
+    A typed scan: each Creative B ``CampaignConceptPayload`` is paired
+    with the CD Grader ``GraderEvaluationPayload`` of the same iteration
+    and the best-scoring pair wins — ties go to the later iteration, so
+    a loop that never improved keeps its latest concept. Returns the
+    ``campaign_concept`` / ``grader_evaluation`` update, or ``{}`` when
+    history holds no graded concept.
+    """
+    concepts: dict[int, CampaignConcept] = {}
+    best: tuple[CampaignConcept, GraderEvaluation] | None = None
+    for entry in state.history:
+        payload = entry.payload
+        if isinstance(payload, CampaignConceptPayload):
+            concepts[entry.iteration] = payload.concept
+        elif isinstance(payload, GraderEvaluationPayload):
+            concept = concepts.get(entry.iteration)
+            if concept is not None and (
+                best is None or payload.evaluation.score >= best[1].score
+            ):
+                best = (concept, payload.evaluation)
+    if best is None:
+        return {}
+    return {"campaign_concept": best[0], "grader_evaluation": best[1]}
+
+
+def _best_of_synthesis(
+    agent_fn: Callable[[AgencyState], AgencyState | Awaitable[AgencyState]],
+) -> Callable[[AgencyState], AgencyState | Awaitable[AgencyState]]:
+    """Give CD Synthesis the best concept when the loop is exhausted.
+
+    On ``rejected_exhausted`` the latest revision need not be the
+    strongest, so ``_best_of``'s pick is restored onto state first. Every
+    score on that path is below the threshold, so ``_route_after_synthesis``
+    still reaches ``finalise_max_iterations``. Same name-keeping and
+    sync / async split as ``_speculative_creative_b``.
+    """
+    def restore(state: AgencyState) -> None:
+        if _check_approval(state) == "rejected_exhausted":
+            for name, value in _best_of(state).items():
+                setattr(state, name, value)
+
+    if inspect.iscoroutinefunction(agent_fn):
+        async def awrapped(state: AgencyState) -> AgencyState:
+            restore(state)
+            return await agent_fn(state)
+
+        awrapped.__name__ = agent_fn.__name__
+        return awrapped
+
+    def wrapped(state: AgencyState) -> AgencyState:
+        restore(state)
+        return agent_fn(state)
+
+    wrapped.__name__ = agent_fn.__name__
+    return wrapped
+
+
+# ---------------------------------------------------------------------------
+# Concurrent grader + feedback
+# ---------------------------------------------------------------------------
+
+
+def _fork_for_grader(state: AgencyState) -> AgencyState:
+    return state.model_copy(update={"history": []})
+
+
+def _fork_for_feedback(state: AgencyState) -> AgencyState:
+    # The grade for this concept doesn't exist yet; hide the previous
+    # iteration's so Feedback doesn't coach against a stale score.
+    return state.model_copy(update={"history": [], "grader_evaluation": None})
+
+
+def _merge_grade_and_feedback(
+    state: AgencyState,
+    graded: AgencyState,
+    coached: AgencyState | None,
+) -> AgencyState:
+    """Fold the grader's result — and feedback's, if it is needed — into state.
+
+    Feedback is kept only on the ``rejected_budget`` route; on any other
+    route it (and any error it raised) is dropped, exactly as if it had
+    never run.
+    """
+    state.grader_evaluation = graded.grader_evaluation
+    state.status = graded.status
+    state.error = graded.error
+    state.history.extend(graded.history)
+    if coached is not None and _check_approval(state) == "rejected_budget":
+        state.cd_feedback_direction = coached.cd_feedback_direction
+        state.status = coached.status
+        state.error = coached.error
+        state.history.extend(coached.history)
     return state
 
 
+def _detached(
+    agent_fn: Callable[[AgencyState], AgencyState],
+) -> Callable[[AgencyState], AgencyState]:
+    """Run ``agent_fn`` without the calling node's LangChain callbacks.
+
+    For a worker-thread call that may outlive its node: the stream
+    handlers LangGraph attaches would otherwise keep emitting its
+    tokens after the node has returned. Call inside a copied context.
+    """
+    def detached(state: AgencyState) -> AgencyState:
+        var_child_runnable_config.set(None)
+        return agent_fn(state)
+
+    return detached
+
+
+def _grade_and_feedback_node(
+    agents: dict[str, Callable[..., Any]],
+) -> Callable[[AgencyState], Any]:
+    """Build the ``grade_and_feedback_st2`` node for ``agents``.
+
+    Runs CD Grader and CD Feedback concurrently, each on its own copy of
+    state, and merges them with ``_merge_grade_and_feedback``. Feedback
+    is not started at all on the last iteration — a rejection there
+    routes to synthesis, so its direction could never be used.
+
+    The async variant cancels the feedback task once the grade makes it
+    unnecessary. The sync variant cannot interrupt a running call: it
+    stops waiting for it and lets the worker thread finish in the
+    background, so a discarded Feedback call is still paid for and still
+    draws on the provider's rate limit — use the async graph where that
+    matters. Its worker runs without the graph's LangChain callbacks, so
+    those tokens never reach ``stream_mode="messages"`` after the node
+    has returned. Both agents go through ``_guard``, and the merged state
+    is returned — the serial graph adds the node via ``_partial_update``.
+    """
+    grader = _guard(agents["cd_grader_st2"])
+    feedback = _guard(agents["cd_feedback_st2"])
+
+    if inspect.iscoroutinefunction(grader):
+        async def agrade_and_feedback(state: AgencyState) -> AgencyState:
+            if state.iteration >= state.max_iterations:
+                return _merge_grade_and_feedback(
+                    state, await grader(_fork_for_grader(state)), None
+                )
+            feedback_task = asyncio.ensure_future(
+                feedback(_fork_for_feedback(state))
+            )
+            try:
+                graded = await grader(_fork_for_grader(state))
+            except BaseException:
+                feedback_task.cancel()
+                raise
+            if _check_approval(graded) != "rejected_budget":
+                feedback_task.cancel()
+                return _merge_grade_and_feedback(state, graded, None)
+            return _merge_grade_and_feedback(state, graded, await feedback_task)
+
+        return agrade_and_feedback
+
+    def grade_and_feedback(state: AgencyState) -> AgencyState:
+        if state.iteration >= state.max_iterations:
+            return _merge_grade_and_feedback(
+                state, grader(_fork_for_grader(state)), None
+            )
+        # ContextThreadPoolExecutor runs the worker in a copy of the
+        # node's context (tracing span included); _detached then drops
+        # the LangChain run config from that copy.
+        executor = ContextThreadPoolExecutor(max_workers=1)
+        try:
+            feedback_future = executor.submit(
+                _detached(feedback), _fork_for_feedback(state)
+            )
+            graded = grader(_fork_for_grader(state))
+            if _check_approval(graded) != "rejected_budget":
+                return _merge_grade_and_feedback(state, graded, None)
+            return _merge_grade_and_feedback(
+                state, graded, feedback_future.result()
+            )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    return grade_and_feedback
+
+
 # ---------------------------------------------------------------------------
 # Finalisation nodes
 # ---------------------------------------------------------------------------
 
 
-def _finalise_approved(state: AgencyState) -> AgencyState:
+def _finalise_approved(state: AgencyState) -> dict[str, Any]:
     """Mark the workflow as approved."""
-    state.status = WorkflowStatus.APPROVED
-    return state
+    return {"status": WorkflowStatus.APPROVED}
 
 
-def _finalise_max_iterations(state: AgencyState) -> AgencyState:
+def _finalise_max_iterations(state: AgencyState) -> dict[str, Any]:
     """Mark the workflow as max-iterations-reached.
 
-    Unlike v1, v2 does NOT perform best-of restoration of a prior
-    campaign concept. Only one ``CampaignConcept`` lives on state at a
-    time (each Creative B revision overwrites the previous), and the
-    history stores rendered-text copies rather than typed snapshots.
-    The latest campaign — the one the final grader saw — is what
-    ``state.campaign_concept`` already holds, so we leave it in place.
-    CD Synthesis then evaluates that campaign for the user-facing
-    narrative.
-
-    If per-iteration best-of becomes a requirement we'd add a
-    ``campaign_concept_history: list[CampaignConcept]`` on state; that
-    is out of scope for Phase D (ADR 0014).
+    Best-of restoration has already happened by the time this runs: on
+    the ``rejected_exhausted`` path ``_best_of_synthesis`` put the
+    highest-scoring concept from history back on state *before* CD
+    Synthesis, so the synthesis narrative and ``state.campaign_concept``
+    describe the same concept. Doing it here, as v1 does, would swap
+    the concept out from under the recommendation.
     """
-    state.status = WorkflowStatus.MAX_ITERATIONS_REACHED
-    return state
+    return {"status": WorkflowStatus.MAX_ITERATIONS_REACHED}
 
 
-def _finalise_failed(state: AgencyState) -> AgencyState:
+def _finalise_failed(state: AgencyState) -> dict[str, Any]:
     """Mark the workflow as failed and ensure an error message is present."""
+    update: dict[str, Any] = {"status": WorkflowStatus.FAILED}
     if state.error is None:
-        state.error = "Unknown failure (no error detail captured)"
-    state.status = WorkflowStatus.FAILED
-    return state
+        update["error"] = "Unknown failure (no error detail captured)"
+    return update
 
 
 # ---------------------------------------------------------------------------
@@ -299,7 +849,14 @@ def _route_after_synthesis(state: AgencyState) -> str:
 # ---------------------------------------------------------------------------
 
 
-def build_graph_st2() -> StateGraph:
+def build_graph_st2(
+    checkpointer: BaseCheckpointSaver | None = None,
+    *,
+    asynchronous: bool = False,
+    parallel_concepts: bool = False,
+    speculative_concepts: int = SPECULATIVE_CONCEPTS,
+    concurrent_feedback: bool = CONCURRENT_FEEDBACK,
+) -> StateGraph:
     """Build and compile the Standard 2.0 creative agency workflow graph.
 
     Graph structure (success path):
@@ -310,31 +867,116 @@ def build_graph_st2() -> StateGraph:
                 -> rejected + budget -> cd_feedback_st2 -> creative_b_st2 (loop)
                 -> rejected + exhausted -> cd_synthesis_st2 -> finalise_max_iterations -> END
 
+    Parallel concept mode (``parallel_concepts=True``) replaces the
+    campaign loop with a fan-out:
+        interrupt_territory_selection
+            -> (select) -> Send x N -> develop_concept_st2 (one per territory)
+            -> collect_concepts_st2 -> cd_synthesis_st2 -> finalise_* -> END
+
+    Speculative mode (``speculative_concepts > 0``, serial graph only)
+    adds one node ahead of the interrupt:
+        creative_a_st2 -> speculate_concepts_st2 -> interrupt_territory_selection
+
+    Concurrent feedback (``concurrent_feedback=True``) merges the grader
+    and feedback steps of the campaign loop:
+        creative_b_st2 -> grade_and_feedback_st2
+            -> approved / rejected + exhausted -> cd_synthesis_st2
+            -> rejected + budget -> creative_b_st2 (loop)
+
     Failure path (any agent raises a non-control-flow exception):
-        _safe_node writes the error string into ``state.error``; the
-        next routing function's error guard diverts to ``finalise_failed``.
+        _safe_node writes the error string to ``error``; the next
+        routing function's error guard diverts to ``finalise_failed``.
+
+    Args:
+        checkpointer: Optional checkpointer override (e.g. a throwaway
+            ``MemorySaver`` in tests, or a saver from
+            ``build_checkpointer("sqlite", db_path=...)``). When None,
+            the module-scope ``_CHECKPOINTER`` is used.
+        asynchronous: When True, agent nodes use the ``arun_*`` coroutine
+            variants; drive the compiled graph with ``ainvoke()`` /
+            ``astream()``.
+        parallel_concepts: When True, the interrupt accepts several
+            territory indices and each selection is developed and graded
+            in its own concurrent branch; CD Synthesis then compares the
+            resulting concepts.
+        speculative_concepts: Number of territories to pre-develop with
+            Creative B while the graph waits at the interrupt (0 = off).
+            Speculative calls always use the sync ``run_creative_b_st2``
+            on a background thread, whichever variant the graph runs.
+            Ignored when ``parallel_concepts`` is True.
+        concurrent_feedback: When True, CD Feedback runs alongside CD
+            Grader and is kept only if the grade sends the concept back
+            for revision.
 
     Returns:
-        A compiled LangGraph StateGraph, with the module-scope
-        ``_CHECKPOINTER`` attached. Callers must pass
+        A compiled LangGraph StateGraph, with the chosen checkpointer
+        attached. Callers must pass
         ``config={"configurable": {"thread_id": "<id>"}}`` on every
         ``invoke()`` / ``stream()``.
     """
     graph = StateGraph(AgencyState)
+    speculate = speculative_concepts > 0 and not parallel_concepts
+
+    # Agent functions are looked up at build time (not bound at import) so
+    # tests that monkeypatch this module's names see their stubs.
+    if asynchronous:
+        agents = {
+            "strategist_st2": arun_strategist_st2,
+            "creative_a_st2": arun_creative_a_st2,
+            "creative_b_st2": arun_creative_b_st2,
+            "cd_grader_st2": arun_cd_grader_st2,
+            "cd_feedback_st2": arun_cd_feedback_st2,
+            "cd_synthesis_st2": arun_cd_synthesis_st2,
+        }
+    else:
+        agents = {
+            "strategist_st2": run_strategist_st2,
+            "creative_a_st2": run_creative_a_st2,
+            "creative_b_st2": run_creative_b_st2,
+            "cd_grader_st2": run_cd_grader_st2,
+            "cd_feedback_st2": run_cd_feedback_st2,
+            "cd_synthesis_st2": run_cd_synthesis_st2,
+        }
 
     # --- Agent nodes (every one wrapped; wrapper re-raises GraphBubbleUp) ---
-    graph.add_node("strategist_st2", _safe_node(run_strategist_st2))
-    graph.add_node("creative_a_st2", _safe_node(run_creative_a_st2))
+    graph.add_node("strategist_st2", _safe_node(agents["strategist_st2"]))
+    graph.add_node("creative_a_st2", _safe_node(agents["creative_a_st2"]))
     graph.add_node(
         "interrupt_territory_selection",
         _safe_node(_interrupt_territory_selection),
     )
-    graph.add_node("creative_b_st2", _safe_node(run_creative_b_st2))
-    graph.add_node("cd_grader_st2", _safe_node(run_cd_grader_st2))
-    graph.add_node("cd_feedback_st2", _safe_node(run_cd_feedback_st2))
-    graph.add_node("cd_synthesis_st2", _safe_node(run_cd_synthesis_st2))
-
-    # --- Finalisation nodes (unwrapped — they own state.status mutation) ---
+    if parallel_concepts:
+        graph.add_node(
+            "develop_concept_st2",
+            _develop_concept_node(agents, concurrent_feedback),
+        )
+        graph.add_node("collect_concepts_st2", _safe_node(_collect_concepts))
+    else:
+        creative_b = agents["creative_b_st2"]
+        if speculate:
+            creative_b = _speculative_creative_b(creative_b)
+            graph.add_node(
+                "speculate_concepts_st2",
+                _speculate_concepts_node(speculative_concepts, run_creative_b_st2),
+            )
+        graph.add_node("creative_b_st2", _safe_node(creative_b))
+        if concurrent_feedback:
+            graph.add_node(
+                "grade_and_feedback_st2",
+                _partial_update(_grade_and_feedback_node(agents)),
+            )
+        else:
+            graph.add_node("cd_grader_st2", _safe_node(agents["cd_grader_st2"]))
+            graph.add_node(
+                "cd_feedback_st2", _safe_node(agents["cd_feedback_st2"])
+            )
+    cd_synthesis = agents["cd_synthesis_st2"]
+    if not parallel_concepts:
+        # Parallel mode compares its candidates in synthesis instead.
+        cd_synthesis = _best_of_synthesis(cd_synthesis)
+    graph.add_node("cd_synthesis_st2", _safe_node(cd_synthesis))
+
+    # --- Finalisation nodes (unwrapped — they own the status write) ---
     graph.add_node("finalise_approved", _finalise_approved)
     graph.add_node("finalise_max_iterations", _finalise_max_iterations)
     graph.add_node("finalise_failed", _finalise_failed)
@@ -350,37 +992,68 @@ def build_graph_st2() -> StateGraph:
     graph.add_conditional_edges(
         "creative_a_st2",
         _check_failed,
-        {"ok": "interrupt_territory_selection", "failed": "finalise_failed"},
-    )
-    graph.add_conditional_edges(
-        "interrupt_territory_selection",
-        _route_after_interrupt,
-        {
-            "selected": "creative_b_st2",
-            "rerun": "creative_a_st2",
-            "failed": "finalise_failed",
-        },
-    )
-    graph.add_conditional_edges(
-        "creative_b_st2",
-        _check_failed,
-        {"ok": "cd_grader_st2", "failed": "finalise_failed"},
-    )
-    graph.add_conditional_edges(
-        "cd_grader_st2",
-        _check_approval,
         {
-            "approved": "cd_synthesis_st2",
-            "rejected_budget": "cd_feedback_st2",
-            "rejected_exhausted": "cd_synthesis_st2",
+            "ok": "speculate_concepts_st2" if speculate
+            else "interrupt_territory_selection",
             "failed": "finalise_failed",
         },
     )
-    graph.add_conditional_edges(
-        "cd_feedback_st2",
-        _check_failed,
-        {"ok": "creative_b_st2", "failed": "finalise_failed"},
-    )
+    if speculate:
+        graph.add_edge("speculate_concepts_st2", "interrupt_territory_selection")
+    if parallel_concepts:
+        graph.add_conditional_edges(
+            "interrupt_territory_selection",
+            _fan_out_concepts,
+            {
+                "develop_concept_st2": "develop_concept_st2",
+                "rerun": "creative_a_st2",
+                "failed": "finalise_failed",
+            },
+        )
+        # Fan-in: collect runs once, after every branch in the step.
+        graph.add_edge("develop_concept_st2", "collect_concepts_st2")
+        graph.add_conditional_edges(
+            "collect_concepts_st2",
+            _check_failed,
+            {"ok": "cd_synthesis_st2", "failed": "finalise_failed"},
+        )
+    else:
+        graph.add_conditional_edges(
+            "interrupt_territory_selection",
+            _route_after_interrupt,
+            {
+                "selected": "creative_b_st2",
+                "rerun": "creative_a_st2",
+                "failed": "finalise_failed",
+            },
+        )
+        grader_node = (
+            "grade_and_feedback_st2" if concurrent_feedback else "cd_grader_st2"
+        )
+        graph.add_conditional_edges(
+            "creative_b_st2",
+            _check_failed,
+            {"ok": grader_node, "failed": "finalise_failed"},
+        )
+        graph.add_conditional_edges(
+            grader_node,
+            _check_approval,
+            {
+                "approved": "cd_synthesis_st2",
+                # Concurrent mode already holds the revision direction.
+                "rejected_budget": (
+                    "creative_b_st2" if concurrent_feedback else "cd_feedback_st2"
+                ),
+                "rejected_exhausted": "cd_synthesis_st2",
+                "failed": "finalise_failed",
+            },
+        )
+        if not concurrent_feedback:
+            graph.add_conditional_edges(
+                "cd_feedback_st2",
+                _check_failed,
+                {"ok": "creative_b_st2", "failed": "finalise_failed"},
+            )
     graph.add_conditional_edges(
         "cd_synthesis_st2",
         _route_after_synthesis,
@@ -395,9 +1068,13 @@ def build_graph_st2() -> StateGraph:
     graph.add_edge("finalise_max_iterations", END)
     graph.add_edge("finalise_failed", END)
 
-    return graph.compile(checkpointer=_CHECKPOINTER)
+    if checkpointer is None:
+        checkpointer = _CHECKPOINTER
+    return graph.compile(checkpointer=checkpointer)
 
 
-# Pre-built graph instance for convenience. Shares ``_CHECKPOINTER``
-# with every other ``build_graph_st2()`` call in the process.
+# Pre-built graph instances for convenience. Both share ``_CHECKPOINTER``
+# with every other ``build_graph_st2()`` call in the process; a thread
+# must be resumed on the same topology it was started on.
 agency_graph_st2 = build_graph_st2()
+agency_graph_st2_parallel = build_graph_st2(parallel_concepts=True)
@@ -0,0 +1,333 @@
+"""
+agt_sea — Fake Chat Model
+
+A deterministic, offline stand-in for the provider chat models, selected
+with ``LLM_PROVIDER=fake`` (``LLMProvider.FAKE``). It lets the full
+graphs run — in tests, in the benchmarks, or in the frontend without an
+API key — at a configurable cost:
+
+* **Latency** — each request sleeps for a duration drawn uniformly from
+  ``latency_seconds`` (``asyncio.sleep`` on the async path, so concurrent
+  runs overlap the way real network calls do).
+* **Failures** — each request raises ``FakeLLMError`` with probability
+  ``failure_rate``. It subclasses ``ConnectionError`` and is on the fake
+  provider's transport-retry allowlist, so it exercises the same retry
+  path a dropped connection would.
+* **Scores** — any ``score`` field in structured output is drawn
+  uniformly from ``score_range``.
+* **Streaming** — when a caller streams (a streaming callback handler,
+  e.g. LangGraph's ``stream_mode="messages"``), the same response is
+  delivered in ``stream_chunk_chars``-sized pieces, tool-call arguments
+  as ``tool_call_chunks``, with the latency spread across them.
+
+Structured output works through the normal ``with_structured_output()``
+path: the bound tool's JSON schema is filled in field by field, so any
+Pydantic schema an agent asks for comes back valid. A few fields read the
+prompt so the graph behaves sensibly — Creative A gets as many
+territories as the prompt asks for, and CD Synthesis recommends (and
+summarises) the concept titles it was shown.
+
+Responses are a pure function of ``seed``, the schema and the prompt, so
+the same run produces the same artifacts. Failure draws also count prior
+attempts at the same prompt, so a retried request can succeed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator, Sequence
+from typing import Any
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.runnables import Runnable
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from pydantic import PrivateAttr
+
+# Prompt patterns the structured output reads.
+_TERRITORY_COUNT = re.compile(r"generate\s+(\d+)\s+distinct", re.IGNORECASE)
+_CONCEPT_TITLE = re.compile(r"^Title:\s*(.+)$", re.MULTILINE)
+
+_DEFAULT_ARRAY_LENGTH = 2
+_DEFAULT_TERRITORIES = 3
+# Prompts remembered for failure draws before the counter resets.
+_MAX_TRACKED_PROMPTS = 10_000
+
+_WORDS = (
+    "brand", "moment", "ritual", "everyday", "surprise", "audience",
+    "truth", "tension", "craft", "community", "story", "bold", "quiet",
+    "culture", "habit", "spark", "utility", "play", "shared", "signal",
+)
+
+
+class FakeLLMError(ConnectionError):
+    """An injected transient failure — retried like a dropped connection."""
+
+
+class FakeChatModel(BaseChatModel):
+    """Offline chat model returning seeded, schema-valid responses."""
+
+    model_name: str = "fake-model"
+    temperature: float | None = None
+    latency_seconds: tuple[float, float] = (0.0, 0.0)
+    failure_rate: float = 0.0
+    score_range: tuple[float, float] = (60.0, 95.0)
+    seed: int = 0
+    stream_chunk_chars: int = 40
+
+    _attempts: dict[str, int] = PrivateAttr(default_factory=dict)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake"
+
+    @property
+    def _identifying_params(self) -> dict[str, Any]:
+        return {
+            "model_name": self.model_name,
+            "temperature": self.temperature,
+            "seed": self.seed,
+        }
+
+    def bind_tools(
+        self,
+        tools: Sequence[Any],
+        *,
+        tool_choice: Any = None,
+        **kwargs: Any,
+    ) -> Runnable:
+        """Bind tool schemas — how ``with_structured_output()`` reaches us."""
+        return self.bind(
+            tools=[convert_to_openai_tool(tool) for tool in tools], **kwargs
+        )
+
+    # ------------------------------------------------------------------
+    # Generation
+    # ------------------------------------------------------------------
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        delay, result = self._respond(messages, kwargs.get("tools"))
+        time.sleep(delay)
+        if result is None:
+            raise FakeLLMError(f"{self.model_name}: injected failure")
+        return result
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        delay, result = self._respond(messages, kwargs.get("tools"))
+        await asyncio.sleep(delay)
+        if result is None:
+            raise FakeLLMError(f"{self.model_name}: injected failure")
+        return result
+
+    def _stream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        delay, result = self._respond(messages, kwargs.get("tools"))
+        if result is None:
+            time.sleep(delay)
+            raise FakeLLMError(f"{self.model_name}: injected failure")
+        chunks = self._chunks(result)
+        for chunk in chunks:
+            time.sleep(delay / len(chunks))
+            yield chunk
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        delay, result = self._respond(messages, kwargs.get("tools"))
+        if result is None:
+            await asyncio.sleep(delay)
+            raise FakeLLMError(f"{self.model_name}: injected failure")
+        chunks = self._chunks(result)
+        for chunk in chunks:
+            await asyncio.sleep(delay / len(chunks))
+            yield chunk
+
+    def _chunks(self, result: ChatResult) -> list[ChatGenerationChunk]:
+        """Split a response into stream chunks; usage rides on the last."""
+        message = result.generations[0].message
+        size = max(1, self.stream_chunk_chars)
+        chunks: list[AIMessageChunk] = []
+        if message.tool_calls:
+            call = message.tool_calls[0]
+            text = json.dumps(call["args"])
+            for start in range(0, len(text), size):
+                first = start == 0
+                chunks.append(
+                    AIMessageChunk(
+                        content="",
+                        tool_call_chunks=[
+                            {
+                                "name": call["name"] if first else None,
+                                "args": text[start : start + size],
+                                "id": call["id"] if first else None,
+                                "index": 0,
+                            }
+                        ],
+                    )
+                )
+        else:
+            text = str(message.content)
+            chunks = [
+                AIMessageChunk(content=text[start : start + size])
+                for start in range(0, len(text), size)
+            ]
+        chunks[-1].usage_metadata = message.usage_metadata
+        return [ChatGenerationChunk(message=chunk) for chunk in chunks]
+
+    def _respond(
+        self,
+        messages: list[BaseMessage],
+        tools: list[dict[str, Any]] | None,
+    ) -> tuple[float, ChatResult | None]:
+        """Draw this request's latency and response (None = fail it)."""
+        prompt = "\n\n".join(str(message.content) for message in messages)
+        tool = tools[0]["function"] if tools else None
+        digest = hashlib.sha256(
+            f"{self.seed}\0{tool['name'] if tool else ''}\0{prompt}".encode()
+        ).hexdigest()
+
+        with self._lock:
+            if len(self._attempts) >= _MAX_TRACKED_PROMPTS:
+                self._attempts.clear()
+            attempt = self._attempts.get(digest, 0)
+            self._attempts[digest] = attempt + 1
+        draw = random.Random(f"{digest}:{attempt}")
+        delay = draw.uniform(*self.latency_seconds)
+        if draw.random() < self.failure_rate:
+            return delay, None
+
+        rng = random.Random(digest)
+        if tool is None:
+            content = f"Fake response from {self.model_name}.\n\n" + "\n\n".join(
+                _sentence(rng, 24) for _ in range(3)
+            )
+            message = AIMessage(content=content)
+            output = content
+        else:
+            args = _ArgsBuilder(rng, prompt, self.score_range).build(
+                tool["parameters"]
+            )
+            message = AIMessage(
+                content="",
+                tool_calls=[
+                    {"name": tool["name"], "args": args, "id": f"call_{digest[:12]}"}
+                ],
+            )
+            output = json.dumps(args)
+
+        input_tokens = len(prompt) // 4
+        output_tokens = len(output) // 4
+        message.usage_metadata = {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+        }
+        return delay, ChatResult(generations=[ChatGeneration(message=message)])
+
+
+# ---------------------------------------------------------------------------
+# Schema filling
+# ---------------------------------------------------------------------------
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(_WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+class _ArgsBuilder:
+    """Fills a tool's JSON schema with seeded values."""
+
+    def __init__(
+        self,
+        rng: random.Random,
+        prompt: str,
+        score_range: tuple[float, float],
+    ) -> None:
+        self._rng = rng
+        self._score_range = score_range
+        self._titles = _CONCEPT_TITLE.findall(prompt)
+        match = _TERRITORY_COUNT.search(prompt)
+        self._territories = int(match.group(1)) if match else _DEFAULT_TERRITORIES
+
+    def build(self, schema: dict[str, Any]) -> dict[str, Any]:
+        return self._value("", schema, 0, "")
+
+    def _array_length(self, name: str) -> int:
+        if name == "territories":
+            return self._territories
+        if name == "score_summary":
+            return max(len(self._titles), 1)
+        return _DEFAULT_ARRAY_LENGTH
+
+    def _value(
+        self, name: str, schema: dict[str, Any], index: int, parent: str
+    ) -> Any:
+        """Fill ``schema`` for field ``name`` (item ``index`` of ``parent``)."""
+        if "anyOf" in schema:
+            # Optional fields (``X | None``) are left empty.
+            options = [s for s in schema["anyOf"] if s.get("type") != "null"]
+            if len(options) < len(schema["anyOf"]) or not options:
+                return None
+            return self._value(name, options[0], index, parent)
+
+        kind = schema.get("type")
+        if kind == "object":
+            return {
+                key: self._value(key, sub, index, name)
+                for key, sub in schema.get("properties", {}).items()
+            }
+        if kind == "array":
+            item = schema.get("items", {})
+            return [
+                self._value(name, item, i, parent)
+                for i in range(self._array_length(name))
+            ]
+        if kind in ("number", "integer"):
+            if name == "score":
+                return round(self._rng.uniform(*self._score_range), 1)
+            return schema.get("minimum", 0)
+        if kind == "boolean":
+            return False
+        if "enum" in schema:
+            return schema["enum"][0]
+        return self._string(name, index, parent)
+
+    def _string(self, name: str, index: int, parent: str) -> str:
+        # CD Synthesis refers back to the concepts it was shown.
+        if self._titles and name == "selected_title":
+            return self._titles[0]
+        if self._titles and name == "title" and parent == "score_summary":
+            return self._titles[index % len(self._titles)]
+        if name in ("title", "name"):
+            return f"{self._rng.choice(_WORDS).capitalize()} {index + 1}"
+        return _sentence(self._rng, 12)
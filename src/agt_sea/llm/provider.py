@@ -13,29 +13,105 @@ This module owns the two retry layers described in ADR 0012:
    compose BaseChatModel-only methods (e.g. ``.with_structured_output()``)
    should request an unwrapped model via ``get_llm(with_retry=False)``,
    apply those methods, then wrap the result with
-   ``wrap_with_transport_retry()`` manually.
+   ``wrap_with_transport_retry()`` manually — or, for the common
+   structured-output case, call ``get_structured_llm()``, which does
+   exactly that and caches the composed runnable.
 
 2. **Structured-output validation retry.** ``invoke_with_validation_retry()``
    wraps a single ``.invoke()`` on a composed structured-output runnable and
-   reprompts once on ``pydantic.ValidationError``. Transport retry fires
+   reprompts once on ``pydantic.ValidationError``
+   (``ainvoke_with_validation_retry()`` is the ``.ainvoke()`` twin used by
+   the async agent variants). Transport retry fires
    during the network call; validation retry fires after a successful
    delivery when the structured-output parser fails to rebuild the Pydantic
    model. They are orthogonal — wrap with both when using
    ``.with_structured_output()``.
+
+``get_llm()`` and ``get_structured_llm()`` cache what they build, so agents
+and threads share one SDK client (and its connection pool) per
+configuration and the structured-output schema / tool binding is generated
+once per schema — see ``clear_llm_cache()`` for invalidation after an API
+key rotation. With ``LLM_RESPONSE_CACHE`` on, zero-temperature chat models
+are also built with an on-disk response cache (``get_response_cache()``),
+so a repeated deterministic call never leaves the process.
+With ``LLM_RATE_LIMITS`` set, each chat model also carries the
+process-wide ``TokenBucketRateLimiter`` for its (provider, model)
+(``get_rate_limiter()``), so concurrent runs queue client-side rather
+than being throttled by the provider. With ``LLM_FAILOVER`` / ``LLM_HEDGE``
+set, the retry-wrapped runnables fall back to other providers / models
+after repeated transport failures and send a hedged duplicate request
+when a call runs past its model's p95 latency (``HedgedRunnable``). With
+``LLM_CIRCUIT_BREAKER`` on, each transport attempt first passes its
+provider's process-wide ``CircuitBreaker`` (``circuit_breakers()``), so a
+provider that is down fails fast instead of soaking up retries.
+
+Two smaller helpers support provider prompt caching:
+``apply_prompt_caching()`` adds cache breakpoints to an agent's messages
+when ``LLM_PROMPT_CACHING`` is on, and ``track_llm_usage()`` collects the
+token usage (including cache reads / writes) of every chat-model call made
+inside it — with its latency, request count, transport retries and
+validation reprompts — for recording on ``AgentOutput``.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import Enum
 from typing import Any, TypeVar
+from uuid import UUID, uuid4
 
+from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_core.messages import BaseMessage, HumanMessage
-from langchain_core.runnables import Runnable
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+from langchain_core.rate_limiters import BaseRateLimiter
+from langchain_core.tracers.context import register_configure_hook
+from langchain_core.runnables import Runnable, RunnableConfig
+from langchain_core.runnables.config import (
+    ContextThreadPoolExecutor,
+    ensure_config,
+    patch_config,
+)
+from langchain_core.runnables.retry import RunnableRetry
 from pydantic import BaseModel, ValidationError
 
-from agt_sea.config import LLM_MAX_RETRIES, get_llm_provider, get_model_name
+from agt_sea.config import (
+    FAKE_LLM_FAILURE_RATE,
+    FAKE_LLM_LATENCY_SECONDS,
+    FAKE_LLM_SCORE_RANGE,
+    FAKE_LLM_SEED,
+    LLM_CIRCUIT_BREAKER,
+    LLM_CIRCUIT_FAILURE_RATE,
+    LLM_CIRCUIT_MIN_CALLS,
+    LLM_CIRCUIT_OPEN_SECONDS,
+    LLM_CIRCUIT_WINDOW,
+    LLM_CLIENT_CACHE_SIZE,
+    LLM_FAILOVER,
+    LLM_FAILOVER_AFTER,
+    LLM_HEDGE,
+    LLM_HEDGE_MIN_SAMPLES,
+    LLM_MAX_RETRIES,
+    LLM_PROMPT_CACHING,
+    LLM_RATE_LIMITS,
+    LLM_RESPONSE_CACHE,
+    LLM_RESPONSE_CACHE_ALL_TEMPERATURES,
+    LLM_RESPONSE_CACHE_MAX_BYTES,
+    LLM_RESPONSE_CACHE_PATH,
+    get_llm_provider,
+    get_model_name,
+)
+from agt_sea.llm.response_cache import SqliteResponseCache
 from agt_sea.models.state import LLMProvider
+from agt_sea.tracing import validation_reprompt
 
 logger = logging.getLogger(__name__)
 
@@ -121,11 +197,16 @@ def _retryable_exceptions_for(
         from google.genai.errors import ServerError
         return (ServerError,)
 
+    if provider == LLMProvider.FAKE:
+        # Only the injected failures — a bug in the fake must not retry.
+        from agt_sea.llm.fake import FakeLLMError
+        return (FakeLLMError,)
+
     return ()
 
 
 def wrap_with_transport_retry(
-    runnable: Runnable, provider: LLMProvider
+    runnable: Runnable, provider: LLMProvider, attempts: int | None = None
 ) -> Runnable:
     """Wrap a LangChain runnable with transport-level retries.
 
@@ -139,19 +220,876 @@ def wrap_with_transport_retry(
         runnable: The runnable to wrap. May be a BaseChatModel or any
             composed runnable (e.g. model.with_structured_output(...)).
         provider: Which provider's exception allowlist to apply.
+        attempts: Attempts to make, including the first. Defaults to
+            LLM_MAX_RETRIES.
 
     Returns:
         A new runnable that retries on the allowlisted exceptions. If
         the provider has no retryable exceptions defined (unreachable
-        today), the runnable is returned unchanged.
+        today), the runnable is returned unchanged. With
+        LLM_CIRCUIT_BREAKER on, each attempt first passes the provider's
+        circuit breaker.
     """
     exception_types = _retryable_exceptions_for(provider)
     if not exception_types:
         return runnable
-    return runnable.with_retry(
-        retry_if_exception_type=exception_types,
-        stop_after_attempt=LLM_MAX_RETRIES,
+    if LLM_CIRCUIT_BREAKER:
+        # Inside the retry, so every attempt is an outcome for the breaker
+        # and an open breaker cuts the remaining attempts short.
+        runnable = CircuitBreakerRunnable(
+            runnable, get_circuit_breaker(provider), exception_types
+        )
+    return _TaggedRetry(
+        bound=runnable,
+        kwargs={},
+        config={},
+        retry_exception_types=exception_types,
+        wait_exponential_jitter=True,
+        max_attempt_number=attempts or LLM_MAX_RETRIES,
+    )
+
+
+class _TaggedRetry(RunnableRetry):
+    """``RunnableRetry`` whose ``retry:attempt:N`` tag reaches the chat model.
+
+    LangChain tags only the retried runnable itself — the tag is not
+    inheritable — so a chat model inside a structured-output sequence or
+    the circuit breaker never sees it. Here the tag is inherited by every
+    run under the attempt, which is how tracing numbers its LLM spans.
+    """
+
+    @staticmethod
+    def _patch_config(
+        config: RunnableConfig, run_manager: Any, retry_state: Any
+    ) -> RunnableConfig:
+        child = run_manager.get_child()
+        attempt = retry_state.attempt_number
+        if attempt > 1:
+            child.add_tags([f"retry:attempt:{attempt}"])
+        return patch_config(config, callbacks=child)
+
+
+# ---------------------------------------------------------------------------
+# Circuit breaker
+# ---------------------------------------------------------------------------
+#
+# Transport retry handles a blip; it makes a hard outage worse. Every
+# concurrent run spends LLM_MAX_RETRIES backed-off attempts against a
+# provider that is down, and queue latency balloons. A breaker per
+# provider, shared process-wide, watches recent attempt outcomes and —
+# once the failure rate trips — fails calls immediately with
+# CircuitOpenError, which the failover chain treats like a transport
+# error. Only allowlisted transport errors count as failures: an auth or
+# validation error means the provider answered.
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a provider whose circuit breaker is open."""
+
+    def __init__(self, provider: LLMProvider, retry_after: float) -> None:
+        super().__init__(
+            f"Circuit breaker for {provider.value} is open; "
+            f"retry in {retry_after:.1f}s."
+        )
+        self.provider = provider
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class CircuitTransition:
+    """One breaker state change, kept for monitoring."""
+    provider: LLMProvider
+    from_state: CircuitState
+    to_state: CircuitState
+    at: float  # time.time()
+    failure_rate: float
+
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker over a provider's recent attempts.
+
+    Closed, every call goes through and its outcome joins a window of the
+    last ``window`` attempts; once ``min_calls`` are in the window and the
+    failed share reaches ``failure_rate``, the breaker opens. Open, calls
+    are refused for ``open_seconds``. Then it is half-open: one trial
+    call goes through (the rest are still refused) and its outcome closes
+    the breaker or re-opens it. Thread-safe; state changes are logged and
+    kept in ``transitions``.
+
+    Every state change starts a new generation. ``before_call()`` returns
+    the generation as the call's ticket, which goes back to ``record()`` /
+    ``abandon()``. Outcomes from an earlier generation are ignored, so a
+    call admitted while closed and finishing during half-open cannot
+    settle the trial.
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        *,
+        failure_rate: float = 0.5,
+        min_calls: int = 10,
+        window: int = 20,
+        open_seconds: float = 30.0,
+        clock: Any = time.monotonic,
+    ) -> None:
+        self.provider = provider
+        self.failure_rate = failure_rate
+        self.min_calls = max(1, min_calls)
+        self.open_seconds = open_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._outcomes: deque[bool] = deque(maxlen=max(window, self.min_calls))
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._generation = 0
+        self.transitions: deque[CircuitTransition] = deque(maxlen=100)
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def current_failure_rate(self) -> float:
+        """Failed share of the attempts in the window (0 when empty)."""
+        with self._lock:
+            return self._rate()
+
+    def _rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def _transition(self, to_state: CircuitState) -> None:
+        """Move to ``to_state``. Hold the lock."""
+        transition = CircuitTransition(
+            provider=self.provider,
+            from_state=self._state,
+            to_state=to_state,
+            at=time.time(),
+            failure_rate=self._rate(),
+        )
+        self._state = to_state
+        self._generation += 1
+        self.transitions.append(transition)
+        log = logger.warning if to_state == CircuitState.OPEN else logger.info
+        log(
+            "Circuit breaker for %s: %s -> %s (failure rate %.0f%%)",
+            self.provider.value,
+            transition.from_state.value,
+            to_state.value,
+            transition.failure_rate * 100,
+        )
+
+    def _maybe_half_open(self) -> None:
+        """Open -> half-open once the open period has passed. Hold the lock."""
+        if (
+            self._state == CircuitState.OPEN
+            and self._clock() - self._opened_at >= self.open_seconds
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+
+    def before_call(self) -> int:
+        """Admit a call and return its ticket, or raise ``CircuitOpenError``."""
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == CircuitState.CLOSED:
+                return self._generation
+            if self._state == CircuitState.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return self._generation
+            retry_after = max(
+                0.0, self._opened_at + self.open_seconds - self._clock()
+            )
+        raise CircuitOpenError(self.provider, retry_after)
+
+    def record(self, ticket: int, success: bool) -> None:
+        """Record the outcome of the call admitted with ``ticket``."""
+        with self._lock:
+            if ticket != self._generation:
+                return  # admitted before the last state change
+            if self._state == CircuitState.HALF_OPEN:
+                self._trial_in_flight = False
+                self._outcomes.clear()
+                if success:
+                    self._transition(CircuitState.CLOSED)
+                else:
+                    self._opened_at = self._clock()
+                    self._transition(CircuitState.OPEN)
+                return
+            self._outcomes.append(success)
+            if (
+                self._state == CircuitState.CLOSED
+                and len(self._outcomes) >= self.min_calls
+                and self._rate() >= self.failure_rate
+            ):
+                self._opened_at = self._clock()
+                self._transition(CircuitState.OPEN)
+
+    def abandon(self, ticket: int) -> None:
+        """An admitted call ended without an outcome; free the trial slot."""
+        with self._lock:
+            if ticket == self._generation and self._state == CircuitState.HALF_OPEN:
+                self._trial_in_flight = False
+
+    def snapshot(self) -> dict[str, Any]:
+        """State, failure rate and last transition, for monitoring."""
+        with self._lock:
+            self._maybe_half_open()
+            last = self.transitions[-1] if self.transitions else None
+            return {
+                "provider": self.provider.value,
+                "state": self._state.value,
+                "failure_rate": self._rate(),
+                "attempts": len(self._outcomes),
+                "last_transition_at": last.at if last else None,
+            }
+
+
+class CircuitBreakerRunnable(Runnable):
+    """Passes each call through a ``CircuitBreaker`` before ``runnable``.
+
+    ``failures`` are the exception types that count against the breaker —
+    the provider's transport allowlist. Anything else, success or not,
+    counts as the provider having answered.
+    """
+
+    def __init__(
+        self,
+        runnable: Runnable,
+        breaker: CircuitBreaker,
+        failures: tuple[type[BaseException], ...],
+    ) -> None:
+        self.runnable = runnable
+        self.breaker = breaker
+        self.failures = failures
+
+    def _record_error(self, ticket: int, error: BaseException) -> None:
+        if isinstance(error, asyncio.CancelledError):
+            # Abandoned (e.g. a hedge loser) — not an outcome either way.
+            self.breaker.abandon(ticket)
+            return
+        self.breaker.record(ticket, not isinstance(error, self.failures))
+
+    def invoke(
+        self, input: Any, config: RunnableConfig | None = None, **kwargs: Any
+    ) -> Any:
+        ticket = self.breaker.before_call()
+        try:
+            result = self.runnable.invoke(input, config, **kwargs)
+        except BaseException as exc:
+            self._record_error(ticket, exc)
+            raise
+        self.breaker.record(ticket, True)
+        return result
+
+    async def ainvoke(
+        self, input: Any, config: RunnableConfig | None = None, **kwargs: Any
+    ) -> Any:
+        ticket = self.breaker.before_call()
+        try:
+            result = await self.runnable.ainvoke(input, config, **kwargs)
+        except BaseException as exc:
+            self._record_error(ticket, exc)
+            raise
+        self.breaker.record(ticket, True)
+        return result
+
+    def stream(
+        self, input: Any, config: RunnableConfig | None = None, **kwargs: Any
+    ) -> Iterator[Any]:
+        ticket = self.breaker.before_call()
+        try:
+            yield from self.runnable.stream(input, config, **kwargs)
+        except BaseException as exc:
+            self._record_error(ticket, exc)
+            raise
+        self.breaker.record(ticket, True)
+
+    async def astream(
+        self, input: Any, config: RunnableConfig | None = None, **kwargs: Any
+    ) -> AsyncIterator[Any]:
+        ticket = self.breaker.before_call()
+        try:
+            async for chunk in self.runnable.astream(input, config, **kwargs):
+                yield chunk
+        except BaseException as exc:
+            self._record_error(ticket, exc)
+            raise
+        self.breaker.record(ticket, True)
+
+
+_CIRCUIT_BREAKERS: dict[LLMProvider, CircuitBreaker] = {}
+_CIRCUIT_BREAKERS_LOCK = threading.Lock()
+
+
+def get_circuit_breaker(provider: LLMProvider) -> CircuitBreaker:
+    """The process-wide breaker for ``provider``, created on first use."""
+    with _CIRCUIT_BREAKERS_LOCK:
+        breaker = _CIRCUIT_BREAKERS.get(provider)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                provider,
+                failure_rate=LLM_CIRCUIT_FAILURE_RATE,
+                min_calls=LLM_CIRCUIT_MIN_CALLS,
+                window=LLM_CIRCUIT_WINDOW,
+                open_seconds=LLM_CIRCUIT_OPEN_SECONDS,
+            )
+            _CIRCUIT_BREAKERS[provider] = breaker
+        return breaker
+
+
+def circuit_breakers() -> dict[LLMProvider, CircuitBreaker]:
+    """Every breaker created so far, by provider — for monitoring."""
+    with _CIRCUIT_BREAKERS_LOCK:
+        return dict(_CIRCUIT_BREAKERS)
+
+
+# ---------------------------------------------------------------------------
+# Chat model cache
+# ---------------------------------------------------------------------------
+#
+# Constructing a chat model builds a new SDK client — its own HTTP
+# connection pool, so a fresh TCP/TLS handshake on the first request. A v2
+# run with revision loops calls get_llm() a dozen times, so instances are
+# cached in a small LRU keyed on (provider, model, temperature, retry
+# attempts, schema), where retry attempts is None for the unwrapped chat
+# model and schema is None for anything but get_structured_llm() entries.
+# One lock guards lookup *and* construction, so concurrent callers never
+# build duplicate clients for the same key. Construction does no I/O, so
+# holding the lock across it is cheap.
+#
+# Raw and wrapped entries share the LRU, so a raw entry can be evicted
+# while a wrapper built on it survives. Each wrapper entry therefore
+# records the chat models it holds, and a raw miss reuses one of those
+# before building a second client for the same key.
+
+_LLMCacheKey = tuple[
+    LLMProvider, str, float | None, int | None, type[BaseModel] | None
+]
+
+_LLM_CACHE: OrderedDict[_LLMCacheKey, Runnable] = OrderedDict()
+# Wrapper key -> the raw chat models that wrapper holds, by raw key.
+_WRAPPED_CLIENTS: dict[_LLMCacheKey, dict[_LLMCacheKey, BaseChatModel]] = {}
+_LLM_CACHE_LOCK = threading.Lock()
+
+
+def _cache_get(key: _LLMCacheKey) -> Runnable | None:
+    """LRU lookup. Caller must hold ``_LLM_CACHE_LOCK``."""
+    cached = _LLM_CACHE.get(key)
+    if cached is not None:
+        _LLM_CACHE.move_to_end(key)
+    return cached
+
+
+def _cache_put(
+    key: _LLMCacheKey,
+    llm: Runnable,
+    clients: dict[_LLMCacheKey, BaseChatModel] | None = None,
+) -> None:
+    """Insert and trim to ``LLM_CLIENT_CACHE_SIZE``. Caller holds the lock.
+
+    ``clients`` are the raw chat models a wrapper entry holds.
+    """
+    if LLM_CLIENT_CACHE_SIZE <= 0:
+        return
+    _LLM_CACHE[key] = llm
+    if clients:
+        _WRAPPED_CLIENTS[key] = clients
+    while len(_LLM_CACHE) > LLM_CLIENT_CACHE_SIZE:
+        evicted, _ = _LLM_CACHE.popitem(last=False)
+        _WRAPPED_CLIENTS.pop(evicted, None)
+
+
+def _held_client(raw_key: _LLMCacheKey) -> BaseChatModel | None:
+    """A cached wrapper's chat model for ``raw_key``. Caller holds the lock."""
+    for clients in _WRAPPED_CLIENTS.values():
+        client = clients.get(raw_key)
+        if client is not None:
+            return client
+    return None
+
+
+class _ClientRecorder:
+    """Builds raw chat models for a wrapper, recording each one it uses."""
+
+    def __init__(self, temperature: float | None) -> None:
+        self.temperature = temperature
+        self.clients: dict[_LLMCacheKey, BaseChatModel] = {}
+
+    def __call__(self, provider: LLMProvider, model: str) -> Runnable:
+        client = get_llm(provider, model, self.temperature, with_retry=False)
+        self.clients[(provider, model, self.temperature, None, None)] = client
+        return client
+
+
+def clear_llm_cache(provider: LLMProvider | None = None) -> int:
+    """Drop cached chat models so the next ``get_llm()`` builds fresh ones.
+
+    SDK clients read their API key at construction, so call this after
+    rotating a key (or changing any other client-level setting).
+
+    Args:
+        provider: Only drop this provider's instances. When None, the
+            whole cache is cleared.
+
+    Returns:
+        The number of cache entries removed.
+    """
+    with _LLM_CACHE_LOCK:
+        if provider is None:
+            removed = len(_LLM_CACHE)
+            _LLM_CACHE.clear()
+            _WRAPPED_CLIENTS.clear()
+            return removed
+        # A retry-wrapped entry may hold any provider as a failover target.
+        stale = [
+            key
+            for key in _LLM_CACHE
+            if key[0] == provider or (LLM_FAILOVER and key[3] is not None)
+        ]
+        for key in stale:
+            del _LLM_CACHE[key]
+            _WRAPPED_CLIENTS.pop(key, None)
+        return len(stale)
+
+
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+#
+# One SqliteResponseCache per process, opened on first use and shared by
+# every chat model that qualifies. The decision is made when a chat model
+# is constructed, so after toggling the LLM_RESPONSE_CACHE* settings at
+# runtime call clear_llm_cache() to rebuild the cached clients.
+
+_RESPONSE_CACHE: SqliteResponseCache | None = None
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+
+def get_response_cache() -> SqliteResponseCache | None:
+    """Return the shared on-disk response cache, or None when disabled."""
+    global _RESPONSE_CACHE
+    if not LLM_RESPONSE_CACHE:
+        return None
+    with _RESPONSE_CACHE_LOCK:
+        if _RESPONSE_CACHE is None:
+            _RESPONSE_CACHE = SqliteResponseCache(
+                LLM_RESPONSE_CACHE_PATH, max_bytes=LLM_RESPONSE_CACHE_MAX_BYTES
+            )
+        return _RESPONSE_CACHE
+
+
+def _response_cache_for(temperature: float | None) -> SqliteResponseCache | None:
+    """Return the response cache if a model at ``temperature`` should use it.
+
+    Only explicit zero-temperature models qualify by default — ``None``
+    means the provider's own (non-zero) default, which samples.
+    """
+    if temperature != 0.0 and not LLM_RESPONSE_CACHE_ALL_TEMPERATURES:
+        return None
+    return get_response_cache()
+
+
+# ---------------------------------------------------------------------------
+# Client-side rate limiting
+# ---------------------------------------------------------------------------
+#
+# Transport retry reacts to a 429 after the provider has refused the
+# request, and Google's 429s are not retried at all (see
+# _retryable_exceptions_for). With LLM_RATE_LIMITS set, every chat model is
+# built with a TokenBucketRateLimiter shared by all instances for the same
+# (provider, model) — every agent, thread and event loop in the process —
+# so requests queue client-side instead. LangChain acquires it before each
+# request (transport retries included) and skips it for response-cache
+# hits. The token bucket is debited after each response with the tokens
+# actually used, since the count isn't known up front: a request waits
+# while the bucket is in debt. Response-cache hits report their original
+# usage and are debited too — a conservative over-count.
+
+
+class TokenBucketRateLimiter(BaseRateLimiter):
+    """Requests-per-minute and tokens-per-minute buckets for one model.
+
+    Both buckets start full, hold one minute's allowance and refill
+    continuously — the model the providers themselves describe. A zero
+    rate leaves that bucket unlimited. Safe to share across threads and
+    event loops: state sits behind a ``threading.Lock`` held only for
+    bookkeeping, never while waiting.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = 0.0,
+        tokens_per_minute: float = 0.0,
+        *,
+        clock: Any = time.monotonic,
+    ) -> None:
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._requests = requests_per_minute
+        self._tokens = tokens_per_minute
+        self._updated = clock()
+        # Cumulative time callers spent queued — for monitoring.
+        self.waited_seconds = 0.0
+
+    def _refill(self) -> None:
+        """Top both buckets up for the time since the last update. Hold the lock."""
+        now = self._clock()
+        elapsed = now - self._updated
+        self._updated = now
+        if self.requests_per_minute:
+            self._requests = min(
+                self.requests_per_minute,
+                self._requests + elapsed * self.requests_per_minute / 60,
+            )
+        if self.tokens_per_minute:
+            self._tokens = min(
+                self.tokens_per_minute,
+                self._tokens + elapsed * self.tokens_per_minute / 60,
+            )
+
+    def _reserve(self) -> float:
+        """Take a request slot, or return how long to wait before retrying."""
+        with self._lock:
+            self._refill()
+            wait = 0.0
+            if self.requests_per_minute and self._requests < 1:
+                wait = (1 - self._requests) * 60 / self.requests_per_minute
+            if self.tokens_per_minute and self._tokens < 0:
+                wait = max(wait, -self._tokens * 60 / self.tokens_per_minute)
+            if wait:
+                return wait
+            if self.requests_per_minute:
+                self._requests -= 1
+            return 0.0
+
+    def acquire(self, *, blocking: bool = True) -> bool:
+        """Take a request slot, sleeping until one is free when ``blocking``."""
+        while wait := self._reserve():
+            if not blocking:
+                return False
+            self._note_wait(wait)
+            time.sleep(wait)
+        return True
+
+    async def aacquire(self, *, blocking: bool = True) -> bool:
+        """Async twin of ``acquire()`` — waits with ``asyncio.sleep``."""
+        while wait := self._reserve():
+            if not blocking:
+                return False
+            self._note_wait(wait)
+            await asyncio.sleep(wait)
+        return True
+
+    def _note_wait(self, wait: float) -> None:
+        with self._lock:
+            self.waited_seconds += wait
+
+    def record_tokens(self, tokens: int) -> None:
+        """Debit ``tokens`` used by a completed request."""
+        if not self.tokens_per_minute:
+            return
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+
+
+class _TokenDebitHandler(BaseCallbackHandler):
+    """Debits each response's token usage from a rate limiter."""
+
+    run_inline = True
+
+    def __init__(self, limiter: TokenBucketRateLimiter) -> None:
+        super().__init__()
+        self.limiter = limiter
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        tokens = 0
+        for generations in response.generations:
+            for generation in generations:
+                message = getattr(generation, "message", None)
+                if isinstance(message, AIMessage) and message.usage_metadata:
+                    tokens += message.usage_metadata.get("total_tokens", 0)
+        if tokens:
+            self.limiter.record_tokens(tokens)
+
+
+_RATE_LIMITERS: dict[tuple[LLMProvider, str], TokenBucketRateLimiter] = {}
+_RATE_LIMITERS_LOCK = threading.Lock()
+
+
+def get_rate_limiter(
+    provider: LLMProvider, model: str
+) -> TokenBucketRateLimiter | None:
+    """Return the shared limiter for ``(provider, model)``, or None if unlimited.
+
+    A ``provider:model`` entry in ``LLM_RATE_LIMITS`` wins over a
+    provider-wide one; either way each model gets its own buckets.
+    """
+    limits = LLM_RATE_LIMITS.get((provider, model)) or LLM_RATE_LIMITS.get(
+        (provider, None)
     )
+    if not limits or not any(limits):
+        return None
+    with _RATE_LIMITERS_LOCK:
+        limiter = _RATE_LIMITERS.get((provider, model))
+        if limiter is None:
+            limiter = TokenBucketRateLimiter(*limits)
+            _RATE_LIMITERS[(provider, model)] = limiter
+        return limiter
+
+
+# ---------------------------------------------------------------------------
+# Failover and hedged requests
+# ---------------------------------------------------------------------------
+#
+# Transport retry keeps hammering one provider; when that provider is
+# down, every attempt fails the same way. With LLM_FAILOVER set, each
+# target's retry wrapper is cut to LLM_FAILOVER_AFTER attempts and the
+# targets are chained with ``.with_fallbacks()``, handling the union of
+# their transport allowlists — so an auth or validation error still
+# surfaces immediately rather than being masked by a backup model.
+#
+# Every chat model carries its (provider, model) in its run metadata, so
+# LLMUsageTracker can record which target actually served a call.
+
+
+def _failover_targets(
+    provider: LLMProvider, model_name: str
+) -> list[tuple[LLMProvider, str]]:
+    """LLM_FAILOVER resolved to concrete models, minus the primary."""
+    targets: list[tuple[LLMProvider, str]] = []
+    for target_provider, target_model in LLM_FAILOVER:
+        target = (target_provider, target_model or get_model_name(target_provider))
+        if target != (provider, model_name) and target not in targets:
+            targets.append(target)
+    return targets
+
+
+def _resilient(
+    build: Callable[[LLMProvider, str], Runnable],
+    provider: LLMProvider,
+    model_name: str,
+) -> Runnable:
+    """Wrap ``build(provider, model)`` with retry, failover and hedging.
+
+    ``build`` returns the unwrapped runnable (a chat model or a
+    structured-output composition) for one target.
+    """
+    targets = _failover_targets(provider, model_name)
+    attempts = LLM_FAILOVER_AFTER if targets else None
+    chain = wrap_with_transport_retry(build(provider, model_name), provider, attempts)
+    backups = [
+        wrap_with_transport_retry(build(p, m), p, attempts) for p, m in targets
+    ]
+    hedge = chain
+    if backups:
+        exceptions = tuple(
+            {
+                exc
+                for p in (provider, *(p for p, _ in targets))
+                for exc in _retryable_exceptions_for(p)
+            }
+            | {CircuitOpenError}
+        )
+        chain = chain.with_fallbacks(backups, exceptions_to_handle=exceptions)
+        hedge = backups[0]
+        if len(backups) > 1:
+            hedge = hedge.with_fallbacks(backups[1:], exceptions_to_handle=exceptions)
+    if LLM_HEDGE:
+        chain = HedgedRunnable(chain, hedge, min_samples=LLM_HEDGE_MIN_SAMPLES)
+    return chain
+
+
+_HEDGE_ATTEMPT_KEY = "agt_sea_hedge_attempt"
+
+
+class _HedgeAttempts:
+    """The primary / hedge attempt ids of one hedged call.
+
+    Registers both with the active usage tracker (if any) so their usage
+    is held back, and hands each attempt a config carrying its id. Set
+    ``winner`` to the index that served the call before ``settle()``.
+    """
+
+    def __init__(self, config: RunnableConfig | None) -> None:
+        self._config = ensure_config(config)
+        self._ids = (uuid4().hex, uuid4().hex)
+        self._tracker = _USAGE_TRACKER.get()
+        self.winner: int | None = None
+        if self._tracker is not None:
+            self._tracker.hold(*self._ids)
+
+    def config(self, index: int) -> RunnableConfig:
+        metadata = self._config.get("metadata", {})
+        return {
+            **self._config,
+            "metadata": {**metadata, _HEDGE_ATTEMPT_KEY: self._ids[index]},
+        }
+
+    def settle(self) -> None:
+        if self._tracker is None:
+            return
+        if self.winner is None:
+            # Both attempts failed: every request and error was real.
+            for attempt in self._ids:
+                self._tracker.settle(attempt)
+            return
+        keep = self._ids[self.winner]
+        self._tracker.settle(keep, *(i for i in self._ids if i != keep))
+
+
+class HedgedRunnable(Runnable):
+    """Sends a duplicate request once a call runs past the recent p95 latency.
+
+    The first call that succeeds wins; an async loser is cancelled, a sync
+    one is abandoned to finish in its worker thread. If both fail, the
+    primary's error is raised. Latencies of successful primary calls feed
+    the p95 — hedging starts once ``min_samples`` of them are recorded.
+
+    Each attempt runs with its id in the run metadata, and the active
+    ``LLMUsageTracker`` holds that attempt's usage until the race is
+    decided: the winner's is counted, the loser's — including anything a
+    sync loser reports later — is dropped, so ``served`` is always the
+    winner.
+    """
+
+    def __init__(
+        self,
+        primary: Runnable,
+        hedge: Runnable,
+        *,
+        min_samples: int = 20,
+        window: int = 200,
+    ) -> None:
+        self.primary = primary
+        self.hedge = hedge
+        self.min_samples = max(1, min_samples)
+        self._latencies: deque[float] = deque(maxlen=max(window, self.min_samples))
+        self._lock = threading.Lock()
+        self.hedges_sent = 0
+        self.hedges_won = 0
+
+    def hedge_delay(self) -> float | None:
+        """Seconds to wait before hedging, or None while still warming up."""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+
+    def _record(self, seconds: float) -> None:
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def _timed_primary(self, input: Any, config: RunnableConfig | None, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        result = self.primary.invoke(input, config, **kwargs)
+        self._record(time.perf_counter() - start)
+        return result
+
+    async def _atimed_primary(
+        self, input: Any, config: RunnableConfig | None, **kwargs: Any
+    ) -> Any:
+        start = time.perf_counter()
+        result = await self.primary.ainvoke(input, config, **kwargs)
+        self._record(time.perf_counter() - start)
+        return result
+
+    def _hedged(self) -> None:
+        with self._lock:
+            self.hedges_sent += 1
+        logger.info("Hedging LLM call past its p95 latency")
+
+    def _won(self, winner: Any, hedge: Any) -> None:
+        if winner is hedge:
+            with self._lock:
+                self.hedges_won += 1
+
+    def invoke(
+        self, input: Any, config: RunnableConfig | None = None, **kwargs: Any
+    ) -> Any:
+        delay = self.hedge_delay()
+        if delay is None:
+            return self._timed_primary(input, config, **kwargs)
+
+        attempts = _HedgeAttempts(config)
+        executor = ContextThreadPoolExecutor(max_workers=2)
+        try:
+            first = executor.submit(
+                self._timed_primary, input, attempts.config(0), **kwargs
+            )
+            if wait([first], timeout=delay).done:
+                attempts.winner = 0
+                return first.result()
+            self._hedged()
+            second = executor.submit(
+                self.hedge.invoke, input, attempts.config(1), **kwargs
+            )
+            pending: set[Future] = {first, second}
+            errors: dict[Future, BaseException] = {}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.exception() is None:
+                        self._won(future, second)
+                        attempts.winner = 0 if future is first else 1
+                        return future.result()
+                    errors[future] = future.exception()
+            raise errors[first]
+        finally:
+            attempts.settle()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def ainvoke(
+        self, input: Any, config: RunnableConfig | None = None, **kwargs: Any
+    ) -> Any:
+        delay = self.hedge_delay()
+        if delay is None:
+            return await self._atimed_primary(input, config, **kwargs)
+
+        attempts = _HedgeAttempts(config)
+        first = asyncio.ensure_future(
+            self._atimed_primary(input, attempts.config(0), **kwargs)
+        )
+        second: asyncio.Future | None = None
+        try:
+            done, _ = await asyncio.wait({first}, timeout=delay)
+            if done:
+                attempts.winner = 0
+                return first.result()
+            self._hedged()
+            second = asyncio.ensure_future(
+                self.hedge.ainvoke(input, attempts.config(1), **kwargs)
+            )
+            pending: set[asyncio.Future] = {first, second}
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        self._won(task, second)
+                        attempts.winner = 0 if task is first else 1
+                        return task.result()
+            raise first.exception()
+        finally:
+            attempts.settle()
+            for task in (first, second):
+                if task is not None and not task.done():
+                    task.cancel()
 
 
 # ---------------------------------------------------------------------------
@@ -200,54 +1138,176 @@ def get_llm(
             you need to compose BaseChatModel-only methods such as
             .with_structured_output() on the raw model before wrapping.
 
+    Instances are cached per (provider, model, temperature, retry
+    policy): repeat calls with the same arguments return the same object,
+    and the retry-wrapped variant wraps the same cached chat model as
+    ``with_retry=False``, so every agent shares one SDK client and its
+    connection pool. Chat models are stateless between calls, so sharing
+    across threads is safe. Call ``clear_llm_cache()`` after rotating an
+    API key — the key is read when the client is constructed.
+
     Returns:
         A LangChain runnable ready to use with .invoke(), .stream(),
-        etc. When with_retry is True the concrete type is RunnableRetry;
-        when False it is the provider-specific BaseChatModel subclass.
+        etc. When with_retry is True the concrete type is RunnableRetry
+        (a RunnableWithFallbacks / HedgedRunnable around it when
+        LLM_FAILOVER / LLM_HEDGE are set); when False it is the
+        provider-specific BaseChatModel subclass.
+    """
+    provider = provider or get_llm_provider()
+    model_name = model or get_model_name(provider)
+
+    with _LLM_CACHE_LOCK:
+        raw_key: _LLMCacheKey = (provider, model_name, temperature, None, None)
+        chat_model = _cache_get(raw_key)
+        if chat_model is None:
+            # Evicted as a raw entry, but maybe still held by a wrapper.
+            chat_model = _held_client(raw_key) or _build_chat_model(
+                provider, model_name, temperature
+            )
+            _cache_put(raw_key, chat_model)
+        if not with_retry:
+            return chat_model
+
+        retry_key: _LLMCacheKey = (
+            provider, model_name, temperature, LLM_MAX_RETRIES, None
+        )
+        wrapped = _cache_get(retry_key)
+    if wrapped is not None:
+        return wrapped
+
+    # Built outside the lock: failover targets call get_llm() themselves.
+    raw = _ClientRecorder(temperature)
+    wrapped = _resilient(raw, provider, model_name)
+    with _LLM_CACHE_LOCK:
+        # A concurrent caller may have won the race — keep its instance.
+        cached = _cache_get(retry_key)
+        if cached is not None:
+            return cached
+        _cache_put(retry_key, wrapped, raw.clients)
+        return wrapped
+
+
+def get_structured_llm(
+    schema: type[_StructuredT],
+    provider: LLMProvider | None = None,
+    model: str | None = None,
+    temperature: float | None = None,
+) -> Runnable[Any, _StructuredT]:
+    """Return a cached, retry-wrapped structured-output runnable for ``schema``.
+
+    Composes the pattern every structured agent uses — raw chat model from
+    ``get_llm(with_retry=False)``, ``.with_structured_output(schema)``, then
+    ``wrap_with_transport_retry()`` around the composed runnable — and
+    caches the result per (provider, model, temperature, retry policy,
+    schema). ``.with_structured_output()`` regenerates the JSON schema and
+    the tool binding each time it is called; caching means a revision loop
+    pays for that once, not per iteration.
+
+    The composed runnable holds no per-call state, so one instance is safe
+    to share across runs and threads.
+
+    Args:
+        schema: The Pydantic model the LLM output is parsed into.
+        provider: Which LLM provider to use. Defaults to config.
+        model: Model name override. Defaults to ``get_model_name(provider)``.
+        temperature: Sampling temperature, as for ``get_llm()``.
+
+    Returns:
+        A runnable whose ``.invoke()`` / ``.ainvoke()`` return ``schema``
+        instances — pass it to ``invoke_with_validation_retry()``.
     """
     provider = provider or get_llm_provider()
     model_name = model or get_model_name(provider)
+    key: _LLMCacheKey = (provider, model_name, temperature, LLM_MAX_RETRIES, schema)
+
+    with _LLM_CACHE_LOCK:
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+
+    # Built outside the lock: get_llm() takes it itself.
+    raw = _ClientRecorder(temperature)
+    structured_llm = _resilient(
+        lambda p, m: raw(p, m).with_structured_output(schema),
+        provider,
+        model_name,
+    )
+
+    with _LLM_CACHE_LOCK:
+        # A concurrent caller may have won the race — keep its instance so
+        # every caller shares one runnable per key.
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+        _cache_put(key, structured_llm, raw.clients)
+        return structured_llm
 
+
+def _build_chat_model(
+    provider: LLMProvider,
+    model_name: str,
+    temperature: float | None,
+) -> BaseChatModel:
+    """Construct a fresh provider chat model (uncached — see ``get_llm``)."""
     # Only include ``temperature`` in the constructor kwargs when the
     # caller has explicitly supplied one. Passing ``None`` through would
     # override each provider SDK's default with a null value.
-    extra_kwargs: dict[str, float] = {}
+    extra_kwargs: dict[str, Any] = {}
     if temperature is not None:
         extra_kwargs["temperature"] = temperature
+    response_cache = _response_cache_for(temperature)
+    if response_cache is not None:
+        extra_kwargs["cache"] = response_cache
+    # Read back by LLMUsageTracker to record which target served a call.
+    extra_kwargs["metadata"] = {
+        "agt_sea_provider": provider.value,
+        "agt_sea_model": model_name,
+    }
+    rate_limiter = get_rate_limiter(provider, model_name)
+    if rate_limiter is not None:
+        extra_kwargs["rate_limiter"] = rate_limiter
+        if rate_limiter.tokens_per_minute:
+            extra_kwargs["callbacks"] = [_TokenDebitHandler(rate_limiter)]
 
-    chat_model: BaseChatModel
     if provider == LLMProvider.ANTHROPIC:
         from langchain_anthropic import ChatAnthropic
 
-        chat_model = ChatAnthropic(
+        return ChatAnthropic(
             model=model_name,
             **extra_kwargs,
         )
-    elif provider == LLMProvider.GOOGLE:
+    if provider == LLMProvider.GOOGLE:
         from langchain_google_genai import ChatGoogleGenerativeAI
 
-        chat_model = ChatGoogleGenerativeAI(
+        return ChatGoogleGenerativeAI(
             model=model_name,
             **extra_kwargs,
         )
-    elif provider == LLMProvider.OPENAI:
+    if provider == LLMProvider.OPENAI:
         from langchain_openai import ChatOpenAI
 
-        chat_model = ChatOpenAI(
+        return ChatOpenAI(
             model=model_name,
             **extra_kwargs,
         )
-    else:
-        # Unreachable via the enum, but guards against future additions
-        # that aren't wired up yet.
-        valid = ", ".join(p.value for p in LLMProvider)
-        raise ValueError(
-            f"Unsupported provider '{provider}'. Must be one of: {valid}"
+    if provider == LLMProvider.FAKE:
+        from agt_sea.llm.fake import FakeChatModel
+
+        return FakeChatModel(
+            model_name=model_name,
+            latency_seconds=FAKE_LLM_LATENCY_SECONDS,
+            failure_rate=FAKE_LLM_FAILURE_RATE,
+            score_range=FAKE_LLM_SCORE_RANGE,
+            seed=FAKE_LLM_SEED,
+            **extra_kwargs,
         )
 
-    if not with_retry:
-        return chat_model
-    return wrap_with_transport_retry(chat_model, provider)
+    # Unreachable via the enum, but guards against future additions
+    # that aren't wired up yet.
+    valid = ", ".join(p.value for p in LLMProvider)
+    raise ValueError(
+        f"Unsupported provider '{provider}'. Must be one of: {valid}"
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -288,20 +1348,344 @@ def invoke_with_validation_retry(
     try:
         return structured_llm.invoke(messages)
     except ValidationError as exc:
-        logger.warning(
-            "Structured output failed validation on first attempt, "
-            "retrying with reprompt: %s",
-            exc,
-        )
-        reprompt = messages + [
-            HumanMessage(
-                content=(
-                    "Your previous response failed schema validation:\n\n"
-                    f"{exc}\n\n"
-                    "Return a new response that conforms exactly to the "
-                    "required schema. Do not apologise or explain — "
-                    "return only the corrected structured output."
-                )
-            )
-        ]
+        reprompt = _validation_reprompt(messages, exc)
+    with validation_reprompt():
         return structured_llm.invoke(reprompt)
+
+
+async def ainvoke_with_validation_retry(
+    structured_llm: Runnable[Any, _StructuredT],
+    messages: list[BaseMessage],
+) -> _StructuredT:
+    """Async twin of ``invoke_with_validation_retry``.
+
+    Same one-shot reprompt contract, but awaits ``.ainvoke()`` so the
+    calling event loop is free while the request is in flight. Transport
+    retries wrapped inside ``structured_llm`` apply to ``.ainvoke()``
+    exactly as they do to ``.invoke()``.
+
+    Raises:
+        pydantic.ValidationError: If both attempts fail schema validation.
+    """
+    try:
+        return await structured_llm.ainvoke(messages)
+    except ValidationError as exc:
+        reprompt = _validation_reprompt(messages, exc)
+    with validation_reprompt():
+        return await structured_llm.ainvoke(reprompt)
+
+
+def _validation_reprompt(
+    messages: list[BaseMessage], exc: ValidationError
+) -> list[BaseMessage]:
+    """Log the first-attempt failure and build the reprompt message list.
+
+    Also counts the reprompt on the active ``track_llm_usage()`` tracker.
+    """
+    tracker = _USAGE_TRACKER.get()
+    if tracker is not None:
+        tracker.record_validation_reprompt()
+    logger.warning(
+        "Structured output failed validation on first attempt, "
+        "retrying with reprompt: %s",
+        exc,
+    )
+    return messages + [
+        HumanMessage(
+            content=(
+                "Your previous response failed schema validation:\n\n"
+                f"{exc}\n\n"
+                "Return a new response that conforms exactly to the "
+                "required schema. Do not apologise or explain — "
+                "return only the corrected structured output."
+            )
+        )
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Provider prompt caching
+# ---------------------------------------------------------------------------
+#
+# Anthropic caches a prompt prefix up to each block marked with
+# ``cache_control``. Every agent's prompt has the same shape — a static
+# system prompt, then a human turn that opens with the brief — so two
+# breakpoints cover it: the end of the system prompt (shared by every run
+# with the same lenses) and the end of the brief (shared by every
+# iteration of one run). Prefixes shorter than the model's minimum
+# cacheable length are silently not cached by the API.
+
+_EPHEMERAL_CACHE = {"type": "ephemeral"}
+
+
+def _cached_text_block(text: str) -> dict[str, Any]:
+    return {"type": "text", "text": text, "cache_control": _EPHEMERAL_CACHE}
+
+
+def apply_prompt_caching(
+    messages: list[BaseMessage],
+    provider: LLMProvider,
+    *,
+    brief: str | None = None,
+) -> list[BaseMessage]:
+    """Mark the static prefix of ``messages`` for provider prompt caching.
+
+    A no-op (``messages`` returned unchanged) unless ``LLM_PROMPT_CACHING``
+    is on and the provider takes explicit cache markers — today only
+    Anthropic.
+
+    Args:
+        messages: The agent's prompt, system message first.
+        provider: The provider the messages are about to be sent to.
+        brief: The brief text the first human message opens with. When
+            given and found, the human turn is split after it and the
+            brief half gets its own breakpoint.
+
+    Returns:
+        A new message list with ``cache_control`` content blocks.
+    """
+    if not LLM_PROMPT_CACHING or provider != LLMProvider.ANTHROPIC:
+        return messages
+
+    marked: list[BaseMessage] = []
+    brief_marked = False
+    for message in messages:
+        if isinstance(message, SystemMessage) and isinstance(message.content, str):
+            marked.append(SystemMessage(content=[_cached_text_block(message.content)]))
+            continue
+        if (
+            not brief_marked
+            and brief
+            and isinstance(message, HumanMessage)
+            and isinstance(message.content, str)
+            and brief in message.content
+        ):
+            split = message.content.index(brief) + len(brief)
+            blocks = [_cached_text_block(message.content[:split])]
+            rest = message.content[split:]
+            if rest.strip():
+                blocks.append({"type": "text", "text": rest})
+            marked.append(HumanMessage(content=blocks))
+            brief_marked = True
+            continue
+        marked.append(message)
+    return marked
+
+
+# Run-metadata key carrying the assembled system prompt's content hash
+# (prompts/registry.py). Read back by LLMUsageTracker and the tracing
+# handler, so an AgentOutput or span names the exact prompt it was sent.
+_PROMPT_HASH_KEY = "agt_sea_prompt_hash"
+
+
+def with_prompt_hash(runnable: Runnable, prompt_hash: str) -> Runnable:
+    """Stamp ``prompt_hash`` into the run metadata of every call ``runnable`` makes.
+
+    Args:
+        runnable: The agent's composed (structured) runnable.
+        prompt_hash: ``AssembledPrompt.content_hash`` of its system prompt.
+
+    Returns:
+        A binding of ``runnable`` that carries the hash as metadata.
+    """
+    return runnable.with_config(metadata={_PROMPT_HASH_KEY: prompt_hash})
+
+
+# ---------------------------------------------------------------------------
+# Token usage tracking
+# ---------------------------------------------------------------------------
+#
+# Structured-output runnables return the parsed model, not the AIMessage,
+# so usage can't be read off the return value. Instead a callback handler
+# is bound to a context variable and registered as a LangChain configure
+# hook: every chat-model call made while ``track_llm_usage()`` is active —
+# including transport retries and the validation reprompt — reports to
+# it. Context variables follow asyncio tasks, so the async agents get the
+# same behaviour.
+#
+# Each transport retry re-invokes the chat model, so it shows up as one
+# more chat-model start plus one error; validation reprompts happen above
+# the callback layer and are counted by ``invoke_with_validation_retry``.
+
+
+@dataclass
+class _CallUsage:
+    """Metrics from one chat-model run's start, end or error callback."""
+
+    served: tuple[LLMProvider, str] | None
+    requests: int = 0
+    errors: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
+
+
+class LLMUsageTracker(BaseCallbackHandler):
+    """Accumulates token usage and call metrics across chat-model calls."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._lock = threading.Lock()
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.cache_read_tokens = 0
+        self.cache_creation_tokens = 0
+        self.requests = 0
+        self.errors = 0
+        self.validation_reprompts = 0
+        self.latency_seconds: float | None = None
+        # (provider, model) of the last request that succeeded — which a
+        # failover or hedge may have sent somewhere other than asked.
+        self.served: tuple[LLMProvider, str] | None = None
+        # content_hash of the system prompt sent with the last request.
+        self.prompt_hash: str | None = None
+        self._runs: dict[UUID, tuple[tuple[LLMProvider, str] | None, str | None]] = {}
+        # Hedge attempts still racing (usage held back) and those that lost.
+        self._held: dict[str, list[_CallUsage]] = {}
+        self._dropped: set[str] = set()
+
+    def hold(self, *attempts: str) -> None:
+        """Hold back usage from these hedge attempts until ``settle()``."""
+        with self._lock:
+            for attempt in attempts:
+                self._held[attempt] = []
+
+    def settle(self, winner: str | None, *losers: str) -> None:
+        """Count the winning attempt's metrics; drop the losers', now and later."""
+        with self._lock:
+            if winner is not None:
+                for usage in self._held.pop(winner, []):
+                    self._count(usage)
+            for attempt in losers:
+                self._held.pop(attempt, None)
+                self._dropped.add(attempt)
+
+    def record_validation_reprompt(self) -> None:
+        """Count one structured-output reprompt after a validation failure."""
+        with self._lock:
+            self.validation_reprompts += 1
+
+    def _record(self, attempt: str | None, usage: _CallUsage) -> None:
+        """Count ``usage`` now, hold it for ``settle()``, or drop it. Hold the lock."""
+        if attempt in self._dropped:
+            return  # a hedge loser that carried on anyway
+        if attempt in self._held:
+            self._held[attempt].append(usage)
+            return
+        self._count(usage)
+
+    def _count(self, usage: _CallUsage) -> None:
+        """Add one run's metrics to the totals. Hold the lock."""
+        if usage.served is not None:
+            self.served = usage.served
+        self.requests += usage.requests
+        self.errors += usage.errors
+        self.input_tokens += usage.input_tokens
+        self.output_tokens += usage.output_tokens
+        self.cache_read_tokens += usage.cache_read_tokens
+        self.cache_creation_tokens += usage.cache_creation_tokens
+
+    def on_chat_model_start(
+        self,
+        serialized: dict[str, Any],
+        messages: Any,
+        *,
+        run_id: UUID,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        attempt = (metadata or {}).get(_HEDGE_ATTEMPT_KEY)
+        with self._lock:
+            self._runs[run_id] = (_served_target(metadata), attempt)
+            if metadata and _PROMPT_HASH_KEY in metadata:
+                self.prompt_hash = metadata[_PROMPT_HASH_KEY]
+            self._record(attempt, _CallUsage(served=None, requests=1))
+
+    def on_llm_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        with self._lock:
+            _, attempt = self._runs.pop(run_id, (None, None))
+            # A cancelled hedge loser is not a failed attempt.
+            if not isinstance(error, asyncio.CancelledError):
+                self._record(attempt, _CallUsage(served=None, errors=1))
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        usage = _CallUsage(served=None)
+        for generations in response.generations:
+            for generation in generations:
+                if not isinstance(generation, ChatGeneration):
+                    continue
+                message = generation.message
+                if not isinstance(message, AIMessage) or not message.usage_metadata:
+                    continue
+                tokens = message.usage_metadata
+                details = tokens.get("input_token_details") or {}
+                usage.input_tokens += tokens.get("input_tokens", 0)
+                usage.output_tokens += tokens.get("output_tokens", 0)
+                usage.cache_read_tokens += details.get("cache_read", 0) or 0
+                usage.cache_creation_tokens += details.get("cache_creation", 0) or 0
+        with self._lock:
+            usage.served, attempt = self._runs.pop(run_id, (None, None))
+            self._record(attempt, usage)
+
+    def output_fields(
+        self,
+        provider: LLMProvider | None = None,
+        model: str | None = None,
+    ) -> dict[str, Any]:
+        """Return the metrics as ``AgentOutput`` keyword arguments.
+
+        When the requested ``provider`` / ``model`` are given, they are
+        included too — replaced by the provider and model that actually
+        served the call if a failover or hedge answered it.
+        """
+        fields: dict[str, Any] = {}
+        if provider is not None:
+            fields["provider"], fields["model"] = self.served or (provider, model)
+        return fields | {
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cache_read_tokens": self.cache_read_tokens,
+            "cache_creation_tokens": self.cache_creation_tokens,
+            "llm_calls": self.requests,
+            # A failed request is retried unless it was the last one, and
+            # the last one failing means no AgentOutput is ever written.
+            "transport_retries": self.errors,
+            "validation_reprompts": self.validation_reprompts,
+            "latency_seconds": self.latency_seconds,
+            "prompt_hash": self.prompt_hash,
+        }
+
+
+def _served_target(
+    metadata: dict[str, Any] | None,
+) -> tuple[LLMProvider, str] | None:
+    """The (provider, model) a chat model stamped into its run metadata."""
+    if not metadata or "agt_sea_provider" not in metadata:
+        return None
+    return LLMProvider(metadata["agt_sea_provider"]), metadata["agt_sea_model"]
+
+
+_USAGE_TRACKER: ContextVar[LLMUsageTracker | None] = ContextVar(
+    "agt_sea_llm_usage_tracker", default=None
+)
+register_configure_hook(_USAGE_TRACKER, inheritable=True)
+
+
+@contextmanager
+def track_llm_usage() -> Iterator[LLMUsageTracker]:
+    """Collect usage and timing for every chat-model call made inside the block.
+
+    ``latency_seconds`` is set when the block exits, so read it (or
+    ``output_fields()``) after the ``with`` statement.
+    """
+    tracker = LLMUsageTracker()
+    token = _USAGE_TRACKER.set(tracker)
+    start = time.perf_counter()
+    try:
+        yield tracker
+    finally:
+        tracker.latency_seconds = time.perf_counter() - start
+        _USAGE_TRACKER.reset(token)
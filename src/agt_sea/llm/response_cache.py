@@ -0,0 +1,187 @@
+"""
+agt_sea — LLM Response Cache
+
+A content-addressed, on-disk cache of chat-model responses, plugged into
+LangChain's own chat-model cache hook (``BaseChatModel(cache=...)``).
+
+Deterministic calls — the CD Grader runs at temperature 0.0 and its prompt
+promises "the same concept must receive the same score on re-evaluation" —
+don't need a second round-trip for a prompt they have already answered.
+``get_llm()`` in ``llm/provider.py`` attaches this cache to zero-temperature
+chat models when ``LLM_RESPONSE_CACHE`` is enabled.
+
+Keying. LangChain hands the cache two strings per call: the serialised
+message list, and an "llm string" describing the model configuration —
+provider class, model name, temperature, and any bound tools (which is how
+a structured-output schema reaches the model). The cache key is the
+SHA-256 of both, so it covers (provider, model, temperature, messages,
+schema) without this module having to know about any of them.
+
+Storage. One SQLite table, WAL mode, rows carrying their payload size and
+last-access time. When the total payload exceeds ``max_bytes`` the least
+recently used rows are deleted until it fits.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, Generation
+
+from agt_sea.config import LLM_RESPONSE_CACHE_MAX_BYTES
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+"""
+
+
+def response_cache_key(prompt: str, llm_string: str) -> str:
+    """Return the content address for a (prompt, model configuration) pair."""
+    digest = hashlib.sha256()
+    digest.update(llm_string.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(prompt.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _encode(generations: Sequence[Generation]) -> str:
+    """Serialise chat generations with LangChain's stable message dict format."""
+    records: list[dict[str, Any]] = []
+    for generation in generations:
+        if not isinstance(generation, ChatGeneration):
+            raise TypeError(
+                f"SqliteResponseCache only stores chat generations, got "
+                f"{type(generation).__name__}"
+            )
+        records.append(
+            {
+                "message": message_to_dict(generation.message),
+                "generation_info": generation.generation_info,
+            }
+        )
+    return json.dumps(records)
+
+
+def _decode(payload: str) -> list[Generation]:
+    records = json.loads(payload)
+    messages = messages_from_dict([record["message"] for record in records])
+    return [
+        ChatGeneration(message=message, generation_info=record["generation_info"])
+        for message, record in zip(messages, records)
+    ]
+
+
+class SqliteResponseCache(BaseCache):
+    """LangChain ``BaseCache`` backed by a size-bounded SQLite file.
+
+    Thread-safe: a single connection guarded by a lock, shared by every
+    chat model the cache is attached to. LangChain's async cache methods
+    default to running these sync ones in an executor.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        max_bytes: int = LLM_RESPONSE_CACHE_MAX_BYTES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def lookup(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
+        key = response_cache_key(prompt, llm_string)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                (self._clock(), key),
+            )
+            self._conn.commit()
+            self.hits += 1
+        return _decode(row[0])
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        key = response_cache_key(prompt, llm_string)
+        payload = _encode(return_val)
+        size = len(payload.encode("utf-8"))
+        if self.max_bytes > 0 and size > self.max_bytes:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, payload, size, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, payload, size, self._clock()),
+            )
+            self._evict_locked()
+            self._conn.commit()
+
+    def _evict_locked(self) -> None:
+        """Drop least recently used rows until under budget. Caller holds the lock."""
+        if self.max_bytes <= 0:
+            return
+        (total,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at ASC"
+        ).fetchall()
+        stale: list[tuple[str]] = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            stale.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", stale)
+        self.evictions += len(stale)
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def total_bytes(self) -> int:
+        """Return the summed payload size of every cached response."""
+        with self._lock:
+            (total,) = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return total
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -9,8 +9,9 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 from enum import Enum
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 # ---------------------------------------------------------------------------
@@ -48,6 +49,8 @@ class LLMProvider(str, Enum):
     ANTHROPIC = "anthropic"
     GOOGLE = "google"
     OPENAI = "openai"
+    # Deterministic offline stand-in (llm/fake.py) for tests and benchmarks.
+    FAKE = "fake"
 
 
 class CreativePhilosophy(str, Enum):
@@ -152,12 +155,80 @@ class AgentOutput(BaseModel):
         ...,
         description="The iteration number when this output was produced.",
     )
-    content: str
+    content: str = Field(
+        default="",
+        description=(
+            "Free-text output (creative briefs, Standard 1.0 concepts, CD "
+            "Feedback's direction). Empty when `payload` carries a typed "
+            "artifact; its text is rendered on demand for display."
+        ),
+    )
     timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
     evaluation: CDEvaluation | None = Field(
         default=None,
         description="Present only when agent is creative_director.",
     )
+    payload: AgentPayload | None = Field(
+        default=None,
+        description=(
+            "[2.0] Typed artifact from a structured-output agent — Creative "
+            "A's territories, Creative B's concept, the CD Grader's score, "
+            "CD Synthesis's judgement. Discriminated on `kind`."
+        ),
+    )
+    cache_read_tokens: int = Field(
+        default=0,
+        description=(
+            "Input tokens served from the provider's prompt cache across "
+            "this agent's LLM calls."
+        ),
+    )
+    cache_creation_tokens: int = Field(
+        default=0,
+        description=(
+            "Input tokens written to the provider's prompt cache across "
+            "this agent's LLM calls."
+        ),
+    )
+    input_tokens: int = Field(
+        default=0,
+        description="Input tokens reported across this agent's LLM calls.",
+    )
+    output_tokens: int = Field(
+        default=0,
+        description="Output tokens reported across this agent's LLM calls.",
+    )
+    llm_calls: int = Field(
+        default=0,
+        description=(
+            "Chat-model requests made, counting transport retries and the "
+            "validation reprompt."
+        ),
+    )
+    transport_retries: int = Field(
+        default=0,
+        description="Requests that failed and were retried by the transport layer.",
+    )
+    validation_reprompts: int = Field(
+        default=0,
+        description="Structured-output validation reprompts issued.",
+    )
+    latency_seconds: float | None = Field(
+        default=None,
+        description=(
+            "Wall-clock seconds spent in this agent's LLM calls, including "
+            "retries and reprompts. None on entries recorded before this "
+            "was tracked."
+        ),
+    )
+    prompt_hash: str | None = Field(
+        default=None,
+        description=(
+            "content_hash of the assembled system prompt sent with the last "
+            "LLM request (prompts/registry.py). None on entries recorded "
+            "before this was tracked."
+        ),
+    )
 
 
 # [2.0] Creative artifacts produced by the multi-stage pipeline (see ADR 0014).
@@ -239,9 +310,9 @@ class GraderEvaluation(BaseModel):
 
 class ConceptScoreSummary(BaseModel):
     """
-    Per-concept summary inside `CDSynthesis`. Built to support N concepts so
-    the model carries forward into the future parallel Creative B variant;
-    the current graph passes a single-element list.
+    Per-concept summary inside `CDSynthesis`. One entry per developed
+    concept — a single element on the serial v2 graph, one per selected
+    territory on the parallel graph.
     """
     title: str = Field(
         ...,
@@ -263,7 +334,8 @@ class CDSynthesis(BaseModel):
     """
     Structured output of CD Synthesis — final editorial judgement delivered
     to the user. Schema supports N concepts (see `ConceptScoreSummary`); the
-    simplified Standard 2.0 graph passes one.
+    serial Standard 2.0 graph passes one, the parallel graph one per
+    selected territory.
     """
     selected_title: str = Field(
         ...,
@@ -275,7 +347,7 @@ class CDSynthesis(BaseModel):
     )
     score_summary: list[ConceptScoreSummary] = Field(
         default_factory=list,
-        description="Per-concept summaries. Single element in the simplified v2 graph.",
+        description="Per-concept summaries. Single element on the serial v2 graph.",
     )
     comparison_notes: str | None = Field(
         default=None,
@@ -284,22 +356,175 @@ class CDSynthesis(BaseModel):
 
 
 # ---------------------------------------------------------------------------
-# Graph state
+# History payloads
 # ---------------------------------------------------------------------------
+# [2.0] Typed artifacts carried on `AgentOutput.payload`, so history keeps
+# each iteration's concept and grade as objects (best-of is a scan, not a
+# parse) and no pre-rendered text copy is checkpointed alongside them.
 
-class AgencyState(BaseModel):
+class TerritoriesPayload(BaseModel):
+    """Creative A's history payload: the territories it generated."""
+    kind: Literal["territories"] = "territories"
+    territories: list[Territory]
+
+
+class CampaignConceptPayload(BaseModel):
+    """Creative B's history payload: the concept for this iteration."""
+    kind: Literal["campaign_concept"] = "campaign_concept"
+    concept: CampaignConcept
+
+
+class GraderEvaluationPayload(BaseModel):
+    """CD Grader's history payload: the score for this iteration's concept."""
+    kind: Literal["grader_evaluation"] = "grader_evaluation"
+    evaluation: GraderEvaluation
+
+
+class CDSynthesisPayload(BaseModel):
+    """CD Synthesis's history payload: the final editorial judgement."""
+    kind: Literal["cd_synthesis"] = "cd_synthesis"
+    synthesis: CDSynthesis
+
+
+AgentPayload = Annotated[
+    TerritoriesPayload
+    | CampaignConceptPayload
+    | GraderEvaluationPayload
+    | CDSynthesisPayload,
+    Field(discriminator="kind"),
+]
+
+# `AgentOutput` is declared above the artifacts its payload refers to.
+AgentOutput.model_rebuild()
+
+
+def render_campaign_concept(concept: CampaignConcept) -> str:
+    """Render a CampaignConcept as a readable text block."""
+    deliverables = "\n".join(
+        f"- {d.name}: {d.explanation}" for d in concept.deliverables
+    )
+    return (
+        f"Title: {concept.title}\n"
+        f"Core idea: {concept.core_idea}\n"
+        f"Deliverables:\n{deliverables}\n"
+        f"Why it works: {concept.why_it_works}"
+    )
+
+
+def render_grader_evaluation(evaluation: GraderEvaluation) -> str:
+    """Render a GraderEvaluation as score and rationale lines."""
+    return f"Score: {evaluation.score}/100\nRationale: {evaluation.rationale}"
+
+
+def render_payload(entry: AgentOutput) -> str:
+    """Render an entry's output as plain text.
+
+    The one text form of each payload, shared by the frontend and the CD
+    Synthesis prompt; free-text entries return ``content`` unchanged.
     """
-    Shared state object passed through the LangGraph agent graph.
+    payload = entry.payload
+    if isinstance(payload, TerritoriesPayload):
+        return "\n\n".join(
+            f"Territory {idx}: {territory.title}\n"
+            f"Core idea: {territory.core_idea}\n"
+            f"Why it works: {territory.why_it_works}"
+            for idx, territory in enumerate(payload.territories, start=1)
+        )
+    if isinstance(payload, CampaignConceptPayload):
+        return render_campaign_concept(payload.concept)
+    if isinstance(payload, GraderEvaluationPayload):
+        return render_grader_evaluation(payload.evaluation)
+    if isinstance(payload, CDSynthesisPayload):
+        synthesis = payload.synthesis
+        return (
+            f"Recommendation: {synthesis.selected_title}\n\n"
+            f"{synthesis.recommendation}"
+        )
+    return entry.content
+
+
+class ConceptCandidate(BaseModel):
+    """
+    One branch of the parallel Creative B fan-out: a selected territory
+    developed into a campaign and graded (with its own feedback loop).
+    Branches write these to `AgencyState.concept_candidates`; the collect
+    node merges them back into the main state before CD Synthesis. A
+    branch's agent outputs go straight to `AgencyState.history` instead
+    of riding on the candidate, so every checkpoint stores them once.
+    """
+    territory_index: int = Field(
+        ...,
+        description="Index of the developed territory in `AgencyState.territories`.",
+    )
+    territory: Territory = Field(
+        ...,
+        description="The territory this branch developed.",
+    )
+    campaign_concept: CampaignConcept | None = Field(
+        default=None,
+        description="The branch's final campaign concept.",
+    )
+    grader_evaluation: GraderEvaluation | None = Field(
+        default=None,
+        description="Grader score for the branch's final campaign concept.",
+    )
+    iterations: int = Field(
+        default=0,
+        description="Creative B passes the branch used.",
+    )
+    error: str | None = Field(
+        default=None,
+        description="Populated when an agent inside the branch failed.",
+    )
 
-    This is the single source of truth at every node. Each agent reads
-    what it needs and appends its output to the history.
+
+def _merge_concept_candidates(
+    left: list[ConceptCandidate],
+    right: list[ConceptCandidate],
+) -> list[ConceptCandidate]:
+    """LangGraph reducer for `AgencyState.concept_candidates`.
+
+    Keyed on `territory_index` so it is idempotent: parallel branches each
+    contribute their own candidate in the same step, and a write that
+    carries an existing candidate back leaves it unchanged.
     """
+    merged = {candidate.territory_index: candidate for candidate in left}
+    merged.update((candidate.territory_index, candidate) for candidate in right)
+    return [merged[index] for index in sorted(merged)]
+
+
+def _append_history(
+    left: list[AgentOutput],
+    right: list[AgentOutput],
+) -> list[AgentOutput]:
+    """LangGraph reducer for `AgencyState.history`.
+
+    Graph nodes return partial updates, and their `history` write holds
+    only the entries the node produced; the reducer appends them. A
+    node that writes no history leaves the channel (and its checkpoint
+    blob) untouched.
+    """
+    return [*left, *right]
+
+
+# ---------------------------------------------------------------------------
+# Graph state
+# ---------------------------------------------------------------------------
+
+class RunConfig(BaseModel):
+    """
+    Immutable per-run inputs: lenses, temperatures, LLM override and
+    loop limits.
+
+    Set once when a run starts and never written by a node, so the
+    graphs keep it as a single `AgencyState.run_config` channel — one
+    checkpoint blob per thread rather than ~20 per-field channels, and
+    no re-validation at each step (a model instance is passed through
+    as-is). Frozen: a run that needs different settings is a new run.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
-    # --- Input ---
-    client_brief: str = Field(
-        default="",
-        description="The raw client brief as supplied.",
-    )
     # Per-agent philosophy lenses. Standard 1.0 and Standard 2.0 each get
     # their own set so the two pipelines can be steered independently. CD
     # Grader (st2) is omitted on purpose — neutral by contract.
@@ -377,6 +602,85 @@ class AgencyState(BaseModel):
         ),
     )
 
+    # --- Loop limits ---
+    max_iterations: int = Field(
+        default=3,
+        description="Maximum allowed iterations before forced exit.",
+    )
+    approval_threshold: float = Field(
+        default=80.0,
+        description="Minimum cd_score required for approval.",
+    )
+    # [2.0] Per-agent temperature. Grader is hardcoded to 0.0 for repeatable
+    # scoring and is not sidebar-exposed; kept on the config for traceability.
+    creative_a_st2_temperature: float = Field(
+        default=0.7,
+        ge=0.0,
+        le=1.0,
+        description="Temperature passed to `get_llm()` when invoking Creative A.",
+    )
+    creative_b_st2_temperature: float = Field(
+        default=0.7,
+        ge=0.0,
+        le=1.0,
+        description="Temperature passed to `get_llm()` when invoking Creative B.",
+    )
+    cd_feedback_st2_temperature: float = Field(
+        default=0.7,
+        ge=0.0,
+        le=1.0,
+        description="Temperature for the CD Feedback agent (qualitative revision direction).",
+    )
+    cd_synthesis_st2_temperature: float = Field(
+        default=0.7,
+        ge=0.0,
+        le=1.0,
+        description="Temperature for the CD Synthesis agent (final editorial judgement).",
+    )
+    cd_grader_st2_temperature: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=1.0,
+        description="Temperature for the CD Grader — hardcoded default for repeatable scoring.",
+    )
+
+
+def _run_config_field(name: str) -> property:
+    """Read-only `AgencyState` attribute that reads `run_config.<name>`."""
+    return property(
+        lambda self: getattr(self.run_config, name),
+        doc=f"`run_config.{name}` (read-only; set via `RunConfig`).",
+    )
+
+
+class AgencyState(BaseModel):
+    """
+    Shared state object passed through the LangGraph agent graph.
+
+    This is the single source of truth at every node. Each agent reads
+    what it needs and appends its output to the history.
+
+    Inside the graphs, nodes return partial update dicts (only the
+    fields they changed) rather than the whole state; `history` and
+    `concept_candidates` are reducer-merged, so their writes carry only
+    the new entries. The immutable per-run inputs sit in `run_config`;
+    the state exposes each of its fields as a read-only attribute.
+    """
+
+    # --- Input ---
+    client_brief: str = Field(
+        default="",
+        description="The raw client brief as supplied.",
+    )
+    run_config: RunConfig = Field(
+        default_factory=RunConfig,
+        description=(
+            "Immutable per-run inputs (lenses, temperatures, LLM override, "
+            "loop limits). Written once with the graph input; no node "
+            "writes it."
+        ),
+    )
+
     # --- Agent outputs (latest for quick access) ---
     creative_brief: str | None = Field(
         default=None,
@@ -405,6 +709,13 @@ class AgencyState(BaseModel):
         default=None,
         description="Territory chosen by the user at the interrupt; input to Creative B.",
     )
+    selected_territory_indices: list[int] = Field(
+        default_factory=list,
+        description=(
+            "Indices into `territories` chosen at the interrupt. One entry on "
+            "the serial graph; one per Creative B branch on the parallel graph."
+        ),
+    )
     territory_rejection_context: str | None = Field(
         default=None,
         description=(
@@ -432,55 +743,24 @@ class AgencyState(BaseModel):
         default=None,
         description="Final editorial judgement emitted by CD Synthesis before END.",
     )
+    concept_candidates: Annotated[
+        list[ConceptCandidate], _merge_concept_candidates
+    ] = Field(
+        default_factory=list,
+        description=(
+            "Parallel graph only: one developed and graded concept per "
+            "selected territory, written concurrently by the Creative B "
+            "branches. Empty on the serial graph."
+        ),
+    )
 
     # --- Iteration tracking ---
     iteration: int = Field(
         default=0,
         description="Current iteration count for the creative loop.",
     )
-    max_iterations: int = Field(
-        default=3,
-        description="Maximum allowed iterations before forced exit.",
-    )
-    approval_threshold: float = Field(
-        default=80.0,
-        description="Minimum cd_score required for approval.",
-    )
-    # [2.0] Per-agent temperature. Grader is hardcoded to 0.0 for repeatable
-    # scoring and is not sidebar-exposed; kept on state for traceability.
-    creative_a_st2_temperature: float = Field(
-        default=0.7,
-        ge=0.0,
-        le=1.0,
-        description="Temperature passed to `get_llm()` when invoking Creative A.",
-    )
-    creative_b_st2_temperature: float = Field(
-        default=0.7,
-        ge=0.0,
-        le=1.0,
-        description="Temperature passed to `get_llm()` when invoking Creative B.",
-    )
-    cd_feedback_st2_temperature: float = Field(
-        default=0.7,
-        ge=0.0,
-        le=1.0,
-        description="Temperature for the CD Feedback agent (qualitative revision direction).",
-    )
-    cd_synthesis_st2_temperature: float = Field(
-        default=0.7,
-        ge=0.0,
-        le=1.0,
-        description="Temperature for the CD Synthesis agent (final editorial judgement).",
-    )
-    cd_grader_st2_temperature: float = Field(
-        default=0.0,
-        ge=0.0,
-        le=1.0,
-        description="Temperature for the CD Grader — hardcoded default for repeatable scoring.",
-    )
-
     # --- History ---
-    history: list[AgentOutput] = Field(
+    history: Annotated[list[AgentOutput], _append_history] = Field(
         default_factory=list,
         description="Ordered log of every agent output across all iterations.",
     )
@@ -498,3 +778,64 @@ class AgencyState(BaseModel):
             "rehydration to render an error state instead of agent output."
         ),
     )
+
+    # --- Run configuration (read-only views onto `run_config`) ---
+    strategist_st1_strategic_philosophy = _run_config_field(
+        "strategist_st1_strategic_philosophy"
+    )
+    creative_st1_creative_philosophy = _run_config_field(
+        "creative_st1_creative_philosophy"
+    )
+    creative_director_st1_creative_philosophy = _run_config_field(
+        "creative_director_st1_creative_philosophy"
+    )
+    strategist_st2_strategic_philosophy = _run_config_field(
+        "strategist_st2_strategic_philosophy"
+    )
+    creative_a_st2_creative_philosophy = _run_config_field(
+        "creative_a_st2_creative_philosophy"
+    )
+    creative_b_st2_creative_philosophy = _run_config_field(
+        "creative_b_st2_creative_philosophy"
+    )
+    creative_director_st2_creative_philosophy = _run_config_field(
+        "creative_director_st2_creative_philosophy"
+    )
+    creative_a_st2_provenance = _run_config_field("creative_a_st2_provenance")
+    creative_a_st2_taste = _run_config_field("creative_a_st2_taste")
+    creative_b_st2_provenance = _run_config_field("creative_b_st2_provenance")
+    creative_b_st2_taste = _run_config_field("creative_b_st2_taste")
+    creative_director_st2_provenance = _run_config_field(
+        "creative_director_st2_provenance"
+    )
+    creative_director_st2_taste = _run_config_field("creative_director_st2_taste")
+    llm_provider = _run_config_field("llm_provider")
+    llm_model = _run_config_field("llm_model")
+    max_iterations = _run_config_field("max_iterations")
+    approval_threshold = _run_config_field("approval_threshold")
+    creative_a_st2_temperature = _run_config_field("creative_a_st2_temperature")
+    creative_b_st2_temperature = _run_config_field("creative_b_st2_temperature")
+    cd_feedback_st2_temperature = _run_config_field("cd_feedback_st2_temperature")
+    cd_synthesis_st2_temperature = _run_config_field("cd_synthesis_st2_temperature")
+    cd_grader_st2_temperature = _run_config_field("cd_grader_st2_temperature")
+
+    @model_validator(mode="before")
+    @classmethod
+    def _collect_run_config(cls, data: Any) -> Any:
+        """Fold flat `RunConfig` keys into `run_config`.
+
+        Keeps `AgencyState(client_brief=..., max_iterations=5)`, batch
+        JSONL rows and older checkpoints working: any `RunConfig` field
+        given at the top level overrides the same field on an explicit
+        `run_config`.
+        """
+        if not isinstance(data, dict):
+            return data
+        flat = {name: data[name] for name in RunConfig.model_fields if name in data}
+        if not flat:
+            return data
+        base = data.get("run_config") or {}
+        if isinstance(base, RunConfig):
+            base = dict(base)
+        rest = {k: v for k, v in data.items() if k not in flat}
+        return {**rest, "run_config": {**base, **flat}}
@@ -5,12 +5,29 @@ Loads prompt content from plain text files on disk. Prompts are organised
 by category (e.g. ``philosophies/``, ``templates/``, ``guidance/``) and
 keyed by name — each category maps to a subdirectory under ``prompts/``
 and each prompt to a ``.txt`` file inside it.
+
+Loaded prompts are cached in memory per (category, name). A cached entry
+is trusted for ``PROMPT_CACHE_CHECK_SECONDS`` before the file's mtime is
+checked again, so agents building system prompts on every iteration don't
+touch the disk, while edits to a prompt file still hot-reload in dev.
+``warm_prompt_cache()`` preloads every prompt at startup.
+
+Each reload of an edited file (and each ``clear_prompt_cache()``) bumps
+``prompt_generation()``. The prompt registry keys its assembled prompts
+on it, so they are rebuilt only after a lens file actually changes.
+``check_prompt_files()`` looks for such edits without a load, for
+callers (the Streamlit app, once per rerun) whose prompts are all
+served from the registry.
 """
 
 from __future__ import annotations
 
+import time
+from dataclasses import dataclass
 from pathlib import Path
 
+from agt_sea.config import PROMPT_CACHE_CHECK_SECONDS
+
 from agt_sea.models.state import (
     CreativePhilosophy,
     Provenance,
@@ -21,6 +38,77 @@ from agt_sea.models.state import (
 _PROMPTS_DIR = Path(__file__).parent
 
 
+# ---------------------------------------------------------------------------
+# In-memory cache
+# ---------------------------------------------------------------------------
+#
+# Plain dict, no lock: entries are replaced wholesale (never mutated in
+# place), so the worst a race can do is read the same file twice.
+
+
+@dataclass(frozen=True)
+class _CachedPrompt:
+    text: str
+    mtime_ns: int
+    checked_at: float
+
+
+_PROMPT_CACHE: dict[tuple[str, str], _CachedPrompt] = {}
+_GENERATION = 0
+
+
+def prompt_generation() -> int:
+    """Counter bumped whenever a cached prompt's text may have changed."""
+    return _GENERATION
+
+
+def _bump_generation() -> None:
+    global _GENERATION
+    _GENERATION += 1
+
+
+def clear_prompt_cache() -> None:
+    """Drop every cached prompt so the next load reads from disk."""
+    _PROMPT_CACHE.clear()
+    _bump_generation()
+
+
+def check_prompt_files() -> int:
+    """Reload every cached prompt whose file changed on disk.
+
+    One ``stat`` per cached prompt, no reads unless a file was edited.
+
+    Returns:
+        The current ``prompt_generation()``.
+    """
+    for (category, name), cached in list(_PROMPT_CACHE.items()):
+        path = _PROMPTS_DIR / category / f"{name}.txt"
+        try:
+            changed = path.stat().st_mtime_ns != cached.mtime_ns
+        except FileNotFoundError:
+            changed = True
+        if changed:
+            _PROMPT_CACHE.pop((category, name), None)
+            _bump_generation()
+    return _GENERATION
+
+
+def warm_prompt_cache() -> int:
+    """Load every prompt file under ``prompts/`` into the cache.
+
+    Call once at startup so the first run doesn't pay for the reads.
+
+    Returns:
+        The number of prompts cached.
+    """
+    count = 0
+    for path in sorted(_PROMPTS_DIR.rglob("*.txt")):
+        category = path.parent.relative_to(_PROMPTS_DIR).as_posix()
+        load_prompt(category, path.stem)
+        count += 1
+    return count
+
+
 def load_prompt(category: str, name: str) -> str:
     """Load a prompt text file from disk.
 
@@ -32,14 +120,38 @@ def load_prompt(category: str, name: str) -> str:
         category: The prompt category directory (e.g. 'philosophies').
         name: The filename stem (e.g. 'bold_and_disruptive').
 
+    Served from the in-memory cache when possible. Once an entry is
+    older than ``PROMPT_CACHE_CHECK_SECONDS`` the file's mtime is checked
+    and the text is re-read only if the file has changed.
+
     Returns:
         The prompt text with leading/trailing whitespace stripped.
 
     Raises:
         FileNotFoundError: If no prompt file exists for the given category/name.
     """
+    key = (category, name)
+    now = time.monotonic()
+    cached = _PROMPT_CACHE.get(key)
+    if cached is not None and now - cached.checked_at < PROMPT_CACHE_CHECK_SECONDS:
+        return cached.text
+
     path = _PROMPTS_DIR / category / f"{name}.txt"
-    return path.read_text().strip()
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        if _PROMPT_CACHE.pop(key, None) is not None:
+            _bump_generation()
+        raise
+
+    if cached is not None and cached.mtime_ns == mtime_ns:
+        text = cached.text
+    else:
+        text = path.read_text().strip()
+        if cached is not None:
+            _bump_generation()
+    _PROMPT_CACHE[key] = _CachedPrompt(text=text, mtime_ns=mtime_ns, checked_at=now)
+    return text
 
 
 def load_creative_philosophy(philosophy: CreativePhilosophy) -> str:
@@ -0,0 +1,103 @@
+"""
+agt_sea — Prompt assembly registry
+
+Memoises assembled system prompts. Each agent's ``_build_system_prompt``
+(and Creative B's / Creative 1.0's ``_build_revision_prompt``) is a pure
+function of a handful of lens enums — philosophy, provenance, taste, and
+for Creative A the territory count — so the space of distinct prompts is
+small. ``assemble_prompt()`` renders each (builder, arguments)
+combination once and serves the result by key thereafter.
+
+Every assembled prompt carries a stable ``content_hash`` (SHA-256 of the
+text). Agents stamp it into each LLM call's run metadata with
+``with_prompt_hash()``, and it lands on the ``AgentOutput`` as
+``prompt_hash`` and on the call's span, so a result can be traced back
+to the exact prompt text without storing the text itself.
+
+Entries are kept until the prompt loader reports an edited prompt file:
+each one records the loader's ``prompt_generation()`` it was rendered
+under, and is re-rendered (with a new hash, if the text changed) only
+once that counter moves. A lookup is a dict read and an integer compare
+— no clock, no ``stat``. ``clear_prompt_registry()`` drops everything.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+
+from agt_sea.prompts.loader import prompt_generation
+
+
+@dataclass(frozen=True)
+class AssembledPrompt:
+    """A rendered prompt plus its content hash."""
+
+    text: str
+    content_hash: str
+
+
+def content_hash(text: str) -> str:
+    """Return the hex SHA-256 digest used as a prompt's identity."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+#
+# Keyed on the builder's qualified name plus its (hashable) arguments.
+# Unbounded on purpose: the key space is the product of a few small enums
+# per role. Plain dict, no lock — entries are replaced wholesale, so a
+# race at worst renders the same prompt twice.
+
+_RegistryKey = tuple[str, tuple[Hashable, ...], tuple[tuple[str, Hashable], ...]]
+
+
+@dataclass(frozen=True)
+class _Entry:
+    prompt: AssembledPrompt
+    generation: int
+
+
+_REGISTRY: dict[_RegistryKey, _Entry] = {}
+
+
+def assemble_prompt(
+    builder: Callable[..., str],
+    *args: Hashable,
+    **kwargs: Hashable,
+) -> AssembledPrompt:
+    """Render ``builder(*args, **kwargs)`` once and serve it from the registry.
+
+    Args:
+        builder: A pure prompt builder — same arguments, same text.
+        *args: Positional builder arguments (must be hashable).
+        **kwargs: Keyword builder arguments (must be hashable).
+
+    Returns:
+        The assembled prompt and its content hash.
+    """
+    key: _RegistryKey = (
+        f"{builder.__module__}.{builder.__qualname__}",
+        args,
+        tuple(sorted(kwargs.items())),
+    )
+    generation = prompt_generation()
+    entry = _REGISTRY.get(key)
+    if entry is not None and entry.generation == generation:
+        return entry.prompt
+
+    text = builder(*args, **kwargs)
+    if entry is not None and entry.prompt.text == text:
+        prompt = entry.prompt
+    else:
+        prompt = AssembledPrompt(text=text, content_hash=content_hash(text))
+    _REGISTRY[key] = _Entry(prompt=prompt, generation=generation)
+    return prompt
+
+
+def clear_prompt_registry() -> None:
+    """Drop every assembled prompt so the next call re-renders."""
+    _REGISTRY.clear()
@@ -0,0 +1,265 @@
+"""
+agt_sea — Tracing
+
+Optional OpenTelemetry spans for the graph workflows and their LLM calls.
+Nothing here is required: when ``opentelemetry`` is not installed every
+helper is a no-op, and when it is installed but no tracer provider has
+been configured the OpenTelemetry API itself discards the spans.
+
+Span tree for one run:
+
+* ``node <name>`` — one per agent node, opened by ``_safe_node`` in both
+  workflows. Attributes: ``agt_sea.node``, ``agt_sea.iteration``,
+  ``agt_sea.thread_id`` (v2 / any run given a thread_id) and
+  ``agt_sea.agent_role`` for nodes that are agents. A node that fails
+  records the exception and an ERROR status; LangGraph's control-flow
+  signals (the territory interrupt) do not.
+* ``chat <model>`` — a child span per chat-model request, created by a
+  LangChain callback handler registered as a configure hook (the same
+  mechanism as ``track_llm_usage``). Every transport retry is its own
+  request and so its own span, numbered by ``agt_sea.llm.attempt`` from
+  the ``retry:attempt:N`` tag that ``wrap_with_transport_retry()``
+  passes down to the chat model; the structured-output validation
+  reprompt is flagged with ``agt_sea.llm.validation_reprompt``, and
+  ``agt_sea.prompt_hash`` is the content hash of the system prompt the
+  agent sent (see ``with_prompt_hash()``). Spans carry the node's
+  attributes plus the GenAI ``gen_ai.*`` provider / model / token-usage
+  attributes.
+
+Spans go to the global tracer provider unless ``set_tracer_provider()``
+points agt_sea at a dedicated one (tests use this with an in-memory
+exporter).
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+from langchain_core.tracers.context import register_configure_hook
+
+from agt_sea.models.state import AgencyState, AgentRole
+
+try:
+    from opentelemetry import trace
+    from opentelemetry.trace import Status, StatusCode
+except ImportError:  # the optional `otel` extra
+    trace = None
+
+_TRACER_NAME = "agt_sea"
+_AGENT_ROLES = frozenset(role.value for role in AgentRole)
+_RETRY_TAG_PREFIX = "retry:attempt:"
+
+# None = the global tracer provider.
+_tracer_provider: Any = None
+
+# Attributes of the innermost open node span, copied onto its LLM spans.
+_NODE_ATTRIBUTES: ContextVar[dict[str, Any] | None] = ContextVar(
+    "agt_sea_node_attributes", default=None
+)
+_VALIDATION_REPROMPT: ContextVar[bool] = ContextVar(
+    "agt_sea_validation_reprompt", default=False
+)
+
+
+def tracing_available() -> bool:
+    """True when the OpenTelemetry API is importable."""
+    return trace is not None
+
+
+def set_tracer_provider(provider: Any) -> None:
+    """Send agt_sea spans to ``provider`` (None restores the global one)."""
+    global _tracer_provider
+    _tracer_provider = provider
+
+
+def _tracer() -> Any:
+    return trace.get_tracer(_TRACER_NAME, tracer_provider=_tracer_provider)
+
+
+def node_name_for(fn_name: str) -> str:
+    """Map a node function's name to its graph node name.
+
+    ``run_cd_grader_st2`` / ``arun_cd_grader_st2`` -> ``cd_grader_st2``;
+    private helpers such as ``_collect_concepts`` lose the underscore.
+    """
+    name = fn_name.lstrip("_")
+    for prefix in ("arun_", "run_"):
+        if name.startswith(prefix):
+            return name[len(prefix):]
+    return name
+
+
+def _thread_id() -> str | None:
+    """Return the running graph's ``thread_id``, if there is one."""
+    from langgraph.config import get_config
+
+    try:
+        thread_id = get_config().get("configurable", {}).get("thread_id")
+    except RuntimeError:  # called outside a runnable context
+        return None
+    return None if thread_id is None else str(thread_id)
+
+
+# ---------------------------------------------------------------------------
+# Node spans
+# ---------------------------------------------------------------------------
+
+
+@contextmanager
+def node_span(node: str, state: AgencyState) -> Iterator[Any]:
+    """Open a ``node <node>`` span around one graph node's execution.
+
+    Yields the span (None when OpenTelemetry is unavailable). Exceptions
+    are neither recorded nor turned into an ERROR status automatically —
+    ``_safe_node`` calls ``record_node_error()`` for real failures and
+    lets control-flow signals pass unmarked.
+    """
+    if trace is None:
+        yield None
+        return
+
+    attributes: dict[str, Any] = {
+        "agt_sea.node": node,
+        "agt_sea.iteration": state.iteration,
+    }
+    thread_id = _thread_id()
+    if thread_id is not None:
+        attributes["agt_sea.thread_id"] = thread_id
+    if node in _AGENT_ROLES:
+        attributes["agt_sea.agent_role"] = node
+
+    token = _NODE_ATTRIBUTES.set(attributes)
+    try:
+        with _tracer().start_as_current_span(
+            f"node {node}",
+            attributes=attributes,
+            record_exception=False,
+            set_status_on_exception=False,
+        ) as span:
+            yield span
+    finally:
+        _NODE_ATTRIBUTES.reset(token)
+
+
+def record_node_error(span: Any, exc: BaseException) -> None:
+    """Mark ``span`` as failed with ``exc`` (no-op for a None span)."""
+    if span is None:
+        return
+    span.record_exception(exc)
+    span.set_status(Status(StatusCode.ERROR, f"{type(exc).__name__}: {exc}"))
+
+
+@contextmanager
+def validation_reprompt() -> Iterator[None]:
+    """Flag the chat-model spans opened inside the block as a reprompt."""
+    token = _VALIDATION_REPROMPT.set(True)
+    try:
+        yield
+    finally:
+        _VALIDATION_REPROMPT.reset(token)
+
+
+# ---------------------------------------------------------------------------
+# LLM spans
+# ---------------------------------------------------------------------------
+
+
+class _LLMSpanHandler(BaseCallbackHandler):
+    """Opens a span per chat-model request, closed on end or error."""
+
+    # Run in the caller's thread / task, so the current span (the node)
+    # is the parent.
+    run_inline = True
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._lock = threading.Lock()
+        self._spans: dict[UUID, Any] = {}
+
+    def on_chat_model_start(
+        self,
+        serialized: dict[str, Any],
+        messages: Any,
+        *,
+        run_id: UUID,
+        tags: list[str] | None = None,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        metadata = metadata or {}
+        model = metadata.get("ls_model_name") or "unknown"
+        attributes: dict[str, Any] = dict(_NODE_ATTRIBUTES.get() or {})
+        attributes["gen_ai.operation.name"] = "chat"
+        attributes["gen_ai.request.model"] = model
+        if metadata.get("ls_provider"):
+            attributes["gen_ai.system"] = metadata["ls_provider"]
+        if metadata.get("agt_sea_prompt_hash"):
+            attributes["agt_sea.prompt_hash"] = metadata["agt_sea_prompt_hash"]
+        attributes["agt_sea.llm.attempt"] = _attempt_from_tags(tags)
+        attributes["agt_sea.llm.validation_reprompt"] = _VALIDATION_REPROMPT.get()
+
+        span = _tracer().start_span(f"chat {model}", attributes=attributes)
+        with self._lock:
+            self._spans[run_id] = span
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            span = self._spans.pop(run_id, None)
+        if span is None:
+            return
+        for generations in response.generations:
+            for generation in generations:
+                if not isinstance(generation, ChatGeneration):
+                    continue
+                message = generation.message
+                if isinstance(message, AIMessage) and message.usage_metadata:
+                    usage = message.usage_metadata
+                    span.set_attribute(
+                        "gen_ai.usage.input_tokens", usage.get("input_tokens", 0)
+                    )
+                    span.set_attribute(
+                        "gen_ai.usage.output_tokens", usage.get("output_tokens", 0)
+                    )
+        span.end()
+
+    def on_llm_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        with self._lock:
+            span = self._spans.pop(run_id, None)
+        if span is None:
+            return
+        record_node_error(span, error)
+        span.end()
+
+
+def _attempt_from_tags(tags: list[str] | None) -> int:
+    """Read the transport-retry attempt number LangChain tags retries with.
+
+    Inherited tags come first, so the last match is the innermost retry.
+    """
+    for tag in reversed(tags or ()):
+        if tag.startswith(_RETRY_TAG_PREFIX):
+            try:
+                return int(tag[len(_RETRY_TAG_PREFIX):])
+            except ValueError:
+                break
+    return 1
+
+
+# A single process-wide handler, attached to every LangChain run through
+# the configure hook. Not registered at all without OpenTelemetry.
+_LLM_SPAN_HANDLER: ContextVar[_LLMSpanHandler | None] = ContextVar(
+    "agt_sea_llm_span_handler",
+    default=_LLMSpanHandler() if trace is not None else None,
+)
+if trace is not None:
+    register_configure_hook(_LLM_SPAN_HANDLER, inheritable=True)
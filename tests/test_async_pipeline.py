@@ -0,0 +1,285 @@
+"""
+agt_sea — Async Pipeline Tests
+
+Unit tests (pytest, no real LLM calls) for the async execution path:
+
+1. ``ainvoke_with_validation_retry`` — the async twin of the validation
+   retry helper, fed a fake structured runnable with an ``ainvoke``.
+2. ``build_graph_st1(asynchronous=True)`` — a stubbed run reaches
+   APPROVED through ``ainvoke()``, and an agent exception still becomes
+   a clean FAILED exit via the async ``_safe_node`` wrapper.
+3. ``build_graph_st2(asynchronous=True)`` — interrupt / resume through
+   ``ainvoke()`` on both checkpointer backends.
+4. Concurrency — many runs on one event loop overlap their (simulated)
+   LLM latency instead of serialising it.
+
+Run with:
+    uv run pytest tests/test_async_pipeline.py
+
+Tests drive coroutines with ``asyncio.run`` so no pytest plugin is
+needed. Agents are stubbed on the workflow modules and graphs rebuilt
+after patching — see the patching note in ``test_pipeline_failure.py``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from langgraph.types import Command
+from pydantic import ValidationError
+
+from agt_sea.graph import workflow_st1, workflow_st2
+from agt_sea.graph.checkpointer import BoundedMemorySaver, build_checkpointer
+from agt_sea.llm.provider import ainvoke_with_validation_retry
+from agt_sea.models.state import (
+    AgencyState,
+    CampaignConcept,
+    CDEvaluation,
+    CDSynthesis,
+    GraderEvaluation,
+    Territory,
+    WorkflowStatus,
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+class _FakeAsyncStructuredLLM:
+    """Scripted stand-in for a structured runnable's ``ainvoke``."""
+
+    def __init__(self, results: list[Any]) -> None:
+        self._results = list(results)
+        self.calls: list[list[BaseMessage]] = []
+
+    async def ainvoke(self, messages: list[BaseMessage]) -> CDEvaluation:
+        self.calls.append(messages)
+        result = self._results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def _valid_evaluation(score: int = 90) -> CDEvaluation:
+    return CDEvaluation(
+        score=score,
+        strengths=["clear insight"],
+        weaknesses=["execution vague"],
+        direction="Tighten the hero film brief.",
+    )
+
+
+def _make_validation_error() -> ValidationError:
+    try:
+        CDEvaluation.model_validate({"score": "not a number", "direction": "ok"})
+    except ValidationError as exc:
+        return exc
+    raise RuntimeError("expected CDEvaluation.model_validate to raise")
+
+
+def _stub_st1_agents(monkeypatch: pytest.MonkeyPatch, delay: float = 0.0) -> None:
+    """Replace the v1 async agents with stubs that sleep ``delay`` seconds."""
+    async def arun_strategist_st1(state: AgencyState) -> AgencyState:
+        await asyncio.sleep(delay)
+        state.creative_brief = "stub brief"
+        return state
+
+    async def arun_creative_st1(state: AgencyState) -> AgencyState:
+        await asyncio.sleep(delay)
+        state.creative_concept = "stub concept"
+        state.iteration += 1
+        return state
+
+    async def arun_creative_director_st1(state: AgencyState) -> AgencyState:
+        await asyncio.sleep(delay)
+        state.cd_evaluation = _valid_evaluation()
+        return state
+
+    for fn in (arun_strategist_st1, arun_creative_st1, arun_creative_director_st1):
+        monkeypatch.setattr(workflow_st1, fn.__name__, fn)
+
+
+def _stub_st2_agents(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Replace the v2 async agents with no-LLM stubs."""
+    async def arun_strategist_st2(state: AgencyState) -> AgencyState:
+        state.creative_brief = "stub brief"
+        return state
+
+    async def arun_creative_a_st2(state: AgencyState) -> AgencyState:
+        state.territories = [
+            Territory(title=f"T{i}", core_idea="idea", why_it_works="why")
+            for i in range(state.num_territories)
+        ]
+        return state
+
+    async def arun_creative_b_st2(state: AgencyState) -> AgencyState:
+        state.campaign_concept = CampaignConcept(
+            title=f"Campaign from {state.selected_territory.title}",
+            core_idea="idea",
+            why_it_works="why",
+        )
+        state.iteration += 1
+        return state
+
+    async def arun_cd_grader_st2(state: AgencyState) -> AgencyState:
+        state.grader_evaluation = GraderEvaluation(score=90, rationale="good")
+        return state
+
+    async def arun_cd_synthesis_st2(state: AgencyState) -> AgencyState:
+        state.cd_synthesis = CDSynthesis(
+            selected_title=state.campaign_concept.title,
+            recommendation="ship it",
+        )
+        return state
+
+    for fn in (
+        arun_strategist_st2,
+        arun_creative_a_st2,
+        arun_creative_b_st2,
+        arun_cd_grader_st2,
+        arun_cd_synthesis_st2,
+    ):
+        monkeypatch.setattr(workflow_st2, fn.__name__, fn)
+
+
+def _config(thread_id: str) -> dict:
+    return {"configurable": {"thread_id": thread_id}}
+
+
+async def _pause_and_resume(graph, thread_id: str) -> AgencyState:
+    cfg = _config(thread_id)
+    await graph.ainvoke(AgencyState(client_brief="brief"), config=cfg)
+    snap = await graph.aget_state(cfg)
+    assert snap.next == ("interrupt_territory_selection",)
+    raw = await graph.ainvoke(
+        Command(resume={"action": "select", "index": 2}), config=cfg
+    )
+    return AgencyState.model_validate(raw)
+
+
+# ---------------------------------------------------------------------------
+# Async validation retry
+# ---------------------------------------------------------------------------
+
+
+def test_async_validation_retry_transparent_on_first_success() -> None:
+    fake = _FakeAsyncStructuredLLM([_valid_evaluation()])
+    messages = [SystemMessage(content="cd"), HumanMessage(content="evaluate")]
+
+    result = asyncio.run(ainvoke_with_validation_retry(fake, messages))
+
+    assert result.score == 90
+    assert len(fake.calls) == 1
+
+
+def test_async_validation_retry_reprompts_once() -> None:
+    fake = _FakeAsyncStructuredLLM([_make_validation_error(), _valid_evaluation()])
+    messages = [SystemMessage(content="cd"), HumanMessage(content="evaluate")]
+
+    result = asyncio.run(ainvoke_with_validation_retry(fake, messages))
+
+    assert result.score == 90
+    assert len(fake.calls) == 2
+    assert len(fake.calls[1]) == 3
+    assert "failed schema validation" in fake.calls[1][-1].content
+
+
+# ---------------------------------------------------------------------------
+# Standard 1.0 async graph
+# ---------------------------------------------------------------------------
+
+
+def test_async_st1_graph_reaches_approved(monkeypatch: pytest.MonkeyPatch) -> None:
+    _stub_st1_agents(monkeypatch)
+    graph = workflow_st1.build_graph_st1(asynchronous=True)
+
+    raw = asyncio.run(graph.ainvoke(AgencyState(client_brief="brief")))
+    final_state = AgencyState.model_validate(raw)
+
+    assert final_state.status == WorkflowStatus.APPROVED
+    assert final_state.iteration == 1
+
+
+def test_async_st1_agent_failure_surfaces_as_failed(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _stub_st1_agents(monkeypatch)
+
+    async def arun_creative_st1(state: AgencyState) -> AgencyState:
+        raise RuntimeError("creative boom")
+
+    monkeypatch.setattr(workflow_st1, "arun_creative_st1", arun_creative_st1)
+    graph = workflow_st1.build_graph_st1(asynchronous=True)
+
+    raw = asyncio.run(graph.ainvoke(AgencyState(client_brief="brief")))
+    final_state = AgencyState.model_validate(raw)
+
+    assert final_state.status == WorkflowStatus.FAILED
+    assert "arun_creative_st1 failed: RuntimeError: creative boom" in final_state.error
+
+
+def test_async_st1_runs_overlap_on_one_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    """20 runs x 3 agents x 50ms would take ~3s serially."""
+    _stub_st1_agents(monkeypatch, delay=0.05)
+    graph = workflow_st1.build_graph_st1(asynchronous=True)
+
+    async def run_many() -> list[dict]:
+        return await asyncio.gather(
+            *(graph.ainvoke(AgencyState(client_brief=f"brief {i}")) for i in range(20))
+        )
+
+    start = time.perf_counter()
+    results = asyncio.run(run_many())
+    elapsed = time.perf_counter() - start
+
+    assert all(
+        AgencyState.model_validate(raw).status == WorkflowStatus.APPROVED
+        for raw in results
+    )
+    assert elapsed < 1.5
+
+
+# ---------------------------------------------------------------------------
+# Standard 2.0 async graph
+# ---------------------------------------------------------------------------
+
+
+def test_async_st2_interrupt_and_resume_memory(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _stub_st2_agents(monkeypatch)
+    graph = workflow_st2.build_graph_st2(
+        checkpointer=BoundedMemorySaver(), asynchronous=True
+    )
+
+    final_state = asyncio.run(_pause_and_resume(graph, "async-memory"))
+
+    assert final_state.status == WorkflowStatus.APPROVED
+    assert final_state.selected_territory.title == "T2"
+
+
+def test_async_st2_interrupt_and_resume_sqlite(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """The batched SQLite saver serves the async graph via thread offload."""
+    _stub_st2_agents(monkeypatch)
+    saver = build_checkpointer("sqlite", db_path=tmp_path / "cp.sqlite")
+    try:
+        graph = workflow_st2.build_graph_st2(checkpointer=saver, asynchronous=True)
+        final_state = asyncio.run(_pause_and_resume(graph, "async-sqlite"))
+    finally:
+        saver.close()
+
+    assert final_state.status == WorkflowStatus.APPROVED
+    assert final_state.cd_synthesis.selected_title == "Campaign from T2"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,224 @@
+"""
+agt_sea — Batch Run Tests
+
+Unit tests (no real LLM calls — runs use ``LLMProvider.FAKE``) for
+``agt_sea/batch.py`` and the ``agt-sea batch`` command in ``cli.py``:
+
+1. Briefs load from a directory of ``*.txt`` files or a JSONL file.
+2. Selection policies resolve the v2 territory interrupt.
+3. The run-start limiter spaces starts per provider, and a throttled
+   start does not hold a concurrency slot.
+4. ``agt-sea batch`` streams one JSONL record per brief, recording a
+   bad brief as failed without stopping the batch.
+
+Run with:
+    uv run pytest tests/test_batch.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from agt_sea import cli
+from agt_sea.batch import (
+    BatchRunner,
+    BriefJob,
+    RunStartLimiter,
+    SelectionPolicy,
+    Workflow,
+    load_jobs,
+    select_indices,
+)
+from agt_sea.llm.provider import clear_llm_cache
+from agt_sea.models.state import LLMProvider
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_llm_cache()
+    yield
+    clear_llm_cache()
+
+
+def _collect(runner: BatchRunner, jobs) -> list[dict]:
+    async def collect() -> list[dict]:
+        return [record async for record in runner.run(jobs)]
+
+    return asyncio.run(collect())
+
+
+# ---------------------------------------------------------------------------
+# Loading
+# ---------------------------------------------------------------------------
+
+
+def test_load_jobs_from_directory(tmp_path: Path) -> None:
+    (tmp_path / "b_socks.txt").write_text("  Sell socks.\n")
+    (tmp_path / "a_hats.txt").write_text("Sell hats.")
+    (tmp_path / "notes.md").write_text("ignored")
+
+    jobs = load_jobs(tmp_path)
+
+    assert [job.id for job in jobs] == ["a_hats", "b_socks"]
+    assert jobs[1].fields == {"client_brief": "Sell socks."}
+
+
+def test_load_jobs_from_jsonl(tmp_path: Path) -> None:
+    source = tmp_path / "overnight.jsonl"
+    source.write_text(
+        '{"id": "socks", "brief": "Sell socks.", "num_territories": 2}\n'
+        "\n"
+        '{"client_brief": "Sell hats.", "creative_a_st2_taste": "pop_maximalist"}\n'
+    )
+
+    socks, hats = load_jobs(source)
+
+    assert socks.id == "socks"
+    assert socks.fields == {"client_brief": "Sell socks.", "num_territories": 2}
+    assert hats.id == "overnight-3"
+    assert hats.fields["creative_a_st2_taste"] == "pop_maximalist"
+
+    source.write_text('{"id": "empty"}\n')
+    with pytest.raises(ValueError, match="client_brief"):
+        load_jobs(source)
+
+
+# ---------------------------------------------------------------------------
+# Selection policy and rate limit
+# ---------------------------------------------------------------------------
+
+
+def test_select_indices() -> None:
+    assert select_indices(SelectionPolicy.FIRST, [], 3) == [0]
+    assert select_indices(SelectionPolicy.ALL, [], 3) == [0, 1, 2]
+    assert select_indices(SelectionPolicy.TOP_SCORED, [70.0, 90.0, 90.0], 3) == [1]
+    assert select_indices(SelectionPolicy.TOP_SCORED, [None, 60.0, None], 3) == [1]
+    assert select_indices(SelectionPolicy.TOP_SCORED, [None, None], 2) == [0]
+
+
+def test_run_start_limiter_spaces_starts_per_provider() -> None:
+    limiter = RunStartLimiter({LLMProvider.FAKE: 600})  # one start per 0.1s
+
+    async def starts() -> tuple[float, float]:
+        begin = time.monotonic()
+        await asyncio.gather(*(limiter.acquire(LLMProvider.FAKE) for _ in range(3)))
+        limited = time.monotonic() - begin
+        begin = time.monotonic()
+        await asyncio.gather(*(limiter.acquire(LLMProvider.OPENAI) for _ in range(3)))
+        return limited, time.monotonic() - begin
+
+    limited, unlimited = asyncio.run(starts())
+    assert limited >= 0.19
+    assert unlimited < 0.05
+
+
+def test_throttled_start_does_not_hold_a_concurrency_slot(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    runner = BatchRunner(
+        Workflow.ST1,
+        defaults={"llm_provider": LLMProvider.FAKE},
+        concurrency=1,
+        rate_limits={LLMProvider.FAKE: 600},  # one start per 0.1s
+    )
+
+    async def run_one(job):
+        return {"id": job.id}
+
+    monkeypatch.setattr(runner, "run_one", run_one)
+    jobs = [
+        BriefJob(id="fake-1", source="-", fields={"client_brief": "a"}),
+        BriefJob(id="fake-2", source="-", fields={"client_brief": "b"}),
+        BriefJob(
+            id="openai",
+            source="-",
+            fields={"client_brief": "c", "llm_provider": LLMProvider.OPENAI},
+        ),
+    ]
+
+    records = _collect(runner, jobs)
+
+    # Whichever FAKE run starts second waits 0.1s outside the gate, so
+    # the unlimited OPENAI run is never queued behind it.
+    assert records[-1]["id"].startswith("fake")
+
+
+# ---------------------------------------------------------------------------
+# Runs
+# ---------------------------------------------------------------------------
+
+
+def test_top_scored_policy_resumes_with_the_best_territory(tmp_path: Path) -> None:
+    (tmp_path / "socks.txt").write_text("Sell socks.")
+    runner = BatchRunner(
+        Workflow.ST2,
+        policy=SelectionPolicy.TOP_SCORED,
+        defaults={"llm_provider": LLMProvider.FAKE, "num_territories": 3},
+    )
+
+    (record,) = _collect(runner, load_jobs(tmp_path))
+
+    scores = record["territory_scores"]
+    assert len(scores) == 3
+    assert record["selected_indices"] == [scores.index(max(scores))]
+    assert record["status"] in ("approved", "max_iterations_reached")
+    assert record["state"]["selected_territory"] == (
+        record["state"]["territories"][record["selected_indices"][0]]
+    )
+
+
+def test_all_policy_develops_every_territory(tmp_path: Path) -> None:
+    (tmp_path / "socks.txt").write_text("Sell socks.")
+    runner = BatchRunner(
+        Workflow.ST2,
+        policy=SelectionPolicy.ALL,
+        defaults={"llm_provider": LLMProvider.FAKE, "num_territories": 2},
+    )
+
+    (record,) = _collect(runner, load_jobs(tmp_path))
+
+    assert record["selected_indices"] == [0, 1]
+    assert len(record["state"]["concept_candidates"]) == 2
+
+
+def test_cli_streams_records_and_flags_failures(tmp_path: Path) -> None:
+    source = tmp_path / "briefs.jsonl"
+    source.write_text(
+        '{"id": "socks", "brief": "Sell socks."}\n'
+        '{"id": "bad", "brief": "Sell hats.", "num_territories": "many"}\n'
+    )
+    output = tmp_path / "results.jsonl"
+
+    status = cli.main(
+        [
+            "batch",
+            str(source),
+            "--workflow",
+            "st1",
+            "--provider",
+            "fake",
+            "--concurrency",
+            "2",
+            "--output",
+            str(output),
+        ]
+    )
+
+    records = {
+        record["id"]: record
+        for record in map(json.loads, output.read_text().splitlines())
+    }
+    assert status == 1
+    assert records["socks"]["workflow"] == "st1"
+    assert records["socks"]["state"]["cd_evaluation"] is not None
+    assert records["bad"]["status"] == "failed"
+    assert "num_territories" in records["bad"]["error"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,215 @@
+"""
+agt_sea — Per-Call Metrics Tests
+
+Unit tests (no real LLM calls) for the call metrics recorded on each
+``AgentOutput``:
+
+1. ``track_llm_usage`` counts requests, transport retries and
+   validation reprompts, and times the block.
+2. An agent writes those metrics, plus input / output tokens and the
+   content hash of the system prompt it sent, onto its history entry.
+3. ``summarise_node_metrics`` (the run-metadata per-node breakdown)
+   aggregates them by agent.
+
+Run with:
+    uv run pytest tests/test_call_metrics.py
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import RunnableLambda
+from pydantic import ValidationError
+
+from agt_sea.agents import cd_feedback_st2
+from agt_sea.llm.provider import invoke_with_validation_retry, track_llm_usage
+from agt_sea.models.state import (
+    AgencyState,
+    AgentOutput,
+    AgentRole,
+    CampaignConcept,
+    GraderEvaluation,
+    LLMProvider,
+)
+from agt_sea.prompts.registry import content_hash
+
+# Make `frontend` importable the same way app.py does at runtime.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "frontend"))
+
+from components.run_metadata import summarise_node_metrics  # noqa: E402
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+class _FlakyChatModel(BaseChatModel):
+    """Fails ``failures`` times with ConnectionError, then answers."""
+
+    failures: int = 0
+    delay: float = 0.0
+
+    @property
+    def _llm_type(self) -> str:
+        return "flaky"
+
+    def _generate(
+        self,
+        messages: list[Any],
+        stop: list[str] | None = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        time.sleep(self.delay)
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("reset by peer")
+        message = AIMessage(
+            content="push the idea further",
+            usage_metadata={
+                "input_tokens": 120,
+                "output_tokens": 30,
+                "total_tokens": 150,
+            },
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+def _retrying(model: BaseChatModel):
+    return model.with_retry(
+        retry_if_exception_type=(ConnectionError,),
+        stop_after_attempt=3,
+        wait_exponential_jitter=False,
+    )
+
+
+def _validation_error() -> ValidationError:
+    try:
+        GraderEvaluation(score=500, rationale="too high")
+    except ValidationError as exc:
+        return exc
+    raise AssertionError("expected a ValidationError")
+
+
+# ---------------------------------------------------------------------------
+# Tracker
+# ---------------------------------------------------------------------------
+
+
+def test_tracker_counts_requests_retries_and_time() -> None:
+    model = _retrying(_FlakyChatModel(failures=2, delay=0.05))
+
+    with track_llm_usage() as usage:
+        model.invoke("hello")
+
+    fields = usage.output_fields()
+    assert fields["llm_calls"] == 3
+    assert fields["transport_retries"] == 2
+    assert fields["input_tokens"] == 120
+    assert fields["output_tokens"] == 30
+    assert fields["latency_seconds"] >= 0.15
+
+
+def test_tracker_counts_validation_reprompts() -> None:
+    attempts: list[int] = []
+
+    def structured(messages: list[Any]) -> GraderEvaluation:
+        attempts.append(len(messages))
+        if len(attempts) == 1:
+            raise _validation_error()
+        return GraderEvaluation(score=70, rationale="fine")
+
+    with track_llm_usage() as usage:
+        invoke_with_validation_retry(
+            RunnableLambda(structured), [HumanMessage(content="grade")]
+        )
+
+    assert attempts == [1, 2]
+    assert usage.output_fields()["validation_reprompts"] == 1
+
+
+# ---------------------------------------------------------------------------
+# Agent history entry
+# ---------------------------------------------------------------------------
+
+
+def test_agent_records_call_metrics_on_history(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    model = _retrying(_FlakyChatModel(failures=1, delay=0.05))
+    monkeypatch.setattr(cd_feedback_st2, "get_llm", lambda **_: model)
+    state = AgencyState(
+        creative_brief="Sell socks.",
+        llm_provider=LLMProvider.OPENAI,
+        llm_model="stub",
+        campaign_concept=CampaignConcept(
+            title="Sock It", core_idea="idea", why_it_works="why"
+        ),
+    )
+
+    _, messages, _, _ = cd_feedback_st2._build_call(state)
+    state = cd_feedback_st2.run_cd_feedback_st2(state)
+
+    entry = state.history[-1]
+    assert entry.llm_calls == 2
+    assert entry.transport_retries == 1
+    assert entry.validation_reprompts == 0
+    assert (entry.input_tokens, entry.output_tokens) == (120, 30)
+    assert entry.latency_seconds >= 0.1
+    assert entry.prompt_hash == content_hash(messages[0].content)
+
+
+# ---------------------------------------------------------------------------
+# Run-metadata breakdown
+# ---------------------------------------------------------------------------
+
+
+def _entry(agent: AgentRole, **metrics: Any) -> AgentOutput:
+    return AgentOutput(
+        agent=agent,
+        provider=LLMProvider.OPENAI,
+        model="stub",
+        iteration=1,
+        content="x",
+        **metrics,
+    )
+
+
+def test_node_breakdown_aggregates_by_agent() -> None:
+    history = [
+        _entry(AgentRole.CREATIVE_B_ST2, latency_seconds=2.0, output_tokens=400),
+        _entry(AgentRole.CD_GRADER_ST2, latency_seconds=0.5, validation_reprompts=1),
+        _entry(
+            AgentRole.CREATIVE_B_ST2,
+            latency_seconds=1.25,
+            output_tokens=300,
+            transport_retries=2,
+        ),
+        # Recorded before timing existed: counted, but adds no time.
+        _entry(AgentRole.CD_GRADER_ST2),
+    ]
+
+    rows = summarise_node_metrics(history)
+
+    assert [row["node"] for row in rows] == ["creative_b_st2", "cd_grader_st2"]
+    creative_b, grader = rows
+    assert creative_b["calls"] == 2
+    assert creative_b["llm seconds"] == 3.25
+    assert creative_b["output tokens"] == 700
+    assert creative_b["retries"] == 2
+    assert grader["calls"] == 2
+    assert grader["llm seconds"] == 0.5
+    assert grader["reprompts"] == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,333 @@
+"""
+agt_sea — Checkpointer Backend Tests
+
+Unit tests (pytest, no real LLM calls) for ``graph/checkpointer.py``:
+
+1. ``build_checkpointer`` backend selection and validation.
+2. ``BatchedSqliteSaver`` durability — a Standard 2.0 run paused at the
+   territory-selection interrupt survives closing the saver and
+   reopening the same database file (the "worker restart" case), then
+   resumes to END.
+3. Batched commits — writes between checkpoint boundaries are held in
+   one transaction rather than committed one at a time.
+4. ``BoundedMemorySaver`` — idle-TTL and byte-budget eviction, and the
+   eviction counters exposed via ``stats()``.
+
+Run with:
+    uv run pytest tests/test_checkpointer.py
+
+Agents are stubbed on ``agt_sea.graph.workflow_st2`` and the graph is
+rebuilt after patching — see the patching note in
+``test_pipeline_failure.py``.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.types import Command
+
+from agt_sea.graph import workflow_st2 as workflow_module
+from agt_sea.graph.checkpointer import (
+    BatchedSqliteSaver,
+    BoundedMemorySaver,
+    build_checkpointer,
+)
+from agt_sea.models.state import (
+    AgencyState,
+    CampaignConcept,
+    CDSynthesis,
+    GraderEvaluation,
+    Territory,
+    WorkflowStatus,
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _stub_agents(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Replace every v2 agent on the workflow module with a no-LLM stub.
+
+    Stubs only populate what downstream routing and the next agent read.
+    """
+    def run_strategist_st2(state: AgencyState) -> AgencyState:
+        state.creative_brief = "stub brief"
+        return state
+
+    def run_creative_a_st2(state: AgencyState) -> AgencyState:
+        state.territories = [
+            Territory(title=f"T{i}", core_idea="idea", why_it_works="why")
+            for i in range(state.num_territories)
+        ]
+        return state
+
+    def run_creative_b_st2(state: AgencyState) -> AgencyState:
+        state.campaign_concept = CampaignConcept(
+            title=f"Campaign from {state.selected_territory.title}",
+            core_idea="idea",
+            why_it_works="why",
+        )
+        state.iteration += 1
+        return state
+
+    def run_cd_grader_st2(state: AgencyState) -> AgencyState:
+        state.grader_evaluation = GraderEvaluation(score=90, rationale="good")
+        return state
+
+    def run_cd_synthesis_st2(state: AgencyState) -> AgencyState:
+        state.cd_synthesis = CDSynthesis(
+            selected_title=state.campaign_concept.title,
+            recommendation="ship it",
+        )
+        return state
+
+    for fn in (
+        run_strategist_st2,
+        run_creative_a_st2,
+        run_creative_b_st2,
+        run_cd_grader_st2,
+        run_cd_synthesis_st2,
+    ):
+        monkeypatch.setattr(workflow_module, fn.__name__, fn)
+
+
+def _config(thread_id: str) -> dict:
+    return {"configurable": {"thread_id": thread_id}}
+
+
+class _FakeClock:
+    """Manually advanced stand-in for ``time.monotonic``."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _pause_run(graph, thread_id: str) -> None:
+    """Run a stubbed v2 graph up to the territory-selection interrupt."""
+    graph.invoke(AgencyState(client_brief="brief"), config=_config(thread_id))
+
+
+# ---------------------------------------------------------------------------
+# Factory
+# ---------------------------------------------------------------------------
+
+
+def test_build_checkpointer_memory_backend() -> None:
+    saver = build_checkpointer("memory")
+    assert isinstance(saver, BoundedMemorySaver)
+    assert isinstance(saver, MemorySaver)
+
+
+def test_build_checkpointer_sqlite_backend_uses_wal(tmp_path: Path) -> None:
+    saver = build_checkpointer("sqlite", db_path=tmp_path / "cp.sqlite")
+    try:
+        assert isinstance(saver, BatchedSqliteSaver)
+        mode = saver.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode.lower() == "wal"
+    finally:
+        saver.close()
+
+
+def test_build_checkpointer_rejects_unknown_backend() -> None:
+    with pytest.raises(ValueError, match="Invalid checkpointer backend"):
+        build_checkpointer("postgres")
+
+
+# ---------------------------------------------------------------------------
+# Durability across a "restart"
+# ---------------------------------------------------------------------------
+
+
+def test_paused_run_survives_sqlite_reopen(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Pause at the interrupt, close the saver, reopen the file, resume."""
+    _stub_agents(monkeypatch)
+    db_path = tmp_path / "cp.sqlite"
+    cfg = _config("restart-thread")
+
+    first = build_checkpointer("sqlite", db_path=db_path)
+    graph = workflow_module.build_graph_st2(checkpointer=first)
+    graph.invoke(AgencyState(client_brief="brief"), config=cfg)
+    assert graph.get_state(cfg).next == ("interrupt_territory_selection",)
+    first.close()
+
+    # Fresh saver on the same file stands in for a new worker process.
+    second = build_checkpointer("sqlite", db_path=db_path)
+    try:
+        graph = workflow_module.build_graph_st2(checkpointer=second)
+        snap = graph.get_state(cfg)
+        assert snap.next == ("interrupt_territory_selection",)
+        assert len(AgencyState.model_validate(snap.values).territories) == 3
+
+        raw = graph.invoke(
+            Command(resume={"action": "select", "index": 1}), config=cfg
+        )
+        final_state = AgencyState.model_validate(raw)
+        assert final_state.status == WorkflowStatus.APPROVED
+        assert final_state.selected_territory.title == "T1"
+    finally:
+        second.close()
+
+
+def test_interrupt_is_committed_without_explicit_flush(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """A second connection sees the paused run while the first is still open.
+
+    Proves the interrupt write is committed eagerly rather than parked in
+    the open batch waiting for a ``put()`` that never comes.
+    """
+    _stub_agents(monkeypatch)
+    db_path = tmp_path / "cp.sqlite"
+    cfg = _config("eager-thread")
+
+    saver = build_checkpointer("sqlite", db_path=db_path, batch_size=1000)
+    try:
+        graph = workflow_module.build_graph_st2(checkpointer=saver)
+        graph.invoke(AgencyState(client_brief="brief"), config=cfg)
+
+        reader = sqlite3.connect(str(db_path))
+        try:
+            (interrupt_rows,) = reader.execute(
+                "SELECT COUNT(*) FROM writes "
+                "WHERE thread_id = ? AND channel = '__interrupt__'",
+                ("eager-thread",),
+            ).fetchone()
+        finally:
+            reader.close()
+        assert interrupt_rows == 1
+    finally:
+        saver.close()
+
+
+# ---------------------------------------------------------------------------
+# Batching
+# ---------------------------------------------------------------------------
+
+
+def test_writes_are_batched_until_checkpoint_boundary(tmp_path: Path) -> None:
+    """Plain task writes are held; the next ``put()`` commits them together."""
+    saver = build_checkpointer(
+        "sqlite", db_path=tmp_path / "cp.sqlite", batch_size=1000
+    )
+    try:
+        cfg = {
+            "configurable": {
+                "thread_id": "t",
+                "checkpoint_ns": "",
+                "checkpoint_id": "c1",
+            }
+        }
+        saver.put_writes(cfg, [("creative_brief", "a")], task_id="task-1")
+        saver.put_writes(cfg, [("territories", [])], task_id="task-2")
+        assert saver._uncommitted == 2
+        assert saver.conn.in_transaction
+
+        saver.flush()
+        assert saver._uncommitted == 0
+        assert not saver.conn.in_transaction
+    finally:
+        saver.close()
+
+
+
+# ---------------------------------------------------------------------------
+# Bounded memory backend
+# ---------------------------------------------------------------------------
+
+
+def test_idle_threads_are_evicted_after_ttl(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _stub_agents(monkeypatch)
+    clock = _FakeClock()
+    saver = BoundedMemorySaver(ttl_seconds=60, max_bytes=0, clock=clock)
+    graph = workflow_module.build_graph_st2(checkpointer=saver)
+
+    _pause_run(graph, "old")
+    clock.now = 30
+    _pause_run(graph, "recent")
+    assert saver.stats().threads == 2
+
+    # 70s after "old" was last touched, 40s after "recent".
+    clock.now = 70
+    assert not graph.get_state(_config("old")).values
+    assert graph.get_state(_config("recent")).values
+
+    stats = saver.stats()
+    assert stats.threads == 1
+    assert stats.ttl_evictions == 1
+    assert stats.budget_evictions == 0
+    assert "old" not in saver.storage
+
+
+def test_reads_refresh_the_idle_clock(monkeypatch: pytest.MonkeyPatch) -> None:
+    _stub_agents(monkeypatch)
+    clock = _FakeClock()
+    saver = BoundedMemorySaver(ttl_seconds=60, max_bytes=0, clock=clock)
+    graph = workflow_module.build_graph_st2(checkpointer=saver)
+
+    _pause_run(graph, "polled")
+    clock.now = 50
+    graph.get_state(_config("polled"))
+    clock.now = 100
+    assert graph.get_state(_config("polled")).values
+    assert saver.stats().ttl_evictions == 0
+
+
+def test_byte_budget_evicts_least_recently_used(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _stub_agents(monkeypatch)
+    saver = BoundedMemorySaver(ttl_seconds=0, max_bytes=0)
+    graph = workflow_module.build_graph_st2(checkpointer=saver)
+
+    _pause_run(graph, "a")
+    one_thread = saver.stats().bytes
+    assert one_thread > 0
+
+    # Budget fits two paused runs but not three.
+    saver.max_bytes = int(one_thread * 2.5)
+    _pause_run(graph, "b")
+    graph.get_state(_config("a"))  # "a" is now more recent than "b"
+    _pause_run(graph, "c")
+
+    stats = saver.stats()
+    assert stats.budget_evictions == 1
+    assert stats.threads == 2
+    assert stats.bytes <= saver.max_bytes
+    assert not graph.get_state(_config("b")).values
+    assert graph.get_state(_config("a")).values
+    assert graph.get_state(_config("c")).values
+
+
+def test_bounded_saver_resumes_paused_run(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Eviction bookkeeping doesn't disturb the interrupt/resume flow."""
+    _stub_agents(monkeypatch)
+    saver = BoundedMemorySaver()
+    graph = workflow_module.build_graph_st2(checkpointer=saver)
+    cfg = _config("resume")
+
+    _pause_run(graph, "resume")
+    raw = graph.invoke(Command(resume={"action": "select", "index": 0}), config=cfg)
+
+    assert AgencyState.model_validate(raw).status == WorkflowStatus.APPROVED
+    saver.delete_thread("resume")
+    assert saver.stats().threads == 0
+    assert saver.stats().bytes == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,166 @@
+"""
+agt_sea — Circuit Breaker Tests
+
+Unit tests (no real LLM calls) for the per-provider circuit breaker in
+``agt_sea/llm/provider.py``:
+
+1. ``CircuitBreaker`` opens once the failure rate over its window trips,
+   goes half-open after the open period, and lets one trial call decide
+   whether it closes or re-opens. Every transition is recorded, and an
+   outcome from before the last transition never settles the trial.
+2. ``wrap_with_transport_retry`` puts the provider's shared breaker
+   inside the retry, so an open breaker cuts the remaining attempts
+   short and later calls fail fast.
+
+Run with:
+    uv run pytest tests/test_circuit_breaker.py
+"""
+
+from __future__ import annotations
+
+import pytest
+from langchain_core.messages import HumanMessage
+
+from agt_sea.llm import provider
+from agt_sea.llm.fake import FakeChatModel, FakeLLMError
+from agt_sea.llm.provider import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    circuit_breakers,
+    track_llm_usage,
+    wrap_with_transport_retry,
+)
+from agt_sea.models.state import LLMProvider
+
+_MESSAGES = [HumanMessage(content="hello")]
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _breaker(clock: _Clock, **kwargs) -> CircuitBreaker:
+    settings = {"failure_rate": 0.5, "min_calls": 4, "window": 4, "open_seconds": 10}
+    return CircuitBreaker(LLMProvider.FAKE, clock=clock, **(settings | kwargs))
+
+
+# ---------------------------------------------------------------------------
+# State machine
+# ---------------------------------------------------------------------------
+
+
+def test_opens_at_the_failure_rate() -> None:
+    breaker = _breaker(_Clock())
+
+    for success in (True, False, True):
+        breaker.record(breaker.before_call(), success)
+    assert breaker.state == CircuitState.CLOSED  # below min_calls
+
+    breaker.record(breaker.before_call(), False)  # 2 of 4 failed
+    assert breaker.state == CircuitState.OPEN
+    with pytest.raises(CircuitOpenError, match="fake") as raised:
+        breaker.before_call()
+    assert raised.value.retry_after == pytest.approx(10)
+
+
+def test_half_open_trial_closes_or_reopens() -> None:
+    clock = _Clock()
+    breaker = _breaker(clock, min_calls=1)
+    breaker.record(breaker.before_call(), False)
+
+    clock.now += 10
+    assert breaker.state == CircuitState.HALF_OPEN
+    trial = breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()  # refused while the trial is in flight
+    breaker.record(trial, False)
+    assert breaker.state == CircuitState.OPEN
+
+    clock.now += 10
+    breaker.record(breaker.before_call(), True)
+    assert breaker.state == CircuitState.CLOSED
+    breaker.before_call()
+
+    assert [(t.from_state, t.to_state) for t in breaker.transitions] == [
+        (CircuitState.CLOSED, CircuitState.OPEN),
+        (CircuitState.OPEN, CircuitState.HALF_OPEN),
+        (CircuitState.HALF_OPEN, CircuitState.OPEN),
+        (CircuitState.OPEN, CircuitState.HALF_OPEN),
+        (CircuitState.HALF_OPEN, CircuitState.CLOSED),
+    ]
+
+
+def test_abandoned_trial_frees_the_slot() -> None:
+    clock = _Clock()
+    breaker = _breaker(clock, min_calls=1)
+    breaker.record(breaker.before_call(), False)
+    clock.now += 10
+
+    breaker.abandon(breaker.before_call())
+    breaker.before_call()
+    assert breaker.state == CircuitState.HALF_OPEN
+
+
+def test_stale_call_does_not_settle_the_trial() -> None:
+    clock = _Clock()
+    breaker = _breaker(clock, min_calls=2, window=2)
+    stale = breaker.before_call()  # admitted while closed, still running
+    for _ in range(2):
+        breaker.record(breaker.before_call(), False)
+    assert breaker.state == CircuitState.OPEN
+
+    clock.now += 10
+    trial = breaker.before_call()
+    breaker.record(stale, True)  # the old call finishes first
+    assert breaker.state == CircuitState.HALF_OPEN
+
+    breaker.record(trial, False)
+    assert breaker.state == CircuitState.OPEN
+
+
+# ---------------------------------------------------------------------------
+# Transport retry wiring
+# ---------------------------------------------------------------------------
+
+
+def test_open_breaker_cuts_retries_short(monkeypatch: pytest.MonkeyPatch) -> None:
+    breaker = _breaker(_Clock(), min_calls=2, window=2)
+    monkeypatch.setattr(provider, "LLM_CIRCUIT_BREAKER", True)
+    monkeypatch.setattr(provider, "_CIRCUIT_BREAKERS", {LLMProvider.FAKE: breaker})
+
+    wrapped = wrap_with_transport_retry(
+        FakeChatModel(failure_rate=1.0), LLMProvider.FAKE, attempts=5
+    ).model_copy(update={"wait_exponential_jitter": False})
+
+    with track_llm_usage() as usage:
+        with pytest.raises(CircuitOpenError):
+            wrapped.invoke(_MESSAGES)
+    assert usage.requests == 2  # the third attempt never left the process
+
+    with track_llm_usage() as usage:
+        with pytest.raises(CircuitOpenError):
+            wrapped.invoke(_MESSAGES)
+    assert usage.requests == 0
+
+    assert circuit_breakers() == {LLMProvider.FAKE: breaker}
+    assert breaker.snapshot()["state"] == "open"
+
+
+def test_non_transport_errors_do_not_count() -> None:
+    breaker = _breaker(_Clock(), min_calls=1, window=1)
+    runnable = provider.CircuitBreakerRunnable(
+        FakeChatModel(failure_rate=1.0), breaker, (ValueError,)
+    )
+
+    with pytest.raises(FakeLLMError):
+        runnable.invoke(_MESSAGES)
+    assert breaker.state == CircuitState.CLOSED
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,324 @@
+"""
+agt_sea — Concurrent Grader + Feedback Tests
+
+Unit tests (pytest, no real LLM calls) for the Standard 2.0 graph built
+with ``concurrent_feedback=True``:
+
+1. A rejected iteration runs CD Grader and CD Feedback at the same time
+   and carries Feedback's direction into the next Creative B pass.
+2. An approved pass drops Feedback's output (and any error it raised);
+   the last iteration never starts Feedback at all.
+3. On the sync graph a discarded Feedback call finishes in the
+   background without streaming its tokens into later nodes; the async
+   graph cancels it once the grade approves.
+
+Run with:
+    uv run pytest tests/test_concurrent_feedback.py
+
+Agents are stubbed on the workflow module and graphs rebuilt after
+patching — see the patching note in ``test_pipeline_failure.py``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langgraph.types import Command
+
+from agt_sea.graph import workflow_st2
+from agt_sea.graph.checkpointer import BoundedMemorySaver
+from agt_sea.models.state import (
+    AgencyState,
+    AgentOutput,
+    AgentRole,
+    CampaignConcept,
+    CDSynthesis,
+    GraderEvaluation,
+    LLMProvider,
+    Territory,
+    WorkflowStatus,
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+_DELAY = 0.3
+
+
+def _entry(agent: AgentRole, state: AgencyState, content: str) -> AgentOutput:
+    return AgentOutput(
+        agent=agent,
+        provider=LLMProvider.ANTHROPIC,
+        model="stub",
+        iteration=state.iteration,
+        content=content,
+    )
+
+
+def _stub_agents(
+    monkeypatch: pytest.MonkeyPatch,
+    scores: list[float],
+) -> dict[str, list]:
+    """Install sync stubs; the grader returns ``scores`` in order."""
+    calls: dict[str, list] = {"creative_b": [], "feedback": []}
+    remaining = list(scores)
+
+    def run_strategist_st2(state: AgencyState) -> AgencyState:
+        state.creative_brief = "stub brief"
+        return state
+
+    def run_creative_a_st2(state: AgencyState) -> AgencyState:
+        state.territories = [
+            Territory(title="T0", core_idea="idea", why_it_works="why")
+        ]
+        return state
+
+    def run_creative_b_st2(state: AgencyState) -> AgencyState:
+        calls["creative_b"].append(state.cd_feedback_direction)
+        state.iteration += 1
+        state.campaign_concept = CampaignConcept(
+            title=f"Campaign v{state.iteration}",
+            core_idea="idea",
+            why_it_works="why",
+        )
+        return state
+
+    def run_cd_grader_st2(state: AgencyState) -> AgencyState:
+        time.sleep(_DELAY)
+        score = remaining.pop(0)
+        state.grader_evaluation = GraderEvaluation(score=score, rationale="stub")
+        state.history.append(_entry(AgentRole.CD_GRADER_ST2, state, str(score)))
+        return state
+
+    def run_cd_feedback_st2(state: AgencyState) -> AgencyState:
+        calls["feedback"].append(state.grader_evaluation)
+        time.sleep(_DELAY)
+        state.cd_feedback_direction = f"direction {state.iteration}"
+        state.history.append(
+            _entry(AgentRole.CD_FEEDBACK_ST2, state, state.cd_feedback_direction)
+        )
+        return state
+
+    def run_cd_synthesis_st2(state: AgencyState) -> AgencyState:
+        state.cd_synthesis = CDSynthesis(
+            selected_title=state.campaign_concept.title,
+            recommendation="ship it",
+        )
+        return state
+
+    for fn in (
+        run_strategist_st2,
+        run_creative_a_st2,
+        run_creative_b_st2,
+        run_cd_grader_st2,
+        run_cd_feedback_st2,
+        run_cd_synthesis_st2,
+    ):
+        monkeypatch.setattr(workflow_st2, fn.__name__, fn)
+    return calls
+
+
+def _run(graph, thread_id: str, max_iterations: int = 3) -> AgencyState:
+    cfg = {"configurable": {"thread_id": thread_id}}
+    graph.invoke(
+        AgencyState(
+            client_brief="brief", num_territories=1, max_iterations=max_iterations
+        ),
+        config=cfg,
+    )
+    raw = graph.invoke(Command(resume={"action": "select", "index": 0}), config=cfg)
+    return AgencyState.model_validate(raw)
+
+
+def _agents(state: AgencyState) -> list[AgentRole]:
+    return [entry.agent for entry in state.history]
+
+
+# ---------------------------------------------------------------------------
+# Sync graph
+# ---------------------------------------------------------------------------
+
+
+def test_rejection_runs_grader_and_feedback_together(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = _stub_agents(monkeypatch, scores=[40.0, 90.0])
+    graph = workflow_st2.build_graph_st2(
+        checkpointer=BoundedMemorySaver(), concurrent_feedback=True
+    )
+
+    start = time.perf_counter()
+    final_state = _run(graph, "concurrent-reject")
+    elapsed = time.perf_counter() - start
+
+    assert final_state.status == WorkflowStatus.APPROVED
+    # The revision pass read the direction written alongside the grade.
+    assert calls["creative_b"] == [None, "direction 1"]
+    # Feedback starts on both passes and never sees the previous grade.
+    assert calls["feedback"] == [None, None]
+    assert _agents(final_state) == [
+        AgentRole.CD_GRADER_ST2,
+        AgentRole.CD_FEEDBACK_ST2,
+        AgentRole.CD_GRADER_ST2,
+    ]
+    # Serial would be grader + feedback + grader = 3 x _DELAY.
+    assert elapsed < _DELAY * 2.5
+
+
+def test_approval_drops_feedback_and_its_errors(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _stub_agents(monkeypatch, scores=[90.0])
+
+    def run_cd_feedback_st2(state: AgencyState) -> AgencyState:
+        raise RuntimeError("feedback boom")
+
+    monkeypatch.setattr(workflow_st2, "run_cd_feedback_st2", run_cd_feedback_st2)
+    graph = workflow_st2.build_graph_st2(
+        checkpointer=BoundedMemorySaver(), concurrent_feedback=True
+    )
+
+    final_state = _run(graph, "concurrent-approve")
+
+    assert final_state.status == WorkflowStatus.APPROVED
+    assert final_state.error is None
+    assert final_state.cd_feedback_direction is None
+    assert _agents(final_state) == [AgentRole.CD_GRADER_ST2]
+
+
+def test_feedback_failure_on_rejection_fails_the_run(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _stub_agents(monkeypatch, scores=[40.0])
+
+    def run_cd_feedback_st2(state: AgencyState) -> AgencyState:
+        raise RuntimeError("feedback boom")
+
+    monkeypatch.setattr(workflow_st2, "run_cd_feedback_st2", run_cd_feedback_st2)
+    graph = workflow_st2.build_graph_st2(
+        checkpointer=BoundedMemorySaver(), concurrent_feedback=True
+    )
+
+    final_state = _run(graph, "concurrent-fail")
+
+    assert final_state.status == WorkflowStatus.FAILED
+    assert "run_cd_feedback_st2 failed: RuntimeError: feedback boom" in (
+        final_state.error
+    )
+
+
+def test_last_iteration_skips_feedback(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = _stub_agents(monkeypatch, scores=[40.0])
+    graph = workflow_st2.build_graph_st2(
+        checkpointer=BoundedMemorySaver(), concurrent_feedback=True
+    )
+
+    final_state = _run(graph, "concurrent-exhausted", max_iterations=1)
+
+    assert final_state.status == WorkflowStatus.MAX_ITERATIONS_REACHED
+    assert calls["feedback"] == []
+
+
+def test_discarded_feedback_does_not_stream(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _stub_agents(monkeypatch, scores=[90.0])
+    feedback_finished: list[bool] = []
+
+    def run_cd_feedback_st2(state: AgencyState) -> AgencyState:
+        time.sleep(_DELAY)  # outlives the approving grade
+        FakeListChatModel(responses=["discarded direction"]).invoke("coach")
+        feedback_finished.append(True)
+        return state
+
+    def run_cd_synthesis_st2(state: AgencyState) -> AgencyState:
+        time.sleep(_DELAY * 2)  # feedback finishes while this node runs
+        state.cd_synthesis = CDSynthesis(
+            selected_title=state.campaign_concept.title, recommendation="ship it"
+        )
+        return state
+
+    monkeypatch.setattr(workflow_st2, "run_cd_feedback_st2", run_cd_feedback_st2)
+    monkeypatch.setattr(workflow_st2, "run_cd_synthesis_st2", run_cd_synthesis_st2)
+    graph = workflow_st2.build_graph_st2(
+        checkpointer=BoundedMemorySaver(), concurrent_feedback=True
+    )
+    cfg = {"configurable": {"thread_id": "concurrent-detached"}}
+    graph.invoke(AgencyState(client_brief="brief", num_territories=1), config=cfg)
+
+    messages = [
+        chunk.content
+        for chunk, _ in graph.stream(
+            Command(resume={"action": "select", "index": 0}),
+            config=cfg,
+            stream_mode="messages",
+        )
+    ]
+
+    assert feedback_finished == [True]
+    assert "discarded direction" not in "".join(messages)
+
+
+# ---------------------------------------------------------------------------
+# Async graph
+# ---------------------------------------------------------------------------
+
+
+def test_async_approval_cancels_feedback(monkeypatch: pytest.MonkeyPatch) -> None:
+    _stub_agents(monkeypatch, scores=[90.0])
+    feedback_finished: list[bool] = []
+
+    async def arun_cd_feedback_st2(state: AgencyState) -> AgencyState:
+        await asyncio.sleep(5)
+        feedback_finished.append(True)
+        return state
+
+    async def arun_cd_grader_st2(state: AgencyState) -> AgencyState:
+        state.grader_evaluation = GraderEvaluation(score=90, rationale="ok")
+        return state
+
+    monkeypatch.setattr(workflow_st2, "arun_cd_feedback_st2", arun_cd_feedback_st2)
+    monkeypatch.setattr(workflow_st2, "arun_cd_grader_st2", arun_cd_grader_st2)
+    for name in (
+        "run_strategist_st2",
+        "run_creative_a_st2",
+        "run_creative_b_st2",
+        "run_cd_synthesis_st2",
+    ):
+        fn = getattr(workflow_st2, name)
+
+        async def wrapper(state: AgencyState, fn=fn) -> AgencyState:
+            return fn(state)
+
+        monkeypatch.setattr(workflow_st2, f"a{name}", wrapper)
+    graph = workflow_st2.build_graph_st2(
+        checkpointer=BoundedMemorySaver(),
+        asynchronous=True,
+        concurrent_feedback=True,
+    )
+    cfg = {"configurable": {"thread_id": "concurrent-async"}}
+
+    async def run() -> AgencyState:
+        await graph.ainvoke(
+            AgencyState(client_brief="brief", num_territories=1), config=cfg
+        )
+        raw = await graph.ainvoke(
+            Command(resume={"action": "select", "index": 0}), config=cfg
+        )
+        return AgencyState.model_validate(raw)
+
+    start = time.perf_counter()
+    final_state = asyncio.run(run())
+
+    assert final_state.status == WorkflowStatus.APPROVED
+    assert feedback_finished == []
+    assert time.perf_counter() - start < 1.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
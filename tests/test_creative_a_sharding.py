@@ -0,0 +1,243 @@
+"""
+agt_sea — Sharded Creative A Tests
+
+Unit tests (no real LLM calls) for Creative A's sharded territory
+generation in ``agt_sea/agents/creative_a_st2.py``:
+
+1. A territory count splits into near-equal shards, each steered to its
+   own direction.
+2. The merge drops near-duplicates, and a short merge is topped up —
+   again if a top-up only echoes existing territories, with a warning
+   once the top-ups run out.
+3. A validation failure reprompts only the shard it came from.
+4. Sync and async sharded runs on the fake provider return the full,
+   distinct set with the usage of every shard on one history entry.
+
+Run with:
+    uv run pytest tests/test_creative_a_sharding.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import threading
+
+import pytest
+from langchain_core.runnables import RunnableLambda
+
+from agt_sea.agents import creative_a_st2
+from agt_sea.agents.creative_a_st2 import (
+    TerritorySet,
+    _merge_territories,
+    _shard_sizes,
+    arun_creative_a_st2,
+    run_creative_a_st2,
+)
+from agt_sea.llm.provider import clear_llm_cache
+from agt_sea.models.state import AgencyState, LLMProvider, Territory
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_llm_cache()
+    yield
+    clear_llm_cache()
+
+
+def _territory(title: str, core_idea: str = "An idea.") -> Territory:
+    return Territory(title=title, core_idea=core_idea, why_it_works="Because.")
+
+
+def _state(num_territories: int) -> AgencyState:
+    return AgencyState(
+        client_brief="Sell socks.",
+        creative_brief="Socks, but exciting.",
+        llm_provider=LLMProvider.FAKE,
+        num_territories=num_territories,
+    )
+
+
+_NOUNS = (
+    "armour", "laundry", "heroics", "grandmothers", "football", "rain",
+    "moonlight", "commuters", "dancing", "silence", "thunder", "gardens",
+)
+
+
+class _ScriptedLLM:
+    """Stands in for the structured runnable; records every prompt."""
+
+    def __init__(
+        self,
+        fail_direction: str | None = None,
+        fixed_titles: bool = False,
+        echoing_top_ups: int = 0,
+    ):
+        self.prompts: list[str] = []
+        self._fail_direction = fail_direction
+        self._fixed_titles = fixed_titles
+        self._echoing_top_ups = echoing_top_ups
+        self._lock = threading.Lock()
+
+    def __call__(self, messages) -> TerritorySet:
+        prompt = messages[1].content
+        with self._lock:
+            self.prompts.append(prompt)
+            call = len(self.prompts)
+        if self._fail_direction and self._fail_direction in prompt and len(messages) == 2:
+            TerritorySet.model_validate({})  # raises ValidationError
+        count = int(re.search(r"produce (\d+) distinct", prompt).group(1))
+        prefix = f"Call{call}"
+        if self._fixed_titles:
+            if "already exist" not in prompt:
+                prefix = "Same"
+            elif self._echoing_top_ups:
+                # A top-up that repeats a title the shards already wrote.
+                self._echoing_top_ups -= 1
+                prefix = "Same"
+        return TerritorySet(
+            territories=[
+                _territory(f"{prefix} {i}", f"Socks as {_NOUNS[(call * 3 + i) % 12]}.")
+                for i in range(count)
+            ]
+        )
+
+
+def _patch_llm(monkeypatch: pytest.MonkeyPatch, llm: _ScriptedLLM) -> None:
+    monkeypatch.setattr(
+        creative_a_st2,
+        "get_structured_llm",
+        lambda *args, **kwargs: RunnableLambda(llm),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Planning and merging
+# ---------------------------------------------------------------------------
+
+
+def test_shard_sizes() -> None:
+    assert _shard_sizes(12, 3) == [3, 3, 3, 3]
+    assert _shard_sizes(7, 3) == [3, 2, 2]
+    assert _shard_sizes(2, 3) == [2]
+
+
+def test_merge_drops_near_duplicates() -> None:
+    merged = _merge_territories(
+        [
+            [_territory("Toe Rebellion", "Socks that start a revolution at your feet.")],
+            [
+                _territory("toe rebellion!", "Something else entirely."),
+                _territory("Sock Revolution", "Socks that start a revolution at your feet."),
+                _territory("Odd Pairs", "Mismatched on purpose."),
+            ],
+        ]
+    )
+    assert [t.title for t in merged] == ["Toe Rebellion", "Odd Pairs"]
+
+
+# ---------------------------------------------------------------------------
+# Shard calls
+# ---------------------------------------------------------------------------
+
+
+def test_each_shard_gets_its_own_direction(monkeypatch: pytest.MonkeyPatch) -> None:
+    llm = _ScriptedLLM()
+    _patch_llm(monkeypatch, llm)
+
+    result = run_creative_a_st2(_state(12), shard_size=3)
+
+    assert len(result.territories) == 12
+    assert len(llm.prompts) == 4
+    directions = [
+        re.search(r"from this direction: (.+?)\. The others", p).group(1)
+        for p in llm.prompts
+    ]
+    assert len(set(directions)) == 4
+
+
+def test_validation_failure_retries_only_its_shard(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    failing = creative_a_st2._SHARD_DIRECTIONS[1]
+    llm = _ScriptedLLM(fail_direction=f"direction: {failing}")
+    _patch_llm(monkeypatch, llm)
+
+    result = run_creative_a_st2(_state(9), shard_size=3)
+
+    assert len(result.territories) == 9
+    assert len(llm.prompts) == 4  # three shards plus one reprompt
+    assert sum(f"direction: {failing}" in p for p in llm.prompts) == 2
+    assert result.history[-1].validation_reprompts == 1
+
+
+def test_short_merge_is_topped_up(monkeypatch: pytest.MonkeyPatch) -> None:
+    llm = _ScriptedLLM(fixed_titles=True)
+    _patch_llm(monkeypatch, llm)
+
+    result = run_creative_a_st2(_state(6), shard_size=3)
+
+    # Both shards return "Same 0..2"; the top-up replaces the duplicates.
+    assert len(result.territories) == 6
+    assert "already exist: Same 0; Same 1; Same 2" in llm.prompts[-1]
+    assert len({t.title for t in result.territories}) == 6
+
+
+def test_duplicate_top_up_is_retried(monkeypatch: pytest.MonkeyPatch) -> None:
+    llm = _ScriptedLLM(fixed_titles=True, echoing_top_ups=1)
+    _patch_llm(monkeypatch, llm)
+
+    result = run_creative_a_st2(_state(6), shard_size=3)
+
+    # Two shards, a top-up that echoes "Same 0..2", then a second top-up.
+    assert len(llm.prompts) == 4
+    assert len({t.title for t in result.territories}) == 6
+
+
+def test_short_set_after_top_ups_is_logged(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    llm = _ScriptedLLM(fixed_titles=True, echoing_top_ups=creative_a_st2._MAX_TOP_UPS)
+    _patch_llm(monkeypatch, llm)
+
+    with caplog.at_level(logging.WARNING, logger=creative_a_st2.__name__):
+        result = run_creative_a_st2(_state(6), shard_size=3)
+
+    assert len(llm.prompts) == 2 + creative_a_st2._MAX_TOP_UPS
+    assert len(result.territories) == 3
+    assert "returned 3 of 6 territories" in caplog.text
+
+
+def test_small_requests_are_not_sharded(monkeypatch: pytest.MonkeyPatch) -> None:
+    llm = _ScriptedLLM()
+    _patch_llm(monkeypatch, llm)
+
+    run_creative_a_st2(_state(3), shard_size=3)
+
+    assert len(llm.prompts) == 1
+    assert "in parallel" not in llm.prompts[0]
+
+
+# ---------------------------------------------------------------------------
+# Fake provider end to end
+# ---------------------------------------------------------------------------
+
+
+def test_sharded_run_on_the_fake() -> None:
+    result = run_creative_a_st2(_state(12), shard_size=3)
+
+    assert len(result.territories) == 12
+    assert len({t.title.lower() for t in result.territories}) == 12
+    assert result.history[-1].llm_calls >= 4
+
+
+def test_async_sharded_run_on_the_fake() -> None:
+    result = asyncio.run(arun_creative_a_st2(_state(8), shard_size=3))
+
+    assert len(result.territories) == 8
+    assert result.history[-1].llm_calls >= 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
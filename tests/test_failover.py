@@ -0,0 +1,250 @@
+"""
+agt_sea — Failover and Hedging Tests
+
+Unit tests (no real LLM calls — runs use ``LLMProvider.FAKE``) for
+provider failover and hedged requests in ``agt_sea/llm/provider.py``:
+
+1. ``LLM_FAILOVER`` parses into (provider, model) targets validated
+   against ``AVAILABLE_MODELS``.
+2. A call whose primary keeps failing is served by the next target, and
+   the agent's ``AgentOutput`` records the target that answered.
+3. ``HedgedRunnable`` waits for the recent p95 latency, then races a
+   second request and takes whichever answers first; only the winner's
+   requests, errors and usage are counted, even when the loser finishes
+   or fails later in the block.
+
+Run with:
+    uv run pytest tests/test_failover.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+from langchain_core.messages import HumanMessage
+
+from agt_sea.agents.cd_grader_st2 import run_cd_grader_st2
+from agt_sea.config import parse_failover
+from agt_sea.llm import provider
+from agt_sea.llm.fake import FakeChatModel, FakeLLMError
+from agt_sea.llm.provider import (
+    HedgedRunnable,
+    clear_llm_cache,
+    get_llm,
+    get_structured_llm,
+    track_llm_usage,
+)
+from agt_sea.models.state import (
+    AgencyState,
+    CampaignConcept,
+    GraderEvaluation,
+    LLMProvider,
+)
+
+_MESSAGES = [HumanMessage(content="hello")]
+
+
+@pytest.fixture
+def failover(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Primary ``fake-down`` always fails; ``fake-backup`` answers."""
+    build = provider._build_chat_model
+
+    def build_with_outage(provider_, model_name, temperature):
+        model = build(provider_, model_name, temperature)
+        if model_name == "fake-down":
+            model.failure_rate = 1.0
+        return model
+
+    monkeypatch.setattr(provider, "_build_chat_model", build_with_outage)
+    monkeypatch.setattr(provider, "LLM_FAILOVER", [(LLMProvider.FAKE, "fake-backup")])
+    monkeypatch.setattr(provider, "LLM_FAILOVER_AFTER", 1)
+    clear_llm_cache()
+    yield
+    clear_llm_cache()
+
+
+def _hedged(
+    primary_latency: float,
+    hedge_latency: float,
+    primary_failure_rate: float = 0.0,
+    hedge_failure_rate: float = 0.0,
+) -> HedgedRunnable:
+    hedged = HedgedRunnable(
+        FakeChatModel(
+            model_name="fake-slow",
+            latency_seconds=(primary_latency, primary_latency),
+            failure_rate=primary_failure_rate,
+            metadata={"agt_sea_provider": "fake", "agt_sea_model": "fake-slow"},
+        ),
+        FakeChatModel(
+            model_name="fake-fast",
+            latency_seconds=(hedge_latency, hedge_latency),
+            failure_rate=hedge_failure_rate,
+            metadata={"agt_sea_provider": "fake", "agt_sea_model": "fake-fast"},
+        ),
+        min_samples=3,
+    )
+    for _ in range(3):
+        hedged._record(0.05)
+    return hedged
+
+
+# ---------------------------------------------------------------------------
+# Config
+# ---------------------------------------------------------------------------
+
+
+def test_parse_failover() -> None:
+    assert parse_failover("") == []
+    assert parse_failover("openai:gpt-5.4-mini, Google") == [
+        (LLMProvider.OPENAI, "gpt-5.4-mini"),
+        (LLMProvider.GOOGLE, None),
+    ]
+    with pytest.raises(ValueError, match="LLM_FAILOVER"):
+        parse_failover("mistral")
+    with pytest.raises(ValueError, match="gpt-5.4-nano"):
+        parse_failover("openai:gpt-2")
+
+
+# ---------------------------------------------------------------------------
+# Failover
+# ---------------------------------------------------------------------------
+
+
+def test_failover_serves_from_the_next_target(failover: None) -> None:
+    llm = get_llm(provider=LLMProvider.FAKE, model="fake-down")
+    with track_llm_usage() as usage:
+        assert llm.invoke(_MESSAGES).content
+    assert usage.served == (LLMProvider.FAKE, "fake-backup")
+    assert usage.requests == 2
+
+    structured = get_structured_llm(
+        GraderEvaluation, provider=LLMProvider.FAKE, model="fake-down"
+    )
+    assert isinstance(structured.invoke(_MESSAGES), GraderEvaluation)
+
+
+def test_failover_is_skipped_for_the_primary_itself(failover: None) -> None:
+    llm = get_llm(provider=LLMProvider.FAKE, model="fake-backup")
+    with track_llm_usage() as usage:
+        llm.invoke(_MESSAGES)
+    assert usage.requests == 1
+
+
+def test_agent_output_records_the_serving_model(failover: None) -> None:
+    state = AgencyState(
+        client_brief="Sell socks.",
+        llm_provider=LLMProvider.FAKE,
+        llm_model="fake-down",
+        campaign_concept=CampaignConcept(
+            title="Sock It", core_idea="Socks.", why_it_works="Feet."
+        ),
+    )
+
+    entry = run_cd_grader_st2(state).history[-1]
+
+    assert (entry.provider, entry.model) == (LLMProvider.FAKE, "fake-backup")
+    assert entry.transport_retries == 1
+
+
+def test_without_failover_the_error_propagates(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(provider, "LLM_MAX_RETRIES", 1)
+    llm = provider.wrap_with_transport_retry(
+        FakeChatModel(failure_rate=1.0), LLMProvider.FAKE
+    )
+    with pytest.raises(FakeLLMError):
+        llm.invoke(_MESSAGES)
+
+
+# ---------------------------------------------------------------------------
+# Hedging
+# ---------------------------------------------------------------------------
+
+
+def test_no_hedge_until_warmed_up() -> None:
+    hedged = HedgedRunnable(FakeChatModel(), FakeChatModel(), min_samples=2)
+    assert hedged.hedge_delay() is None
+    hedged.invoke(_MESSAGES)
+    hedged.invoke(_MESSAGES)
+    assert hedged.hedge_delay() is not None
+    assert hedged.hedges_sent == 0
+
+
+def test_slow_primary_is_hedged() -> None:
+    hedged = _hedged(primary_latency=1.0, hedge_latency=0.0)
+
+    start = time.perf_counter()
+    with track_llm_usage() as usage:
+        assert hedged.invoke(_MESSAGES).content
+    assert time.perf_counter() - start < 0.5
+    assert (hedged.hedges_sent, hedged.hedges_won) == (1, 1)
+    assert usage.served == (LLMProvider.FAKE, "fake-fast")
+
+
+def test_slow_primary_is_hedged_async() -> None:
+    hedged = _hedged(primary_latency=1.0, hedge_latency=0.0)
+
+    async def call() -> tuple[float, provider.LLMUsageTracker]:
+        start = time.perf_counter()
+        with track_llm_usage() as usage:
+            await hedged.ainvoke(_MESSAGES)
+        return time.perf_counter() - start, usage
+
+    elapsed, usage = asyncio.run(call())
+    assert elapsed < 0.5
+    assert hedged.hedges_won == 1
+    assert usage.served == (LLMProvider.FAKE, "fake-fast")
+    assert usage.errors == 0  # the cancelled primary is not a failure
+
+
+def test_fast_primary_beats_its_hedge() -> None:
+    hedged = _hedged(primary_latency=0.1, hedge_latency=0.5)
+    with track_llm_usage() as usage:
+        hedged.invoke(_MESSAGES)
+    assert (hedged.hedges_sent, hedged.hedges_won) == (1, 0)
+    assert usage.served == (LLMProvider.FAKE, "fake-slow")
+
+
+def test_sync_loser_finishing_inside_the_block_is_not_counted() -> None:
+    hedged = _hedged(primary_latency=0.3, hedge_latency=0.0)
+
+    with track_llm_usage() as usage:
+        hedged.invoke(_MESSAGES)
+        winner_tokens = usage.output_tokens
+        time.sleep(0.5)  # e.g. a reprompt, or other shards still running
+
+    assert usage.served == (LLMProvider.FAKE, "fake-fast")
+    assert usage.requests == 1
+    assert usage.output_tokens == winner_tokens > 0
+
+
+def test_sync_loser_failing_inside_the_block_is_not_counted() -> None:
+    hedged = _hedged(primary_latency=0.3, hedge_latency=0.0, primary_failure_rate=1.0)
+
+    with track_llm_usage() as usage:
+        hedged.invoke(_MESSAGES)
+        time.sleep(0.5)  # the abandoned primary fails in here
+
+    assert hedged.hedges_won == 1
+    assert (usage.requests, usage.errors) == (1, 0)
+
+
+def test_both_failed_attempts_are_counted() -> None:
+    hedged = _hedged(
+        primary_latency=0.3,
+        hedge_latency=0.0,
+        primary_failure_rate=1.0,
+        hedge_failure_rate=1.0,
+    )
+
+    with track_llm_usage() as usage:
+        with pytest.raises(FakeLLMError):
+            hedged.invoke(_MESSAGES)
+
+    assert (usage.requests, usage.errors) == (2, 2)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
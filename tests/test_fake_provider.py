@@ -0,0 +1,186 @@
+"""
+agt_sea — Fake Provider Tests
+
+Unit tests (no real LLM calls) for ``LLMProvider.FAKE`` and the
+``FakeChatModel`` in ``agt_sea/llm/fake.py``:
+
+1. ``get_llm`` / ``get_structured_llm`` build the fake for the FAKE
+   provider, and its structured output is schema-valid for every agent
+   schema.
+2. Responses are deterministic per seed and prompt; scores follow the
+   configured range.
+3. Injected failures are retried by the transport retry layer.
+4. Both graphs run end to end on the fake provider.
+
+Run with:
+    uv run pytest tests/test_fake_provider.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from langchain_core.messages import HumanMessage, SystemMessage
+from langgraph.types import Command
+
+from agt_sea.agents.creative_a_st2 import TerritorySet
+from agt_sea.graph.checkpointer import BoundedMemorySaver
+from agt_sea.graph.workflow_st1 import build_graph_st1
+from agt_sea.graph.workflow_st2 import build_graph_st2
+from agt_sea.llm.fake import FakeChatModel, FakeLLMError
+from agt_sea.llm.provider import (
+    clear_llm_cache,
+    get_llm,
+    get_structured_llm,
+    wrap_with_transport_retry,
+)
+from agt_sea.models.state import (
+    AgencyState,
+    CampaignConcept,
+    CDEvaluation,
+    CDSynthesis,
+    GraderEvaluation,
+    LLMProvider,
+    WorkflowStatus,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_llm_cache()
+    yield
+    clear_llm_cache()
+
+
+def _messages(text: str) -> list:
+    return [SystemMessage(content="system"), HumanMessage(content=text)]
+
+
+# ---------------------------------------------------------------------------
+# Provider wiring and structured output
+# ---------------------------------------------------------------------------
+
+
+def test_get_llm_builds_the_fake() -> None:
+    llm = get_llm(provider=LLMProvider.FAKE, with_retry=False)
+    assert isinstance(llm, FakeChatModel)
+    assert llm.model_name == "fake-model"
+
+    response = get_llm(provider=LLMProvider.FAKE).invoke(_messages("hello"))
+    assert response.content
+    assert response.usage_metadata["input_tokens"] > 0
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [TerritorySet, CampaignConcept, GraderEvaluation, CDSynthesis, CDEvaluation],
+)
+def test_structured_output_is_schema_valid(schema) -> None:
+    structured = get_structured_llm(schema, provider=LLMProvider.FAKE)
+    result = structured.invoke(_messages("any prompt"))
+    assert isinstance(result, schema)
+
+
+def test_structured_output_reads_the_prompt() -> None:
+    territories = get_structured_llm(TerritorySet, provider=LLMProvider.FAKE).invoke(
+        _messages("Please generate 5 distinct\ncreative territories.")
+    )
+    assert len(territories.territories) == 5
+    assert len({t.title for t in territories.territories}) == 5
+
+    synthesis = get_structured_llm(CDSynthesis, provider=LLMProvider.FAKE).invoke(
+        _messages("Concept 1:\n\nTitle: Sock It\n\nConcept 2:\n\nTitle: Toe Up")
+    )
+    assert synthesis.selected_title == "Sock It"
+    assert [s.title for s in synthesis.score_summary] == ["Sock It", "Toe Up"]
+    assert synthesis.comparison_notes is None
+
+
+def test_responses_are_deterministic_and_scores_in_range() -> None:
+    model = FakeChatModel(score_range=(40.0, 50.0), seed=7)
+    grader = model.with_structured_output(GraderEvaluation)
+    first = grader.invoke(_messages("concept A"))
+    assert grader.invoke(_messages("concept A")) == first
+    assert 40.0 <= first.score <= 50.0
+
+    other_seed = FakeChatModel(score_range=(40.0, 50.0), seed=8)
+    assert other_seed.with_structured_output(GraderEvaluation).invoke(
+        _messages("concept A")
+    ) != first
+
+
+# ---------------------------------------------------------------------------
+# Failure injection
+# ---------------------------------------------------------------------------
+
+
+def test_injected_failures_raise_and_are_retried() -> None:
+    always = FakeChatModel(failure_rate=1.0)
+    with pytest.raises(FakeLLMError):
+        always.invoke(_messages("hello"))
+
+    # Each retry is a fresh failure draw, so a flaky fake eventually answers.
+    flaky = FakeChatModel(failure_rate=0.5, seed=3)
+    retrying = flaky.with_retry(
+        retry_if_exception_type=(FakeLLMError,),
+        stop_after_attempt=20,
+        wait_exponential_jitter=False,
+    )
+    assert retrying.invoke(_messages("hello")).content
+
+
+def test_fake_failures_are_on_the_retry_allowlist() -> None:
+    wrapped = wrap_with_transport_retry(FakeChatModel(), LLMProvider.FAKE)
+    assert wrapped.retry_exception_types == (FakeLLMError,)
+
+
+# ---------------------------------------------------------------------------
+# End to end
+# ---------------------------------------------------------------------------
+
+
+def test_v1_graph_runs_on_the_fake() -> None:
+    final = AgencyState.model_validate(
+        build_graph_st1().invoke(
+            AgencyState(client_brief="Sell socks.", llm_provider=LLMProvider.FAKE)
+        )
+    )
+    assert final.status in (
+        WorkflowStatus.APPROVED,
+        WorkflowStatus.MAX_ITERATIONS_REACHED,
+    )
+    assert final.cd_evaluation is not None
+    assert all(entry.provider == LLMProvider.FAKE for entry in final.history)
+
+
+def test_v2_async_graph_runs_on_the_fake() -> None:
+    graph = build_graph_st2(checkpointer=BoundedMemorySaver(), asynchronous=True)
+    cfg = {"configurable": {"thread_id": "fake-v2"}}
+
+    async def run() -> dict:
+        await graph.ainvoke(
+            AgencyState(
+                client_brief="Sell socks.",
+                llm_provider=LLMProvider.FAKE,
+                num_territories=4,
+            ),
+            config=cfg,
+        )
+        return await graph.ainvoke(
+            Command(resume={"action": "select", "index": 2}), config=cfg
+        )
+
+    final = AgencyState.model_validate(asyncio.run(run()))
+
+    assert len(final.territories) == 4
+    assert final.status in (
+        WorkflowStatus.APPROVED,
+        WorkflowStatus.MAX_ITERATIONS_REACHED,
+    )
+    assert final.cd_synthesis.selected_title == final.campaign_concept.title
+    assert final.history[-1].llm_calls == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -1,7 +1,8 @@
 """
 agt_sea — LLM Provider Unit Tests
 
-Unit tests for the transport-level retry wrapper in llm/provider.py.
+Unit tests for the transport-level retry wrapper and the chat-model
+cache in llm/provider.py.
 
 Run with:
     uv run pytest tests/test_llm_provider.py
@@ -15,6 +16,8 @@ from __future__ import annotations
 
 from typing import Any
 
+import threading
+
 import httpx
 import pytest
 from anthropic import APIConnectionError
@@ -24,7 +27,13 @@ from langchain_core.messages import AIMessage, HumanMessage
 from langchain_core.outputs import ChatGeneration, ChatResult
 from pydantic import BaseModel
 
-from agt_sea.llm.provider import wrap_with_transport_retry
+from agt_sea.llm import provider as provider_module
+from agt_sea.llm.provider import (
+    clear_llm_cache,
+    get_llm,
+    get_structured_llm,
+    wrap_with_transport_retry,
+)
 from agt_sea.models.state import LLMProvider
 
 
@@ -159,6 +168,139 @@ def test_wrap_with_transport_retry_composes_with_structured_output() -> None:
     assert call_count["n"] == 2
 
 
+# ---------------------------------------------------------------------------
+# Chat model cache
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def _empty_llm_cache(monkeypatch: pytest.MonkeyPatch):
+    """Start and end each cache test with an empty cache and a dummy key."""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    clear_llm_cache()
+    yield
+    clear_llm_cache()
+
+
+def test_get_llm_reuses_instance_per_key(_empty_llm_cache: None) -> None:
+    first = get_llm(LLMProvider.ANTHROPIC, "claude-sonnet-4-6", 0.7, with_retry=False)
+    again = get_llm(LLMProvider.ANTHROPIC, "claude-sonnet-4-6", 0.7, with_retry=False)
+    other_temp = get_llm(
+        LLMProvider.ANTHROPIC, "claude-sonnet-4-6", 0.2, with_retry=False
+    )
+
+    assert first is again
+    assert first is not other_temp
+
+
+def test_retry_wrapped_llm_shares_the_cached_client(_empty_llm_cache: None) -> None:
+    raw = get_llm(LLMProvider.ANTHROPIC, "claude-sonnet-4-6", 0.7, with_retry=False)
+    wrapped = get_llm(LLMProvider.ANTHROPIC, "claude-sonnet-4-6", 0.7)
+
+    assert wrapped is get_llm(LLMProvider.ANTHROPIC, "claude-sonnet-4-6", 0.7)
+    assert wrapped is not raw
+    assert wrapped.bound is raw
+
+
+def test_clear_llm_cache_by_provider(_empty_llm_cache: None) -> None:
+    anthropic = get_llm(LLMProvider.ANTHROPIC, "claude-sonnet-4-6", with_retry=False)
+    openai = get_llm(LLMProvider.OPENAI, "gpt-5.4-mini", with_retry=False)
+
+    assert clear_llm_cache(LLMProvider.ANTHROPIC) == 1
+
+    assert get_llm(LLMProvider.OPENAI, "gpt-5.4-mini", with_retry=False) is openai
+    assert (
+        get_llm(LLMProvider.ANTHROPIC, "claude-sonnet-4-6", with_retry=False)
+        is not anthropic
+    )
+
+
+def test_llm_cache_is_bounded(
+    _empty_llm_cache: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(provider_module, "LLM_CLIENT_CACHE_SIZE", 2)
+
+    oldest = get_llm(LLMProvider.ANTHROPIC, "m", 0.1, with_retry=False)
+    get_llm(LLMProvider.ANTHROPIC, "m", 0.2, with_retry=False)
+    get_llm(LLMProvider.ANTHROPIC, "m", 0.3, with_retry=False)
+
+    assert len(provider_module._LLM_CACHE) == 2
+    assert get_llm(LLMProvider.ANTHROPIC, "m", 0.1, with_retry=False) is not oldest
+
+
+def test_evicted_client_is_reused_from_its_wrapper(
+    _empty_llm_cache: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(provider_module, "LLM_CLIENT_CACHE_SIZE", 2)
+
+    wrapped = get_llm(LLMProvider.ANTHROPIC, "m", 0.1)
+    # Evicts the raw 0.1 entry; the wrapper (and its client) survive.
+    get_llm(LLMProvider.ANTHROPIC, "m", 0.2, with_retry=False)
+
+    raw_key = (LLMProvider.ANTHROPIC, "m", 0.1, None, None)
+    assert raw_key not in provider_module._LLM_CACHE
+    assert get_llm(LLMProvider.ANTHROPIC, "m", 0.1, with_retry=False) is wrapped.bound
+
+
+def test_concurrent_get_llm_builds_one_client(_empty_llm_cache: None) -> None:
+    results: list[Any] = []
+    barrier = threading.Barrier(8)
+
+    def worker() -> None:
+        barrier.wait()
+        results.append(get_llm(LLMProvider.ANTHROPIC, "claude-sonnet-4-6", 0.5))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(results) == 8
+    assert all(r is results[0] for r in results)
+
+
+class _Verdict(BaseModel):
+    score: int
+
+
+class _Label(BaseModel):
+    label: str
+
+
+def test_structured_llm_binds_schema_once_per_key(
+    _empty_llm_cache: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Repeat calls reuse the composed runnable — no second schema binding."""
+    bindings: list[type] = []
+    original = ChatAnthropic.with_structured_output
+
+    def counting_with_structured_output(self, schema, **kwargs):
+        bindings.append(schema)
+        return original(self, schema, **kwargs)
+
+    monkeypatch.setattr(
+        ChatAnthropic, "with_structured_output", counting_with_structured_output
+    )
+
+    first = get_structured_llm(_Verdict, LLMProvider.ANTHROPIC, "claude-sonnet-4-6", 0.3)
+    again = get_structured_llm(_Verdict, LLMProvider.ANTHROPIC, "claude-sonnet-4-6", 0.3)
+    other = get_structured_llm(_Label, LLMProvider.ANTHROPIC, "claude-sonnet-4-6", 0.3)
+
+    assert first is again
+    assert first is not other
+    assert bindings == [_Verdict, _Label]
+
+
+def test_clear_llm_cache_drops_structured_runnables(_empty_llm_cache: None) -> None:
+    first = get_structured_llm(_Verdict, LLMProvider.ANTHROPIC, "claude-sonnet-4-6")
+    clear_llm_cache(LLMProvider.ANTHROPIC)
+    assert get_structured_llm(
+        _Verdict, LLMProvider.ANTHROPIC, "claude-sonnet-4-6"
+    ) is not first
+
+
 if __name__ == "__main__":
     # Allow running directly like the other scripts in this folder, even
     # though pytest is the preferred entry point.
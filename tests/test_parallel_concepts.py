@@ -0,0 +1,350 @@
+"""
+agt_sea — Parallel Concept Fan-Out Tests
+
+Unit tests (pytest, no real LLM calls) for the Standard 2.0 graph built
+with ``parallel_concepts=True``:
+
+1. Several territories selected at the interrupt are each developed and
+   graded in their own ``Send`` branch, concurrently, and merged back
+   before CD Synthesis.
+2. Each branch keeps the serial graph's feedback loop, and a failing
+   branch fails the run cleanly.
+3. The ``concept_candidates`` reducer and the multi-concept synthesis
+   prompt.
+
+Run with:
+    uv run pytest tests/test_parallel_concepts.py
+
+Agents are stubbed on the workflow module and graphs rebuilt after
+patching — see the patching note in ``test_pipeline_failure.py``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+from langchain_core.runnables import RunnableLambda
+from langgraph.types import Command
+
+from agt_sea.agents import cd_synthesis_st2
+from agt_sea.graph import workflow_st2
+from agt_sea.graph.checkpointer import BoundedMemorySaver
+from agt_sea.llm.provider import LLMUsageTracker
+from agt_sea.models.state import (
+    AgencyState,
+    AgentOutput,
+    AgentRole,
+    CampaignConcept,
+    CDSynthesis,
+    ConceptCandidate,
+    GraderEvaluation,
+    LLMProvider,
+    Territory,
+    WorkflowStatus,
+    _merge_concept_candidates,
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+# Grader score per territory title; anything missing scores 90.
+_SCORES = {"T0": 85.0, "T1": 50.0, "T2": 92.0}
+
+
+def _entry(agent: AgentRole, state: AgencyState, content: str) -> AgentOutput:
+    return AgentOutput(
+        agent=agent,
+        provider=LLMProvider.ANTHROPIC,
+        model="stub",
+        iteration=state.iteration,
+        content=content,
+    )
+
+
+def _stub_agents(
+    monkeypatch: pytest.MonkeyPatch, delay: float = 0.0
+) -> dict[str, list]:
+    """Install sync stubs on the workflow module; return call records."""
+    calls: dict[str, list] = {"creative_b": [], "feedback": [], "synthesis": []}
+
+    def run_strategist_st2(state: AgencyState) -> AgencyState:
+        state.creative_brief = "stub brief"
+        return state
+
+    def run_creative_a_st2(state: AgencyState) -> AgencyState:
+        state.territories = [
+            Territory(title=f"T{i}", core_idea="idea", why_it_works="why")
+            for i in range(state.num_territories)
+        ]
+        return state
+
+    def run_creative_b_st2(state: AgencyState) -> AgencyState:
+        time.sleep(delay)
+        calls["creative_b"].append(
+            (state.selected_territory.title, threading.get_ident())
+        )
+        state.iteration += 1
+        state.campaign_concept = CampaignConcept(
+            title=f"Campaign {state.selected_territory.title}",
+            core_idea="idea",
+            why_it_works="why",
+        )
+        state.history.append(
+            _entry(AgentRole.CREATIVE_B_ST2, state, state.campaign_concept.title)
+        )
+        return state
+
+    def run_cd_grader_st2(state: AgencyState) -> AgencyState:
+        score = _SCORES.get(state.selected_territory.title, 90.0)
+        state.grader_evaluation = GraderEvaluation(score=score, rationale="stub")
+        state.history.append(_entry(AgentRole.CD_GRADER_ST2, state, str(score)))
+        return state
+
+    def run_cd_feedback_st2(state: AgencyState) -> AgencyState:
+        calls["feedback"].append(state.selected_territory.title)
+        state.cd_feedback_direction = "push it"
+        return state
+
+    def run_cd_synthesis_st2(state: AgencyState) -> AgencyState:
+        calls["synthesis"].append(
+            [c.campaign_concept.title for c in state.concept_candidates]
+        )
+        state.cd_synthesis = CDSynthesis(
+            selected_title=state.campaign_concept.title,
+            recommendation="ship it",
+        )
+        return state
+
+    for fn in (
+        run_strategist_st2,
+        run_creative_a_st2,
+        run_creative_b_st2,
+        run_cd_grader_st2,
+        run_cd_feedback_st2,
+        run_cd_synthesis_st2,
+    ):
+        monkeypatch.setattr(workflow_st2, fn.__name__, fn)
+    return calls
+
+
+def _config(thread_id: str) -> dict:
+    return {"configurable": {"thread_id": thread_id}}
+
+
+def _run_parallel(graph, indices: list[int], thread_id: str) -> AgencyState:
+    cfg = _config(thread_id)
+    initial = AgencyState(client_brief="brief", num_territories=4, max_iterations=2)
+    graph.invoke(initial, config=cfg)
+    assert graph.get_state(cfg).next == ("interrupt_territory_selection",)
+    raw = graph.invoke(
+        Command(resume={"action": "select", "indices": indices}), config=cfg
+    )
+    return AgencyState.model_validate(raw)
+
+
+# ---------------------------------------------------------------------------
+# Fan-out / fan-in
+# ---------------------------------------------------------------------------
+
+
+def test_selected_territories_are_developed_and_compared(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = _stub_agents(monkeypatch)
+    graph = workflow_st2.build_graph_st2(
+        checkpointer=BoundedMemorySaver(), parallel_concepts=True
+    )
+
+    final_state = _run_parallel(graph, [0, 2], "fan-out")
+
+    assert final_state.status == WorkflowStatus.APPROVED
+    assert [c.territory_index for c in final_state.concept_candidates] == [0, 2]
+    assert calls["synthesis"] == [["Campaign T0", "Campaign T2"]]
+    # Top-scoring branch is promoted onto the serial-graph fields.
+    assert final_state.campaign_concept.title == "Campaign T2"
+    assert final_state.grader_evaluation.score == 92.0
+    # Both branches' history entries land on the main history, once —
+    # the candidates do not carry a second copy.
+    titles = [
+        e.content
+        for e in final_state.history
+        if e.agent == AgentRole.CREATIVE_B_ST2
+    ]
+    assert sorted(titles) == ["Campaign T0", "Campaign T2"]
+    assert all(
+        "history" not in c.model_dump() for c in final_state.concept_candidates
+    )
+
+
+def test_branches_run_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Three 0.3s Creative B passes should take ~0.3s, not ~0.9s."""
+    calls = _stub_agents(monkeypatch, delay=0.3)
+    graph = workflow_st2.build_graph_st2(
+        checkpointer=BoundedMemorySaver(), parallel_concepts=True
+    )
+
+    start = time.perf_counter()
+    final_state = _run_parallel(graph, [0, 2, 3], "concurrent")
+    elapsed = time.perf_counter() - start
+
+    assert len(final_state.concept_candidates) == 3
+    assert len({thread for _, thread in calls["creative_b"]}) == 3
+    assert elapsed < 0.75
+
+
+def test_each_branch_keeps_its_own_feedback_loop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = _stub_agents(monkeypatch)
+    graph = workflow_st2.build_graph_st2(
+        checkpointer=BoundedMemorySaver(), parallel_concepts=True
+    )
+
+    final_state = _run_parallel(graph, [0, 1], "feedback-loop")
+
+    # T1 scores below threshold and spends its budget; T0 approves at once.
+    assert calls["feedback"] == ["T1"]
+    by_index = {c.territory_index: c for c in final_state.concept_candidates}
+    assert by_index[0].iterations == 1
+    assert by_index[1].iterations == 2
+    assert final_state.iteration == 2
+    assert final_state.status == WorkflowStatus.APPROVED
+
+
+def test_failing_branch_fails_the_run(monkeypatch: pytest.MonkeyPatch) -> None:
+    _stub_agents(monkeypatch)
+
+    def run_cd_grader_st2(state: AgencyState) -> AgencyState:
+        if state.selected_territory.title == "T1":
+            raise RuntimeError("grader boom")
+        state.grader_evaluation = GraderEvaluation(score=90, rationale="ok")
+        return state
+
+    monkeypatch.setattr(workflow_st2, "run_cd_grader_st2", run_cd_grader_st2)
+    graph = workflow_st2.build_graph_st2(
+        checkpointer=BoundedMemorySaver(), parallel_concepts=True
+    )
+
+    final_state = _run_parallel(graph, [0, 1], "branch-failure")
+
+    assert final_state.status == WorkflowStatus.FAILED
+    assert "run_cd_grader_st2 failed: RuntimeError: grader boom" in final_state.error
+
+
+def test_async_parallel_graph(monkeypatch: pytest.MonkeyPatch) -> None:
+    _stub_agents(monkeypatch)
+
+    def _as_async(fn):
+        async def wrapper(state: AgencyState) -> AgencyState:
+            await asyncio.sleep(0.2)
+            return fn(state)
+
+        wrapper.__name__ = f"a{fn.__name__}"
+        return wrapper
+
+    for name in (
+        "run_strategist_st2",
+        "run_creative_a_st2",
+        "run_creative_b_st2",
+        "run_cd_grader_st2",
+        "run_cd_feedback_st2",
+        "run_cd_synthesis_st2",
+    ):
+        monkeypatch.setattr(
+            workflow_st2, f"a{name}", _as_async(getattr(workflow_st2, name))
+        )
+    graph = workflow_st2.build_graph_st2(
+        checkpointer=BoundedMemorySaver(),
+        asynchronous=True,
+        parallel_concepts=True,
+    )
+    cfg = _config("async-parallel")
+
+    async def run() -> tuple[AgencyState, float]:
+        await graph.ainvoke(
+            AgencyState(client_brief="brief", num_territories=4), config=cfg
+        )
+        start = time.perf_counter()
+        raw = await graph.ainvoke(
+            Command(resume={"action": "select", "indices": [0, 2, 3]}),
+            config=cfg,
+        )
+        return AgencyState.model_validate(raw), time.perf_counter() - start
+
+    final_state, elapsed = asyncio.run(run())
+
+    assert len(final_state.concept_candidates) == 3
+    assert final_state.status == WorkflowStatus.APPROVED
+    # Serial would be 3 x (B + grader) + synthesis = 1.4s.
+    assert elapsed < 1.0
+
+
+# ---------------------------------------------------------------------------
+# Reducer + synthesis prompt
+# ---------------------------------------------------------------------------
+
+
+def _candidate(index: int, title: str = "c") -> ConceptCandidate:
+    return ConceptCandidate(
+        territory_index=index,
+        territory=Territory(title=f"T{index}", core_idea="i", why_it_works="w"),
+        campaign_concept=CampaignConcept(
+            title=title, core_idea="idea", why_it_works="why"
+        ),
+        grader_evaluation=GraderEvaluation(score=70, rationale="r"),
+    )
+
+
+def test_candidate_reducer_is_idempotent_and_ordered() -> None:
+    merged = _merge_concept_candidates([_candidate(2)], [_candidate(0)])
+    assert [c.territory_index for c in merged] == [0, 2]
+    # A full-state write carrying the same list back changes nothing.
+    assert _merge_concept_candidates(merged, merged) == merged
+
+
+def test_synthesis_prompt_lists_every_concept(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        cd_synthesis_st2,
+        "get_structured_llm",
+        lambda *a, **k: RunnableLambda(lambda messages: None),
+    )
+    state = AgencyState(
+        creative_brief="Sell socks.",
+        llm_provider=LLMProvider.OPENAI,
+        llm_model="stub",
+        campaign_concept=_candidate(0, "Sock It").campaign_concept,
+        concept_candidates=[_candidate(0, "Sock It"), _candidate(1, "Toe Jam")],
+    )
+
+    _, messages, _, _ = cd_synthesis_st2._build_call(state)
+    human = messages[1].content
+
+    assert "(2 concepts total)" in human
+    assert "Title: Sock It" in human and "Title: Toe Jam" in human
+    assert "compare them in `comparison_notes`" in human
+
+
+def test_synthesis_follows_the_recommended_concept() -> None:
+    state = AgencyState(
+        campaign_concept=_candidate(0, "Sock It").campaign_concept,
+        concept_candidates=[_candidate(0, "Sock It"), _candidate(1, "Toe Jam")],
+    )
+    synthesis = CDSynthesis(selected_title="Toe Jam", recommendation="go")
+
+    state = cd_synthesis_st2._apply_result(
+        state, synthesis, LLMProvider.OPENAI, "stub", LLMUsageTracker()
+    )
+
+    assert state.campaign_concept.title == "Toe Jam"
+    assert state.selected_territory.title == "T1"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,182 @@
+"""
+agt_sea — Partial Node Update Tests
+
+Unit tests (no real LLM calls — runs use ``LLMProvider.FAKE``) for the
+partial-update contract of the graph nodes in
+``agt_sea/graph/workflow_st1.py`` and ``agt_sea/graph/workflow_st2.py``:
+
+1. ``state_update`` keeps only the fields a node changed, and only the
+   history entries it appended.
+2. Stream update events carry just those fields; the append-reduced
+   ``history`` still ends up complete and in order.
+3. The checkpointer stores a new blob only for channels that changed —
+   the brief and the run config are written once per run, not per step.
+
+Run with:
+    uv run pytest tests/test_partial_updates.py
+"""
+
+from __future__ import annotations
+
+import pytest
+from langgraph.types import Command
+
+from agt_sea.graph import workflow_st1
+from agt_sea.graph.checkpointer import BoundedMemorySaver
+from agt_sea.graph.workflow_st1 import build_graph_st1, snapshot_state, state_update
+from agt_sea.graph.workflow_st2 import build_graph_st2
+from agt_sea.llm.provider import clear_llm_cache
+from agt_sea.models.state import (
+    AgencyState,
+    AgentOutput,
+    AgentRole,
+    LLMProvider,
+    WorkflowStatus,
+)
+
+# Inputs no node writes after the run starts.
+_INPUT_FIELDS = {"client_brief", "run_config"}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_llm_cache()
+    yield
+    clear_llm_cache()
+
+
+def _entry(agent: AgentRole) -> AgentOutput:
+    return AgentOutput(
+        agent=agent,
+        provider=LLMProvider.FAKE,
+        model="fake",
+        iteration=0,
+        content="x",
+    )
+
+
+# ---------------------------------------------------------------------------
+# state_update
+# ---------------------------------------------------------------------------
+
+
+def test_state_update_keeps_only_changes() -> None:
+    state = AgencyState(
+        client_brief="Sell socks.", history=[_entry(AgentRole.STRATEGIST_ST1)]
+    )
+    snapshot = snapshot_state(state)
+
+    state.creative_brief = "Socks, but exciting."
+    state.iteration = 0  # assigned, but unchanged
+    state.history.append(_entry(AgentRole.CREATIVE_ST1))
+
+    update = state_update(snapshot, state)
+    assert set(update) == {"creative_brief", "history"}
+    assert [e.agent for e in update["history"]] == [AgentRole.CREATIVE_ST1]
+    assert state_update(snapshot, {"status": WorkflowStatus.FAILED}) == {
+        "status": WorkflowStatus.FAILED
+    }
+
+
+# ---------------------------------------------------------------------------
+# Standard 1.0
+# ---------------------------------------------------------------------------
+
+
+def test_v1_stream_updates_are_partial() -> None:
+    graph = build_graph_st1()
+    updates: list[tuple[str, dict]] = []
+    final: dict = {}
+
+    for mode, payload in graph.stream(
+        AgencyState(client_brief="Sell socks.", llm_provider=LLMProvider.FAKE),
+        stream_mode=["updates", "values"],
+    ):
+        if mode == "values":
+            final = payload
+        else:
+            # Nodes that write nothing (check_iterations) stream None.
+            updates.extend(
+                (node, update or {}) for node, update in payload.items()
+            )
+
+    written = [e for _, update in updates for e in update.get("history", [])]
+    assert all(not _INPUT_FIELDS & set(update) for _, update in updates)
+    assert all(len(update.get("history", [])) <= 1 for _, update in updates)
+    assert AgencyState.model_validate(final).history == written
+
+    node, update = updates[-1]
+    assert node in ("finalise_approved", "finalise_max_iterations")
+    assert set(update) <= {"status", "creative_concept"}
+
+
+def test_v1_failed_node_writes_only_the_error(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def run_strategist_st1(state: AgencyState) -> AgencyState:
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(workflow_st1, "run_strategist_st1", run_strategist_st1)
+    graph = build_graph_st1()
+
+    updates = dict(
+        (node, update)
+        for event in graph.stream(AgencyState(client_brief="Sell socks."))
+        for node, update in event.items()
+    )
+
+    assert updates["strategist_st1"] == {
+        "error": "run_strategist_st1 failed: RuntimeError: boom"
+    }
+    assert updates["finalise_failed"] == {"status": WorkflowStatus.FAILED}
+
+
+# ---------------------------------------------------------------------------
+# Standard 2.0
+# ---------------------------------------------------------------------------
+
+
+def test_v2_checkpoints_rewrite_only_changed_channels() -> None:
+    saver = BoundedMemorySaver()
+    graph = build_graph_st2(checkpointer=saver, speculative_concepts=0)
+    cfg = {"configurable": {"thread_id": "partial-updates"}}
+
+    updates = list(
+        graph.stream(
+            AgencyState(
+                client_brief="Sell socks.",
+                llm_provider=LLMProvider.FAKE,
+                num_territories=3,
+            ),
+            config=cfg,
+        )
+    )
+    updates += graph.stream(
+        Command(resume={"action": "select", "index": 1}), config=cfg
+    )
+
+    for event in updates:
+        for node, update in event.items():
+            if node != "__interrupt__":
+                assert not _INPUT_FIELDS & set(update or {}), node
+
+    versions: dict[str, int] = {}
+    for _, _, channel, _ in saver.blobs:
+        versions[channel] = versions.get(channel, 0) + 1
+    assert versions["client_brief"] == 1
+    assert versions["run_config"] == 1
+
+    final = AgencyState.model_validate(graph.get_state(cfg).values)
+    assert final.status in (
+        WorkflowStatus.APPROVED,
+        WorkflowStatus.MAX_ITERATIONS_REACHED,
+    )
+    # The input write, then one blob per node that appended an entry.
+    assert versions["history"] == 1 + len(final.history)
+    assert [e.timestamp for e in final.history] == sorted(
+        e.timestamp for e in final.history
+    )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -42,7 +42,7 @@ from datetime import datetime
 from langgraph.types import Command
 
 from agt_sea.graph.workflow_st2 import agency_graph_st2
-from agt_sea.models.state import AgencyState, WorkflowStatus
+from agt_sea.models.state import AgencyState, WorkflowStatus, render_payload
 
 from _helpers import load_brief, print_entry_fields
 
@@ -124,7 +124,7 @@ def main() -> AgencyState:
         print_entry_fields(entry, indent="  ")
         print("-" * 60)
         # Trim for terminal readability
-        snippet = entry.content
+        snippet = render_payload(entry)
         if len(snippet) > 500:
             snippet = snippet[:500] + "..."
         print(snippet)
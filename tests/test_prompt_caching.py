@@ -0,0 +1,172 @@
+"""
+agt_sea — Provider Prompt Caching Tests
+
+Unit tests (no real LLM calls) for the prompt-caching helpers in
+``llm/provider.py``:
+
+1. ``apply_prompt_caching`` — opt-in, Anthropic-only ``cache_control``
+   breakpoints on the system prompt and on the brief.
+2. ``track_llm_usage`` — cache read / write tokens reported by the chat
+   model are collected and land on the agent's ``AgentOutput``.
+
+Run with:
+    uv run pytest tests/test_prompt_caching.py
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from agt_sea.agents import cd_feedback_st2
+from agt_sea.llm import provider as provider_module
+from agt_sea.llm.provider import apply_prompt_caching, track_llm_usage
+from agt_sea.models.state import (
+    AgencyState,
+    CampaignConcept,
+    LLMProvider,
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+class _UsageReportingChatModel(BaseChatModel):
+    """Chat model that records its prompts and reports cache usage."""
+
+    cache_read: int = 0
+    cache_creation: int = 0
+    prompts: list[Any] = []
+
+    @property
+    def _llm_type(self) -> str:
+        return "usage-reporting"
+
+    def _generate(
+        self,
+        messages: list[Any],
+        stop: list[str] | None = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        self.prompts.append(messages)
+        message = AIMessage(
+            content="push the idea further",
+            usage_metadata={
+                "input_tokens": 1200,
+                "output_tokens": 40,
+                "total_tokens": 1240,
+                "input_token_details": {
+                    "cache_read": self.cache_read,
+                    "cache_creation": self.cache_creation,
+                },
+            },
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+def _messages() -> list:
+    return [
+        SystemMessage(content="You are a creative director."),
+        HumanMessage(
+            content="Here is the creative brief:\n\nSell socks.\n\nCritique this."
+        ),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# apply_prompt_caching
+# ---------------------------------------------------------------------------
+
+
+def test_prompt_caching_is_off_by_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(provider_module, "LLM_PROMPT_CACHING", False)
+    messages = _messages()
+    cached = apply_prompt_caching(messages, LLMProvider.ANTHROPIC, brief="Sell socks.")
+    assert cached is messages
+
+
+def test_prompt_caching_marks_system_prompt_and_brief(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(provider_module, "LLM_PROMPT_CACHING", True)
+
+    system, human = apply_prompt_caching(
+        _messages(), LLMProvider.ANTHROPIC, brief="Sell socks."
+    )
+
+    assert system.content == [
+        {
+            "type": "text",
+            "text": "You are a creative director.",
+            "cache_control": {"type": "ephemeral"},
+        }
+    ]
+    brief_block, rest_block = human.content
+    assert brief_block["text"] == "Here is the creative brief:\n\nSell socks."
+    assert brief_block["cache_control"] == {"type": "ephemeral"}
+    assert rest_block == {"type": "text", "text": "\n\nCritique this."}
+    assert "cache_control" not in rest_block
+
+
+def test_prompt_caching_skips_providers_without_markers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(provider_module, "LLM_PROMPT_CACHING", True)
+    messages = _messages()
+    cached = apply_prompt_caching(messages, LLMProvider.OPENAI, brief="Sell socks.")
+    assert cached is messages
+
+
+# ---------------------------------------------------------------------------
+# Usage tracking
+# ---------------------------------------------------------------------------
+
+
+def test_track_llm_usage_sums_across_calls() -> None:
+    model = _UsageReportingChatModel(cache_read=1000, cache_creation=0, prompts=[])
+
+    with track_llm_usage() as usage:
+        model.invoke("first")
+        model.invoke("second")
+
+    assert usage.requests == 2
+    assert usage.input_tokens == 2400
+    assert usage.cache_read_tokens == 2000
+    assert usage.cache_creation_tokens == 0
+
+
+def test_agent_records_cache_tokens_on_history(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(provider_module, "LLM_PROMPT_CACHING", True)
+    model = _UsageReportingChatModel(cache_read=900, cache_creation=300, prompts=[])
+    monkeypatch.setattr(cd_feedback_st2, "get_llm", lambda **_: model)
+
+    state = AgencyState(
+        client_brief="brief",
+        creative_brief="Sell socks.",
+        llm_provider=LLMProvider.ANTHROPIC,
+        llm_model="claude-sonnet-4-6",
+        campaign_concept=CampaignConcept(
+            title="Sock It", core_idea="idea", why_it_works="why"
+        ),
+    )
+    state = cd_feedback_st2.run_cd_feedback_st2(state)
+
+    entry = state.history[-1]
+    assert entry.cache_read_tokens == 900
+    assert entry.cache_creation_tokens == 300
+    # The prompt that reached the model carried the breakpoints.
+    sent_system = model.prompts[0][0]
+    assert sent_system.content[0]["cache_control"] == {"type": "ephemeral"}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
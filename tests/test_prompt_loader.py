@@ -0,0 +1,129 @@
+"""
+agt_sea — Prompt Loader Cache Tests
+
+Unit tests for the in-memory prompt cache in ``prompts/loader.py``:
+repeat loads skip the disk, edited files hot-reload once the mtime check
+interval has passed (bumping the prompt generation), and
+``warm_prompt_cache`` preloads every category.
+
+Run with:
+    uv run pytest tests/test_prompt_loader.py
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from agt_sea.prompts import loader
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def prompts_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the loader at a throwaway prompts tree with an empty cache."""
+    (tmp_path / "taste").mkdir()
+    (tmp_path / "taste" / "loud.txt").write_text("  be loud  \n")
+    monkeypatch.setattr(loader, "_PROMPTS_DIR", tmp_path)
+    loader.clear_prompt_cache()
+    yield tmp_path
+    loader.clear_prompt_cache()
+
+
+def _count_reads(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    reads: list[Path] = []
+    original = Path.read_text
+
+    def counting_read_text(self: Path, *args, **kwargs) -> str:
+        reads.append(self)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+    return reads
+
+
+def _rewrite(path: Path, text: str) -> None:
+    """Rewrite a file and push its mtime forward so the change is visible."""
+    stat = path.stat()
+    path.write_text(text)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+def test_repeat_loads_are_served_from_memory(
+    prompts_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(loader, "PROMPT_CACHE_CHECK_SECONDS", 60.0)
+    reads = _count_reads(monkeypatch)
+
+    assert loader.load_prompt("taste", "loud") == "be loud"
+    assert loader.load_prompt("taste", "loud") == "be loud"
+    assert len(reads) == 1
+
+
+def test_unchanged_file_is_not_reread_after_mtime_check(
+    prompts_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(loader, "PROMPT_CACHE_CHECK_SECONDS", 0.0)
+    reads = _count_reads(monkeypatch)
+
+    loader.load_prompt("taste", "loud")
+    loader.load_prompt("taste", "loud")
+    assert len(reads) == 1
+
+
+def test_edited_file_hot_reloads(
+    prompts_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(loader, "PROMPT_CACHE_CHECK_SECONDS", 0.0)
+    assert loader.load_prompt("taste", "loud") == "be loud"
+
+    _rewrite(prompts_dir / "taste" / "loud.txt", "be louder")
+
+    assert loader.load_prompt("taste", "loud") == "be louder"
+
+
+def test_check_prompt_files_bumps_the_generation_on_edit(
+    prompts_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(loader, "PROMPT_CACHE_CHECK_SECONDS", 60.0)
+    loader.load_prompt("taste", "loud")
+    generation = loader.check_prompt_files()
+    assert loader.check_prompt_files() == generation  # nothing changed
+
+    _rewrite(prompts_dir / "taste" / "loud.txt", "be louder")
+
+    assert loader.check_prompt_files() > generation
+    assert loader.load_prompt("taste", "loud") == "be louder"
+
+
+def test_missing_prompt_still_raises(prompts_dir: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        loader.load_prompt("taste", "absent")
+
+
+def test_warm_prompt_cache_loads_every_shipped_prompt() -> None:
+    loader.clear_prompt_cache()
+    try:
+        count = loader.warm_prompt_cache()
+        shipped = list(Path(loader.__file__).parent.rglob("*.txt"))
+        assert count == len(shipped) > 0
+        assert any(
+            category == "philosophies/creative" for category, _ in loader._PROMPT_CACHE
+        )
+    finally:
+        loader.clear_prompt_cache()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
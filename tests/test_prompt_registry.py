@@ -0,0 +1,104 @@
+"""
+agt_sea — Prompt Assembly Registry Tests
+
+Unit tests for ``prompts/registry.py``: each (builder, lenses)
+combination renders once, content hashes are stable and distinct per
+combination, and entries re-render only when the prompt loader's
+generation moves, so prompt edits still show up.
+
+Run with:
+    uv run pytest tests/test_prompt_registry.py
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+import pytest
+
+from agt_sea.agents import creative_a_st2, creative_b_st2
+from agt_sea.models.state import CreativePhilosophy, Provenance, Taste
+from agt_sea.prompts import loader
+from agt_sea.prompts.registry import assemble_prompt, clear_prompt_registry
+
+
+@pytest.fixture(autouse=True)
+def _empty_registry():
+    clear_prompt_registry()
+    yield
+    clear_prompt_registry()
+
+
+def test_each_combination_renders_once() -> None:
+    calls: list[str] = []
+
+    def build(lens: str) -> str:
+        calls.append(lens)
+        return f"prompt for {lens}"
+
+    first = assemble_prompt(build, "a")
+    again = assemble_prompt(build, "a")
+    other = assemble_prompt(build, "b")
+
+    assert first is again
+    assert other.text == "prompt for b"
+    assert calls == ["a", "b"]
+
+
+def test_content_hash_is_sha256_of_text() -> None:
+    prompt = assemble_prompt(lambda: "static prompt")
+    assert prompt.content_hash == hashlib.sha256(b"static prompt").hexdigest()
+
+
+def test_entries_re_render_on_a_new_generation() -> None:
+    source = {"text": "v1"}
+    calls: list[str] = []
+
+    def build() -> str:
+        calls.append(source["text"])
+        return source["text"]
+
+    first = assemble_prompt(build)
+    source["text"] = "v2"
+    assert assemble_prompt(build) is first  # no clock: served until invalidated
+    assert calls == ["v1"]
+
+    loader.clear_prompt_cache()  # bumps the loader generation
+    updated = assemble_prompt(build)
+    assert updated.text == "v2"
+    assert updated.content_hash != first.content_hash
+
+    loader.clear_prompt_cache()
+    assert assemble_prompt(build) is updated  # unchanged text keeps its object
+
+
+def test_agent_lens_combinations_hash_distinctly() -> None:
+    neutral = assemble_prompt(
+        creative_a_st2._build_system_prompt,
+        philosophy=CreativePhilosophy.NEUTRAL,
+        provenance=Provenance.NEUTRAL,
+        taste=Taste.NEUTRAL,
+        num_territories=3,
+    )
+    flavoured = assemble_prompt(
+        creative_a_st2._build_system_prompt,
+        philosophy=CreativePhilosophy.BOLD_AND_DISRUPTIVE,
+        provenance=Provenance.NEUTRAL,
+        taste=Taste.AVANT_GARDE,
+        num_territories=3,
+    )
+    revision = assemble_prompt(
+        creative_b_st2._build_revision_prompt,
+        philosophy=CreativePhilosophy.NEUTRAL,
+        provenance=Provenance.NEUTRAL,
+        taste=Taste.NEUTRAL,
+    )
+
+    hashes = {neutral.content_hash, flavoured.content_hash, revision.content_hash}
+    assert len(hashes) == 3
+    assert "Your creative taste:" in flavoured.text
+    assert "Your creative taste:" not in neutral.text
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
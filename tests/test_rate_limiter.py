@@ -0,0 +1,156 @@
+"""
+agt_sea — Rate Limiter Tests
+
+Unit tests (no real LLM calls) for the client-side token-bucket rate
+limiting in ``agt_sea/llm/provider.py``:
+
+1. ``LLM_RATE_LIMITS`` parses into per-(provider, model) RPM / TPM pairs.
+2. The request bucket refills continuously and queues callers when
+   empty; the token bucket blocks while in debt after a large response.
+3. ``get_llm`` attaches one shared limiter per (provider, model) and
+   debits each response's token usage from it.
+
+Run with:
+    uv run pytest tests/test_rate_limiter.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from agt_sea.config import parse_rate_limits
+from agt_sea.llm import provider
+from agt_sea.llm.provider import (
+    TokenBucketRateLimiter,
+    clear_llm_cache,
+    get_llm,
+    get_rate_limiter,
+)
+from agt_sea.models.state import LLMProvider
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def limits(monkeypatch: pytest.MonkeyPatch) -> dict:
+    """Patch LLM_RATE_LIMITS and start from no limiters / cached models."""
+    configured: dict = {}
+    monkeypatch.setattr(provider, "LLM_RATE_LIMITS", configured)
+    monkeypatch.setattr(provider, "_RATE_LIMITERS", {})
+    clear_llm_cache()
+    yield configured
+    clear_llm_cache()
+
+
+# ---------------------------------------------------------------------------
+# Config
+# ---------------------------------------------------------------------------
+
+
+def test_parse_rate_limits() -> None:
+    assert parse_rate_limits("") == {}
+    assert parse_rate_limits(
+        "anthropic=50/30000, openai:gpt-5.4=500, google=/1000"
+    ) == {
+        (LLMProvider.ANTHROPIC, None): (50.0, 30000.0),
+        (LLMProvider.OPENAI, "gpt-5.4"): (500.0, 0.0),
+        (LLMProvider.GOOGLE, None): (0.0, 1000.0),
+    }
+    with pytest.raises(ValueError, match="LLM_RATE_LIMITS"):
+        parse_rate_limits("mistral=10")
+    with pytest.raises(ValueError, match="LLM_RATE_LIMITS"):
+        parse_rate_limits("anthropic")
+
+
+# ---------------------------------------------------------------------------
+# Buckets
+# ---------------------------------------------------------------------------
+
+
+def test_request_bucket_refills_continuously() -> None:
+    clock = _Clock()
+    limiter = TokenBucketRateLimiter(requests_per_minute=60, clock=clock)
+
+    assert all(limiter.acquire(blocking=False) for _ in range(60))
+    assert not limiter.acquire(blocking=False)
+
+    clock.now += 0.5
+    assert not limiter.acquire(blocking=False)
+    clock.now += 0.5
+    assert limiter.acquire(blocking=False)
+    assert not limiter.acquire(blocking=False)
+
+
+def test_token_bucket_blocks_while_in_debt() -> None:
+    clock = _Clock()
+    limiter = TokenBucketRateLimiter(tokens_per_minute=600, clock=clock)
+
+    assert limiter.acquire(blocking=False)
+    limiter.record_tokens(900)  # 300 tokens over the allowance
+    assert not limiter.acquire(blocking=False)
+
+    clock.now += 29  # refills 290 of the 300
+    assert not limiter.acquire(blocking=False)
+    clock.now += 1
+    assert limiter.acquire(blocking=False)
+
+
+def test_concurrent_callers_queue() -> None:
+    limiter = TokenBucketRateLimiter(requests_per_minute=600)  # 10 per second
+    while limiter.acquire(blocking=False):
+        pass
+
+    async def burst() -> float:
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.aacquire() for _ in range(3)))
+        return time.monotonic() - start
+
+    assert asyncio.run(burst()) >= 0.25
+    assert limiter.waited_seconds > 0
+
+
+# ---------------------------------------------------------------------------
+# Wiring
+# ---------------------------------------------------------------------------
+
+
+def test_limiters_are_shared_per_provider_and_model(limits: dict) -> None:
+    limits[(LLMProvider.FAKE, None)] = (100.0, 0.0)
+    limits[(LLMProvider.FAKE, "fake-large")] = (10.0, 5000.0)
+
+    small = get_rate_limiter(LLMProvider.FAKE, "fake-model")
+    assert small is get_rate_limiter(LLMProvider.FAKE, "fake-model")
+    assert small.requests_per_minute == 100.0
+    assert small is not get_rate_limiter(LLMProvider.FAKE, "fake-other")
+    assert get_rate_limiter(LLMProvider.FAKE, "fake-large").tokens_per_minute == 5000.0
+    assert get_rate_limiter(LLMProvider.OPENAI, "gpt-5.4") is None
+
+
+def test_get_llm_acquires_and_debits_tokens(limits: dict) -> None:
+    limits[(LLMProvider.FAKE, None)] = (100.0, 10_000.0)
+
+    # Two temperatures -> two cached chat models, one shared limiter.
+    warm = get_llm(provider=LLMProvider.FAKE, temperature=0.7)
+    cold = get_llm(provider=LLMProvider.FAKE, temperature=0.0)
+    limiter = get_rate_limiter(LLMProvider.FAKE, "fake-model")
+    assert get_llm(provider=LLMProvider.FAKE, with_retry=False).rate_limiter is limiter
+
+    response = warm.invoke("hello")
+    cold.invoke("hello")
+
+    used = response.usage_metadata["total_tokens"]
+    assert limiter._requests == pytest.approx(98, abs=0.1)
+    assert limiter._tokens == pytest.approx(10_000 - 2 * used, abs=5)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,273 @@
+"""
+agt_sea — LLM Response Cache Tests
+
+Unit tests (no real LLM calls) for ``llm/response_cache.py`` and its
+wiring in ``llm/provider.py``:
+
+1. ``SqliteResponseCache`` — repeat calls are served from disk, keys
+   separate temperature and structured-output schema, and the file is
+   trimmed least-recently-used first.
+2. ``get_llm()`` wiring — only zero-temperature chat models get the cache
+   unless ``LLM_RESPONSE_CACHE_ALL_TEMPERATURES`` is set.
+3. A CD Grader run served from the cache on its second evaluation.
+
+Run with:
+    uv run pytest tests/test_response_cache.py
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from pydantic import BaseModel
+
+from agt_sea.agents import cd_grader_st2
+from agt_sea.llm import provider as provider_module
+from agt_sea.llm.provider import clear_llm_cache
+from agt_sea.llm.response_cache import SqliteResponseCache
+from agt_sea.models.state import (
+    AgencyState,
+    CampaignConcept,
+    GraderEvaluation,
+    LLMProvider,
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+class _ToolCallingChatModel(BaseChatModel):
+    """Chat model that answers every call with a tool call and counts calls.
+
+    Plain-text calls get ``reply`` back; calls with a bound tool get a tool
+    call carrying ``tool_args``, which is what ``with_structured_output``
+    parses into the schema.
+    """
+
+    temperature: float = 0.0
+    reply: str = "a fresh reply"
+    tool_args: dict[str, Any] = {}
+    calls: list[Any] = []
+
+    @property
+    def _llm_type(self) -> str:
+        return "tool-calling-fake"
+
+    @property
+    def _identifying_params(self) -> dict[str, Any]:
+        return {"temperature": self.temperature}
+
+    def bind_tools(self, tools: list[Any], **kwargs: Any) -> Any:
+        return self.bind(tools=[convert_to_openai_tool(t) for t in tools], **kwargs)
+
+    def _generate(
+        self,
+        messages: list[Any],
+        stop: list[str] | None = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        self.calls.append(messages)
+        tools = kwargs.get("tools")
+        if not tools:
+            message = AIMessage(content=self.reply)
+        else:
+            message = AIMessage(
+                content="",
+                tool_calls=[
+                    {
+                        "name": tools[0]["function"]["name"],
+                        "args": self.tool_args,
+                        "id": f"call-{len(self.calls)}",
+                    }
+                ],
+            )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+class _Verdict(BaseModel):
+    verdict: str
+
+
+class _OtherVerdict(BaseModel):
+    verdict: str
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> SqliteResponseCache:
+    response_cache = SqliteResponseCache(tmp_path / "responses.sqlite")
+    yield response_cache
+    response_cache.close()
+
+
+# ---------------------------------------------------------------------------
+# SqliteResponseCache
+# ---------------------------------------------------------------------------
+
+
+def test_repeat_call_is_served_from_disk(
+    cache: SqliteResponseCache, tmp_path: Path
+) -> None:
+    model = _ToolCallingChatModel(cache=cache, calls=[])
+
+    first = model.invoke("same prompt")
+    second = model.invoke("same prompt")
+    model.invoke("different prompt")
+
+    assert second.content == first.content == "a fresh reply"
+    assert len(model.calls) == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    # A second process opening the same file sees the stored response.
+    reopened = SqliteResponseCache(tmp_path / "responses.sqlite")
+    fresh_model = _ToolCallingChatModel(cache=reopened, calls=[])
+    assert fresh_model.invoke("same prompt").content == "a fresh reply"
+    assert fresh_model.calls == []
+    reopened.close()
+
+
+def test_key_separates_temperature_and_schema(cache: SqliteResponseCache) -> None:
+    cold = _ToolCallingChatModel(
+        cache=cache, temperature=0.0, tool_args={"verdict": "ok"}, calls=[]
+    )
+    warm = _ToolCallingChatModel(
+        cache=cache, temperature=0.5, tool_args={"verdict": "ok"}, calls=[]
+    )
+
+    cold.invoke("prompt")
+    warm.invoke("prompt")
+    assert len(cold.calls) == len(warm.calls) == 1
+
+    cold.with_structured_output(_Verdict).invoke("prompt")
+    cold.with_structured_output(_OtherVerdict).invoke("prompt")
+    parsed = cold.with_structured_output(_Verdict).invoke("prompt")
+
+    assert parsed == _Verdict(verdict="ok")
+    # Plain call + one per schema; the repeated _Verdict call was a hit.
+    assert len(cold.calls) == 3
+
+
+def test_cache_evicts_least_recently_used_beyond_max_bytes(tmp_path: Path) -> None:
+    ticks = iter(range(1, 100))
+    cache = SqliteResponseCache(
+        tmp_path / "small.sqlite", clock=lambda: float(next(ticks))
+    )
+    model = _ToolCallingChatModel(cache=cache, calls=[])
+    model.invoke("a")
+    entry_size = cache.total_bytes()
+    cache.max_bytes = 2 * entry_size
+
+    model.invoke("b")
+    model.invoke("a")  # touch "a" so "b" is the oldest
+    model.invoke("c")
+
+    assert cache.evictions == 1
+    assert cache.total_bytes() <= cache.max_bytes
+    calls_before = len(model.calls)
+    model.invoke("a")
+    model.invoke("c")
+    assert len(model.calls) == calls_before
+    model.invoke("b")
+    assert len(model.calls) == calls_before + 1
+    cache.close()
+
+
+# ---------------------------------------------------------------------------
+# Provider wiring
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def enabled_cache(
+    cache: SqliteResponseCache, monkeypatch: pytest.MonkeyPatch
+) -> SqliteResponseCache:
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+    monkeypatch.setattr(provider_module, "LLM_RESPONSE_CACHE", True)
+    monkeypatch.setattr(provider_module, "_RESPONSE_CACHE", cache)
+    clear_llm_cache()
+    yield cache
+    clear_llm_cache()
+
+
+def test_response_cache_is_off_by_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(provider_module, "LLM_RESPONSE_CACHE", False)
+    assert provider_module.get_response_cache() is None
+
+
+def test_only_zero_temperature_models_are_cached(
+    enabled_cache: SqliteResponseCache,
+) -> None:
+    deterministic = provider_module.get_llm(
+        LLMProvider.ANTHROPIC, "claude-test", 0.0, with_retry=False
+    )
+    sampled = provider_module.get_llm(
+        LLMProvider.ANTHROPIC, "claude-test", 0.7, with_retry=False
+    )
+    provider_default = provider_module.get_llm(
+        LLMProvider.ANTHROPIC, "claude-test", None, with_retry=False
+    )
+
+    assert deterministic.cache is enabled_cache
+    assert sampled.cache is None
+    assert provider_default.cache is None
+
+
+def test_all_temperatures_flag_caches_sampled_models(
+    enabled_cache: SqliteResponseCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(provider_module, "LLM_RESPONSE_CACHE_ALL_TEMPERATURES", True)
+    sampled = provider_module.get_llm(
+        LLMProvider.ANTHROPIC, "claude-test", 0.7, with_retry=False
+    )
+    assert sampled.cache is enabled_cache
+
+
+# ---------------------------------------------------------------------------
+# Agent integration
+# ---------------------------------------------------------------------------
+
+
+def test_grader_re_evaluation_is_served_from_cache(
+    cache: SqliteResponseCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    model = _ToolCallingChatModel(
+        cache=cache,
+        tool_args={"score": 72.0, "rationale": "solid, not yet surprising"},
+        calls=[],
+    )
+    monkeypatch.setattr(
+        cd_grader_st2,
+        "get_structured_llm",
+        lambda schema, **_: model.with_structured_output(schema),
+    )
+
+    def grade() -> AgencyState:
+        state = AgencyState(
+            client_brief="brief",
+            creative_brief="Sell socks.",
+            campaign_concept=CampaignConcept(
+                title="Sock It", core_idea="idea", why_it_works="why"
+            ),
+        )
+        return cd_grader_st2.run_cd_grader_st2(state)
+
+    first = grade()
+    second = grade()
+
+    assert len(model.calls) == 1
+    assert second.grader_evaluation == first.grader_evaluation
+    assert second.grader_evaluation == GraderEvaluation(
+        score=72.0, rationale="solid, not yet surprising"
+    )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
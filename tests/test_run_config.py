@@ -0,0 +1,74 @@
+"""
+agt_sea — Run Configuration Tests
+
+Unit tests (no LLM calls) for ``RunConfig`` and its place on
+``AgencyState`` in ``agt_sea/models/state.py``:
+
+1. Flat run-configuration keys fold into ``run_config``, overriding an
+   explicit one, and read back through the state's views.
+2. ``RunConfig`` is frozen and its views are read-only.
+3. A dumped state — nested ``run_config`` — rehydrates unchanged.
+
+Run with:
+    uv run pytest tests/test_run_config.py
+"""
+
+from __future__ import annotations
+
+import pytest
+from pydantic import ValidationError
+
+from agt_sea.models.state import (
+    AgencyState,
+    CreativePhilosophy,
+    LLMProvider,
+    RunConfig,
+)
+
+
+def test_flat_keys_fold_into_run_config() -> None:
+    base = RunConfig(max_iterations=5, approval_threshold=70.0)
+
+    state = AgencyState(
+        client_brief="Sell socks.",
+        run_config=base,
+        max_iterations=2,
+        llm_provider="fake",
+    )
+
+    assert state.run_config == RunConfig(
+        max_iterations=2, approval_threshold=70.0, llm_provider=LLMProvider.FAKE
+    )
+    assert state.max_iterations == 2
+    assert state.llm_provider == LLMProvider.FAKE
+    assert "max_iterations" not in AgencyState.model_fields
+
+
+def test_run_config_is_immutable() -> None:
+    state = AgencyState(creative_a_st2_temperature=0.3)
+
+    with pytest.raises(ValidationError):
+        state.run_config.max_iterations = 9
+    with pytest.raises((AttributeError, ValueError)):
+        state.creative_a_st2_temperature = 0.9
+    with pytest.raises(ValidationError):
+        RunConfig(creative_a_st2_temperature=1.5)
+
+
+def test_dump_round_trips() -> None:
+    state = AgencyState(
+        client_brief="Sell socks.",
+        creative_b_st2_creative_philosophy=CreativePhilosophy.BOLD_AND_DISRUPTIVE,
+    )
+
+    rehydrated = AgencyState.model_validate(state.model_dump(mode="json"))
+
+    assert rehydrated == state
+    assert (
+        rehydrated.creative_b_st2_creative_philosophy
+        == CreativePhilosophy.BOLD_AND_DISRUPTIVE
+    )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,305 @@
+"""
+agt_sea — Speculative Concept Tests
+
+Unit tests (pytest, no real LLM calls) for the Standard 2.0 graph built
+with ``speculative_concepts=k``:
+
+1. Creative B develops the first k territories while the graph waits at
+   the interrupt; selecting one of them adopts the finished concept with
+   no further Creative B call.
+2. Selecting any other territory, or changing Creative B's inputs after
+   speculation started, falls back to a fresh call — as does a failure
+   to start speculating, which is logged.
+3. ``SpeculativeConceptPool`` cancels the unpicked calls that have not
+   started yet.
+
+Run with:
+    uv run pytest tests/test_speculation.py
+
+Agents are stubbed on the workflow module and graphs rebuilt after
+patching — see the patching note in ``test_pipeline_failure.py``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+from langgraph.types import Command
+
+from agt_sea.graph import workflow_st2
+from agt_sea.graph.checkpointer import BoundedMemorySaver
+from agt_sea.graph.speculation import SPECULATIVE_POOL, SpeculativeConceptPool
+from agt_sea.models.state import (
+    AgencyState,
+    AgentOutput,
+    AgentRole,
+    CampaignConcept,
+    CDSynthesis,
+    GraderEvaluation,
+    LLMProvider,
+    Territory,
+    WorkflowStatus,
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+_DELAY = 0.3
+
+
+def _stub_agents(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Install sync stubs on the workflow module; return Creative B calls."""
+    creative_b_calls: list[str] = []
+
+    def run_strategist_st2(state: AgencyState) -> AgencyState:
+        state.creative_brief = "stub brief"
+        return state
+
+    def run_creative_a_st2(state: AgencyState) -> AgencyState:
+        state.territories = [
+            Territory(title=f"T{i}", core_idea="idea", why_it_works="why")
+            for i in range(state.num_territories)
+        ]
+        return state
+
+    def run_creative_b_st2(state: AgencyState) -> AgencyState:
+        time.sleep(_DELAY)
+        creative_b_calls.append(state.selected_territory.title)
+        state.iteration += 1
+        state.campaign_concept = CampaignConcept(
+            title=f"Campaign {state.selected_territory.title}",
+            core_idea="idea",
+            why_it_works="why",
+        )
+        state.history.append(
+            AgentOutput(
+                agent=AgentRole.CREATIVE_B_ST2,
+                provider=LLMProvider.ANTHROPIC,
+                model="stub",
+                iteration=state.iteration,
+                content=state.campaign_concept.title,
+            )
+        )
+        return state
+
+    def run_cd_grader_st2(state: AgencyState) -> AgencyState:
+        state.grader_evaluation = GraderEvaluation(score=90, rationale="stub")
+        return state
+
+    def run_cd_synthesis_st2(state: AgencyState) -> AgencyState:
+        state.cd_synthesis = CDSynthesis(
+            selected_title=state.campaign_concept.title,
+            recommendation="ship it",
+        )
+        return state
+
+    for fn in (
+        run_strategist_st2,
+        run_creative_a_st2,
+        run_creative_b_st2,
+        run_cd_grader_st2,
+        run_cd_synthesis_st2,
+    ):
+        monkeypatch.setattr(workflow_st2, fn.__name__, fn)
+    return creative_b_calls
+
+
+def _config(thread_id: str) -> dict:
+    return {"configurable": {"thread_id": thread_id}}
+
+
+def _pause(graph, thread_id: str) -> dict:
+    cfg = _config(thread_id)
+    graph.invoke(AgencyState(client_brief="brief", num_territories=4), config=cfg)
+    assert graph.get_state(cfg).next == ("interrupt_territory_selection",)
+    return cfg
+
+
+def _select(graph, cfg: dict, index: int) -> tuple[AgencyState, float]:
+    start = time.perf_counter()
+    raw = graph.invoke(
+        Command(resume={"action": "select", "index": index}), config=cfg
+    )
+    return AgencyState.model_validate(raw), time.perf_counter() - start
+
+
+# ---------------------------------------------------------------------------
+# Graph integration
+# ---------------------------------------------------------------------------
+
+
+def test_selected_speculative_concept_is_reused(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = _stub_agents(monkeypatch)
+    graph = workflow_st2.build_graph_st2(
+        checkpointer=BoundedMemorySaver(), speculative_concepts=2
+    )
+    cfg = _pause(graph, "speculate-hit")
+    time.sleep(_DELAY * 2)  # the user reads the territories
+
+    final_state, elapsed = _select(graph, cfg, 1)
+
+    assert final_state.status == WorkflowStatus.APPROVED
+    assert final_state.campaign_concept.title == "Campaign T1"
+    assert final_state.iteration == 1
+    assert [
+        e.content for e in final_state.history if e.agent == AgentRole.CREATIVE_B_ST2
+    ] == ["Campaign T1"]
+    # Only the two speculative calls ever ran — none after the click.
+    assert sorted(calls) == ["T0", "T1"]
+    assert elapsed < _DELAY
+
+
+def test_unspeculated_selection_makes_a_fresh_call(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = _stub_agents(monkeypatch)
+    graph = workflow_st2.build_graph_st2(
+        checkpointer=BoundedMemorySaver(), speculative_concepts=2
+    )
+    cfg = _pause(graph, "speculate-miss")
+
+    final_state, _ = _select(graph, cfg, 3)
+
+    assert final_state.campaign_concept.title == "Campaign T3"
+    assert calls[-1] == "T3"
+    assert SPECULATIVE_POOL.pending("speculate-miss") == []
+
+
+def test_changed_inputs_do_not_reuse_speculation(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = _stub_agents(monkeypatch)
+    graph = workflow_st2.build_graph_st2(
+        checkpointer=BoundedMemorySaver(), speculative_concepts=1
+    )
+    cfg = _pause(graph, "speculate-stale")
+    # Creative B's temperature changes after speculation started. The
+    # run config is frozen, so an operator override replaces it whole.
+    paused = AgencyState.model_validate(graph.get_state(cfg).values)
+    graph.update_state(
+        cfg,
+        {
+            "run_config": paused.run_config.model_copy(
+                update={"creative_b_st2_temperature": 0.1}
+            )
+        },
+    )
+
+    final_state, _ = _select(graph, cfg, 0)
+
+    assert final_state.campaign_concept.title == "Campaign T0"
+    assert calls.count("T0") == 2  # speculative + fresh
+
+
+def test_failure_to_speculate_is_logged_not_fatal(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    calls = _stub_agents(monkeypatch)
+
+    def start(*args, **kwargs) -> None:
+        raise RuntimeError("pool unavailable")
+
+    monkeypatch.setattr(SPECULATIVE_POOL, "start", start)
+    graph = workflow_st2.build_graph_st2(
+        checkpointer=BoundedMemorySaver(), speculative_concepts=2
+    )
+
+    with caplog.at_level("WARNING", logger=workflow_st2.__name__):
+        cfg = _pause(graph, "speculate-broken")
+    final_state, _ = _select(graph, cfg, 0)
+
+    assert final_state.status == WorkflowStatus.APPROVED
+    assert calls == ["T0"]
+    assert "pool unavailable" in caplog.text
+
+
+def test_async_graph_awaits_running_speculation(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = _stub_agents(monkeypatch)
+
+    async def arun_creative_b_st2(state: AgencyState) -> AgencyState:
+        raise AssertionError("speculative concept should have been reused")
+
+    monkeypatch.setattr(workflow_st2, "arun_creative_b_st2", arun_creative_b_st2)
+    for name in (
+        "run_strategist_st2",
+        "run_creative_a_st2",
+        "run_cd_grader_st2",
+        "run_cd_synthesis_st2",
+    ):
+        fn = getattr(workflow_st2, name)
+
+        async def wrapper(state: AgencyState, fn=fn) -> AgencyState:
+            return fn(state)
+
+        monkeypatch.setattr(workflow_st2, f"a{name}", wrapper)
+    graph = workflow_st2.build_graph_st2(
+        checkpointer=BoundedMemorySaver(),
+        asynchronous=True,
+        speculative_concepts=1,
+    )
+    cfg = _config("speculate-async")
+
+    async def run() -> AgencyState:
+        await graph.ainvoke(
+            AgencyState(client_brief="brief", num_territories=4), config=cfg
+        )
+        # Select immediately: the speculative call is still in flight.
+        raw = await graph.ainvoke(
+            Command(resume={"action": "select", "index": 0}), config=cfg
+        )
+        return AgencyState.model_validate(raw)
+
+    final_state = asyncio.run(run())
+
+    assert final_state.status == WorkflowStatus.APPROVED
+    assert final_state.campaign_concept.title == "Campaign T0"
+    assert calls == ["T0"]
+
+
+# ---------------------------------------------------------------------------
+# Pool
+# ---------------------------------------------------------------------------
+
+
+def test_pool_cancels_unpicked_pending_calls() -> None:
+    pool = SpeculativeConceptPool(max_workers=1)
+    started: list[str] = []
+    release = threading.Event()
+
+    def develop(state: AgencyState) -> AgencyState:
+        started.append(state.selected_territory.title)
+        release.wait(timeout=5)
+        return state
+
+    state = AgencyState(
+        creative_brief="brief",
+        territories=[
+            Territory(title=f"T{i}", core_idea="idea", why_it_works="why")
+            for i in range(3)
+        ],
+    )
+    assert pool.start("thread", state, [0, 1, 2], develop) == 3
+    futures = pool.pending("thread")
+
+    picked = state.model_copy(update={"selected_territory": state.territories[0]})
+    # Release T0 only after take() has cancelled the rest of the batch.
+    threading.Timer(0.1, release.set).start()
+    result = pool.take("thread", picked)
+
+    assert result.selected_territory.title == "T0"
+    assert futures[1].cancelled() and futures[2].cancelled()
+    assert started == ["T0"]
+    assert pool.take("thread", picked) is None  # batch consumed
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,170 @@
+"""
+agt_sea — Territory Streaming Tests
+
+Unit tests (no real LLM calls — runs use ``LLMProvider.FAKE``) for
+Creative A's incremental territory streaming in
+``agt_sea/agents/creative_a_st2.py``:
+
+1. ``TerritoryStreamParser`` returns each territory from a fragmented
+   ``TerritorySet`` document as soon as its object closes.
+2. ``run_creative_a_st2(on_territory=...)`` hands territories over while
+   the call is still streaming, and every final territory exactly once.
+3. Inside the v2 graph the territories arrive as ``stream_mode="custom"``
+   events ahead of Creative A's update.
+
+Run with:
+    uv run pytest tests/test_territory_stream.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from agt_sea.agents.creative_a_st2 import (
+    TerritoryStreamParser,
+    arun_creative_a_st2,
+    run_creative_a_st2,
+)
+from agt_sea.graph.checkpointer import BoundedMemorySaver
+from agt_sea.graph.workflow_st2 import build_graph_st2
+from agt_sea.llm import provider
+from agt_sea.llm.provider import clear_llm_cache
+from agt_sea.models.state import AgencyState, LLMProvider, Territory
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_llm_cache()
+    yield
+    clear_llm_cache()
+
+
+@pytest.fixture
+def slow_fake(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(provider, "FAKE_LLM_LATENCY_SECONDS", (0.4, 0.4))
+
+
+def _state(num_territories: int = 4) -> AgencyState:
+    return AgencyState(
+        client_brief="Sell socks.",
+        creative_brief="Socks, but exciting.",
+        llm_provider=LLMProvider.FAKE,
+        num_territories=num_territories,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Parser
+# ---------------------------------------------------------------------------
+
+
+def test_parser_yields_each_territory_as_it_closes() -> None:
+    document = json.dumps(
+        {
+            "territories": [
+                {
+                    "title": 'The "Odd" One {out}',
+                    "core_idea": "Brackets ] and braces } in a string \\ stay text.",
+                    "why_it_works": "Because.",
+                },
+                {"title": "Toe Up", "core_idea": "Feet first.", "why_it_works": "Yes."},
+            ]
+        }
+    )
+    first_close = document.index("}", document.index("Because.")) + 1
+
+    parser = TerritoryStreamParser()
+    assert parser.feed(document[: first_close - 1]) == []
+    (first,) = parser.feed(document[first_close - 1 : first_close])
+    assert first.title == 'The "Odd" One {out}'
+    assert parser.feed(document[first_close:]) == [
+        Territory(title="Toe Up", core_idea="Feet first.", why_it_works="Yes.")
+    ]
+
+
+def test_parser_skips_objects_that_are_not_territories() -> None:
+    parser = TerritoryStreamParser()
+    found = parser.feed(
+        '{"territories": [{"title": "Half"}, '
+        '{"title": "Whole", "core_idea": "A.", "why_it_works": "B."}]}'
+    )
+    assert [t.title for t in found] == ["Whole"]
+
+
+# ---------------------------------------------------------------------------
+# Agent
+# ---------------------------------------------------------------------------
+
+
+def test_territories_arrive_before_the_call_returns(slow_fake: None) -> None:
+    arrivals: list[float] = []
+    start = time.perf_counter()
+
+    result = run_creative_a_st2(
+        _state(), on_territory=lambda t: arrivals.append(time.perf_counter() - start)
+    )
+    finished = time.perf_counter() - start
+
+    assert len(arrivals) == 4
+    assert arrivals == sorted(arrivals)
+    assert arrivals[0] < finished - 0.2
+
+
+def test_sharded_stream_emits_every_final_territory_once() -> None:
+    seen: list[Territory] = []
+
+    result = run_creative_a_st2(_state(7), shard_size=3, on_territory=seen.append)
+
+    # The merge may drop a streamed near-duplicate (and top up), so the
+    # preview can hold extras — but no territory arrives twice.
+    assert len(result.territories) == 7
+    assert all(seen.count(t) == 1 for t in result.territories)
+
+
+def test_async_stream(slow_fake: None) -> None:
+    seen: list[str] = []
+
+    result = asyncio.run(
+        arun_creative_a_st2(_state(3), on_territory=lambda t: seen.append(t.title))
+    )
+
+    assert seen == [t.title for t in result.territories]
+
+
+# ---------------------------------------------------------------------------
+# Graph
+# ---------------------------------------------------------------------------
+
+
+def test_v2_graph_streams_territories_as_custom_events() -> None:
+    graph = build_graph_st2(checkpointer=BoundedMemorySaver())
+    events = list(
+        graph.stream(
+            AgencyState(
+                client_brief="Sell socks.",
+                llm_provider=LLMProvider.FAKE,
+                num_territories=3,
+            ),
+            config={"configurable": {"thread_id": "territory-stream"}},
+            stream_mode=["custom", "updates"],
+        )
+    )
+
+    territory_events = [
+        i for i, (mode, payload) in enumerate(events)
+        if mode == "custom" and "territory" in payload
+    ]
+    creative_a_update = next(
+        i for i, (mode, payload) in enumerate(events)
+        if mode == "updates" and "creative_a_st2" in payload
+    )
+    assert len(territory_events) == 3
+    assert max(territory_events) < creative_a_update
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
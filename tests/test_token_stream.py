@@ -0,0 +1,125 @@
+"""
+agt_sea — Token Streaming Tests
+
+Unit tests (no real LLM calls) for live token rendering on the workflow
+page:
+
+1. The pure helpers in ``frontend/components/token_stream.py`` —
+   free text accumulates, partial structured output (tool-call argument
+   fragments or raw JSON content) renders as a preview, and a new message
+   id starts a fresh buffer.
+2. A real agent node streamed with ``stream_mode="messages"`` yields its
+   tokens, tagged with the node name, before the node's update event.
+
+Run with:
+    uv run pytest tests/test_token_stream.py
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+
+from agt_sea.agents import strategist_st2
+from agt_sea.graph import workflow_st2
+from agt_sea.graph.checkpointer import BoundedMemorySaver
+from agt_sea.models.state import AgencyState
+
+# Make `frontend` importable the same way app.py does at runtime.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "frontend"))
+
+from components.token_stream import (  # noqa: E402
+    _TokenBuffer,
+    render_partial_output,
+)
+
+
+# ---------------------------------------------------------------------------
+# Pure helpers
+# ---------------------------------------------------------------------------
+
+
+def test_free_text_accumulates_across_chunks() -> None:
+    buffer = _TokenBuffer()
+    for piece in ("The insight: ", "socks are ", "self-expression."):
+        buffer.add(AIMessageChunk(content=piece, id="run-1"))
+    assert buffer.render() == "The insight: socks are self-expression."
+
+
+def test_partial_tool_call_arguments_render_as_preview() -> None:
+    buffer = _TokenBuffer()
+    fragments = (
+        '{"title": "Sock It to Me", "core_idea": "Odd so',
+        'cks, even days", "deliverables": [{"name": "Launch film", ',
+        '"explanation": "A city of',
+    )
+    for fragment in fragments:
+        buffer.add(
+            AIMessageChunk(
+                content="",
+                id="run-1",
+                tool_call_chunks=[
+                    {"name": None, "args": fragment, "id": None, "index": 0}
+                ],
+            )
+        )
+
+    preview = buffer.render()
+    assert "**campaign:** Sock It to Me" in preview
+    assert "**core idea:** Odd socks, even days" in preview
+    assert "- Launch film" in preview
+
+
+def test_json_content_is_parsed_and_content_blocks_are_read() -> None:
+    assert render_partial_output('{"score": 72, "rationale": "Sol') == (
+        "**score:** 72\n\n**rationale:** Sol"
+    )
+    buffer = _TokenBuffer()
+    buffer.add(AIMessageChunk(content=[{"type": "text", "text": "Hi"}], id="a"))
+    assert buffer.render() == "Hi"
+
+
+def test_new_message_id_starts_a_fresh_buffer() -> None:
+    buffer = _TokenBuffer()
+    buffer.add(AIMessageChunk(content="first call", id="run-1"))
+    buffer.add(AIMessageChunk(content="second", id="run-2"))
+    assert buffer.render() == "second"
+
+
+# ---------------------------------------------------------------------------
+# Graph integration
+# ---------------------------------------------------------------------------
+
+
+def test_strategist_tokens_stream_before_the_node_update(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    model = GenericFakeChatModel(
+        messages=iter([AIMessage(content="Brief: make socks loud again.")])
+    )
+    monkeypatch.setattr(strategist_st2, "get_llm", lambda **_: model)
+    graph = workflow_st2.build_graph_st2(checkpointer=BoundedMemorySaver())
+
+    events: list[tuple[str, str]] = []
+    for mode, payload in graph.stream(
+        AgencyState(client_brief="Sell socks."),
+        config={"configurable": {"thread_id": "token-stream"}},
+        stream_mode=["updates", "messages"],
+    ):
+        if mode == "messages":
+            chunk, metadata = payload
+            events.append(("token", metadata["langgraph_node"]))
+        else:
+            events.extend(("update", node) for node in payload)
+            break  # strategist finished — enough for this test
+
+    assert events[0] == ("token", "strategist_st2")
+    assert events.index(("update", "strategist_st2")) > 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
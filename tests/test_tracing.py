@@ -0,0 +1,316 @@
+"""
+agt_sea — Tracing Tests
+
+Unit tests (no real LLM calls) for the optional OpenTelemetry spans in
+``agt_sea/tracing.py``, captured with the SDK's in-memory exporter:
+
+1. Each ``_safe_node``-wrapped node gets a span carrying thread_id,
+   iteration and agent role; failures are recorded, the territory
+   interrupt is not.
+2. Each chat-model request — transport retries and the validation
+   reprompt included — is a child span of its node, and retries of a
+   real agent call (structured output, circuit breaker) are numbered
+   and carry the agent's prompt hash.
+3. Without OpenTelemetry every helper is a no-op.
+
+Run with:
+    uv run pytest tests/test_tracing.py
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import RunnableLambda
+from langgraph.types import Command
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import StatusCode
+
+from agt_sea import tracing
+from agt_sea.graph import workflow_st1, workflow_st2
+from agt_sea.graph.checkpointer import BoundedMemorySaver
+from agt_sea.llm import provider as provider_module
+from agt_sea.llm.fake import FakeChatModel, FakeLLMError
+from agt_sea.llm.provider import (
+    clear_llm_cache,
+    get_structured_llm,
+    invoke_with_validation_retry,
+    with_prompt_hash,
+)
+from agt_sea.models.state import (
+    AgencyState,
+    CampaignConcept,
+    GraderEvaluation,
+    LLMProvider,
+    Territory,
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def exporter() -> InMemorySpanExporter:
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    tracing.set_tracer_provider(provider)
+    yield exporter
+    tracing.set_tracer_provider(None)
+
+
+class _FlakyChatModel(BaseChatModel):
+    """Fails ``failures`` times with ConnectionError, then answers."""
+
+    model_name: str = "fake-model"
+    failures: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "flaky"
+
+    def _generate(
+        self,
+        messages: list[Any],
+        stop: list[str] | None = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("reset by peer")
+        message = AIMessage(
+            content='{"score": 70, "rationale": "fine"}',
+            usage_metadata={
+                "input_tokens": 50,
+                "output_tokens": 10,
+                "total_tokens": 60,
+            },
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+def _stub_v2_agents(monkeypatch: pytest.MonkeyPatch) -> None:
+    def run_strategist_st2(state: AgencyState) -> AgencyState:
+        state.creative_brief = "stub brief"
+        return state
+
+    def run_creative_a_st2(state: AgencyState) -> AgencyState:
+        state.territories = [
+            Territory(title="T0", core_idea="idea", why_it_works="why")
+        ]
+        return state
+
+    def run_creative_b_st2(state: AgencyState) -> AgencyState:
+        state.iteration += 1
+        state.campaign_concept = CampaignConcept(
+            title="Campaign", core_idea="idea", why_it_works="why"
+        )
+        return state
+
+    def run_cd_grader_st2(state: AgencyState) -> AgencyState:
+        raise RuntimeError("grader boom")
+
+    for fn in (
+        run_strategist_st2,
+        run_creative_a_st2,
+        run_creative_b_st2,
+        run_cd_grader_st2,
+    ):
+        monkeypatch.setattr(workflow_st2, fn.__name__, fn)
+
+
+def _by_name(exporter: InMemorySpanExporter) -> dict[str, list]:
+    spans: dict[str, list] = {}
+    for span in exporter.get_finished_spans():
+        spans.setdefault(span.name, []).append(span)
+    return spans
+
+
+# ---------------------------------------------------------------------------
+# Node spans
+# ---------------------------------------------------------------------------
+
+
+def test_v2_nodes_get_spans_with_run_attributes(
+    exporter: InMemorySpanExporter,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _stub_v2_agents(monkeypatch)
+    graph = workflow_st2.build_graph_st2(checkpointer=BoundedMemorySaver())
+    cfg = {"configurable": {"thread_id": "trace-v2"}}
+
+    graph.invoke(AgencyState(client_brief="brief", num_territories=1), config=cfg)
+    graph.invoke(Command(resume={"action": "select", "index": 0}), config=cfg)
+
+    spans = _by_name(exporter)
+    strategist = spans["node strategist_st2"][0]
+    assert strategist.attributes["agt_sea.thread_id"] == "trace-v2"
+    assert strategist.attributes["agt_sea.agent_role"] == "strategist_st2"
+    assert strategist.attributes["agt_sea.iteration"] == 0
+
+    # The interrupt pauses (GraphInterrupt) and then resumes: neither
+    # execution is an error, and it is not an agent role.
+    interrupts = spans["node interrupt_territory_selection"]
+    assert len(interrupts) == 2
+    assert all(s.status.status_code != StatusCode.ERROR for s in interrupts)
+    assert "agt_sea.agent_role" not in interrupts[0].attributes
+
+    grader = spans["node cd_grader_st2"][0]
+    assert grader.attributes["agt_sea.iteration"] == 1
+    assert grader.status.status_code == StatusCode.ERROR
+    assert grader.events[0].name == "exception"
+
+
+def test_v1_nodes_get_spans(
+    exporter: InMemorySpanExporter,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def run_strategist_st1(state: AgencyState) -> AgencyState:
+        raise RuntimeError("strategist boom")
+
+    monkeypatch.setattr(workflow_st1, "run_strategist_st1", run_strategist_st1)
+    graph = workflow_st1.build_graph_st1()
+
+    graph.invoke(AgencyState(client_brief="brief"))
+
+    (span,) = _by_name(exporter)["node strategist_st1"]
+    assert span.status.status_code == StatusCode.ERROR
+    assert "agt_sea.thread_id" not in span.attributes
+
+
+# ---------------------------------------------------------------------------
+# LLM spans
+# ---------------------------------------------------------------------------
+
+
+def test_llm_attempts_are_child_spans_of_the_node(
+    exporter: InMemorySpanExporter,
+) -> None:
+    model = _FlakyChatModel(failures=1).with_retry(
+        retry_if_exception_type=(ConnectionError,),
+        stop_after_attempt=3,
+        wait_exponential_jitter=False,
+    )
+    state = AgencyState(iteration=2)
+
+    with tracing.node_span("cd_feedback_st2", state):
+        model.invoke([HumanMessage(content="coach")])
+
+    spans = _by_name(exporter)
+    (node,) = spans["node cd_feedback_st2"]
+    first, second = sorted(
+        spans["chat fake-model"], key=lambda s: s.attributes["agt_sea.llm.attempt"]
+    )
+    for chat in (first, second):
+        assert chat.parent.span_id == node.context.span_id
+        assert chat.attributes["agt_sea.agent_role"] == "cd_feedback_st2"
+        assert chat.attributes["agt_sea.iteration"] == 2
+    assert first.attributes["agt_sea.llm.attempt"] == 1
+    assert first.status.status_code == StatusCode.ERROR
+    assert second.attributes["agt_sea.llm.attempt"] == 2
+    assert second.attributes["gen_ai.usage.output_tokens"] == 10
+
+
+class _FlakyFakeChatModel(FakeChatModel):
+    """The fake provider's model, failing ``failures`` requests first."""
+
+    failures: int = 0
+
+    def _generate(self, messages: list[Any], *args: Any, **kwargs: Any) -> ChatResult:
+        if self.failures:
+            self.failures -= 1
+            raise FakeLLMError("reset by peer")
+        return super()._generate(messages, *args, **kwargs)
+
+
+@pytest.mark.parametrize("circuit_breaker", [False, True])
+def test_structured_agent_call_attempts_are_numbered(
+    exporter: InMemorySpanExporter,
+    monkeypatch: pytest.MonkeyPatch,
+    circuit_breaker: bool,
+) -> None:
+    # The retry wraps the structured-output sequence (and the breaker),
+    # not the chat model, so the attempt tag has to be inherited.
+    monkeypatch.setattr(provider_module, "LLM_CIRCUIT_BREAKER", circuit_breaker)
+    monkeypatch.setattr(
+        provider_module,
+        "_build_chat_model",
+        lambda provider, model, temperature: _FlakyFakeChatModel(
+            model_name=model, failures=1
+        ),
+    )
+    clear_llm_cache()
+    try:
+        structured = get_structured_llm(
+            GraderEvaluation, provider=LLMProvider.FAKE, model="fake-model"
+        ).model_copy(update={"wait_exponential_jitter": False})
+        structured = with_prompt_hash(structured, "prompt-hash")
+
+        with tracing.node_span("cd_grader_st2", AgencyState()):
+            invoke_with_validation_retry(structured, [HumanMessage(content="grade")])
+    finally:
+        clear_llm_cache()
+
+    spans = _by_name(exporter)["chat fake-model"]
+    attempts = sorted(span.attributes["agt_sea.llm.attempt"] for span in spans)
+    assert attempts == [1, 2]
+    assert {span.attributes["agt_sea.prompt_hash"] for span in spans} == {
+        "prompt-hash"
+    }
+
+
+def test_validation_reprompt_is_flagged(exporter: InMemorySpanExporter) -> None:
+    parsed: list[int] = []
+
+    def parse(message: AIMessage) -> GraderEvaluation:
+        parsed.append(1)
+        if len(parsed) == 1:
+            return GraderEvaluation.model_validate({"score": 500, "rationale": "x"})
+        return GraderEvaluation.model_validate_json(message.content)
+
+    structured = _FlakyChatModel() | RunnableLambda(parse)
+
+    with tracing.node_span("cd_grader_st2", AgencyState()):
+        invoke_with_validation_retry(structured, [HumanMessage(content="grade")])
+
+    flags = [
+        span.attributes["agt_sea.llm.validation_reprompt"]
+        for span in _by_name(exporter)["chat fake-model"]
+    ]
+    assert sorted(flags) == [False, True]
+
+
+# ---------------------------------------------------------------------------
+# No-op fallback
+# ---------------------------------------------------------------------------
+
+
+def test_helpers_are_no_ops_without_opentelemetry(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(tracing, "trace", None)
+
+    with tracing.node_span("strategist_st2", AgencyState()) as span:
+        assert span is None
+    tracing.record_node_error(span, RuntimeError("ignored"))
+
+
+def test_node_name_for() -> None:
+    assert tracing.node_name_for("arun_cd_grader_st2") == "cd_grader_st2"
+    assert tracing.node_name_for("run_strategist_st1") == "strategist_st1"
+    assert tracing.node_name_for("_collect_concepts") == "collect_concepts"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,299 @@
+"""
+agt_sea — Typed History Tests
+
+Unit tests (no real LLM calls — runs use ``LLMProvider.FAKE`` or stubbed
+agents) for typed history payloads on ``AgentOutput``:
+
+1. Structured Standard 2.0 agents store their artifact as a typed
+   ``payload`` instead of pre-rendered ``content``, and it survives a
+   JSON round trip discriminated on ``kind``.
+2. ``render_payload()`` renders each payload on demand and passes free
+   text through; CD Synthesis's history log builds on it.
+3. When the serial v2 loop runs out of iterations, ``_best_of`` restores
+   the highest-scoring concept from history before CD Synthesis.
+
+Run with:
+    uv run pytest tests/test_typed_history.py
+"""
+
+from __future__ import annotations
+
+import pytest
+from langgraph.types import Command
+
+from agt_sea.agents.cd_synthesis_st2 import _render_history
+from agt_sea.agents.creative_a_st2 import run_creative_a_st2
+from agt_sea.graph import workflow_st2
+from agt_sea.graph.checkpointer import BoundedMemorySaver
+from agt_sea.llm.provider import clear_llm_cache
+from agt_sea.models.state import (
+    AgencyState,
+    AgentOutput,
+    AgentRole,
+    CampaignConcept,
+    CampaignConceptPayload,
+    CampaignDeliverable,
+    CDSynthesis,
+    CDSynthesisPayload,
+    GraderEvaluation,
+    GraderEvaluationPayload,
+    LLMProvider,
+    TerritoriesPayload,
+    Territory,
+    WorkflowStatus,
+    render_payload,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_llm_cache()
+    yield
+    clear_llm_cache()
+
+
+def _concept(title: str) -> CampaignConcept:
+    return CampaignConcept(
+        title=title,
+        core_idea="Socks as armour.",
+        deliverables=[CampaignDeliverable(name="Film", explanation="A knight.")],
+        why_it_works="Everyone has feet.",
+    )
+
+
+def _entry(agent: AgentRole, iteration: int, **fields) -> AgentOutput:
+    return AgentOutput(
+        agent=agent,
+        provider=LLMProvider.FAKE,
+        model="stub",
+        iteration=iteration,
+        **fields,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Payloads
+# ---------------------------------------------------------------------------
+
+
+def test_structured_agent_stores_a_typed_payload() -> None:
+    result = run_creative_a_st2(
+        AgencyState(
+            client_brief="Sell socks.",
+            creative_brief="Socks, but exciting.",
+            llm_provider=LLMProvider.FAKE,
+            num_territories=3,
+        )
+    )
+
+    entry = result.history[-1]
+    assert entry.content == ""
+    assert entry.payload == TerritoriesPayload(territories=result.territories)
+
+
+def test_payload_round_trips_on_kind() -> None:
+    entry = _entry(
+        AgentRole.CD_GRADER_ST2,
+        1,
+        payload=GraderEvaluationPayload(
+            evaluation=GraderEvaluation(score=64, rationale="Close.")
+        ),
+    )
+
+    rehydrated = AgentOutput.model_validate(entry.model_dump(mode="json"))
+
+    assert isinstance(rehydrated.payload, GraderEvaluationPayload)
+    assert rehydrated == entry
+
+
+# ---------------------------------------------------------------------------
+# Rendering
+# ---------------------------------------------------------------------------
+
+
+def test_render_payload_formats_each_payload() -> None:
+    territories = TerritoriesPayload(
+        territories=[
+            Territory(title="Toe Up", core_idea="Feet first.", why_it_works="Yes."),
+            Territory(title="Odd Pairs", core_idea="Mismatch.", why_it_works="Fun."),
+        ]
+    )
+    entry = _entry(AgentRole.CREATIVE_A_ST2, 0, payload=territories)
+    assert render_payload(entry) == (
+        "Territory 1: Toe Up\nCore idea: Feet first.\nWhy it works: Yes.\n\n"
+        "Territory 2: Odd Pairs\nCore idea: Mismatch.\nWhy it works: Fun."
+    )
+
+    concept = CampaignConceptPayload(concept=_concept("Sock Knights"))
+    assert render_payload(_entry(AgentRole.CREATIVE_B_ST2, 1, payload=concept)) == (
+        "Title: Sock Knights\nCore idea: Socks as armour.\n"
+        "Deliverables:\n- Film: A knight.\nWhy it works: Everyone has feet."
+    )
+
+    grade = GraderEvaluationPayload(
+        evaluation=GraderEvaluation(score=72, rationale="Strong.")
+    )
+    assert render_payload(_entry(AgentRole.CD_GRADER_ST2, 1, payload=grade)) == (
+        "Score: 72.0/100\nRationale: Strong."
+    )
+
+    synthesis = CDSynthesisPayload(
+        synthesis=CDSynthesis(selected_title="Sock Knights", recommendation="Ship it.")
+    )
+    assert render_payload(
+        _entry(AgentRole.CD_SYNTHESIS_ST2, 1, payload=synthesis)
+    ) == "Recommendation: Sock Knights\n\nShip it."
+
+
+def test_render_payload_passes_free_text_through() -> None:
+    entry = _entry(AgentRole.CD_FEEDBACK_ST2, 1, content="Push the armour.")
+    assert render_payload(entry) == "Push the armour."
+
+
+def test_synthesis_history_log_renders_payloads() -> None:
+    territories = TerritoriesPayload(
+        territories=[
+            Territory(title="Toe Up", core_idea="Feet first.", why_it_works="Yes."),
+            Territory(title="Odd Pairs", core_idea="Mismatch.", why_it_works="Fun."),
+        ]
+    )
+    grade = GraderEvaluationPayload(
+        evaluation=GraderEvaluation(score=72, rationale="Strong.")
+    )
+    state = AgencyState(
+        history=[
+            _entry(AgentRole.CREATIVE_A_ST2, 0, payload=territories),
+            _entry(AgentRole.CD_GRADER_ST2, 1, payload=grade),
+        ]
+    )
+
+    assert _render_history(state) == (
+        "- iter 0 [creative_a_st2]: Toe Up; Odd Pairs\n"
+        "- iter 1 [cd_grader_st2]: Score: 72.0/100 Rationale: Strong."
+    )
+
+
+# ---------------------------------------------------------------------------
+# Best-of
+# ---------------------------------------------------------------------------
+
+
+def test_best_of_pairs_concepts_with_their_grades() -> None:
+    history = []
+    for iteration, score in ((1, 60.0), (2, 75.0), (3, 75.0), (4, 50.0)):
+        history += [
+            _entry(
+                AgentRole.CREATIVE_B_ST2,
+                iteration,
+                payload=CampaignConceptPayload(concept=_concept(f"v{iteration}")),
+            ),
+            _entry(
+                AgentRole.CD_GRADER_ST2,
+                iteration,
+                payload=GraderEvaluationPayload(
+                    evaluation=GraderEvaluation(score=score, rationale="r")
+                ),
+            ),
+        ]
+
+    best = workflow_st2._best_of(AgencyState(history=history))
+
+    # Ties go to the later iteration.
+    assert best["campaign_concept"].title == "v3"
+    assert best["grader_evaluation"].score == 75.0
+    assert workflow_st2._best_of(AgencyState(history=history[:1])) == {}
+
+
+def _stub_agents(
+    monkeypatch: pytest.MonkeyPatch, scores: list[float]
+) -> list[str]:
+    """Install sync stubs that write typed payloads; returns synthesis input."""
+    synthesised: list[str] = []
+    remaining = list(scores)
+
+    def run_strategist_st2(state: AgencyState) -> AgencyState:
+        state.creative_brief = "stub brief"
+        return state
+
+    def run_creative_a_st2(state: AgencyState) -> AgencyState:
+        state.territories = [
+            Territory(title="T0", core_idea="idea", why_it_works="why")
+        ]
+        return state
+
+    def run_creative_b_st2(state: AgencyState) -> AgencyState:
+        state.iteration += 1
+        state.campaign_concept = _concept(f"Campaign v{state.iteration}")
+        state.history.append(
+            _entry(
+                AgentRole.CREATIVE_B_ST2,
+                state.iteration,
+                payload=CampaignConceptPayload(concept=state.campaign_concept),
+            )
+        )
+        return state
+
+    def run_cd_grader_st2(state: AgencyState) -> AgencyState:
+        state.grader_evaluation = GraderEvaluation(
+            score=remaining.pop(0), rationale="stub"
+        )
+        state.history.append(
+            _entry(
+                AgentRole.CD_GRADER_ST2,
+                state.iteration,
+                payload=GraderEvaluationPayload(evaluation=state.grader_evaluation),
+            )
+        )
+        return state
+
+    def run_cd_feedback_st2(state: AgencyState) -> AgencyState:
+        state.cd_feedback_direction = "try harder"
+        return state
+
+    def run_cd_synthesis_st2(state: AgencyState) -> AgencyState:
+        synthesised.append(state.campaign_concept.title)
+        state.cd_synthesis = CDSynthesis(
+            selected_title=state.campaign_concept.title,
+            recommendation="ship it",
+        )
+        return state
+
+    for fn in (
+        run_strategist_st2,
+        run_creative_a_st2,
+        run_creative_b_st2,
+        run_cd_grader_st2,
+        run_cd_feedback_st2,
+        run_cd_synthesis_st2,
+    ):
+        monkeypatch.setattr(workflow_st2, fn.__name__, fn)
+    return synthesised
+
+
+def test_exhausted_loop_synthesises_the_best_concept(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    synthesised = _stub_agents(monkeypatch, scores=[60.0, 75.0, 50.0])
+    graph = workflow_st2.build_graph_st2(
+        checkpointer=BoundedMemorySaver(),
+        speculative_concepts=0,
+        concurrent_feedback=False,
+    )
+    cfg = {"configurable": {"thread_id": "typed-best-of"}}
+
+    graph.invoke(
+        AgencyState(client_brief="brief", num_territories=1, max_iterations=3),
+        config=cfg,
+    )
+    raw = graph.invoke(Command(resume={"action": "select", "index": 0}), config=cfg)
+    final_state = AgencyState.model_validate(raw)
+
+    assert final_state.status == WorkflowStatus.MAX_ITERATIONS_REACHED
+    assert synthesised == ["Campaign v2"]
+    assert final_state.campaign_concept.title == "Campaign v2"
+    assert final_state.grader_evaluation.score == 75.0
+    assert final_state.cd_synthesis.selected_title == "Campaign v2"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])